@@ -0,0 +1,47 @@
+"""Gunicorn configuration for running the API with several uvicorn workers.
+
+    gunicorn -c gunicorn.conf.py src.main:app
+
+Each worker is a separate process with its own event loop, MongoDB pool
+(``MONGODB_MAX_POOL_SIZE`` connections each) and in-process caches, so
+CPU-bound work (bcrypt, PDFs, license images) in one worker no longer
+stalls requests served by the others. Scheduled jobs run in one worker
+only, elected through a MongoDB lease.
+"""
+
+import multiprocessing
+import os
+import shutil
+
+from src.infrastructure.workers import WORKERS_ENV
+
+bind = os.getenv("BIND", "0.0.0.0:8000")
+workers = int(os.getenv(WORKERS_ENV) or multiprocessing.cpu_count())
+# Workers read this back to know they are not alone (see src/infrastructure/workers.py)
+os.environ[WORKERS_ENV] = str(workers)
+worker_class = "uvicorn.workers.UvicornWorker"
+
+# The app is imported in each worker after the fork, never in the master:
+# MongoDB clients and asyncio objects must not be shared across a fork
+preload_app = False
+
+timeout = int(os.getenv("GUNICORN_TIMEOUT", "60"))
+graceful_timeout = int(os.getenv("GUNICORN_GRACEFUL_TIMEOUT", "30"))
+keepalive = 5
+accesslog = "-"
+errorlog = "-"
+
+
+def on_starting(server):
+    """Start the Prometheus multiprocess directory empty: files left by a previous run would be merged in."""
+    directory = os.getenv("PROMETHEUS_MULTIPROC_DIR")
+    if directory:
+        shutil.rmtree(directory, ignore_errors=True)
+        os.makedirs(directory, exist_ok=True)
+
+
+def child_exit(server, worker):
+    """Drop the live gauges of a worker that exited."""
+    from src.infrastructure.monitoring.prometheus import mark_worker_dead
+
+    mark_worker_dead(worker.pid)
@@ -0,0 +1,116 @@
+"""Latency/query summaries and the JSON baseline CI compares against."""
+
+from __future__ import annotations
+
+import json
+import math
+import platform
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+from .runner import Sample
+
+# Latencies below this are noise on shared CI machines; never flag them
+MIN_REGRESSION_MS = 5.0
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """Nearest-rank percentile (``pct`` in 0-100) of a non-empty list."""
+    if not values:
+        raise ValueError("percentile of an empty list")
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def summarize(samples: Iterable[Sample]) -> dict:
+    """Request count, error count, latency percentiles and queries per request."""
+    samples = list(samples)
+    latencies = [s.latency_ms for s in samples if s.ok]
+    queries = [s.queries for s in samples if s.ok and s.queries is not None]
+    summary = {
+        "requests": len(samples),
+        "errors": sum(1 for s in samples if not s.ok),
+    }
+    if latencies:
+        summary.update({
+            "p50_ms": round(percentile(latencies, 50), 2),
+            "p95_ms": round(percentile(latencies, 95), 2),
+            "p99_ms": round(percentile(latencies, 99), 2),
+        })
+    if queries:
+        summary.update({
+            "queries_per_request": round(sum(queries) / len(queries), 2),
+            "max_queries": max(queries),
+        })
+    return summary
+
+
+def build_report(results: Dict[str, dict], scale: dict, concurrency: int) -> dict:
+    return {
+        "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "scale": scale,
+        "concurrency": concurrency,
+        "scenarios": results,
+    }
+
+
+def write_report(report: dict, path: Path) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(report, indent=2, sort_keys=True) + "\n")
+
+
+def load_report(path: Path) -> dict:
+    return json.loads(path.read_text())
+
+
+def compare(current: dict, baseline: dict, tolerance: float = 0.2) -> List[str]:
+    """Regressions of ``current`` against ``baseline``, as readable lines.
+
+    A scenario regresses when its p95 grows by more than ``tolerance``
+    (and by more than MIN_REGRESSION_MS), when its most expensive request
+    runs more queries, or when it starts failing. Scenarios missing on
+    either side are ignored.
+
+    Queries are gated on ``max_queries`` rather than the mean: cached
+    endpoints (the dashboard, the club directory) only query on a miss, so
+    the mean moves with how many misses a run happened to get, while the
+    cost of a miss does not. Reports without ``max_queries`` fall back to
+    the mean rounded up.
+    """
+    regressions = []
+    for name, base in baseline.get("scenarios", {}).items():
+        now: Optional[dict] = current.get("scenarios", {}).get(name)
+        if now is None:
+            continue
+        if now.get("errors", 0) > base.get("errors", 0):
+            regressions.append(f"{name}: {now['errors']} errors (baseline {base.get('errors', 0)})")
+        if "p95_ms" in base and "p95_ms" in now:
+            limit = max(base["p95_ms"] * (1 + tolerance), base["p95_ms"] + MIN_REGRESSION_MS)
+            if now["p95_ms"] > limit:
+                regressions.append(f"{name}: p95 {now['p95_ms']}ms > {limit:.1f}ms (baseline {base['p95_ms']}ms)")
+        if "max_queries" in base and "max_queries" in now:
+            if now["max_queries"] > base["max_queries"]:
+                regressions.append(
+                    f"{name}: up to {now['max_queries']} queries/request (baseline {base['max_queries']})"
+                )
+        elif "queries_per_request" in base and "queries_per_request" in now:
+            if math.ceil(now["queries_per_request"]) > math.ceil(base["queries_per_request"]):
+                regressions.append(
+                    f"{name}: {now['queries_per_request']} queries/request "
+                    f"(baseline {base['queries_per_request']})"
+                )
+    return regressions
+
+
+def format_table(results: Dict[str, dict]) -> str:
+    lines = [f"{'scenario':28s} {'reqs':>5s} {'err':>4s} {'p50':>9s} {'p95':>9s} {'p99':>9s} {'q/req':>6s}"]
+    for name, s in results.items():
+        lines.append(
+            f"{name:28s} {s['requests']:>5d} {s['errors']:>4d} "
+            f"{s.get('p50_ms', float('nan')):>8.1f}ms {s.get('p95_ms', float('nan')):>8.1f}ms "
+            f"{s.get('p99_ms', float('nan')):>8.1f}ms {s.get('queries_per_request', float('nan')):>6.1f}"
+        )
+    return "\n".join(lines)
@@ -0,0 +1,85 @@
+"""Concurrent HTTP driver for the load test."""
+
+from __future__ import annotations
+
+import asyncio
+import re
+import time
+from dataclasses import dataclass
+from typing import List, Optional, Tuple
+
+import httpx
+
+from .scenarios import Scenario
+
+_SERVER_TIMING_DB = re.compile(r'db;dur=(?P<dur>[\d.]+);desc="(?P<count>\d+) queries"')
+
+
+@dataclass(frozen=True)
+class Sample:
+    """Outcome of one request."""
+    status: int
+    latency_ms: float
+    queries: Optional[int]
+    db_ms: Optional[float]
+
+    @property
+    def ok(self) -> bool:
+        return 200 <= self.status < 400
+
+
+def parse_server_timing(header: Optional[str]) -> Tuple[Optional[int], Optional[float]]:
+    """Read (query count, database ms) from the API's ``Server-Timing`` header."""
+    match = _SERVER_TIMING_DB.search(header or "")
+    if not match:
+        return None, None
+    return int(match["count"]), float(match["dur"])
+
+
+async def login(client: httpx.AsyncClient, email: str, password: str) -> str:
+    """Return a bearer token for the given account."""
+    response = await client.post("/api/v1/auth/login", data={"username": email, "password": password})
+    response.raise_for_status()
+    return response.json()["access_token"]
+
+
+async def _send(client: httpx.AsyncClient, scenario: Scenario, token: str) -> Sample:
+    request = scenario.build()
+    headers = {"Authorization": f"Bearer {token}"} if request.authenticated else {}
+    start = time.perf_counter()
+    try:
+        response = await client.request(
+            request.method, request.path, params=request.params, data=request.data, headers=headers,
+        )
+        # Exports stream their body; the timing includes reading all of it
+        await response.aread()
+    except httpx.HTTPError:
+        return Sample(status=0, latency_ms=(time.perf_counter() - start) * 1000, queries=None, db_ms=None)
+    latency_ms = (time.perf_counter() - start) * 1000
+    queries, db_ms = parse_server_timing(response.headers.get("server-timing"))
+    return Sample(status=response.status_code, latency_ms=latency_ms, queries=queries, db_ms=db_ms)
+
+
+async def run_scenario(
+    client: httpx.AsyncClient,
+    scenario: Scenario,
+    token: str,
+    requests: int,
+    concurrency: int,
+    warmup: int = 0,
+) -> List[Sample]:
+    """Send ``requests`` requests with ``concurrency`` in flight; warm-up requests are discarded."""
+    for _ in range(warmup):
+        await _send(client, scenario, token)
+
+    samples: List[Sample] = []
+    remaining = requests
+
+    async def worker() -> None:
+        nonlocal remaining
+        while remaining > 0:
+            remaining -= 1
+            samples.append(await _send(client, scenario, token))
+
+    await asyncio.gather(*(worker() for _ in range(max(1, min(concurrency, requests)))))
+    return samples
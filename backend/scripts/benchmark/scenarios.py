@@ -0,0 +1,104 @@
+"""Endpoints driven by the load test."""
+
+from __future__ import annotations
+
+import base64
+import json
+import os
+import random
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional
+
+
+@dataclass(frozen=True)
+class Request:
+    method: str
+    path: str
+    params: Dict[str, object] = field(default_factory=dict)
+    data: Optional[Dict[str, str]] = None
+    authenticated: bool = True
+
+
+@dataclass(frozen=True)
+class Scenario:
+    """A named endpoint; ``build`` returns the next request to send (so ids can rotate)."""
+    name: str
+    build: Callable[[], Request]
+    # Exports stream whole collections; they get fewer requests than the rest
+    weight: float = 1.0
+
+
+@dataclass
+class SeededData:
+    """Identifiers read from the seeded database before the run."""
+    club_ids: List[str]
+    payment_year: int
+
+
+SEARCH_TERMS = ["garcia", "mart", "lopez", "ana", "rodri", "per", "sanchez", "mar"]
+
+
+def _signed_webhook() -> Dict[str, str]:
+    """A Redsys notification for an unknown order.
+
+    Signed with REDSYS_SECRET_KEY when it is set, so the request goes past
+    signature verification; otherwise the server rejects it early.
+    """
+    order_id = f"{random.randint(1000, 9999)}bench{random.randint(0, 999):03d}"
+    params = base64.b64encode(json.dumps({
+        "Ds_Order": order_id,
+        "Ds_Response": "0000",
+        "Ds_Amount": "4500",
+        "Ds_Currency": "978",
+        "Ds_TransactionType": "0",
+        "Ds_AuthorisationCode": "123456",
+    }).encode()).decode()
+    signature = "invalid"
+    if os.getenv("REDSYS_SECRET_KEY"):
+        from src.infrastructure.adapters.services.redsys_service import RedsysService
+        signature = RedsysService()._calculate_signature(params, order_id)
+    return {
+        "Ds_SignatureVersion": "HMAC_SHA256_V1",
+        "Ds_MerchantParameters": params,
+        "Ds_Signature": signature,
+    }
+
+
+def build_scenarios(seeded: SeededData) -> List[Scenario]:
+    """The endpoints exercised by the benchmark, in report order."""
+    def club() -> str:
+        return random.choice(seeded.club_ids)
+
+    def term() -> str:
+        return random.choice(SEARCH_TERMS)
+
+    return [
+        Scenario("dashboard_stats", lambda: Request("GET", "/api/dashboard/stats")),
+        Scenario("members_page", lambda: Request("GET", "/api/v1/members/page", {"limit": 50})),
+        Scenario("members_page_by_club", lambda: Request(
+            "GET", "/api/v1/members/page", {"limit": 50, "club_id": club()},
+        )),
+        Scenario("members_suggest", lambda: Request("GET", "/api/v1/members/suggest", {"q": term()})),
+        Scenario("licenses_list", lambda: Request("GET", "/api/v1/licenses", {"limit": 20})),
+        Scenario("licenses_member_search", lambda: Request(
+            "GET", "/api/v1/licenses", {"limit": 20, "search": term()},
+        )),
+        Scenario("club_payment_summary", lambda: Request(
+            "GET", f"/api/v1/member-payments/club/{club()}/summary", {"payment_year": seeded.payment_year},
+        )),
+        Scenario("all_clubs_payment_summary", lambda: Request(
+            "GET", "/api/v1/member-payments/all-clubs/summary", {"payment_year": seeded.payment_year},
+        )),
+        Scenario("members_export", lambda: Request(
+            "GET", "/api/v1/import-export/members/export", {"club_id": club()},
+        ), weight=0.2),
+        Scenario("licenses_export", lambda: Request(
+            "GET", "/api/v1/import-export/licenses/export", {"club_id": club()},
+        ), weight=0.2),
+        Scenario("payments_export", lambda: Request(
+            "GET", "/api/v1/import-export/payments/export", {"payment_year": seeded.payment_year},
+        ), weight=0.1),
+        Scenario("redsys_webhook", lambda: Request(
+            "POST", "/api/v1/payments/webhook", data=_signed_webhook(), authenticated=False,
+        )),
+    ]
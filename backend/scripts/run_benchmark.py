@@ -0,0 +1,113 @@
+"""CLI: load-test the API against seeded data and record a JSON baseline.
+
+Usage:
+    # 1. Seed a local database at benchmark scale (repeatable with a fixed seed)
+    poetry run python -m scripts.seed_demo_data --scale benchmark --random-seed 42
+    # 2. Start the API against that database, then:
+    poetry run python -m scripts.run_benchmark \\
+        [--base-url http://localhost:8000] [--requests 200] [--concurrency 20] \\
+        [--output benchmarks/latest.json] [--baseline benchmarks/baseline.json]
+
+With --baseline, the run is compared against the stored results and the
+command exits with status 1 on a regression (see scripts.benchmark.report).
+--update-baseline overwrites the baseline with this run instead.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import sys
+from datetime import datetime
+from pathlib import Path
+
+import httpx
+
+from scripts.benchmark.report import (
+    build_report,
+    compare,
+    format_table,
+    load_report,
+    summarize,
+    write_report,
+)
+from scripts.benchmark.runner import login, run_scenario
+from scripts.benchmark.scenarios import SeededData, build_scenarios
+
+
+async def load_seeded_data(client: httpx.AsyncClient, token: str) -> SeededData:
+    response = await client.get("/api/v1/clubs", headers={"Authorization": f"Bearer {token}"})
+    response.raise_for_status()
+    club_ids = [club["id"] for club in response.json()]
+    if not club_ids:
+        raise RuntimeError("No clubs found: seed the database first (scripts.seed_demo_data)")
+    return SeededData(club_ids=club_ids, payment_year=datetime.utcnow().year)
+
+
+async def main_async(args: argparse.Namespace) -> int:
+    limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+    async with httpx.AsyncClient(base_url=args.base_url, timeout=args.timeout, limits=limits) as client:
+        token = await login(client, args.email, args.password)
+        seeded = await load_seeded_data(client, token)
+        print(f"Target: {args.base_url} ({len(seeded.club_ids)} clubs)")
+
+        scenarios = build_scenarios(seeded)
+        if args.scenarios:
+            wanted = set(args.scenarios.split(","))
+            scenarios = [s for s in scenarios if s.name in wanted]
+
+        results = {}
+        for scenario in scenarios:
+            requests = max(1, round(args.requests * scenario.weight))
+            print(f"  {scenario.name}: {requests} requests...")
+            samples = await run_scenario(
+                client, scenario, token, requests, args.concurrency, warmup=args.warmup,
+            )
+            results[scenario.name] = summarize(samples)
+
+    report = build_report(results, scale={"clubs": len(seeded.club_ids)}, concurrency=args.concurrency)
+    print()
+    print(format_table(results))
+
+    if args.output:
+        write_report(report, Path(args.output))
+        print(f"\nResults written to: {args.output}")
+
+    if not args.baseline:
+        return 0
+    baseline_path = Path(args.baseline)
+    if args.update_baseline or not baseline_path.exists():
+        write_report(report, baseline_path)
+        print(f"Baseline written to: {baseline_path}")
+        return 0
+
+    regressions = compare(report, load_report(baseline_path), tolerance=args.tolerance)
+    if regressions:
+        print("\nRegressions against the baseline:")
+        for line in regressions:
+            print(f"  {line}")
+        return 1
+    print("\nNo regressions against the baseline.")
+    return 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--base-url", default="http://localhost:8000", help="Running API to load")
+    parser.add_argument("--email", default="admin@spainaikikai.es", help="Super admin account from the seed")
+    parser.add_argument("--password", default="admin123")
+    parser.add_argument("--requests", type=int, default=200, help="Requests per scenario (scaled by its weight)")
+    parser.add_argument("--concurrency", type=int, default=20, help="Requests in flight per scenario")
+    parser.add_argument("--warmup", type=int, default=3, help="Discarded requests before each scenario")
+    parser.add_argument("--timeout", type=float, default=120.0, help="Per-request timeout in seconds")
+    parser.add_argument("--scenarios", help="Comma-separated scenario names (default: all)")
+    parser.add_argument("--output", default="benchmarks/latest.json", help="Where to write this run's results")
+    parser.add_argument("--baseline", help="Baseline JSON to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="Allowed p95 growth (0.2 = 20%%)")
+    parser.add_argument("--update-baseline", action="store_true", help="Overwrite the baseline with this run")
+    args = parser.parse_args()
+    return asyncio.run(main_async(args))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
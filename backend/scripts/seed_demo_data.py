@@ -2,12 +2,18 @@
 """
 Seed script to populate the database with demo data for Spain Aikikai Admin.
 
-Run with: poetry run python scripts/seed_demo_data.py
+Run with: poetry run python scripts/seed_demo_data.py [--scale benchmark]
+
+The default scale is the small demo dataset; ``--scale benchmark`` (or
+--clubs/--members/--payment-years) seeds the volume used by the load tests.
+Pass --random-seed to get the same dataset on every run.
 """
 
+import argparse
 import asyncio
 import os
 import sys
+from dataclasses import dataclass, replace
 from datetime import datetime, timedelta
 from typing import List, Optional
 import random
@@ -21,6 +27,8 @@ load_dotenv()
 import motor.motor_asyncio
 from passlib.context import CryptContext
 
+from src.application.search.member_search import member_search_keys
+
 # Password hashing
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
@@ -33,12 +41,28 @@ def get_password_hash(password: str) -> str:
 MONGODB_URL = os.getenv("MONGODB_URL", "mongodb://localhost:27017")
 DATABASE_NAME = os.getenv("DATABASE_NAME", "spainaikikai")
 
+PROVINCES = ["Madrid", "Barcelona", "Valencia", "Sevilla", "Vizcaya"]
+
+
+@dataclass(frozen=True)
+class SeedScale:
+    """How much data to generate."""
+    clubs: int = 5
+    members: int = 35
+    payment_years: int = 2
+
+
+SCALES = {
+    "demo": SeedScale(),
+    "benchmark": SeedScale(clubs=300, members=30_000, payment_years=5),
+}
+
 
 async def clear_collections(db):
     """Clear all collections before seeding."""
     collections = [
         "associations", "clubs", "members", "licenses",
-        "insurances", "transactions", "seminars", "users"
+        "insurances", "transactions", "member_payments", "seminars", "users"
     ]
     for collection in collections:
         await db[collection].delete_many({})
@@ -66,8 +90,8 @@ async def seed_association(db) -> str:
     return str(result.inserted_id)
 
 
-async def seed_clubs(db, association_id: str) -> List[str]:
-    """Seed clubs across Spain."""
+async def seed_clubs(db, association_id: str, count: int = 5) -> List[str]:
+    """Seed clubs across Spain; beyond the five named dojos, generic clubs are generated."""
     clubs = [
         {
             "name": "Aikido Dojo Central Madrid",
@@ -139,10 +163,31 @@ async def seed_clubs(db, association_id: str) -> List[str]:
         club_ids.append(str(result.inserted_id))
         print(f"  Created club: {club['name']}")
 
+    extra_clubs = []
+    for n in range(len(clubs), count):
+        province = PROVINCES[n % len(PROVINCES)]
+        extra_clubs.append({
+            "name": f"Club Aikido {province} {n + 1}",
+            "address": f"Calle Mayor {n + 1}",
+            "city": province,
+            "province": province,
+            "postal_code": f"{random.randint(10000, 50000)}",
+            "country": "Spain",
+            "phone": f"+34 9{random.randint(10, 99)} {random.randint(100, 999)} {random.randint(100, 999)}",
+            "email": f"club{n + 1}@aikido-demo.es",
+            "is_active": True,
+            "created_at": datetime.utcnow(),
+            "updated_at": datetime.utcnow(),
+        })
+    if extra_clubs:
+        result = await db.clubs.insert_many(extra_clubs)
+        club_ids.extend(str(club_id) for club_id in result.inserted_ids)
+        print(f"  Created {len(extra_clubs)} generated clubs")
+
     return club_ids
 
 
-async def seed_members(db, club_ids: List[str]) -> List[dict]:
+async def seed_members(db, club_ids: List[str], count: int = 35) -> List[dict]:
     """Seed members distributed across clubs."""
 
     first_names_male = [
@@ -167,20 +212,19 @@ async def seed_members(db, club_ids: List[str]) -> List[dict]:
         "Vizcaya": ["Bilbao", "Barakaldo", "Getxo", "Portugalete"]
     }
 
-    provinces = ["Madrid", "Barcelona", "Valencia", "Sevilla", "Vizcaya"]
     statuses = ["active", "active", "active", "active", "inactive", "pending"]
 
     members = []
     member_data = []
 
-    for i in range(35):
+    for i in range(count):
         is_male = random.random() > 0.4
         first_name = random.choice(first_names_male if is_male else first_names_female)
         last_name1 = random.choice(last_names)
         last_name2 = random.choice(last_names)
 
         club_idx = i % len(club_ids)
-        province = provinces[club_idx]
+        province = PROVINCES[club_idx % len(PROVINCES)]
         city = random.choice(cities_by_province[province])
 
         birth_year = random.randint(1960, 2005)
@@ -207,6 +251,7 @@ async def seed_members(db, club_ids: List[str]) -> List[dict]:
             "created_at": datetime.utcnow() - timedelta(days=registration_days_ago),
             "updated_at": datetime.utcnow()
         }
+        member.update(member_search_keys(first_name, member["last_name"], member["dni"], member["email"]))
         members.append(member)
 
     result = await db.members.insert_many(members)
@@ -347,8 +392,17 @@ async def seed_insurances(db, members: List[dict]):
     print(f"  Created {len(insurances)} insurance policies")
 
 
-async def seed_payments(db, members: List[dict]):
-    """Seed payment records."""
+# Per-member breakdown recorded for completed payments, by payment type
+MEMBER_PAYMENT_TYPES = {
+    "license": ("licencia_kyu", "Licencia Kyu"),
+    "accident_insurance": ("seguro_accidentes", "Seguro de accidentes"),
+    "civil_liability_insurance": ("seguro_rc", "Seguro de responsabilidad civil"),
+    "annual_quota": ("cuota_club", "Cuota anual del club"),
+}
+
+
+async def seed_payments(db, members: List[dict], years: int = 2):
+    """Seed payment records spread over the last ``years`` years."""
 
     payment_types = ["annual_quota", "license", "seminar", "accident_insurance", "civil_liability_insurance"]
     payment_statuses = ["completed", "completed", "completed", "pending", "failed"]
@@ -357,9 +411,9 @@ async def seed_payments(db, members: List[dict]):
 
     for member in members:
         # Annual quota payments
-        num_payments = random.randint(1, 4)
+        num_payments = random.randint(1, 2 * years)
         for i in range(num_payments):
-            days_ago = random.randint(1, 730)
+            days_ago = random.randint(1, 365 * years)
             payment_date = datetime.utcnow() - timedelta(days=days_ago)
             status = random.choice(payment_statuses)
 
@@ -383,10 +437,31 @@ async def seed_payments(db, members: List[dict]):
             }
             payments.append(payment)
 
-    if payments:
-        await db.transactions.insert_many(payments)
+    if not payments:
+        return
+    result = await db.transactions.insert_many(payments)
     print(f"  Created {len(payments)} payments")
 
+    member_payments = []
+    for payment, payment_id in zip(payments, result.inserted_ids):
+        if payment["status"] != "completed" or payment["payment_type"] not in MEMBER_PAYMENT_TYPES:
+            continue
+        payment_type, concept = MEMBER_PAYMENT_TYPES[payment["payment_type"]]
+        member_payments.append({
+            "payment_id": str(payment_id),
+            "member_id": payment["member_id"],
+            "payment_year": payment["payment_year"],
+            "payment_type": payment_type,
+            "concept": concept,
+            "amount": payment["amount"],
+            "status": "completed",
+            "created_at": payment["created_at"],
+            "updated_at": datetime.utcnow(),
+        })
+    if member_payments:
+        await db.member_payments.insert_many(member_payments)
+    print(f"  Created {len(member_payments)} member payment records")
+
 
 async def seed_seminars(db, club_ids: List[str], association_id: str):
     """Seed seminars (upcoming, ongoing, completed)."""
@@ -605,14 +680,14 @@ async def seed_users(db, club_ids: List[str], members: List[dict]):
           f"(2 super_admin, 3 club admins linked to members)")
 
 
-async def main():
-    """Main seed function."""
-    print("\n" + "="*60)
-    print("  SPAIN AIKIKAI ADMIN - Demo Data Seeder")
-    print("="*60 + "\n")
+async def seed(scale: SeedScale = SCALES["demo"], random_seed: Optional[int] = None) -> None:
+    """Clear the database and seed it at the given scale."""
+    if random_seed is not None:
+        random.seed(random_seed)
 
     print(f"Connecting to MongoDB: {MONGODB_URL}")
-    print(f"Database: {DATABASE_NAME}\n")
+    print(f"Database: {DATABASE_NAME}")
+    print(f"Scale: {scale.clubs} clubs, {scale.members} members, {scale.payment_years} years of payments\n")
 
     client = motor.motor_asyncio.AsyncIOMotorClient(MONGODB_URL)
     db = client[DATABASE_NAME]
@@ -631,10 +706,10 @@ async def main():
         association_id = await seed_association(db)
 
         print("\nStep 3: Creating Clubs...")
-        club_ids = await seed_clubs(db, association_id)
+        club_ids = await seed_clubs(db, association_id, scale.clubs)
 
         print("\nStep 4: Creating Members...")
-        members = await seed_members(db, club_ids)
+        members = await seed_members(db, club_ids, scale.members)
 
         print("\nStep 5: Creating Licenses...")
         await seed_licenses(db, members, association_id)
@@ -643,7 +718,7 @@ async def main():
         await seed_insurances(db, members)
 
         print("\nStep 7: Creating Payments...")
-        await seed_payments(db, members)
+        await seed_payments(db, members, scale.payment_years)
 
         print("\nStep 8: Creating Seminars...")
         await seed_seminars(db, club_ids, association_id)
@@ -651,16 +726,6 @@ async def main():
         print("\nStep 9: Creating Users...")
         await seed_users(db, club_ids, members)
 
-        print("\n" + "="*60)
-        print("  SEED COMPLETED SUCCESSFULLY!")
-        print("="*60)
-        print("\nDemo Accounts:")
-        print("-"*40)
-        print("  Admin:      admin@spainaikikai.es / admin123")
-        print("  Demo:       demo@spainaikikai.es / demo123")
-        print("  Club Dir:   director@aikido-madrid.es / demo123")
-        print("-"*40 + "\n")
-
     except Exception as e:
         print(f"\nError during seeding: {e}")
         raise
@@ -668,5 +733,49 @@ async def main():
         client.close()
 
 
+def parse_scale(args: argparse.Namespace) -> SeedScale:
+    """Start from the named scale and apply the individual overrides."""
+    overrides = {
+        name: value
+        for name, value in (
+            ("clubs", args.clubs), ("members", args.members), ("payment_years", args.payment_years),
+        )
+        if value is not None
+    }
+    return replace(SCALES[args.scale], **overrides)
+
+
+def add_scale_arguments(parser: argparse.ArgumentParser) -> None:
+    """Register the --scale/--clubs/--members/--payment-years/--random-seed options."""
+    parser.add_argument("--scale", choices=sorted(SCALES), default="demo", help="Named dataset size")
+    parser.add_argument("--clubs", type=int, help="Number of clubs (at least 5)")
+    parser.add_argument("--members", type=int, help="Number of members")
+    parser.add_argument("--payment-years", type=int, help="Years of payment history")
+    parser.add_argument("--random-seed", type=int, help="Seed for a repeatable dataset")
+
+
+async def main():
+    """Main seed function."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    add_scale_arguments(parser)
+    args = parser.parse_args()
+
+    print("\n" + "="*60)
+    print("  SPAIN AIKIKAI ADMIN - Demo Data Seeder")
+    print("="*60 + "\n")
+
+    await seed(parse_scale(args), args.random_seed)
+
+    print("\n" + "="*60)
+    print("  SEED COMPLETED SUCCESSFULLY!")
+    print("="*60)
+    print("\nDemo Accounts:")
+    print("-"*40)
+    print("  Admin:      admin@spainaikikai.es / admin123")
+    print("  Demo:       demo@spainaikikai.es / demo123")
+    print("  Club Dir:   director@aikido-madrid.es / demo123")
+    print("-"*40 + "\n")
+
+
 if __name__ == "__main__":
     asyncio.run(main())
@@ -14,6 +14,10 @@ from .excel_loader import (
 )
 from .matcher import Matcher
 from .normalizers import fuzzy_norm
+from src.application.search.member_search import member_search_keys
+
+# Member fields the stored search keys are derived from
+SEARCH_SOURCE_FIELDS = ("first_name", "last_name", "dni", "email")
 
 
 @dataclass
@@ -111,6 +115,10 @@ def _build_member_update_fields(
     if excel.num_socio and excel.num_socio != prod.get("member_number"):
         fields["member_number"] = excel.num_socio
 
+    if any(key in fields for key in SEARCH_SOURCE_FIELDS):
+        merged = {**prod, **fields}
+        fields.update(member_search_keys(*(merged.get(key) for key in SEARCH_SOURCE_FIELDS)))
+
     return fields
 
 
@@ -231,10 +239,12 @@ class Planner:
             birth = datetime.combine(ex.birth_date, datetime.min.time()).replace(
                 tzinfo=timezone.utc
             )
+        last_name = f"{ex.last1} {ex.last2}".strip()
+        dni = _norm_for_write(ex.dni_raw)
         return {
             "first_name": ex.first_name,
-            "last_name": f"{ex.last1} {ex.last2}".strip(),
-            "dni": _norm_for_write(ex.dni_raw),
+            "last_name": last_name,
+            "dni": dni,
             "email": ex.email,
             "phone": ex.phone,
             "address": ex.address,
@@ -250,6 +260,7 @@ class Planner:
             "registration_date": None,
             "created_at": now,
             "updated_at": now,
+            **member_search_keys(ex.first_name, last_name, dni, ex.email),
             "__excel_num_socio": ex.num_socio,
         }
 
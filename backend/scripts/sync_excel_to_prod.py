@@ -24,20 +24,32 @@ from scripts.sync.reporter import print_summary, write_report
 from scripts.sync.writer import execute_plan
 
 
+# Documents fetched per round trip while loading the prod snapshot
+SNAPSHOT_BATCH_SIZE = 1000
+
+
 async def load_prod_snapshot(db) -> tuple[list, list, dict, dict, dict]:
-    clubs = await db["clubs"].find({}).to_list(length=None)
-    members = await db["members"].find({}).to_list(length=None)
-    licenses_list = await db["licenses"].find({}).to_list(length=None)
-    licenses = {str(l["member_id"]): l for l in licenses_list if l.get("member_id")}
-    insurances_list = await db["insurances"].find({}).to_list(length=None)
+    """Load the prod collections the planner compares against.
+
+    Cursors are consumed in batches and indexed as they arrive, so no
+    intermediate list of every license, insurance or payment is kept.
+    """
+    def _stream(name: str):
+        return db[name].find({}).batch_size(SNAPSHOT_BATCH_SIZE)
+
+    clubs = [c async for c in _stream("clubs")]
+    members = [m async for m in _stream("members")]
+    licenses = {
+        str(l["member_id"]): l
+        async for l in _stream("licenses") if l.get("member_id")
+    }
     insurances = {
         (str(i["member_id"]), i.get("insurance_type", "")): i
-        for i in insurances_list if i.get("member_id")
+        async for i in _stream("insurances") if i.get("member_id")
     }
-    payments_list = await db["member_payments"].find({}).to_list(length=None)
     payments = {
         (str(p["member_id"]), p.get("payment_year"), p.get("payment_type")): p
-        for p in payments_list if p.get("member_id")
+        async for p in _stream("member_payments") if p.get("member_id")
     }
     return clubs, members, licenses, insurances, payments
 
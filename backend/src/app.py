@@ -1,12 +1,20 @@
 """FastAPI application using hexagonal architecture."""
 
+from dotenv import load_dotenv
+load_dotenv()
+
+# Must run before the first pydantic model is defined (FastAPI defines some)
+from src.config.logfire import skip_unused_pydantic_plugin
+skip_unused_pydantic_plugin()
+
 from contextlib import asynccontextmanager
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 from fastapi.staticfiles import StaticFiles
 from pathlib import Path
 import logging
+import os
 
 logger = logging.getLogger(__name__)
 
@@ -25,29 +33,87 @@ from src.infrastructure.web.routers.invoices import router as invoices_router
 from src.infrastructure.web.routers.notifications import router as notifications_router
 from src.infrastructure.web.routers.password_reset import router as password_reset_router
 from src.infrastructure.web.routers.member_payments import router as member_payments_router
+from src.infrastructure.web.middleware import (
+    CompressionMiddleware,
+    PrometheusMiddleware,
+    QueryMetricsMiddleware,
+)
+from src.infrastructure.web.responses import PydanticJSONResponse
 from src.config.logfire import configure_logfire
 from src.config.settings import AppSettings
-from dotenv import load_dotenv
-load_dotenv()
 
 # Global scheduler instance
 _scheduler = None
+# Lease electing the worker that runs the scheduled jobs
+_scheduler_lease = None
+# Global member suggestion refresher instance
+_suggestion_refresher = None
+# Relay of cache invalidations between workers
+_worker_invalidation = None
+# Global payment fulfillment sweeper instance
+_fulfillment_sweeper = None
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Lifespan context manager for startup and shutdown events."""
-    global _scheduler
+    global _scheduler, _scheduler_lease, _suggestion_refresher, _worker_invalidation, _fulfillment_sweeper
 
     # Startup
-    try:
-        from src.infrastructure.scheduler import create_notification_scheduler
-        _scheduler = create_notification_scheduler()
-        if _scheduler:
-            await _scheduler.start()
-            logger.info("Notification scheduler started successfully")
-    except Exception as e:
-        logger.error(f"Failed to start notification scheduler: {e}")
+    from src.infrastructure.startup import startup_phases
+    from src.infrastructure.workers import check_worker_safety
+    check_worker_safety()
+
+    from src.infrastructure.database import close_database_connection, connect_to_database
+    with startup_phases.phase("database"):
+        try:
+            await connect_to_database()
+        except Exception as e:
+            logger.error(f"MongoDB warm-up ping failed: {e}")
+
+    from src.infrastructure.indexes import ensure_indexes
+    with startup_phases.phase("indexes"):
+        await ensure_indexes()
+
+    with startup_phases.phase("background_tasks"):
+        try:
+            from src.infrastructure.web.dependencies import get_worker_invalidation
+            _worker_invalidation = get_worker_invalidation()
+            await _worker_invalidation.start()
+        except Exception as e:
+            logger.error(f"Failed to start worker invalidation: {e}")
+
+        try:
+            from src.infrastructure.scheduler import create_member_suggestion_refresher
+            _suggestion_refresher = create_member_suggestion_refresher()
+            await _suggestion_refresher.start()
+        except Exception as e:
+            logger.error(f"Failed to start member suggestion refresher: {e}")
+
+        try:
+            from src.infrastructure.scheduler import create_scheduler_lease
+            _scheduler_lease = create_scheduler_lease()
+            await _scheduler_lease.start()
+        except Exception as e:
+            logger.error(f"Failed to start scheduler lease: {e}")
+
+        try:
+            from src.infrastructure.scheduler import create_fulfillment_sweeper
+            _fulfillment_sweeper = create_fulfillment_sweeper(leader_lease=_scheduler_lease)
+            await _fulfillment_sweeper.start()
+        except Exception as e:
+            logger.error(f"Failed to start fulfillment sweeper: {e}")
+
+        try:
+            from src.infrastructure.scheduler import create_notification_scheduler
+            _scheduler = create_notification_scheduler(leader_lease=_scheduler_lease)
+            if _scheduler:
+                await _scheduler.start()
+                logger.info("Notification scheduler started successfully")
+        except Exception as e:
+            logger.error(f"Failed to start notification scheduler: {e}")
+
+    startup_phases.report()
 
     yield
 
@@ -55,6 +121,33 @@ async def lifespan(app: FastAPI):
     if _scheduler:
         await _scheduler.stop()
         logger.info("Notification scheduler stopped")
+    if _fulfillment_sweeper:
+        await _fulfillment_sweeper.stop()
+    if _scheduler_lease:
+        await _scheduler_lease.stop()
+    await _drain_fulfillments()
+    if _suggestion_refresher:
+        await _suggestion_refresher.stop()
+    if _worker_invalidation:
+        await _worker_invalidation.stop()
+    await close_database_connection()
+    logger.info("MongoDB connection closed")
+
+
+async def _drain_fulfillments() -> None:
+    """Give the payment fulfillments still running a chance to finish before the database closes."""
+    from src.infrastructure.web.dependencies import get_process_redsys_webhook_use_case
+    timeout = float(os.getenv("FULFILLMENT_DRAIN_SECONDS", "20"))
+    try:
+        finished = await get_process_redsys_webhook_use_case().wait_for_background_tasks(timeout=timeout)
+    except Exception as e:
+        logger.error(f"Failed to wait for payment fulfillments: {e}")
+        return
+    if not finished:
+        logger.warning(
+            f"Payment fulfillments still running after {timeout:.0f}s; "
+            "the fulfillment sweeper resumes their unfinished steps"
+        )
 
 
 def get_scheduler():
@@ -69,6 +162,7 @@ def create_app() -> FastAPI:
         description="A FastAPI application implementing hexagonal architecture for Aikido association management",
         version="1.0.0",
         lifespan=lifespan,
+        default_response_class=PydanticJSONResponse,
     )
 
     configure_logfire(app)
@@ -105,6 +199,15 @@ def create_app() -> FastAPI:
     ]
     if settings.frontend_base_url and settings.frontend_base_url not in cors_origins:
         cors_origins.append(settings.frontend_base_url)
+    app.add_middleware(
+        CompressionMiddleware,
+        minimum_size=int(os.getenv("COMPRESSION_MINIMUM_SIZE", "1000")),
+    )
+    app.add_middleware(PrometheusMiddleware)
+    app.add_middleware(
+        QueryMetricsMiddleware,
+        repeat_threshold=int(os.getenv("QUERY_REPEAT_THRESHOLD", "10")),
+    )
     app.add_middleware(
         CORSMiddleware,
         allow_origins=cors_origins,
@@ -141,5 +244,24 @@ def create_app() -> FastAPI:
     @app.get("/api/v1/health")
     async def health_check():
         return {"status": "healthy", "architecture": "hexagonal"}
+
+    @app.get("/api/v1/health/database")
+    async def database_health_check():
+        from src.infrastructure.database import get_pool_metrics, ping_database
+        try:
+            latency_ms = await ping_database()
+        except Exception as e:
+            return JSONResponse(status_code=503, content={"status": "unavailable", "detail": str(e)})
+        return {
+            "status": "healthy",
+            "ping_ms": round(latency_ms, 2),
+            "pools": get_pool_metrics().snapshot(),
+        }
+
+    @app.get("/metrics", include_in_schema=False)
+    async def metrics():
+        from src.infrastructure.monitoring.prometheus import render_metrics
+        body, content_type = render_metrics()
+        return Response(content=body, media_type=content_type)
     
     return app
\ No newline at end of file
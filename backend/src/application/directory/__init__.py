@@ -0,0 +1,6 @@
+# Directories: per-process copies of small, rarely changing reference data
+from .club_directory import ClubDirectory
+
+__all__ = [
+    "ClubDirectory",
+]
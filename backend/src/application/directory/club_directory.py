@@ -0,0 +1,118 @@
+"""In-process directory of clubs."""
+
+import asyncio
+import copy
+import time
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional
+
+from src.domain.entities.club import Club
+from src.application.ports.club_repository import ClubRepositoryPort
+from src.application.ports.read_routing import ReadRouting, read_routing
+from src.application.read_models.collection_version import CollectionVersion
+from src.application.search.normalizers import norm_name
+
+
+class _Snapshot:
+    """One load of the club collection: clubs by id and ids by normalized name."""
+
+    def __init__(self, clubs: List[Club]):
+        self.clubs = sorted(clubs, key=lambda club: norm_name(club.name))
+        self.by_id: Dict[str, Club] = {club.id: club for club in clubs if club.id}
+        self.id_by_name: Dict[str, str] = {}
+        for club in self.clubs:
+            self.id_by_name.setdefault(norm_name(club.name), club.id)
+        stamps = [club.updated_at for club in clubs if club.updated_at]
+        self.version = CollectionVersion(count=len(clubs), last_modified=max(stamps) if stamps else None)
+
+
+class ClubDirectory:
+    """Per-process copy of every club, for lookups by id and by name.
+
+    Clubs are a few hundred rows that rarely change and are read on almost
+    every request, so the whole collection is loaded at once and kept for
+    ``ttl_seconds``. The club use cases call ``written`` after a write,
+    which invalidates it and, through ``publish``, tells the other workers
+    to do the same; writes made by scripts show up once the TTL expires.
+    Concurrent callers that find it missing or expired share one load.
+    Clubs are copied on the way out, so callers may mutate them.
+    """
+
+    def __init__(
+        self,
+        club_repository: ClubRepositoryPort,
+        ttl_seconds: float = 60.0,
+        clock: Callable[[], float] = time.monotonic,
+        publish: Optional[Callable[[], Awaitable[Any]]] = None,
+    ):
+        self.club_repository = club_repository
+        self.ttl_seconds = ttl_seconds
+        self.publish = publish
+        self._clock = clock
+        self._lock = asyncio.Lock()
+        self._snapshot: Optional[_Snapshot] = None
+        self._loaded_at = 0.0
+        # Bumped by invalidate, so a load that was already reading when a
+        # write happened is not kept as fresh
+        self._generation = 0
+
+    def invalidate(self) -> None:
+        """Drop the loaded clubs; the next lookup reloads them."""
+        self._generation += 1
+        self._snapshot = None
+
+    async def written(self) -> None:
+        """Invalidate after a club write, here and in the other workers."""
+        self.invalidate()
+        if self.publish:
+            await self.publish()
+
+    def _fresh(self) -> Optional[_Snapshot]:
+        if self._snapshot is not None and self._clock() - self._loaded_at < self.ttl_seconds:
+            return self._snapshot
+        return None
+
+    async def _load(self) -> _Snapshot:
+        snapshot = self._fresh()
+        if snapshot is not None:
+            return snapshot
+        async with self._lock:
+            snapshot = self._fresh()
+            if snapshot is not None:
+                return snapshot
+            generation = self._generation
+            # The load is shared by every later caller, so it must not
+            # inherit a reporting caller's tolerance for a lagging secondary
+            with read_routing(ReadRouting.PRIMARY):
+                clubs = await self.club_repository.find_all()
+            snapshot = _Snapshot(clubs)
+            if generation == self._generation:
+                self._snapshot = snapshot
+                self._loaded_at = self._clock()
+            return snapshot
+
+    async def get(self, club_id: Optional[str]) -> Optional[Club]:
+        """The club with the given id, or None."""
+        club = (await self._load()).by_id.get(club_id) if club_id else None
+        return copy.copy(club) if club else None
+
+    async def get_many(self, club_ids: Iterable[str]) -> Dict[str, Club]:
+        """Map each of the given ids that belongs to a club to that club."""
+        by_id = (await self._load()).by_id
+        return {club_id: copy.copy(by_id[club_id]) for club_id in club_ids if club_id in by_id}
+
+    async def all(self) -> List[Club]:
+        """Every club, ordered by name."""
+        return [copy.copy(club) for club in (await self._load()).clubs]
+
+    async def names_by_id(self, club_ids: Iterable[str]) -> Dict[str, str]:
+        """Map each of the given ids that belongs to a club to the club's name."""
+        by_id = (await self._load()).by_id
+        return {club_id: by_id[club_id].name for club_id in club_ids if club_id in by_id}
+
+    async def version(self) -> CollectionVersion:
+        """Version of the clubs being served, for ETags of responses built from them."""
+        return (await self._load()).version
+
+    async def id_for_name(self, name: str) -> Optional[str]:
+        """Id of the club with this name, ignoring case and accents."""
+        return (await self._load()).id_by_name.get(norm_name(name))
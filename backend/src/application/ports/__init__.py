@@ -10,6 +10,11 @@ from .insurance_repository import InsuranceRepositoryPort
 from .price_configuration_repository import PriceConfigurationRepositoryPort
 from .invoice_repository import InvoiceRepositoryPort
 from .password_reset_token_repository import PasswordResetTokenRepositoryPort
+from .payment_fulfillment_repository import PaymentFulfillmentRepositoryPort
+from .webhook_ledger_repository import WebhookLedgerRepositoryPort
+from .query_spec import QuerySpec
+from .read_routing import ReadRouting, current_read_routing, read_routing, reporting
+from .cache import CachePort, cached
 from .email_service import EmailServicePort, EmailMessage, EmailAttachment
 from .pdf_service import PDFServicePort
 from .license_image_service import LicenseImageServicePort, LicenseImageData
@@ -32,6 +37,15 @@ __all__ = [
     "PriceConfigurationRepositoryPort",
     "InvoiceRepositoryPort",
     "PasswordResetTokenRepositoryPort",
+    "PaymentFulfillmentRepositoryPort",
+    "WebhookLedgerRepositoryPort",
+    "QuerySpec",
+    "ReadRouting",
+    "current_read_routing",
+    "read_routing",
+    "reporting",
+    "CachePort",
+    "cached",
     "EmailServicePort",
     "EmailMessage",
     "EmailAttachment",
@@ -0,0 +1,72 @@
+"""Cache port and the decorator caching use case methods through it."""
+
+import functools
+import inspect
+from abc import ABC, abstractmethod
+from typing import Any, Awaitable, Callable, Iterable, Optional
+
+
+class CachePort(ABC):
+    """Port for a namespaced cache of computed values."""
+
+    @abstractmethod
+    async def get_or_load(
+        self,
+        key: str,
+        loader: Callable[[], Awaitable[Any]],
+        ttl: Optional[float] = None,
+        tags: Iterable[str] = (),
+    ) -> Any:
+        """Return the cached value for key, or await loader and cache its result.
+
+        Concurrent misses for the same key share a single call to loader.
+
+        Args:
+            key: Cache key, unique within the cache.
+            loader: Coroutine function computing the value on a miss.
+            ttl: Seconds the value stays valid; the cache default if None.
+            tags: Tags to invalidate the value by.
+        """
+        pass
+
+    @abstractmethod
+    async def delete(self, key: str) -> None:
+        """Drop the value cached for key."""
+        pass
+
+    @abstractmethod
+    async def invalidate_tags(self, *tags: str) -> None:
+        """Drop every value cached with any of the tags."""
+        pass
+
+
+def cached(
+    key: Callable[..., str],
+    ttl: Optional[float] = None,
+    tags: Optional[Callable[..., Iterable[str]]] = None,
+    attribute: str = "cache",
+):
+    """Cache the results of an async use case method.
+
+    ``key`` (and ``tags``, if given) receive the method's arguments without
+    ``self``. The cache is read from the instance attribute named by
+    ``attribute``; when it is None the method always runs.
+    """
+    def decorator(func):
+        if not inspect.iscoroutinefunction(func):
+            raise TypeError(f"@cached needs an async function, got {func!r}")
+
+        @functools.wraps(func)
+        async def wrapper(self, *args, **kwargs):
+            cache: Optional[CachePort] = getattr(self, attribute, None)
+            if cache is None:
+                return await func(self, *args, **kwargs)
+            return await cache.get_or_load(
+                key(*args, **kwargs),
+                lambda: func(self, *args, **kwargs),
+                ttl=ttl,
+                tags=tags(*args, **kwargs) if tags else (),
+            )
+
+        return wrapper
+    return decorator
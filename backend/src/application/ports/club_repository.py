@@ -4,6 +4,7 @@ from abc import ABC, abstractmethod
 from typing import List, Optional
 
 from src.domain.entities.club import Club
+from src.application.read_models.collection_version import CollectionVersion
 
 
 class ClubRepositoryPort(ABC):
@@ -53,3 +54,8 @@ class ClubRepositoryPort(ABC):
     async def exists(self, club_id: str) -> bool:
         """Check if a club exists."""
         pass
+
+    @abstractmethod
+    async def get_collection_version(self, club_id: Optional[str] = None) -> CollectionVersion:
+        """Fingerprint all clubs, or a single one, for conditional GETs."""
+        pass
@@ -1,9 +1,10 @@
 """Repository port interfaces for Insurance domain."""
 
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import AsyncIterator, List, Optional
 
 from src.domain.entities.insurance import Insurance, InsuranceStatus, InsuranceType
+from src.application.read_models.collection_version import CollectionVersion
 
 
 class InsuranceRepositoryPort(ABC):
@@ -14,6 +15,18 @@ class InsuranceRepositoryPort(ABC):
         """Find all insurances."""
         pass
 
+    @abstractmethod
+    def iter_all(self, batch_size: int = 500) -> AsyncIterator[Insurance]:
+        """Stream all insurances, fetching batch_size documents per round trip."""
+        pass
+
+    @abstractmethod
+    def iter_by_member_ids(
+        self, member_ids: List[str], batch_size: int = 500
+    ) -> AsyncIterator[Insurance]:
+        """Stream the insurances of the given members."""
+        pass
+
     @abstractmethod
     async def find_by_id(self, insurance_id: str) -> Optional[Insurance]:
         """Find an insurance by ID."""
@@ -61,6 +74,11 @@ class InsuranceRepositoryPort(ABC):
         """Create a new insurance."""
         pass
 
+    @abstractmethod
+    async def create_bulk(self, insurances: List[Insurance]) -> List[Insurance]:
+        """Create several insurances in a single write."""
+        pass
+
     @abstractmethod
     async def update(self, insurance: Insurance) -> Insurance:
         """Update an existing insurance."""
@@ -75,3 +93,8 @@ class InsuranceRepositoryPort(ABC):
     async def exists(self, insurance_id: str) -> bool:
         """Check if an insurance exists."""
         pass
+
+    @abstractmethod
+    async def get_collection_version(self) -> CollectionVersion:
+        """Fingerprint all insurances for conditional GETs."""
+        pass
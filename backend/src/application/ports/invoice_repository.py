@@ -5,6 +5,7 @@ from typing import List, Optional
 from datetime import date
 
 from src.domain.entities.invoice import Invoice, InvoiceStatus
+from src.application.read_models.page import Page
 
 
 class InvoiceRepositoryPort(ABC):
@@ -15,6 +16,17 @@ class InvoiceRepositoryPort(ABC):
         """Find all invoices."""
         pass
 
+    @abstractmethod
+    async def find_page(
+        self,
+        limit: int,
+        cursor: Optional[str] = None,
+        status: Optional[InvoiceStatus] = None,
+        club_id: Optional[str] = None,
+    ) -> Page[Invoice]:
+        """Find one page of invoices, newest first, starting after cursor."""
+        pass
+
     @abstractmethod
     async def find_by_id(self, invoice_id: str) -> Optional[Invoice]:
         """Find an invoice by ID."""
@@ -1,9 +1,11 @@
 """Repository port interfaces for License domain."""
 
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import AsyncIterator, List, Optional
 
 from src.domain.entities.license import License, LicenseStatus, LicenseType
+from src.application.read_models.license_ref import LicenseRef
+from src.application.read_models.collection_version import CollectionVersion
 
 
 class LicenseRepositoryPort(ABC):
@@ -14,6 +16,23 @@ class LicenseRepositoryPort(ABC):
         """Find all licenses."""
         pass
 
+    @abstractmethod
+    def iter_all(self, batch_size: int = 500) -> AsyncIterator[License]:
+        """Stream all licenses, fetching batch_size documents per round trip."""
+        pass
+
+    @abstractmethod
+    def iter_by_member_ids(
+        self, member_ids: List[str], batch_size: int = 500
+    ) -> AsyncIterator[License]:
+        """Stream the licenses of the given members."""
+        pass
+
+    @abstractmethod
+    def iter_by_club_id(self, club_id: str, batch_size: int = 500) -> AsyncIterator[License]:
+        """Stream the licenses of a club's members."""
+        pass
+
     @abstractmethod
     async def find_by_id(self, license_id: str) -> Optional[License]:
         """Find a license by ID."""
@@ -34,6 +53,11 @@ class LicenseRepositoryPort(ABC):
         """Find licenses by a list of member IDs."""
         pass
 
+    @abstractmethod
+    async def find_refs_by_member_ids(self, member_ids: List[str]) -> List[LicenseRef]:
+        """Find slim references to the licenses of a list of members."""
+        pass
+
     @abstractmethod
     async def find_by_club_id(self, club_id: str, limit: int = 0) -> List[License]:
         """Find licenses by club ID."""
@@ -67,6 +91,22 @@ class LicenseRepositoryPort(ABC):
         """Count licenses with license_number starting with the given prefix."""
         pass
 
+    @abstractmethod
+    async def reserve_license_numbers(self, prefix: str, count: int) -> List[str]:
+        """Atomically reserve ``count`` consecutive license numbers for a prefix.
+
+        Returns the reserved numbers in order (e.g. LIC-2026-0001, LIC-2026-0002).
+        """
+        pass
+
+    @abstractmethod
+    async def upsert_bulk(self, licenses: List[License]) -> List[License]:
+        """Create new licenses and update existing ones in a single write.
+
+        Licenses without an id are created; the rest are updated by id.
+        """
+        pass
+
     @abstractmethod
     async def create(self, license: License) -> License:
         """Create a new license."""
@@ -86,3 +126,8 @@ class LicenseRepositoryPort(ABC):
     async def exists(self, license_id: str) -> bool:
         """Check if a license exists."""
         pass
+
+    @abstractmethod
+    async def get_collection_version(self) -> CollectionVersion:
+        """Fingerprint all licenses for conditional GETs."""
+        pass
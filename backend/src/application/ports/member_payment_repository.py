@@ -1,11 +1,19 @@
 """Repository port interface for MemberPayment domain."""
 
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import AsyncIterator, List, Optional
 
 from src.domain.entities.member_payment import MemberPayment, MemberPaymentType, MemberPaymentStatus
 
 
+class PartialBulkWriteError(Exception):
+    """A bulk write stopped at a failing payment; the payments before it were written."""
+
+    def __init__(self, written: int, message: str):
+        self.written = written
+        super().__init__(message)
+
+
 class MemberPaymentRepositoryPort(ABC):
     """Port for member payment repository operations.
 
@@ -20,7 +28,11 @@ class MemberPaymentRepositoryPort(ABC):
 
     @abstractmethod
     async def create_bulk(self, payments: List[MemberPayment]) -> List[MemberPayment]:
-        """Create multiple member payment records in bulk."""
+        """Create member payment records in bulk, one per (payment, member, payment type).
+
+        Keys already stored keep their record, which is returned instead,
+        so repeating the call with the same payments creates nothing new.
+        """
         pass
 
     @abstractmethod
@@ -57,6 +69,20 @@ class MemberPaymentRepositoryPort(ABC):
         """Find all member payments for a list of members in a specific year."""
         pass
 
+    @abstractmethod
+    def iter_by_year(self, payment_year: int, batch_size: int = 500) -> AsyncIterator[MemberPayment]:
+        """Stream every member payment of a year, fetching batch_size documents per round trip."""
+        pass
+
+    @abstractmethod
+    async def find_by_member_ids_years(
+        self,
+        member_ids: List[str],
+        payment_years: List[int]
+    ) -> List[MemberPayment]:
+        """Find all member payments for a list of members across several years."""
+        pass
+
     @abstractmethod
     async def find_by_payment_id(self, payment_id: str) -> List[MemberPayment]:
         """Find all member payments linked to a parent payment."""
@@ -67,6 +93,19 @@ class MemberPaymentRepositoryPort(ABC):
         """Update a member payment record."""
         pass
 
+    @abstractmethod
+    async def upsert_bulk(self, payments: List[MemberPayment]) -> List[MemberPayment]:
+        """
+        Create or update multiple member payment records in one bulk write.
+
+        Payments without an ID are assigned a new one, so every write is an
+        upsert keyed by _id. Returns the payments with their IDs set.
+
+        Payments are written in order. When one fails, the write stops there
+        and PartialBulkWriteError reports how many were written before it.
+        """
+        pass
+
     @abstractmethod
     async def update_status_by_payment_id(
         self,
@@ -1,9 +1,13 @@
 """Repository port interfaces for Member domain."""
 
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import AsyncIterator, Iterable, List, Optional
 
 from src.domain.entities.member import Member, MemberStatus
+from src.application.read_models.member_ref import MemberRef
+from src.application.ports.query_spec import QuerySpec
+from src.application.read_models.page import Page
+from src.application.read_models.collection_version import CollectionVersion
 
 
 class MemberRepositoryPort(ABC):
@@ -14,16 +18,52 @@ class MemberRepositoryPort(ABC):
         """Find all members."""
         pass
 
+    @abstractmethod
+    def iter_all(self, batch_size: int = 500) -> AsyncIterator[Member]:
+        """Stream all members, fetching batch_size documents per round trip."""
+        pass
+
+    @abstractmethod
+    def iter_by_club_id(self, club_id: str, batch_size: int = 500) -> AsyncIterator[Member]:
+        """Stream the members of a club, fetching batch_size documents per round trip."""
+        pass
+
+    @abstractmethod
+    async def find_by_spec(self, spec: QuerySpec) -> List[Member]:
+        """Find members matching a query spec (filters, sort and limit in one query).
+
+        ``dni`` and ``email`` filters compare against normalized values, so
+        pass them through ``norm_dni`` / ``normalize_email``.
+        """
+        pass
+
+    @abstractmethod
+    async def find_page(
+        self, limit: int, cursor: Optional[str] = None, club_id: Optional[str] = None
+    ) -> Page[Member]:
+        """Find one page of members ordered by last name, starting after cursor."""
+        pass
+
     @abstractmethod
     async def find_by_id(self, member_id: str) -> Optional[Member]:
         """Find a member by ID."""
         pass
 
+    @abstractmethod
+    async def find_by_ids(self, member_ids: List[str]) -> List[Member]:
+        """Find members whose ID is in the given list."""
+        pass
+
     @abstractmethod
     async def find_by_dni(self, dni: str) -> Optional[Member]:
         """Find a member by DNI."""
         pass
 
+    @abstractmethod
+    async def find_by_dnis(self, dnis: List[str]) -> List[Member]:
+        """Find members whose DNI is in the given list."""
+        pass
+
     @abstractmethod
     async def find_by_email(self, email: str) -> Optional[Member]:
         """Find a member by email."""
@@ -40,8 +80,12 @@ class MemberRepositoryPort(ABC):
         pass
 
     @abstractmethod
-    async def search_by_name(self, name: str, limit: int = 0) -> List[Member]:
-        """Search members by name."""
+    async def search_by_name(self, name: str, spec: Optional[QuerySpec] = None) -> List[Member]:
+        """Search members whose name words start with the words of ``name``.
+
+        Matching ignores case and accents. The spec adds filters, sort and
+        limit to the same query.
+        """
         pass
 
     @abstractmethod
@@ -63,3 +107,28 @@ class MemberRepositoryPort(ABC):
     async def exists(self, member_id: str) -> bool:
         """Check if a member exists."""
         pass
+
+    @abstractmethod
+    async def find_refs_by_club_id(
+        self, club_id: str, extra_fields: Iterable[str] = ()
+    ) -> List[MemberRef]:
+        """Find slim references to the members of a club.
+
+        Args:
+            club_id: The club whose members to return.
+            extra_fields: Optional MemberRef fields to load on top of the
+                base projection (see MemberRef.EXTRA_FIELDS).
+        """
+        pass
+
+    @abstractmethod
+    async def find_refs_by_ids(
+        self, member_ids: List[str], extra_fields: Iterable[str] = ()
+    ) -> List[MemberRef]:
+        """Find slim references to the members whose ID is in the given list."""
+        pass
+
+    @abstractmethod
+    async def get_collection_version(self, club_id: Optional[str] = None) -> CollectionVersion:
+        """Fingerprint the members, optionally of one club, for conditional GETs."""
+        pass
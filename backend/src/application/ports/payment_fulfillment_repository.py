@@ -0,0 +1,57 @@
+"""Repository port interface for PaymentFulfillment domain."""
+
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import List, Optional
+
+from src.domain.entities.payment_fulfillment import (
+    PaymentFulfillment,
+    FulfillmentStep,
+    FulfillmentStepState,
+)
+
+
+class PaymentFulfillmentRepositoryPort(ABC):
+    """Port for payment fulfillment repository operations."""
+
+    @abstractmethod
+    async def create(self, fulfillment: PaymentFulfillment) -> PaymentFulfillment:
+        """Create the fulfillment record of a payment."""
+        pass
+
+    @abstractmethod
+    async def find_by_payment_id(self, payment_id: str) -> Optional[PaymentFulfillment]:
+        """Find the fulfillment record of a payment."""
+        pass
+
+    @abstractmethod
+    async def find_unfinished(
+        self,
+        updated_before: datetime,
+        max_attempts: int,
+        limit: int = 100
+    ) -> List[PaymentFulfillment]:
+        """
+        Find fulfillments left with a step not completed.
+
+        Only records untouched since updated_before are returned, so steps
+        still running in some worker are left alone, and only when one of
+        their unfinished steps has been attempted fewer than max_attempts
+        times.
+        """
+        pass
+
+    @abstractmethod
+    async def update_step(
+        self,
+        payment_id: str,
+        step: FulfillmentStep,
+        state: FulfillmentStepState
+    ) -> None:
+        """
+        Persist the state of a single step.
+
+        Only the given step is written, so concurrently running steps of
+        the same payment do not overwrite each other.
+        """
+        pass
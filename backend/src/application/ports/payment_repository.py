@@ -1,9 +1,11 @@
 """Repository port interfaces for Payment domain."""
 
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import AsyncIterator, List, Optional
 
 from src.domain.entities.payment import Payment, PaymentStatus, PaymentType
+from src.application.ports.query_spec import QuerySpec
+from src.application.read_models.page import Page
 
 
 class PaymentRepositoryPort(ABC):
@@ -14,6 +16,28 @@ class PaymentRepositoryPort(ABC):
         """Find all payments."""
         pass
 
+    @abstractmethod
+    def iter_all(self, batch_size: int = 500) -> AsyncIterator[Payment]:
+        """Stream all payments, fetching batch_size documents per round trip."""
+        pass
+
+    @abstractmethod
+    async def find_by_spec(self, spec: QuerySpec) -> List[Payment]:
+        """Find payments matching a query spec (filters, sort and limit in one query)."""
+        pass
+
+    @abstractmethod
+    async def find_page(
+        self,
+        limit: int,
+        cursor: Optional[str] = None,
+        club_id: Optional[str] = None,
+        member_id: Optional[str] = None,
+        payment_year: Optional[int] = None,
+    ) -> Page[Payment]:
+        """Find one page of payments, newest first, starting after cursor."""
+        pass
+
     @abstractmethod
     async def find_by_id(self, payment_id: str) -> Optional[Payment]:
         """Find a payment by ID."""
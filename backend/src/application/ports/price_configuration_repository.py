@@ -1,9 +1,10 @@
 """Repository port interfaces for PriceConfiguration domain."""
 
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Dict, Iterable, List, Optional
 
 from src.domain.entities.price_configuration import PriceConfiguration
+from src.application.read_models.collection_version import CollectionVersion
 
 
 class PriceConfigurationRepositoryPort(ABC):
@@ -75,3 +76,13 @@ class PriceConfigurationRepositoryPort(ABC):
             List of active price configurations matching the keys.
         """
         pass
+
+    @abstractmethod
+    async def get_many(self, keys: Iterable[str]) -> Dict[str, PriceConfiguration]:
+        """Map each of the given keys that has an active price configuration to it."""
+        pass
+
+    @abstractmethod
+    async def get_collection_version(self) -> CollectionVersion:
+        """Fingerprint all price configurations for conditional GETs."""
+        pass
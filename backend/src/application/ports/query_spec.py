@@ -0,0 +1,42 @@
+"""Query specification passed to repository ports."""
+
+from dataclasses import dataclass, field, replace
+from enum import Enum
+from typing import Any, Dict, Tuple
+
+
+@dataclass(frozen=True)
+class QuerySpec:
+    """Combined filters, sort order and limit for a repository query.
+
+    Filters are equality matches on entity field names; a list, tuple or
+    set value matches any of its elements. Repositories compile the whole
+    spec into a single database query, so filtering happens before the
+    limit is applied. Build specs fluently::
+
+        QuerySpec().where(payment_year=2026, club_id=club_id).order_by("created_at", descending=True).take(50)
+    """
+    filters: Dict[str, Any] = field(default_factory=dict)
+    sort: Tuple[Tuple[str, bool], ...] = ()
+    limit: int = 0
+
+    def where(self, **filters: Any) -> "QuerySpec":
+        """Return a spec with the given filters added; None values are ignored."""
+        merged = dict(self.filters)
+        for name, value in filters.items():
+            if value is None:
+                continue
+            if isinstance(value, Enum):
+                value = value.value
+            elif isinstance(value, (list, tuple, set, frozenset)):
+                value = tuple(v.value if isinstance(v, Enum) else v for v in value)
+            merged[name] = value
+        return replace(self, filters=merged)
+
+    def order_by(self, name: str, descending: bool = False) -> "QuerySpec":
+        """Return a spec that also sorts by the given field."""
+        return replace(self, sort=self.sort + ((name, descending),))
+
+    def take(self, limit: int) -> "QuerySpec":
+        """Return a spec limited to at most ``limit`` results (0 means no limit)."""
+        return replace(self, limit=limit)
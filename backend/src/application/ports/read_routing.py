@@ -0,0 +1,51 @@
+"""Read routing hints passed from use cases to repositories."""
+
+import functools
+import inspect
+from contextlib import contextmanager
+from contextvars import ContextVar
+from enum import Enum
+from typing import Iterator
+
+
+class ReadRouting(str, Enum):
+    """Which servers repositories may read from."""
+    PRIMARY = "primary"
+    # Analytical reads that tolerate bounded staleness and may go to a secondary
+    REPORTING = "reporting"
+
+
+_read_routing: ContextVar[ReadRouting] = ContextVar("read_routing", default=ReadRouting.PRIMARY)
+
+
+def current_read_routing() -> ReadRouting:
+    """Read routing in effect for the current task."""
+    return _read_routing.get()
+
+
+@contextmanager
+def read_routing(routing: ReadRouting) -> Iterator[None]:
+    """Route the repository reads made inside the block; writes always go to the primary."""
+    token = _read_routing.set(routing)
+    try:
+        yield
+    finally:
+        _read_routing.reset(token)
+
+
+def reporting(func):
+    """Declare an async use case method or endpoint as a reporting read.
+
+    Repository reads made while it runs use the reporting read preference
+    configured for the database (a secondary within a staleness bound).
+    """
+    if not inspect.iscoroutinefunction(func):
+        raise TypeError(f"@reporting needs an async function, got {func!r}")
+
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs):
+        with read_routing(ReadRouting.REPORTING):
+            return await func(*args, **kwargs)
+
+    wrapper.is_reporting = True
+    return wrapper
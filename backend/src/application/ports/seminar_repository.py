@@ -4,6 +4,8 @@ from abc import ABC, abstractmethod
 from typing import List, Optional
 
 from src.domain.entities.seminar import Seminar, SeminarStatus
+from src.application.read_models.page import Page
+from src.application.read_models.collection_version import CollectionVersion
 
 
 class SeminarRepositoryPort(ABC):
@@ -14,6 +16,17 @@ class SeminarRepositoryPort(ABC):
         """Find all seminars."""
         pass
 
+    @abstractmethod
+    async def find_page(
+        self,
+        limit: int,
+        cursor: Optional[str] = None,
+        club_id: Optional[str] = None,
+        association_id: Optional[str] = None,
+    ) -> Page[Seminar]:
+        """Find one page of seminars, latest start date first, starting after cursor."""
+        pass
+
     @abstractmethod
     async def find_by_id(self, seminar_id: str) -> Optional[Seminar]:
         """Find a seminar by ID."""
@@ -63,3 +76,8 @@ class SeminarRepositoryPort(ABC):
     async def exists(self, seminar_id: str) -> bool:
         """Check if a seminar exists."""
         pass
+
+    @abstractmethod
+    async def get_collection_version(self, club_id: Optional[str] = None) -> CollectionVersion:
+        """Fingerprint the seminars, optionally of one club, for conditional GETs."""
+        pass
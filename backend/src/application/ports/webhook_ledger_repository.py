@@ -0,0 +1,37 @@
+"""Repository port interface for the webhook notification ledger."""
+
+from abc import ABC, abstractmethod
+from typing import Optional
+
+from src.domain.entities.webhook_ledger_entry import WebhookLedgerEntry
+
+
+class WebhookLedgerRepositoryPort(ABC):
+    """Port for webhook ledger operations."""
+
+    @abstractmethod
+    async def claim(self, order_id: str, ds_signature: str) -> Optional[WebhookLedgerEntry]:
+        """
+        Claim a notification for processing in a single round trip.
+
+        Returns None when the claim was acquired (first delivery), or the
+        existing entry when the notification was already received.
+        """
+        pass
+
+    @abstractmethod
+    async def complete(
+        self,
+        order_id: str,
+        ds_signature: str,
+        payment_id: Optional[str],
+        success: bool,
+        message: str
+    ) -> None:
+        """Store the outcome of a processed notification."""
+        pass
+
+    @abstractmethod
+    async def release(self, order_id: str, ds_signature: str) -> None:
+        """Drop a claim whose processing failed so a retry can process it again."""
+        pass
@@ -0,0 +1,12 @@
+# Read models: slim, read-only projections of domain entities
+from .member_ref import MemberRef
+from .license_ref import LicenseRef
+from .page import Page
+from .collection_version import CollectionVersion
+
+__all__ = [
+    "MemberRef",
+    "LicenseRef",
+    "Page",
+    "CollectionVersion",
+]
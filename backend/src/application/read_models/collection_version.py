@@ -0,0 +1,17 @@
+"""Collection version read model."""
+
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
+
+
+@dataclass(frozen=True)
+class CollectionVersion:
+    """Cheap fingerprint of the documents a listing is built from.
+
+    Every write stamps ``updated_at``, so an insert or update moves
+    ``last_modified`` forward and a delete changes ``count``: if neither
+    changed, the listing has not changed either.
+    """
+    count: int = 0
+    last_modified: Optional[datetime] = None
@@ -0,0 +1,45 @@
+"""LicenseRef read model."""
+
+from datetime import datetime
+from typing import Optional
+
+from src.domain.entities.license import InstructorCategory, LicenseStatus, TechnicalGrade
+
+
+class LicenseRef:
+    """Slim projection of a License for summaries.
+
+    Holds the fields needed to classify a member's grade and check
+    validity, without the rest of the License entity.
+    """
+
+    __slots__ = (
+        "id", "member_id", "license_number", "status",
+        "technical_grade", "instructor_category", "expiration_date",
+    )
+
+    def __init__(
+        self,
+        id: str,
+        member_id: Optional[str],
+        license_number: str = "",
+        status: LicenseStatus = LicenseStatus.ACTIVE,
+        technical_grade: TechnicalGrade = TechnicalGrade.KYU,
+        instructor_category: InstructorCategory = InstructorCategory.NONE,
+        expiration_date: Optional[datetime] = None,
+    ):
+        self.id = id
+        self.member_id = member_id
+        self.license_number = license_number
+        self.status = status
+        self.technical_grade = technical_grade
+        self.instructor_category = instructor_category
+        self.expiration_date = expiration_date
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, LicenseRef):
+            return NotImplemented
+        return all(getattr(self, f) == getattr(other, f) for f in self.__slots__)
+
+    def __repr__(self) -> str:
+        return f"LicenseRef(id={self.id!r}, member_id={self.member_id!r}, license_number={self.license_number!r})"
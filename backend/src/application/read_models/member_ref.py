@@ -0,0 +1,49 @@
+"""MemberRef read model."""
+
+from typing import Optional
+
+from src.domain.entities.member import MemberStatus
+
+
+class MemberRef:
+    """Slim projection of a Member for listings and summaries.
+
+    Carries only what summary use cases need to label and filter members,
+    so repositories can project the query instead of hydrating full
+    Member entities. ``email`` and ``dni`` are only populated when
+    requested as extra fields.
+    """
+
+    __slots__ = ("id", "full_name", "club_id", "status", "email", "dni")
+
+    # Optional fields a caller may request on top of the base projection
+    EXTRA_FIELDS = frozenset({"email", "dni"})
+
+    def __init__(
+        self,
+        id: str,
+        full_name: str,
+        club_id: Optional[str] = None,
+        status: MemberStatus = MemberStatus.ACTIVE,
+        email: Optional[str] = None,
+        dni: Optional[str] = None,
+    ):
+        self.id = id
+        self.full_name = full_name
+        self.club_id = club_id
+        self.status = status
+        self.email = email
+        self.dni = dni
+
+    @property
+    def is_active(self) -> bool:
+        """Check if member is currently active."""
+        return self.status == MemberStatus.ACTIVE
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, MemberRef):
+            return NotImplemented
+        return all(getattr(self, f) == getattr(other, f) for f in self.__slots__)
+
+    def __repr__(self) -> str:
+        return f"MemberRef(id={self.id!r}, full_name={self.full_name!r}, status={self.status.value!r})"
@@ -0,0 +1,22 @@
+"""Page read model."""
+
+from dataclasses import dataclass, field
+from typing import Generic, List, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+@dataclass
+class Page(Generic[T]):
+    """One page of a keyset-paginated listing.
+
+    ``next_cursor`` is an opaque token to pass back to fetch the following
+    page; it is None on the last page.
+    """
+    items: List[T] = field(default_factory=list)
+    next_cursor: Optional[str] = None
+
+    @property
+    def has_more(self) -> bool:
+        """Check if another page follows this one."""
+        return self.next_cursor is not None
@@ -0,0 +1,22 @@
+# Search helpers: normalization shared with the Excel sync, member search keys, ranking and autocomplete
+from .normalizers import fuzzy_norm, norm_dni, norm_name
+from .member_search import (
+    looks_like_dni,
+    member_search_keys,
+    name_tokens,
+    normalize_email,
+    rank_members,
+)
+from .member_suggestion_index import MemberSuggestionIndex
+
+__all__ = [
+    "fuzzy_norm",
+    "norm_dni",
+    "norm_name",
+    "looks_like_dni",
+    "member_search_keys",
+    "name_tokens",
+    "normalize_email",
+    "rank_members",
+    "MemberSuggestionIndex",
+]
@@ -0,0 +1,68 @@
+"""Normalized search keys and result ranking for member search."""
+
+import re
+from typing import Dict, Iterable, List, Optional
+
+from src.domain.entities.member import Member
+from src.application.search.normalizers import fuzzy_norm, norm_dni
+
+# Complete DNI (8 digits + letter) or NIE (X/Y/Z + 7 digits + letter)
+_DNI_PATTERN = re.compile(r"^(\d{8}|[XYZ]\d{7})[A-Z]$")
+
+
+def name_tokens(*parts: Optional[str]) -> List[str]:
+    """Accent-folded, lowercased words of the given name parts.
+
+    Hyphens separate words, so "García-López" yields both surnames.
+    """
+    text = " ".join(part.replace("-", " ") for part in parts if part)
+    return fuzzy_norm(text).lower().split()
+
+
+def normalize_email(raw: Optional[str]) -> str:
+    """Lowercase and trim an email address for exact matching."""
+    return (raw or "").strip().lower()
+
+
+def looks_like_dni(query: str) -> bool:
+    """Whether the query is a complete DNI/NIE once normalized."""
+    return bool(_DNI_PATTERN.match(norm_dni(query)))
+
+
+def member_search_keys(
+    first_name: Optional[str],
+    last_name: Optional[str],
+    dni: Optional[str],
+    email: Optional[str],
+) -> Dict[str, object]:
+    """Search keys stored with every member document.
+
+    ``search_tokens`` backs the prefix name search, ``search_dni`` and
+    ``search_email`` the exact-match shortcuts.
+    """
+    return {
+        "search_tokens": name_tokens(first_name, last_name),
+        "search_dni": norm_dni(dni),
+        "search_email": normalize_email(email),
+    }
+
+
+def rank_members(query: str, members: Iterable[Member]) -> List[Member]:
+    """Order name search results by how well they match ``query``.
+
+    Members whose full name (in either order) starts with the query come
+    first, then those matching more query words in full rather than as a
+    prefix; ties are broken by surname and first name.
+    """
+    terms = name_tokens(query)
+    phrase = " ".join(terms)
+
+    def _key(member: Member):
+        first = name_tokens(member.first_name)
+        last = name_tokens(member.last_name)
+        tokens = first + last
+        starts = " ".join(tokens).startswith(phrase) or " ".join(last + first).startswith(phrase)
+        exact = sum(1 for term in terms if term in tokens)
+        return (not starts, -exact, last, first)
+
+    return sorted(members, key=_key)
@@ -0,0 +1,195 @@
+"""In-memory prefix index backing member autocomplete."""
+
+import asyncio
+import heapq
+from typing import Any, AsyncIterable, Awaitable, Callable, Dict, List, Optional, Set
+
+from src.domain.entities.member import Member
+from src.application.read_models.member_ref import MemberRef
+from src.application.search.member_search import name_tokens
+from src.application.search.normalizers import norm_dni
+
+
+def _query_keys(text: Optional[str]) -> List[str]:
+    """Index keys for a query: name words, or a normalized DNI for words with digits."""
+    keys: List[str] = []
+    for part in (text or "").split():
+        if any(char.isdigit() for char in part):
+            dni = norm_dni(part).lower()
+            if dni:
+                keys.append(dni)
+        else:
+            keys.extend(name_tokens(part))
+    return keys
+
+
+class _Node:
+    """Trie node; ``ids`` holds every member with a key under this prefix."""
+
+    __slots__ = ("children", "ids")
+
+    def __init__(self):
+        self.children: Dict[str, "_Node"] = {}
+        self.ids: Set[str] = set()
+
+
+class _Entry:
+    __slots__ = ("ref", "keys", "sort_name")
+
+    def __init__(self, ref: MemberRef, keys: List[str], sort_name: str):
+        self.ref = ref
+        self.keys = keys
+        self.sort_name = sort_name
+
+
+class _Snapshot:
+    """One generation of the index: the trie plus the entry per member."""
+
+    def __init__(self):
+        self.root = _Node()
+        self.entries: Dict[str, _Entry] = {}
+
+    def add(self, member: Member) -> None:
+        self.remove(member.id)
+        first, last = name_tokens(member.first_name), name_tokens(member.last_name)
+        keys = first + last
+        dni = norm_dni(member.dni).lower()
+        if dni:
+            keys.append(dni)
+        ref = MemberRef(
+            id=member.id,
+            full_name=f"{member.first_name} {member.last_name}",
+            club_id=member.club_id,
+            status=member.status,
+        )
+        self.entries[member.id] = _Entry(ref, keys, " ".join(last + first))
+        for key in set(keys):
+            node = self.root
+            for char in key:
+                node = node.children.setdefault(char, _Node())
+                node.ids.add(member.id)
+
+    def remove(self, member_id: str) -> None:
+        entry = self.entries.pop(member_id, None)
+        if entry is None:
+            return
+        # Every key of the member goes at once, so prefixes shared between
+        # its keys can be cleared without reference counting
+        for key in set(entry.keys):
+            path = []
+            node = self.root
+            for char in key:
+                child = node.children.get(char)
+                if child is None:
+                    break
+                path.append((node, char, child))
+                node = child
+            for parent, char, child in reversed(path):
+                child.ids.discard(member_id)
+                if not child.ids:
+                    del parent.children[char]
+
+    def lookup(self, prefix: str) -> Set[str]:
+        node = self.root
+        for char in prefix:
+            node = node.children.get(char)
+            if node is None:
+                return set()
+        return node.ids
+
+
+class MemberSuggestionIndex:
+    """Per-process prefix index over member names and DNIs.
+
+    Built from a full member stream with ``rebuild`` and kept fresh with
+    ``upsert``/``remove`` as members are written. Writes that arrive while
+    a rebuild is streaming are replayed onto the new snapshot before it
+    replaces the current one, so a reconcile never loses them.
+
+    The member use cases call ``written`` after applying a write, which
+    through ``publish`` tells the other workers; their ``invalidate`` hook
+    flags the index as stale so the refresher rebuilds it early.
+    """
+
+    def __init__(self, publish: Optional[Callable[[], Awaitable[Any]]] = None):
+        self.publish = publish
+        self._snapshot = _Snapshot()
+        self._journal: Optional[Dict[str, Optional[Member]]] = None
+        self._stale = asyncio.Event()
+        self.ready = False
+
+    def __len__(self) -> int:
+        return len(self._snapshot.entries)
+
+    def upsert(self, member: Member) -> None:
+        """Add a member or refresh its keys after an update."""
+        if self._journal is not None:
+            self._journal[member.id] = member
+        self._snapshot.add(member)
+
+    def remove(self, member_id: str) -> None:
+        """Drop a deleted member."""
+        if self._journal is not None:
+            self._journal[member_id] = None
+        self._snapshot.remove(member_id)
+
+    async def written(self) -> None:
+        """Signal the other workers after a write applied here with upsert or remove."""
+        if self.publish:
+            await self.publish()
+
+    def invalidate(self) -> None:
+        """Flag the index as behind the database, after a write made by another worker."""
+        self._stale.set()
+
+    async def wait_stale(self, timeout: float) -> bool:
+        """Wait up to ``timeout`` seconds for ``invalidate``; returns whether it was called."""
+        if self._stale.is_set():
+            return True
+        try:
+            await asyncio.wait_for(self._stale.wait(), timeout)
+        except asyncio.TimeoutError:
+            return False
+        return True
+
+    async def rebuild(self, members: AsyncIterable[Member]) -> int:
+        """Replace the index with the given members; returns how many were indexed."""
+        # Writes flagged from here on may be missing from the stream
+        self._stale.clear()
+        self._journal = {}
+        try:
+            snapshot = _Snapshot()
+            async for member in members:
+                snapshot.add(member)
+            for member_id, member in self._journal.items():
+                if member is None:
+                    snapshot.remove(member_id)
+                else:
+                    snapshot.add(member)
+            self._snapshot = snapshot
+            self.ready = True
+        finally:
+            self._journal = None
+        return len(snapshot.entries)
+
+    def suggest(self, query: str, limit: int = 10, club_id: Optional[str] = None) -> List[MemberRef]:
+        """Members with a key starting with every word of ``query``, best matches first.
+
+        Members matching more query words in full rank first; ties are
+        ordered by surname and first name.
+        """
+        keys = _query_keys(query)
+        if not keys or limit <= 0:
+            return []
+        snapshot = self._snapshot
+        matches = sorted((snapshot.lookup(key) for key in keys), key=len)
+        ids = set(matches[0]).intersection(*matches[1:])
+        entries = (snapshot.entries[member_id] for member_id in ids)
+        if club_id is not None:
+            entries = (entry for entry in entries if entry.ref.club_id == club_id)
+        best = heapq.nsmallest(
+            limit,
+            entries,
+            key=lambda entry: (-sum(key in entry.keys for key in keys), entry.sort_name),
+        )
+        return [entry.ref for entry in best]
@@ -0,0 +1,34 @@
+"""Pure string normalization helpers shared by member search and the Excel sync."""
+
+import re
+import unicodedata
+
+
+def norm_dni(raw: str | None) -> str:
+    """Normalize DNI/NIE: strip dots, dashes, whitespace; uppercase; zero → empty."""
+    if not raw:
+        return ""
+    cleaned = re.sub(r"[.\-\s]", "", str(raw)).upper()
+    if cleaned and set(cleaned) == {"0"}:
+        return ""
+    return cleaned
+
+
+def norm_name(raw: str | None) -> str:
+    """Strip accents (NFKD) and uppercase."""
+    if not raw:
+        return ""
+    decomposed = unicodedata.normalize("NFKD", str(raw))
+    ascii_only = "".join(c for c in decomposed if not unicodedata.combining(c))
+    return ascii_only.upper().strip()
+
+
+def fuzzy_norm(raw: str | None) -> str:
+    """Aggressive normalization: strip accents, non-alpha, collapse whitespace."""
+    if not raw:
+        return ""
+    decomposed = unicodedata.normalize("NFKD", str(raw))
+    ascii_only = "".join(c for c in decomposed if not unicodedata.combining(c))
+    alpha_only = re.sub(r"[^A-Za-z\s]", "", ascii_only)
+    collapsed = re.sub(r"\s+", " ", alpha_only).strip()
+    return collapsed.upper()
@@ -11,6 +11,7 @@ from .club.delete_club_use_case import DeleteClubUseCase
 from .member.get_member_use_case import GetMemberUseCase
 from .member.get_all_members_use_case import GetAllMembersUseCase
 from .member.search_members_use_case import SearchMembersUseCase
+from .member.suggest_members_use_case import SuggestMembersUseCase
 from .member.create_member_use_case import CreateMemberUseCase
 from .member.update_member_use_case import UpdateMemberUseCase
 from .member.delete_member_use_case import DeleteMemberUseCase
@@ -65,6 +66,7 @@ __all__ = [
     # Member
     "GetMemberUseCase", "GetAllMembersUseCase",
     "SearchMembersUseCase",
+    "SuggestMembersUseCase",
     "CreateMemberUseCase", "UpdateMemberUseCase",
     "DeleteMemberUseCase", "ChangeMemberStatusUseCase",
     # License
@@ -1,15 +1,23 @@
 """Create Club use case."""
 
+from typing import Optional
+
 from src.domain.entities.club import Club
 from src.domain.exceptions.club import ClubAlreadyExistsError
 from src.application.ports.club_repository import ClubRepositoryPort
+from src.application.directory.club_directory import ClubDirectory
 
 
 class CreateClubUseCase:
     """Use case for creating a new club."""
 
-    def __init__(self, club_repository: ClubRepositoryPort):
+    def __init__(
+        self,
+        club_repository: ClubRepositoryPort,
+        club_directory: Optional[ClubDirectory] = None
+    ):
         self.club_repository = club_repository
+        self.club_directory = club_directory
 
     async def execute(self, name: str, address: str, city: str, province: str,
                      postal_code: str, country: str, phone: str, email: str) -> Club:
@@ -25,4 +33,7 @@ class CreateClubUseCase:
             email=email
         )
 
-        return await self.club_repository.create(club)
+        created = await self.club_repository.create(club)
+        if self.club_directory:
+            await self.club_directory.written()
+        return created
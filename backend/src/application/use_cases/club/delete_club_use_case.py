@@ -1,18 +1,29 @@
 """Delete Club use case."""
 
+from typing import Optional
+
 from src.domain.exceptions.club import ClubNotFoundError
 from src.application.ports.club_repository import ClubRepositoryPort
+from src.application.directory.club_directory import ClubDirectory
 
 
 class DeleteClubUseCase:
     """Use case for deleting a club."""
 
-    def __init__(self, club_repository: ClubRepositoryPort):
+    def __init__(
+        self,
+        club_repository: ClubRepositoryPort,
+        club_directory: Optional[ClubDirectory] = None
+    ):
         self.club_repository = club_repository
+        self.club_directory = club_directory
 
     async def execute(self, club_id: str) -> bool:
         """Execute the use case."""
         if not await self.club_repository.exists(club_id):
             raise ClubNotFoundError(club_id)
 
-        return await self.club_repository.delete(club_id)
+        deleted = await self.club_repository.delete(club_id)
+        if deleted and self.club_directory:
+            await self.club_directory.written()
+        return deleted
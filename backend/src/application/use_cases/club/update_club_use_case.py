@@ -1,15 +1,23 @@
 """Update Club use case."""
 
+from typing import Optional
+
 from src.domain.entities.club import Club
 from src.domain.exceptions.club import ClubNotFoundError
 from src.application.ports.club_repository import ClubRepositoryPort
+from src.application.directory.club_directory import ClubDirectory
 
 
 class UpdateClubUseCase:
     """Use case for updating a club."""
 
-    def __init__(self, club_repository: ClubRepositoryPort):
+    def __init__(
+        self,
+        club_repository: ClubRepositoryPort,
+        club_directory: Optional[ClubDirectory] = None
+    ):
         self.club_repository = club_repository
+        self.club_directory = club_directory
 
     async def execute(self, club_id: str, **kwargs) -> Club:
         """Execute the use case."""
@@ -22,4 +30,7 @@ class UpdateClubUseCase:
             if value is not None and hasattr(club, key):
                 setattr(club, key, value)
 
-        return await self.club_repository.update(club)
+        updated = await self.club_repository.update(club)
+        if self.club_directory:
+            await self.club_directory.written()
+        return updated
@@ -2,7 +2,7 @@
 
 import logging
 from datetime import datetime
-from typing import List
+from typing import List, Set, Tuple
 
 from src.domain.entities.insurance import Insurance, InsuranceType, InsuranceStatus
 from src.domain.entities.member_payment import MemberPayment, MemberPaymentType
@@ -31,6 +31,9 @@ class GenerateInsuranceFromPaymentUseCase:
     ) -> List[Insurance]:
         """Generate insurance for each insurance-type member payment.
 
+        Existing insurances of every member are loaded in one query and all
+        new insurances are written with a single bulk insert.
+
         Args:
             member_payments: List of MemberPayment records (already filtered to insurance types).
             payment_id: The parent payment ID.
@@ -39,29 +42,39 @@ class GenerateInsuranceFromPaymentUseCase:
         Returns:
             List of created Insurance entities.
         """
-        created_insurances: List[Insurance] = []
+        insurance_payments = [
+            (mp, PAYMENT_TYPE_TO_INSURANCE_TYPE[mp.payment_type])
+            for mp in member_payments
+            if mp.payment_type in PAYMENT_TYPE_TO_INSURANCE_TYPE
+        ]
+        if not insurance_payments:
+            return []
+
         start_date = datetime(payment_year, 1, 1)
         end_date = datetime(payment_year, 12, 31, 23, 59, 59)
 
-        for mp in member_payments:
-            insurance_type = PAYMENT_TYPE_TO_INSURANCE_TYPE.get(mp.payment_type)
-            if not insurance_type:
-                continue
+        # Everything already insured this year, from one query for all members
+        member_ids = list(dict.fromkeys(mp.member_id for mp, _ in insurance_payments))
+        insured: Set[Tuple[str, InsuranceType]] = {
+            (ins.member_id, ins.insurance_type)
+            for ins in await self.insurance_repository.find_by_member_ids(member_ids)
+            if ins.status == InsuranceStatus.ACTIVE
+            and ins.start_date and ins.start_date >= start_date
+            and ins.end_date and ins.end_date <= end_date
+        }
 
+        new_insurances: List[Insurance] = []
+        for mp, insurance_type in insurance_payments:
             # Idempotency: check if insurance already exists for this member+year+type
-            existing = await self.insurance_repository.find_active_by_member_year_type(
-                member_id=mp.member_id,
-                payment_year=payment_year,
-                insurance_type=insurance_type,
-            )
-            if existing:
+            if (mp.member_id, insurance_type) in insured:
                 logger.info(
                     "Insurance already exists for member %s, type %s, year %d — skipping",
                     mp.member_id, mp.payment_type.value, payment_year
                 )
                 continue
+            insured.add((mp.member_id, insurance_type))
 
-            insurance = Insurance(
+            new_insurances.append(Insurance(
                 member_id=mp.member_id,
                 insurance_type=insurance_type,
                 policy_number="PENDIENTE",
@@ -70,13 +83,12 @@ class GenerateInsuranceFromPaymentUseCase:
                 end_date=end_date,
                 status=InsuranceStatus.ACTIVE,
                 payment_id=payment_id,
-            )
-
-            created = await self.insurance_repository.create(insurance)
-            created_insurances.append(created)
+            ))
             logger.info(
-                "Created insurance for member %s (type: %s, year: %d)",
+                "Creating insurance for member %s (type: %s, year: %d)",
                 mp.member_id, insurance_type.value, payment_year
             )
 
-        return created_insurances
+        if not new_insurances:
+            return []
+        return await self.insurance_repository.create_bulk(new_insurances)
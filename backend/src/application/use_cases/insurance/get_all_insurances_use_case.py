@@ -1,6 +1,6 @@
 """Get All Insurances use case."""
 
-from typing import List, Optional
+from typing import AsyncIterator, List, Optional
 
 from src.domain.entities.insurance import Insurance
 from src.application.ports.insurance_repository import InsuranceRepositoryPort
@@ -44,3 +44,17 @@ class GetAllInsurancesUseCase:
                 return []
             return await self.insurance_repository.find_by_member_ids(member_ids, limit)
         return await self.insurance_repository.find_all(limit)
+
+    async def iterate(
+        self, club_id: Optional[str] = None, batch_size: int = 500
+    ) -> AsyncIterator[Insurance]:
+        """Stream insurances without loading them all into memory."""
+        if club_id:
+            members = await self.member_repository.find_refs_by_club_id(club_id)
+            source = self.insurance_repository.iter_by_member_ids(
+                [m.id for m in members if m.id], batch_size
+            )
+        else:
+            source = self.insurance_repository.iter_all(batch_size)
+        async for insurance in source:
+            yield insurance
@@ -4,6 +4,7 @@ from typing import List, Optional
 from datetime import date
 
 from src.domain.entities.invoice import Invoice, InvoiceStatus
+from src.application.read_models.page import Page
 from src.application.ports.invoice_repository import InvoiceRepositoryPort
 
 
@@ -33,3 +34,13 @@ class GetAllInvoicesUseCase:
                 limit
             )
         return await self.invoice_repository.find_all(limit)
+
+    async def execute_page(
+        self,
+        limit: int,
+        cursor: Optional[str] = None,
+        status: Optional[InvoiceStatus] = None,
+        club_id: Optional[str] = None
+    ) -> Page[Invoice]:
+        """Get one page of invoices; pass the returned next_cursor to get the next."""
+        return await self.invoice_repository.find_page(limit, cursor, status, club_id)
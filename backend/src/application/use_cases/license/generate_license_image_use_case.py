@@ -1,11 +1,13 @@
 """Generate License Image use case."""
 
+import hashlib
 from dataclasses import dataclass
 from datetime import date
-from typing import Tuple
+from typing import Optional, Tuple
 
 from src.domain.exceptions.license import LicenseNotFoundError
 from src.domain.exceptions.member import MemberNotFoundError
+from src.application.ports.cache import CachePort, cached
 from src.application.ports.license_repository import LicenseRepositoryPort
 from src.application.ports.member_repository import MemberRepositoryPort
 from src.application.ports.license_image_service import (
@@ -14,6 +16,11 @@ from src.application.ports.license_image_service import (
 )
 
 
+def _image_key(data: LicenseImageData) -> str:
+    """Key of a rendered image: a digest of everything drawn on it."""
+    return hashlib.blake2b(repr(data).encode(), digest_size=16).hexdigest()
+
+
 @dataclass
 class LicenseImageResult:
     """Result of license image generation."""
@@ -29,11 +36,13 @@ class GenerateLicenseImageUseCase:
         self,
         license_repository: LicenseRepositoryPort,
         member_repository: MemberRepositoryPort,
-        license_image_service: LicenseImageServicePort
+        license_image_service: LicenseImageServicePort,
+        cache: Optional[CachePort] = None
     ):
         self.license_repository = license_repository
         self.member_repository = member_repository
         self.license_image_service = license_image_service
+        self.cache = cache
 
     def _calculate_license_year(self) -> int:
         """Calculate the current license year based on fiscal cutoff.
@@ -45,6 +54,15 @@ class GenerateLicenseImageUseCase:
         today = date.today()
         return today.year + 1 if today.month >= 10 else today.year
 
+    @cached(key=_image_key, ttl=24 * 3600)
+    async def _render(self, data: LicenseImageData) -> bytes:
+        """Render the image, reusing an earlier render of the same data.
+
+        The key covers every field drawn on the card, so an edit to the
+        license or the member changes the key and needs no invalidation.
+        """
+        return await self.license_image_service.generate_license_image(data)
+
     async def execute(self, license_id: str) -> LicenseImageResult:
         """Execute the use case.
 
@@ -87,7 +105,7 @@ class GenerateLicenseImageUseCase:
         )
 
         # Generate image
-        image_bytes = await self.license_image_service.generate_license_image(image_data)
+        image_bytes = await self._render(image_data)
 
         # Create filename
         safe_name = f"{member.last_name}_{member.first_name}".replace(" ", "_")
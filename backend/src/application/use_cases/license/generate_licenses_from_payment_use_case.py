@@ -1,8 +1,9 @@
 """Generate licenses automatically from completed annual payment."""
 
 import logging
+from collections import defaultdict
 from datetime import datetime
-from typing import List, Optional
+from typing import Dict, List, Optional, Set, Tuple, Union
 
 from src.domain.entities.license import (
     License, LicenseType, LicenseStatus,
@@ -67,82 +68,127 @@ class GenerateLicensesFromPaymentUseCase:
     ) -> List[License]:
         """Generate licenses for each license-type member payment.
 
+        Existing licenses of every member are loaded in one query, renew or
+        create is decided in memory, new license numbers are reserved as a
+        block and everything is written with a single bulk write.
+
         Args:
             member_payments: List of MemberPayment records (already filtered to license types).
             payment_id: The parent payment ID.
             payment_year: The year of the payment (determines license validity period).
 
         Returns:
-            List of created License entities.
+            List of created or renewed License entities.
         """
-        created_licenses: List[License] = []
+        license_payments = [
+            (mp, PAYMENT_TYPE_TO_LICENSE_ATTRS[mp.payment_type])
+            for mp in member_payments
+            if mp.payment_type in PAYMENT_TYPE_TO_LICENSE_ATTRS
+        ]
+        if not license_payments:
+            return []
+
         issue_date = datetime(payment_year, 1, 1)
         expiration_date = datetime(payment_year, 12, 31, 23, 59, 59)
 
-        for mp in member_payments:
-            attrs = PAYMENT_TYPE_TO_LICENSE_ATTRS.get(mp.payment_type)
-            if not attrs:
-                continue
+        member_ids = list(dict.fromkeys(mp.member_id for mp, _ in license_payments))
+        licenses_by_member: Dict[str, List[License]] = defaultdict(list)
+        for lic in await self.license_repository.find_by_member_ids(member_ids):
+            licenses_by_member[lic.member_id].append(lic)
 
-            # Idempotency: check if license already exists for this member+year+type
-            existing = await self.license_repository.find_active_by_member_year(
-                member_id=mp.member_id,
-                payment_year=payment_year,
-                technical_grade=attrs["technical_grade"].value,
-                instructor_category=attrs["instructor_category"].value,
-            )
-            if existing:
+        # Each entry is either a renewed License or the (payment, attrs) of a
+        # license still waiting for its number
+        plan: List[Union[License, Tuple[MemberPayment, dict]]] = []
+        handled: Set[Tuple[str, TechnicalGrade, InstructorCategory]] = set()
+
+        for mp, attrs in license_payments:
+            key = (mp.member_id, attrs["technical_grade"], attrs["instructor_category"])
+            member_licenses = licenses_by_member[mp.member_id]
+
+            # Idempotency: skip if a license already exists for this member+year+type
+            if key in handled or self._find_license_for_year(
+                member_licenses, attrs, issue_date, expiration_date
+            ):
                 logger.info(
                     "License already exists for member %s, type %s, year %d — skipping",
                     mp.member_id, mp.payment_type.value, payment_year
                 )
                 continue
+            handled.add(key)
 
-            # Try to find an existing license for this member to renew
-            member_licenses = await self.license_repository.find_by_member_id(mp.member_id)
             renewable = self._find_renewable_license(member_licenses, attrs)
-
             if renewable:
-                # Renew the existing license
                 renewable.expiration_date = expiration_date
                 renewable.renewal_date = datetime.now()
                 renewable.is_renewed = True
                 renewable.status = LicenseStatus.ACTIVE
                 renewable.last_payment_id = payment_id
-                updated = await self.license_repository.update(renewable)
-                created_licenses.append(updated)
+                plan.append(renewable)
                 logger.info(
-                    "Renewed license %s for member %s (type: %s, year: %d)",
+                    "Renewing license %s for member %s (type: %s, year: %d)",
                     renewable.license_number, mp.member_id, mp.payment_type.value, payment_year
                 )
             else:
-                # No existing license — create a new one
-                prefix = f"LIC-{payment_year}-"
-                count = await self.license_repository.count_by_license_number_prefix(prefix)
-                license_number = f"{prefix}{count + 1:04d}"
-
-                license = License(
-                    license_number=license_number,
-                    member_id=mp.member_id,
-                    license_type=attrs["license_type"],
-                    grade=attrs["grade"],
-                    status=LicenseStatus.ACTIVE,
-                    issue_date=issue_date,
-                    expiration_date=expiration_date,
-                    technical_grade=attrs["technical_grade"],
-                    instructor_category=attrs["instructor_category"],
-                    age_category=attrs["age_category"],
-                    last_payment_id=payment_id,
-                )
+                plan.append((mp, attrs))
+
+        new_count = sum(1 for entry in plan if not isinstance(entry, License))
+        license_numbers = iter(
+            await self.license_repository.reserve_license_numbers(f"LIC-{payment_year}-", new_count)
+            if new_count else []
+        )
+
+        licenses: List[License] = []
+        for entry in plan:
+            if isinstance(entry, License):
+                licenses.append(entry)
+                continue
+            mp, attrs = entry
+            license = License(
+                license_number=next(license_numbers),
+                member_id=mp.member_id,
+                license_type=attrs["license_type"],
+                grade=attrs["grade"],
+                status=LicenseStatus.ACTIVE,
+                issue_date=issue_date,
+                expiration_date=expiration_date,
+                technical_grade=attrs["technical_grade"],
+                instructor_category=attrs["instructor_category"],
+                age_category=attrs["age_category"],
+                last_payment_id=payment_id,
+            )
+            licenses.append(license)
+            logger.info(
+                "Creating license %s for member %s (type: %s, year: %d)",
+                license.license_number, mp.member_id, mp.payment_type.value, payment_year
+            )
 
-                created = await self.license_repository.create(license)
-                created_licenses.append(created)
-                logger.info(
-                    "Created license %s for member %s (type: %s, year: %d)",
-                    license_number, mp.member_id, mp.payment_type.value, payment_year
-                )
+        if not licenses:
+            return []
+        return await self.license_repository.upsert_bulk(licenses)
 
-        return created_licenses
+    @staticmethod
+    def _find_license_for_year(
+        licenses: List[License],
+        attrs: dict,
+        issue_date: datetime,
+        expiration_date: datetime,
+    ) -> Optional[License]:
+        """Find a license of the given type issued within the payment year.
+
+        Mirrors LicenseRepositoryPort.find_active_by_member_year. Licenses of
+        a past year are reported EXPIRED by the repository once their
+        expiration date has passed, so both statuses count.
+        """
+        for lic in licenses:
+            if (
+                lic.technical_grade == attrs["technical_grade"]
+                and lic.instructor_category == attrs["instructor_category"]
+                and lic.status in (LicenseStatus.ACTIVE, LicenseStatus.EXPIRED)
+                and lic.issue_date and lic.issue_date >= issue_date
+                and lic.expiration_date and lic.expiration_date <= expiration_date
+            ):
+                return lic
+        return None
 
     @staticmethod
     def _find_renewable_license(
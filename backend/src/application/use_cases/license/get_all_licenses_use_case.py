@@ -2,7 +2,7 @@
 from typing import Optional
 
 
-from typing import List, Optional
+from typing import AsyncIterator, List, Optional
 
 from src.domain.entities.license import License
 from src.application.ports.license_repository import LicenseRepositoryPort
@@ -26,3 +26,11 @@ class GetAllLicensesUseCase:
         if club_id:
             return await self.license_repository.find_by_club_id(club_id, limit)
         return await self.license_repository.find_all(limit)
+
+    def iterate(
+        self, club_id: Optional[str] = None, batch_size: int = 500
+    ) -> AsyncIterator[License]:
+        """Stream licenses without loading them all into memory."""
+        if club_id:
+            return self.license_repository.iter_by_club_id(club_id, batch_size)
+        return self.license_repository.iter_all(batch_size)
@@ -6,6 +6,7 @@ from typing import Optional
 from src.domain.entities.member import Member, MemberStatus
 from src.domain.exceptions.member import MemberAlreadyExistsError, InvalidClubForMemberError
 from src.application.ports.member_repository import MemberRepositoryPort
+from src.application.search.member_suggestion_index import MemberSuggestionIndex
 from src.application.ports.club_repository import ClubRepositoryPort
 
 
@@ -15,10 +16,12 @@ class CreateMemberUseCase:
     def __init__(
         self,
         member_repository: MemberRepositoryPort,
-        club_repository: ClubRepositoryPort
+        club_repository: ClubRepositoryPort,
+        suggestion_index: Optional[MemberSuggestionIndex] = None
     ):
         self.member_repository = member_repository
         self.club_repository = club_repository
+        self.suggestion_index = suggestion_index
 
     async def execute(
         self,
@@ -68,4 +71,8 @@ class CreateMemberUseCase:
             registration_date=datetime.utcnow()
         )
 
-        return await self.member_repository.create(member)
+        created = await self.member_repository.create(member)
+        if self.suggestion_index is not None:
+            self.suggestion_index.upsert(created)
+            await self.suggestion_index.written()
+        return created
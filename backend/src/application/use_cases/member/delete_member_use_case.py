@@ -1,18 +1,30 @@
 """Delete Member use case."""
 
+from typing import Optional
+
 from src.domain.exceptions.member import MemberNotFoundError
 from src.application.ports.member_repository import MemberRepositoryPort
+from src.application.search.member_suggestion_index import MemberSuggestionIndex
 
 
 class DeleteMemberUseCase:
     """Use case for deleting a member."""
 
-    def __init__(self, member_repository: MemberRepositoryPort):
+    def __init__(
+        self,
+        member_repository: MemberRepositoryPort,
+        suggestion_index: Optional[MemberSuggestionIndex] = None
+    ):
         self.member_repository = member_repository
+        self.suggestion_index = suggestion_index
 
     async def execute(self, member_id: str) -> bool:
         """Execute the use case."""
         if not await self.member_repository.exists(member_id):
             raise MemberNotFoundError(member_id)
 
-        return await self.member_repository.delete(member_id)
+        deleted = await self.member_repository.delete(member_id)
+        if deleted and self.suggestion_index is not None:
+            self.suggestion_index.remove(member_id)
+            await self.suggestion_index.written()
+        return deleted
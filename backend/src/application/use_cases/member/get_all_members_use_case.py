@@ -2,10 +2,12 @@
 from typing import Optional
 
 
-from typing import List, Optional
+from typing import AsyncIterator, List, Optional
 
 from src.domain.entities.member import Member
+from src.application.read_models.page import Page
 from src.application.ports.member_repository import MemberRepositoryPort
+from src.application.ports.query_spec import QuerySpec
 
 
 class GetAllMembersUseCase:
@@ -14,8 +16,26 @@ class GetAllMembersUseCase:
     def __init__(self, member_repository: MemberRepositoryPort):
         self.member_repository = member_repository
 
-    async def execute(self, limit: int = 0, club_id: Optional[str] = None) -> List[Member]:
+    async def execute(
+        self,
+        limit: int = 0,
+        club_id: Optional[str] = None,
+        status: Optional[str] = None
+    ) -> List[Member]:
         """Execute the use case."""
+        spec = QuerySpec().where(club_id=club_id, status=status).take(limit)
+        return await self.member_repository.find_by_spec(spec)
+
+    async def execute_page(
+        self, limit: int, cursor: Optional[str] = None, club_id: Optional[str] = None
+    ) -> Page[Member]:
+        """Get one page of members; pass the returned next_cursor to get the next."""
+        return await self.member_repository.find_page(limit, cursor, club_id)
+
+    def iterate(
+        self, club_id: Optional[str] = None, batch_size: int = 500
+    ) -> AsyncIterator[Member]:
+        """Stream members without loading them all into memory."""
         if club_id:
-            return await self.member_repository.find_by_club_id(club_id, limit)
-        return await self.member_repository.find_all(limit)
+            return self.member_repository.iter_by_club_id(club_id, batch_size)
+        return self.member_repository.iter_all(batch_size)
@@ -1,17 +1,52 @@
 """Search Members use case."""
 
-from typing import List
+from typing import List, Optional
 
 from src.domain.entities.member import Member
 from src.application.ports.member_repository import MemberRepositoryPort
+from src.application.ports.query_spec import QuerySpec
+from src.application.search.member_search import looks_like_dni, normalize_email, rank_members
+from src.application.search.normalizers import norm_dni
+
+# Name matches fetched per requested result, so ranking sees more than the first page
+CANDIDATES_PER_RESULT = 5
 
 
 class SearchMembersUseCase:
-    """Use case for searching members by name."""
+    """Use case for searching members by name, DNI or email."""
 
     def __init__(self, member_repository: MemberRepositoryPort):
         self.member_repository = member_repository
 
-    async def execute(self, name: str, limit: int = 0) -> List[Member]:
-        """Execute the use case."""
-        return await self.member_repository.search_by_name(name, limit)
+    async def execute(
+        self,
+        name: str,
+        limit: int = 0,
+        club_id: Optional[str] = None,
+        status: Optional[str] = None
+    ) -> List[Member]:
+        """Execute the use case.
+
+        A complete DNI/NIE or an email address is matched exactly; any other
+        text is a prefix search over the words of the member's name, best
+        matches first. Club and status filters are part of the query.
+        """
+        query = (name or "").strip()
+        if not query:
+            return []
+        spec = QuerySpec().where(club_id=club_id, status=status)
+
+        if "@" in query:
+            return await self.member_repository.find_by_spec(
+                spec.where(email=normalize_email(query)).take(limit)
+            )
+        if looks_like_dni(query):
+            return await self.member_repository.find_by_spec(
+                spec.where(dni=norm_dni(query)).take(limit)
+            )
+
+        candidates = await self.member_repository.search_by_name(
+            query, spec.take(limit * CANDIDATES_PER_RESULT)
+        )
+        ranked = rank_members(query, candidates)
+        return ranked[:limit] if limit > 0 else ranked
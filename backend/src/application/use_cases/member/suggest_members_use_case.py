@@ -0,0 +1,43 @@
+"""Suggest Members use case."""
+
+from typing import List, Optional
+
+from src.application.read_models.member_ref import MemberRef
+from src.application.search.member_suggestion_index import MemberSuggestionIndex
+from src.application.use_cases.member.search_members_use_case import SearchMembersUseCase
+
+
+class SuggestMembersUseCase:
+    """Use case for member autocomplete served from the in-memory suggestion index."""
+
+    def __init__(
+        self,
+        suggestion_index: MemberSuggestionIndex,
+        search_members_use_case: SearchMembersUseCase
+    ):
+        self.suggestion_index = suggestion_index
+        self.search_members_use_case = search_members_use_case
+
+    async def execute(
+        self,
+        query: str,
+        limit: int = 10,
+        club_id: Optional[str] = None
+    ) -> List[MemberRef]:
+        """Execute the use case.
+
+        Until the index has been built after startup, suggestions fall back
+        to the database search.
+        """
+        if self.suggestion_index.ready:
+            return self.suggestion_index.suggest(query, limit, club_id)
+        members = await self.search_members_use_case.execute(query, limit, club_id)
+        return [
+            MemberRef(
+                id=member.id,
+                full_name=f"{member.first_name} {member.last_name}",
+                club_id=member.club_id,
+                status=member.status,
+            )
+            for member in members
+        ]
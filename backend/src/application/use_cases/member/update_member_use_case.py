@@ -5,13 +5,19 @@ from typing import Optional
 from src.domain.entities.member import Member
 from src.domain.exceptions.member import MemberNotFoundError
 from src.application.ports.member_repository import MemberRepositoryPort
+from src.application.search.member_suggestion_index import MemberSuggestionIndex
 
 
 class UpdateMemberUseCase:
     """Use case for updating a member."""
 
-    def __init__(self, member_repository: MemberRepositoryPort):
+    def __init__(
+        self,
+        member_repository: MemberRepositoryPort,
+        suggestion_index: Optional[MemberSuggestionIndex] = None
+    ):
         self.member_repository = member_repository
+        self.suggestion_index = suggestion_index
 
     async def execute(self, member_id: str, **kwargs) -> Member:
         """Execute the use case."""
@@ -24,4 +30,8 @@ class UpdateMemberUseCase:
             if value is not None and hasattr(member, key):
                 setattr(member, key, value)
 
-        return await self.member_repository.update(member)
+        updated = await self.member_repository.update(member)
+        if self.suggestion_index is not None:
+            self.suggestion_index.upsert(updated)
+            await self.suggestion_index.written()
+        return updated
@@ -8,6 +8,8 @@ from src.domain.entities.member_payment import MemberPaymentStatus, MemberPaymen
 from src.application.ports.member_payment_repository import MemberPaymentRepositoryPort
 from src.application.ports.club_repository import ClubRepositoryPort
 from src.application.ports.member_repository import MemberRepositoryPort
+from src.application.ports.read_routing import reporting
+from src.application.directory.club_directory import ClubDirectory
 
 
 @dataclass
@@ -38,12 +40,15 @@ class GetAllClubsPaymentSummaryUseCase:
         self,
         member_payment_repository: MemberPaymentRepositoryPort,
         club_repository: ClubRepositoryPort,
-        member_repository: MemberRepositoryPort
+        member_repository: MemberRepositoryPort,
+        club_directory: Optional[ClubDirectory] = None
     ):
         self.member_payment_repository = member_payment_repository
         self.club_repository = club_repository
         self.member_repository = member_repository
+        self.club_directory = club_directory
 
+    @reporting
     async def execute(
         self,
         payment_year: Optional[int] = None
@@ -51,7 +56,10 @@ class GetAllClubsPaymentSummaryUseCase:
         if payment_year is None:
             payment_year = datetime.now().year
 
-        clubs = await self.club_repository.find_all()
+        if self.club_directory:
+            clubs = await self.club_directory.all()
+        else:
+            clubs = await self.club_repository.find_all()
 
         club_summaries = []
         grand_total = 0.0
@@ -61,7 +69,7 @@ class GetAllClubsPaymentSummaryUseCase:
             if not club.id or not club.is_active:
                 continue
 
-            all_members = await self.member_repository.find_by_club_id(club.id)
+            all_members = await self.member_repository.find_refs_by_club_id(club.id)
             members = [m for m in all_members if m.is_active]
             total_members = len(members)
             member_ids = [m.id for m in members if m.id]
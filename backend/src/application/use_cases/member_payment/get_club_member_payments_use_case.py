@@ -25,8 +25,8 @@ class GetClubMemberPaymentsUseCase:
     Because MemberPayment has no club_id, the lookup goes:
     club_id -> member_ids (via member_repository) -> MemberPayments.
 
-    Members are already loaded to resolve the ids, so we reuse them to attach the
-    member name to each payment at no extra query cost.
+    Members are loaded as MemberRef projections to resolve the ids, and we reuse
+    them to attach the member name to each payment at no extra query cost.
     """
 
     def __init__(
@@ -40,13 +40,13 @@ class GetClubMemberPaymentsUseCase:
     async def execute(
         self, club_id: str, payment_year: int
     ) -> List[MemberPaymentWithMember]:
-        members = await self.member_repository.find_by_club_id(club_id)
+        members = await self.member_repository.find_refs_by_club_id(club_id)
         if not members:
             return []
         member_ids = [m.id for m in members if m.id]
         if not member_ids:
             return []
-        name_by_id = {m.id: m.get_full_name() for m in members if m.id}
+        name_by_id = {m.id: m.full_name for m in members if m.id}
         payments = await self.member_payment_repository.find_by_member_ids_year(
             member_ids=member_ids,
             payment_year=payment_year,
@@ -2,18 +2,51 @@
 
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, List, Optional
 
 from src.domain.entities.member_payment import MemberPaymentStatus, MemberPaymentType
 from src.domain.entities.license import InstructorCategory, TechnicalGrade
 from src.application.ports.member_payment_repository import MemberPaymentRepositoryPort
 from src.application.ports.club_repository import ClubRepositoryPort
 from src.application.ports.member_repository import MemberRepositoryPort
+from src.application.ports.read_routing import reporting
 from src.application.ports.license_repository import LicenseRepositoryPort
+from src.application.read_models import LicenseRef
+from src.application.directory.club_directory import ClubDirectory
 
 GRADE_GROUP_ORDER = {"shidoin": 0, "fukushidoin": 1, "dan": 2, "kyu": 3, "unknown": 4}
 
 
+def grade_group(lic: LicenseRef) -> str:
+    """Grade group of one license: instructor category first, then technical grade."""
+    if lic.instructor_category == InstructorCategory.SHIDOIN:
+        return "shidoin"
+    if lic.instructor_category == InstructorCategory.FUKUSHIDOIN:
+        return "fukushidoin"
+    if lic.technical_grade == TechnicalGrade.DAN:
+        return "dan"
+    if lic.technical_grade == TechnicalGrade.KYU:
+        return "kyu"
+    return "unknown"
+
+
+def grade_groups_by_member(licenses: Iterable[LicenseRef], payment_year: int) -> Dict[str, str]:
+    """Highest-priority grade group per member, from licenses valid through the end of the year."""
+    year_end = datetime(payment_year, 12, 31)
+    groups: Dict[str, str] = {}
+    for lic in licenses:
+        if not lic.member_id:
+            continue
+        # Classify grade group from valid licenses only
+        if not (lic.expiration_date and lic.expiration_date >= year_end):
+            continue
+        group = grade_group(lic)
+        current = groups.get(lic.member_id, "unknown")
+        if GRADE_GROUP_ORDER.get(group, 4) < GRADE_GROUP_ORDER.get(current, 4):
+            groups[lic.member_id] = group
+    return groups
+
+
 @dataclass
 class PaymentTypeSummary:
     """Summary for a specific payment type."""
@@ -57,12 +90,15 @@ class GetClubPaymentSummaryUseCase:
         club_repository: ClubRepositoryPort,
         member_repository: MemberRepositoryPort,
         license_repository: Optional[LicenseRepositoryPort] = None,
+        club_directory: Optional[ClubDirectory] = None,
     ):
         self.member_payment_repository = member_payment_repository
         self.club_repository = club_repository
         self.member_repository = member_repository
         self.license_repository = license_repository
+        self.club_directory = club_directory
 
+    @reporting
     async def execute(
         self,
         club_id: str,
@@ -82,12 +118,15 @@ class GetClubPaymentSummaryUseCase:
             payment_year = datetime.now().year
 
         # Get club info
-        club = await self.club_repository.find_by_id(club_id)
+        if self.club_directory:
+            club = await self.club_directory.get(club_id)
+        else:
+            club = await self.club_repository.find_by_id(club_id)
         if not club:
             raise ValueError(f"Club with ID {club_id} not found")
 
         # Get only active club members (exclude deactivated members)
-        all_members = await self.member_repository.find_by_club_id(club_id)
+        all_members = await self.member_repository.find_refs_by_club_id(club_id)
         members = [m for m in all_members if m.is_active]
         total_members = len(members)
         member_ids = [m.id for m in members if m.id]
@@ -111,27 +150,9 @@ class GetClubPaymentSummaryUseCase:
         # payment) while never having paid the license fee through the app. license_paid
         # is derived from MemberPayment records below.
         grade_group_by_member: Dict[str, str] = {}
-        year_end = datetime(payment_year, 12, 31)
         if self.license_repository:
-            licenses = await self.license_repository.find_by_member_ids(member_ids, limit=0)
-            for lic in licenses:
-                if not lic.member_id:
-                    continue
-                is_valid = lic.expiration_date and lic.expiration_date >= year_end
-                # Classify grade group from valid licenses only
-                if is_valid:
-                    group = "unknown"
-                    if lic.instructor_category == InstructorCategory.SHIDOIN:
-                        group = "shidoin"
-                    elif lic.instructor_category == InstructorCategory.FUKUSHIDOIN:
-                        group = "fukushidoin"
-                    elif lic.technical_grade == TechnicalGrade.DAN:
-                        group = "dan"
-                    elif lic.technical_grade == TechnicalGrade.KYU:
-                        group = "kyu"
-                    current = grade_group_by_member.get(lic.member_id, "unknown")
-                    if GRADE_GROUP_ORDER.get(group, 4) < GRADE_GROUP_ORDER.get(current, 4):
-                        grade_group_by_member[lic.member_id] = group
+            licenses = await self.license_repository.find_refs_by_member_ids(member_ids)
+            grade_group_by_member = grade_groups_by_member(licenses, payment_year)
 
         # Build member-level payment map. license_paid and insurance_paid both derive
         # from completed MemberPayments for the year (payments are pre-filtered to
@@ -176,7 +197,7 @@ class GetClubPaymentSummaryUseCase:
 
             member_summaries.append(MemberPaymentSummary(
                 member_id=member.id,
-                member_name=member.get_full_name(),
+                member_name=member.full_name,
                 license_paid=payment_data["license_paid"],
                 insurance_paid=payment_data["insurance_paid"],
                 total_paid=payment_data["total_paid"],
@@ -68,8 +68,10 @@ class GetUnpaidMembersUseCase:
                 raise ValueError(f"Invalid payment type: {payment_type}")
 
         # Get all active members for the club
-        members = await self.member_repository.find_by_club_id(club_id)
-        all_member_ids = {m.id for m in members if m.id and m.status.value == "active"}
+        members = await self.member_repository.find_refs_by_club_id(
+            club_id, extra_fields=("email", "dni")
+        )
+        all_member_ids = {m.id for m in members if m.id and m.is_active}
 
         if not all_member_ids:
             return UnpaidMembersResult(
@@ -102,7 +104,7 @@ class GetUnpaidMembersUseCase:
             if member.id in unpaid_member_ids:
                 unpaid_members.append(UnpaidMemberInfo(
                     member_id=member.id,
-                    member_name=member.get_full_name(),
+                    member_name=member.full_name,
                     email=member.email or "",
                     dni=member.dni or ""
                 ))
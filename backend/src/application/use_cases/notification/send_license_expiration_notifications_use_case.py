@@ -86,10 +86,8 @@ class SendLicenseExpirationNotificationsUseCase:
 
     async def _get_licenses_expiring_on(self, target_date) -> List[License]:
         """Get all active licenses expiring on the target date."""
-        all_licenses = await self.license_repository.find_all()
-
         expiring = []
-        for license in all_licenses:
+        async for license in self.license_repository.iter_all():
             if license.end_date and license.status == "active":
                 if license.end_date.date() == target_date:
                     expiring.append(license)
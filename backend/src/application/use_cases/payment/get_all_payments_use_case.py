@@ -3,7 +3,9 @@
 from typing import List, Optional
 
 from src.domain.entities.payment import Payment
+from src.application.read_models.page import Page
 from src.application.ports.payment_repository import PaymentRepositoryPort
+from src.application.ports.query_spec import QuerySpec
 
 
 class GetAllPaymentsUseCase:
@@ -20,19 +22,24 @@ class GetAllPaymentsUseCase:
         payment_year: Optional[int] = None
     ) -> List[Payment]:
         """Execute to use case."""
-        # If payment_year is specified, use year filter
-        if payment_year:
-            payments = await self.payment_repository.find_by_year(payment_year, limit)
-            # Apply additional filters if specified
-            if member_id:
-                payments = [p for p in payments if p.member_id == member_id]
-            if club_id:
-                payments = [p for p in payments if p.club_id == club_id]
-            return payments
+        # All filters go into one query so the limit applies after filtering
+        spec = (
+            QuerySpec()
+            .where(payment_year=payment_year or None, member_id=member_id, club_id=club_id)
+            .order_by("created_at", descending=True)
+            .take(limit)
+        )
+        return await self.payment_repository.find_by_spec(spec)
 
-        # Original logic for non-year filtered queries
-        if member_id:
-            return await self.payment_repository.find_by_member_id(member_id, limit)
-        if club_id:
-            return await self.payment_repository.find_by_club_id(club_id, limit)
-        return await self.payment_repository.find_all(limit)
+    async def execute_page(
+        self,
+        limit: int,
+        cursor: Optional[str] = None,
+        club_id: Optional[str] = None,
+        member_id: Optional[str] = None,
+        payment_year: Optional[int] = None
+    ) -> Page[Payment]:
+        """Get one page of payments; pass the returned next_cursor to get the next."""
+        return await self.payment_repository.find_page(
+            limit, cursor, club_id=club_id, member_id=member_id, payment_year=payment_year
+        )
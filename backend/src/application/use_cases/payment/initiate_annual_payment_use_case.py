@@ -98,8 +98,7 @@ class InitiateAnnualPaymentUseCase:
             ValueError: If any required prices are missing.
         """
         price_keys = list(PAYMENT_TYPE_TO_PRICE_KEY.values())
-        configs = await self.price_repository.find_by_keys(price_keys)
-        key_to_config = {c.key: c for c in configs}
+        key_to_config = await self.price_repository.get_many(price_keys)
 
         missing = [k for k in price_keys if k not in key_to_config]
         if missing:
@@ -116,8 +115,7 @@ class InitiateAnnualPaymentUseCase:
     async def _get_descriptions(self) -> Dict[str, str]:
         """Fetch descriptions from price configurations."""
         price_keys = list(PAYMENT_TYPE_TO_PRICE_KEY.values())
-        configs = await self.price_repository.find_by_keys(price_keys)
-        key_to_config = {c.key: c for c in configs}
+        key_to_config = await self.price_repository.get_many(price_keys)
 
         return {
             item_type: key_to_config[price_key].description
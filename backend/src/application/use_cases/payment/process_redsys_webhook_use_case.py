@@ -1,12 +1,19 @@
 """Process Redsys Webhook use case."""
 
+import asyncio
 import json
+import logging
 from dataclasses import dataclass
-from datetime import datetime
-from typing import Optional, List
+from datetime import datetime, timedelta
+from typing import Awaitable, Callable, Dict, Optional, List, Set, Tuple, TypeVar
 
 from src.domain.entities.payment import Payment, PaymentStatus, PaymentType
 from src.domain.entities.invoice import Invoice, InvoiceLineItem, InvoiceStatus
+from src.domain.entities.payment_fulfillment import (
+    PaymentFulfillment,
+    FulfillmentStep,
+    FulfillmentStepState,
+)
 from src.domain.exceptions.payment import (
     PaymentNotFoundError,
     RedsysPaymentError,
@@ -31,22 +38,54 @@ from src.domain.entities.member_payment import (
 )
 from src.application.ports.price_configuration_repository import PriceConfigurationRepositoryPort
 from src.application.ports.seminar_repository import SeminarRepositoryPort
+from src.application.ports.payment_fulfillment_repository import PaymentFulfillmentRepositoryPort
+from src.application.ports.webhook_ledger_repository import WebhookLedgerRepositoryPort
+from src.domain.entities.webhook_ledger_entry import WebhookLedgerEntry
 from src.application.use_cases.payment.initiate_annual_payment_use_case import PAYMENT_TYPE_TO_PRICE_KEY
 from src.application.use_cases.license.generate_licenses_from_payment_use_case import GenerateLicensesFromPaymentUseCase
 from src.application.use_cases.insurance.generate_insurance_from_payment_use_case import GenerateInsuranceFromPaymentUseCase
 
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
 
 @dataclass
 class WebhookProcessResult:
-    """Result of processing a Redsys webhook."""
-    payment: Payment
+    """Result of processing a Redsys webhook.
+
+    ``invoice`` is only set when the invoice was created before returning;
+    on the regular path it is generated afterwards as a fulfillment step.
+    ``replayed`` results come from the webhook ledger: the notification was
+    already received, so only the stored outcome is returned and ``payment``
+    is not loaded.
+    """
+    payment: Optional[Payment]
     success: bool
     message: str
     invoice: Optional[Invoice] = None
+    payment_id: Optional[str] = None
+    replayed: bool = False
+
+    def __post_init__(self):
+        if self.payment_id is None and self.payment is not None:
+            self.payment_id = self.payment.id
 
 
 class ProcessRedsysWebhookUseCase:
-    """Use case for processing Redsys webhook callbacks."""
+    """Use case for processing Redsys webhook callbacks.
+
+    Only the critical state transition (payment completed plus its member
+    payments) runs before the response is returned to Redsys. Seminar
+    update, license and insurance generation, invoice and email run
+    afterwards as tracked background steps, each with its own retries and
+    its outcome recorded in the payment's fulfillment record.
+
+    The member payments and the record are stored before the payment
+    status, so a notification that fails halfway is retried in full, and
+    steps cut short by a restart are picked up again by
+    ``resume_unfinished_fulfillments``.
+    """
 
     def __init__(
         self,
@@ -61,6 +100,11 @@ class ProcessRedsysWebhookUseCase:
         pdf_service: Optional[PDFServicePort] = None,
         price_configuration_repository: Optional[PriceConfigurationRepositoryPort] = None,
         seminar_repository: Optional[SeminarRepositoryPort] = None,
+        payment_fulfillment_repository: Optional[PaymentFulfillmentRepositoryPort] = None,
+        webhook_ledger_repository: Optional[WebhookLedgerRepositoryPort] = None,
+        fulfillment_max_attempts: int = 3,
+        fulfillment_retry_delay: float = 2.0,
+        fulfillment_max_resumes: int = 2,
     ):
         self.payment_repository = payment_repository
         self.redsys_service = redsys_service
@@ -73,6 +117,14 @@ class ProcessRedsysWebhookUseCase:
         self.pdf_service = pdf_service
         self.price_configuration_repository = price_configuration_repository
         self.seminar_repository = seminar_repository
+        self.payment_fulfillment_repository = payment_fulfillment_repository
+        self.webhook_ledger_repository = webhook_ledger_repository
+        self.fulfillment_max_attempts = fulfillment_max_attempts
+        self.fulfillment_retry_delay = fulfillment_retry_delay
+        self.fulfillment_max_resumes = fulfillment_max_resumes
+        # Strong references to running fulfillment tasks so they are not
+        # garbage collected before they finish.
+        self._background_tasks: Set[asyncio.Task] = set()
 
     async def execute(
         self,
@@ -103,6 +155,61 @@ class ProcessRedsysWebhookUseCase:
         # Parse notification data
         notification = await self.redsys_service.parse_notification(ds_merchant_parameters)
 
+        if not self.webhook_ledger_repository:
+            return await self._process_notification(notification)
+
+        # Insert-first claim: a repeated delivery of the same notification
+        # gets the existing ledger entry back and is not processed again
+        entry = await self.webhook_ledger_repository.claim(notification.order_id, ds_signature)
+        if entry is not None:
+            return self._replay(entry)
+
+        try:
+            result = await self._process_notification(notification)
+        except Exception:
+            # Let Redsys' retry process the notification again
+            try:
+                await self.webhook_ledger_repository.release(notification.order_id, ds_signature)
+            except Exception:
+                logger.exception(
+                    "Failed to release webhook ledger claim for order %s", notification.order_id
+                )
+            raise
+
+        try:
+            await self.webhook_ledger_repository.complete(
+                notification.order_id,
+                ds_signature,
+                payment_id=result.payment_id,
+                success=result.success,
+                message=result.message,
+            )
+        except Exception:
+            logger.exception(
+                "Failed to store webhook outcome for order %s", notification.order_id
+            )
+        return result
+
+    def _replay(self, entry: WebhookLedgerEntry) -> WebhookProcessResult:
+        """Build the result of a notification that was already received."""
+        if entry.is_completed:
+            return WebhookProcessResult(
+                payment=None,
+                payment_id=entry.payment_id,
+                success=bool(entry.success),
+                message=entry.message or "",
+                replayed=True,
+            )
+        # Another delivery is processing it right now
+        return WebhookProcessResult(
+            payment=None,
+            success=True,
+            message="Notificación ya en proceso",
+            replayed=True,
+        )
+
+    async def _process_notification(self, notification) -> WebhookProcessResult:
+        """Apply a verified notification to its payment."""
         # Find payment by order ID (stored as transaction_id)
         payment = await self.payment_repository.find_by_transaction_id(notification.order_id)
 
@@ -121,84 +228,419 @@ class ProcessRedsysWebhookUseCase:
             "error_code": notification.error_code
         }
 
-        invoice = None
-
         # Process based on response
         if notification.is_successful:
+            message = self.redsys_service.get_response_message(notification.response_code)
+            if payment.status == PaymentStatus.COMPLETED:
+                # A retry that arrives after the status was saved
+                await self._ensure_fulfillment(payment)
+                return WebhookProcessResult(payment=payment, success=True, message=message)
+
             # Complete payment
             payment.complete_payment(
                 transaction_id=notification.order_id,
                 redsys_response=payment.redsys_response
             )
 
-            # --- Seminar oficialidad: mark as official on successful payment ---
-            if (
-                payment.payment_type == PaymentType.SEMINAR_OFICIALIDAD
-                and payment.related_entity_id
-                and self.seminar_repository
-            ):
-                try:
-                    seminar = await self.seminar_repository.find_by_id(
-                        payment.related_entity_id
-                    )
-                    if seminar and not seminar.is_official:
-                        seminar.mark_as_official()
-                        await self.seminar_repository.update(seminar)
-                except Exception:
-                    import logging
-                    logging.getLogger(__name__).exception(
-                        "Failed to mark seminar %s as official for payment %s",
-                        payment.related_entity_id,
-                        payment.id,
-                    )
-
-            # Create member payment records if assignments exist
+            # Member payments and the fulfillment record are written before
+            # the COMPLETED status. If any of these writes fails, the payment
+            # is still processing when Redsys retries, and the retry writes
+            # them again: both writes are idempotent.
+            member_payments: List[MemberPayment] = []
             if self.member_payment_repository and payment.member_assignments:
                 member_payments = await self._create_member_payments(payment)
+            fulfillment = await self._store_fulfillment(
+                self._plan_fulfillment(payment, member_payments)
+            )
 
-                # Auto-generate licenses and insurance from member payments
-                await self._generate_licenses_and_insurance(
-                    member_payments, payment.id, payment.payment_year
-                )
-
-            # Update payment status BEFORE invoice/email so it's always persisted
             payment = await self.payment_repository.update(payment)
 
-            # Create invoice if repositories are available
-            if self.invoice_repository and self.member_repository:
-                try:
-                    invoice = await self._create_invoice(payment)
-                except Exception:
-                    import logging
-                    logging.getLogger(__name__).exception(
-                        "Failed to create invoice for payment %s", payment.id
-                    )
-
-            # Send confirmation email
-            if self.email_service and self.member_repository:
-                await self._send_confirmation_email(payment, invoice)
-
-            message = self.redsys_service.get_response_message(notification.response_code)
+            # Seminar, licenses, insurance, invoice and email run after the
+            # response so Redsys is not kept waiting (it retries on timeout)
+            self._schedule(self._run_fulfillment(payment, member_payments, fulfillment))
         else:
             # Payment failed
             error_message = self.redsys_service.get_response_message(notification.response_code)
-            payment.fail_payment(error_message)
             message = error_message
+            if payment.status == PaymentStatus.FAILED:
+                await self._ensure_fulfillment(payment)
+                return WebhookProcessResult(payment=payment, success=False, message=message)
+
+            payment.fail_payment(error_message)
+            # The failure email is recorded before the FAILED status, as above
+            fulfillment = await self._store_fulfillment(self._plan_failure_fulfillment(payment))
 
             # Persist FAILED status
             payment = await self.payment_repository.update(payment)
 
             # Send failure notification
-            if self.email_service and self.member_repository:
-                await self._send_failure_email(payment, error_message)
+            if FulfillmentStep.EMAIL in fulfillment.steps:
+                failed_payment = payment
+                self._schedule(self._run_step(
+                    fulfillment,
+                    FulfillmentStep.EMAIL,
+                    lambda: self._send_failure_email(failed_payment, error_message),
+                ))
 
         return WebhookProcessResult(
             payment=payment,
             success=notification.is_successful,
             message=message,
-            invoice=invoice
         )
 
+    def _schedule(self, coro: Awaitable) -> asyncio.Task:
+        """Run a coroutine in the background, keeping a reference until it finishes."""
+        task = asyncio.ensure_future(coro)
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+        return task
+
+    async def wait_for_background_tasks(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until every scheduled fulfillment task has finished.
+
+        Returns False when timeout seconds passed first; the unfinished
+        steps stay recorded and are resumed later.
+        """
+        loop = asyncio.get_running_loop()
+        deadline = None if timeout is None else loop.time() + timeout
+        while self._background_tasks:
+            remaining = None if deadline is None else deadline - loop.time()
+            if remaining is not None and remaining <= 0:
+                return False
+            await asyncio.wait(list(self._background_tasks), timeout=remaining)
+        return True
+
+    def _plan_fulfillment(
+        self,
+        payment: Payment,
+        member_payments: List[MemberPayment],
+    ) -> PaymentFulfillment:
+        """Build the fulfillment record of a completed payment, every step pending."""
+        license_payments, insurance_payments = self._split_license_and_insurance_payments(
+            member_payments
+        )
+
+        steps: List[FulfillmentStep] = []
+        if self._is_seminar_oficialidad(payment):
+            steps.append(FulfillmentStep.SEMINAR)
+        if license_payments and self.license_repository:
+            steps.append(FulfillmentStep.LICENSES)
+        if insurance_payments and self.insurance_repository:
+            steps.append(FulfillmentStep.INSURANCE)
+        if self.invoice_repository and self.member_repository:
+            steps.append(FulfillmentStep.INVOICE)
+        if self.email_service and self.member_repository:
+            steps.append(FulfillmentStep.EMAIL)
+
+        return PaymentFulfillment(
+            payment_id=payment.id,
+            steps={step: FulfillmentStepState() for step in steps},
+        )
+
+    def _plan_failure_fulfillment(self, payment: Payment) -> PaymentFulfillment:
+        """Build the fulfillment record of a failed payment: only the failure email."""
+        steps = {}
+        if self.email_service and self.member_repository:
+            steps[FulfillmentStep.EMAIL] = FulfillmentStepState()
+        return PaymentFulfillment(payment_id=payment.id, steps=steps)
+
+    async def _store_fulfillment(self, fulfillment: PaymentFulfillment) -> PaymentFulfillment:
+        """Store the fulfillment record before the payment status; errors propagate."""
+        if not self.payment_fulfillment_repository or not fulfillment.steps:
+            return fulfillment
+        return await self.payment_fulfillment_repository.create(fulfillment)
+
+    async def _ensure_fulfillment(self, payment: Payment) -> None:
+        """Record and run the side effects of a payment whose status was saved without them.
+
+        Payments processed before fulfillment records were written ahead of
+        the status have none; a payment that already has one is left to
+        ``resume_unfinished_fulfillments``.
+        """
+        if not self.payment_fulfillment_repository:
+            logger.warning(
+                "Payment %s was already %s; notification ignored", payment.id, payment.status.value
+            )
+            return
+        if await self.payment_fulfillment_repository.find_by_payment_id(payment.id) is not None:
+            return
+
+        logger.warning(
+            "Payment %s was %s without a fulfillment record; scheduling it now",
+            payment.id, payment.status.value,
+        )
+        if payment.status == PaymentStatus.FAILED:
+            fulfillment = await self._store_fulfillment(self._plan_failure_fulfillment(payment))
+            if FulfillmentStep.EMAIL in fulfillment.steps:
+                self._schedule(self._run_step(
+                    fulfillment,
+                    FulfillmentStep.EMAIL,
+                    lambda: self._send_failure_email(payment, payment.error_message or ""),
+                ))
+            return
+
+        member_payments: List[MemberPayment] = []
+        if self.member_payment_repository:
+            member_payments = await self.member_payment_repository.find_by_payment_id(payment.id)
+        fulfillment = await self._store_fulfillment(self._plan_fulfillment(payment, member_payments))
+        self._schedule(self._run_fulfillment(payment, member_payments, fulfillment))
+
+    async def _record_fulfillment(self, fulfillment: PaymentFulfillment) -> PaymentFulfillment:
+        """Store the fulfillment record; tracking failures never block the steps."""
+        if not self.payment_fulfillment_repository or not fulfillment.steps:
+            return fulfillment
+        try:
+            return await self.payment_fulfillment_repository.create(fulfillment)
+        except Exception:
+            logger.exception(
+                "Failed to create fulfillment record for payment %s", fulfillment.payment_id
+            )
+            return fulfillment
+
+    async def _run_fulfillment(
+        self,
+        payment: Payment,
+        member_payments: List[MemberPayment],
+        fulfillment: Optional[PaymentFulfillment] = None,
+    ) -> PaymentFulfillment:
+        """Run every post-payment side effect of a completed payment.
+
+        Steps are independent: seminar, licenses and insurance run
+        concurrently with the invoice, and the confirmation email follows
+        the invoice so it can attach the PDF.
+        """
+        if fulfillment is None:
+            fulfillment = await self._record_fulfillment(
+                self._plan_fulfillment(payment, member_payments)
+            )
+        license_payments, insurance_payments = self._split_license_and_insurance_payments(
+            member_payments
+        )
+
+        jobs = []
+        if FulfillmentStep.SEMINAR in fulfillment.steps:
+            jobs.append(self._run_step(
+                fulfillment,
+                FulfillmentStep.SEMINAR,
+                lambda: self._mark_seminar_official(payment),
+            ))
+        if license_payments or insurance_payments:
+            jobs.append(self._generate_licenses_and_insurance(
+                member_payments, payment.id, payment.payment_year, fulfillment
+            ))
+        jobs.append(self._invoice_and_email(fulfillment, payment))
+
+        await asyncio.gather(*jobs)
+        return fulfillment
+
+    async def resume_unfinished_fulfillments(
+        self,
+        stale_after_seconds: float = 600,
+        limit: int = 100,
+    ) -> int:
+        """
+        Re-run the steps left unfinished by a restart, a crash or a give-up.
+
+        Records updated in the last stale_after_seconds are skipped, since
+        their steps may still be running in a worker. A step is resumed at
+        most ``fulfillment_max_resumes`` times. Steps run at least once, so
+        an email may be sent twice if the process died right after sending
+        it. Returns how many fulfillments were resumed.
+        """
+        if not self.payment_fulfillment_repository:
+            return 0
+
+        max_attempts = self.fulfillment_max_attempts * (1 + self.fulfillment_max_resumes)
+        fulfillments = await self.payment_fulfillment_repository.find_unfinished(
+            updated_before=datetime.utcnow() - timedelta(seconds=stale_after_seconds),
+            max_attempts=max_attempts,
+            limit=limit,
+        )
+        for fulfillment in fulfillments:
+            try:
+                await self.resume_fulfillment(fulfillment, max_attempts)
+            except Exception:
+                logger.exception(
+                    "Failed to resume fulfillment of payment %s", fulfillment.payment_id
+                )
+        return len(fulfillments)
+
+    async def resume_fulfillment(
+        self,
+        fulfillment: PaymentFulfillment,
+        max_attempts: int,
+    ) -> PaymentFulfillment:
+        """Re-run the unfinished steps of one fulfillment record."""
+        steps = set(fulfillment.resumable_steps(max_attempts))
+        if not steps:
+            return fulfillment
+
+        payment = await self.payment_repository.find_by_id(fulfillment.payment_id)
+        if not payment:
+            logger.error(
+                "Cannot resume fulfillment: payment %s not found", fulfillment.payment_id
+            )
+            return fulfillment
+        # The record is written before the status: the status write may have failed
+        if payment.status not in (PaymentStatus.COMPLETED, PaymentStatus.FAILED):
+            logger.warning(
+                "Not resuming fulfillment of payment %s: it is still %s",
+                payment.id, payment.status.value,
+            )
+            return fulfillment
+        logger.info(
+            "Resuming fulfillment steps %s for payment %s",
+            ", ".join(sorted(step.value for step in steps)), payment.id,
+        )
+
+        jobs = []
+        if FulfillmentStep.SEMINAR in steps:
+            jobs.append(self._run_step(
+                fulfillment,
+                FulfillmentStep.SEMINAR,
+                lambda: self._mark_seminar_official(payment),
+            ))
+        license_steps = {FulfillmentStep.LICENSES, FulfillmentStep.INSURANCE}
+        if steps & license_steps and self.member_payment_repository:
+            member_payments = await self.member_payment_repository.find_by_payment_id(payment.id)
+            jobs.append(self._generate_licenses_and_insurance(
+                member_payments, payment.id, payment.payment_year, fulfillment, steps=steps
+            ))
+        if steps & {FulfillmentStep.INVOICE, FulfillmentStep.EMAIL}:
+            jobs.append(self._resume_invoice_and_email(fulfillment, payment, steps))
+
+        await asyncio.gather(*jobs)
+        return fulfillment
+
+    async def _resume_invoice_and_email(
+        self,
+        fulfillment: PaymentFulfillment,
+        payment: Payment,
+        steps: Set[FulfillmentStep],
+    ) -> None:
+        """Resume the invoice and email steps, reusing an invoice created before the interruption."""
+        invoice = None
+        if self.invoice_repository:
+            invoice = await self.invoice_repository.find_by_payment_id(payment.id)
+
+        if FulfillmentStep.INVOICE in steps:
+            if invoice is None:
+                invoice = await self._run_step(
+                    fulfillment,
+                    FulfillmentStep.INVOICE,
+                    lambda: self._create_invoice(payment),
+                )
+            else:
+                await self._save_step(
+                    fulfillment, FulfillmentStep.INVOICE, fulfillment.complete_step(FulfillmentStep.INVOICE)
+                )
+
+        if FulfillmentStep.EMAIL in steps:
+            if payment.status == PaymentStatus.FAILED:
+                await self._run_step(
+                    fulfillment,
+                    FulfillmentStep.EMAIL,
+                    lambda: self._send_failure_email(payment, payment.error_message or ""),
+                )
+            else:
+                await self._run_step(
+                    fulfillment,
+                    FulfillmentStep.EMAIL,
+                    lambda: self._send_confirmation_email(payment, invoice),
+                )
+
+    async def _invoice_and_email(
+        self,
+        fulfillment: PaymentFulfillment,
+        payment: Payment,
+    ) -> None:
+        """Create the invoice, then send the confirmation email with it."""
+        invoice = None
+        if FulfillmentStep.INVOICE in fulfillment.steps:
+            invoice = await self._run_step(
+                fulfillment,
+                FulfillmentStep.INVOICE,
+                lambda: self._create_invoice(payment),
+            )
+        if FulfillmentStep.EMAIL in fulfillment.steps:
+            await self._run_step(
+                fulfillment,
+                FulfillmentStep.EMAIL,
+                lambda: self._send_confirmation_email(payment, invoice),
+            )
+
+    async def _run_step(
+        self,
+        fulfillment: PaymentFulfillment,
+        step: FulfillmentStep,
+        action: Callable[[], Awaitable[T]],
+    ) -> Optional[T]:
+        """Run one fulfillment step with retries, recording its status.
+
+        Returns the action result, or None once all attempts have failed.
+        Never raises: a failing step must not affect the other steps.
+        """
+        last_error: Optional[Exception] = None
+        for attempt in range(1, self.fulfillment_max_attempts + 1):
+            await self._save_step(fulfillment, step, fulfillment.start_step(step))
+            try:
+                result = await action()
+            except Exception as e:
+                last_error = e
+                logger.warning(
+                    "Fulfillment step %s failed for payment %s (attempt %d/%d): %s",
+                    step.value, fulfillment.payment_id, attempt,
+                    self.fulfillment_max_attempts, e,
+                )
+                if attempt < self.fulfillment_max_attempts:
+                    await asyncio.sleep(self.fulfillment_retry_delay * attempt)
+                continue
+
+            await self._save_step(fulfillment, step, fulfillment.complete_step(step))
+            return result
+
+        logger.error(
+            "Fulfillment step %s gave up for payment %s: %s",
+            step.value, fulfillment.payment_id, last_error,
+        )
+        await self._save_step(fulfillment, step, fulfillment.fail_step(step, str(last_error)))
+        return None
+
+    async def _save_step(
+        self,
+        fulfillment: PaymentFulfillment,
+        step: FulfillmentStep,
+        state: FulfillmentStepState,
+    ) -> None:
+        """Persist a step state; tracking failures never break the step."""
+        if not self.payment_fulfillment_repository:
+            return
+        try:
+            await self.payment_fulfillment_repository.update_step(
+                fulfillment.payment_id, step, state
+            )
+        except Exception:
+            logger.exception(
+                "Failed to record fulfillment step %s for payment %s",
+                step.value, fulfillment.payment_id,
+            )
+
+    def _is_seminar_oficialidad(self, payment: Payment) -> bool:
+        """Check if the payment marks a seminar as official."""
+        return bool(
+            payment.payment_type == PaymentType.SEMINAR_OFICIALIDAD
+            and payment.related_entity_id
+            and self.seminar_repository
+        )
+
+    async def _mark_seminar_official(self, payment: Payment) -> None:
+        """Mark the seminar paid for as official."""
+        seminar = await self.seminar_repository.find_by_id(payment.related_entity_id)
+        if seminar and not seminar.is_official:
+            seminar.mark_as_official()
+            await self.seminar_repository.update(seminar)
+
     async def _create_invoice(self, payment: Payment) -> Optional[Invoice]:
         """Create an invoice for a successful payment."""
         if not self.invoice_repository:
@@ -210,7 +652,7 @@ class ProcessRedsysWebhookUseCase:
         if self.member_repository and payment.member_id:
             member = await self.member_repository.find_by_id(payment.member_id)
             if member:
-                customer_name = f"{member.nombre} {member.primer_apellido} {member.segundo_apellido or ''}".strip()
+                customer_name = member.get_full_name().strip()
                 customer_email = member.email
 
         # For annual payments, use payer_name if available
@@ -307,7 +749,7 @@ class ProcessRedsysWebhookUseCase:
         if not member or not member.email:
             return
 
-        member_name = f"{member.nombre} {member.primer_apellido}"
+        member_name = member.get_full_name()
 
         # Get invoice PDF if available
         invoice_pdf = None
@@ -318,17 +760,14 @@ class ProcessRedsysWebhookUseCase:
             except Exception:
                 pass
 
-        try:
-            await self.email_service.send_payment_confirmation(
-                to_email=member.email,
-                member_name=member_name,
-                payment_amount=payment.amount,
-                license_type=payment.payment_type.value,
-                invoice_pdf=invoice_pdf
-            )
-        except Exception:
-            # Log error but don't fail
-            pass
+        # Errors propagate so the fulfillment step is retried
+        await self.email_service.send_payment_confirmation(
+            to_email=member.email,
+            member_name=member_name,
+            payment_amount=payment.amount,
+            license_type=payment.payment_type.value,
+            invoice_pdf=invoice_pdf
+        )
 
     async def _send_failure_email(
         self,
@@ -346,20 +785,16 @@ class ProcessRedsysWebhookUseCase:
         if not member or not member.email:
             return
 
-        member_name = f"{member.nombre} {member.primer_apellido}"
+        member_name = member.get_full_name()
 
-        try:
-            # TODO: Get retry URL from configuration
-            retry_url = "https://example.com/payments/retry"
-            await self.email_service.send_payment_failed_notification(
-                to_email=member.email,
-                member_name=member_name,
-                error_message=error_message,
-                retry_url=retry_url
-            )
-        except Exception:
-            # Log error but don't fail
-            pass
+        # TODO: Get retry URL from configuration
+        retry_url = "https://example.com/payments/retry"
+        await self.email_service.send_payment_failed_notification(
+            to_email=member.email,
+            member_name=member_name,
+            error_message=error_message,
+            retry_url=retry_url
+        )
 
     async def _create_member_payments(self, payment: Payment) -> List[MemberPayment]:
         """Create individual MemberPayment records from payment assignments.
@@ -381,6 +816,22 @@ class ProcessRedsysWebhookUseCase:
         except (json.JSONDecodeError, TypeError):
             return []
 
+        assignments = [a for a in assignments if a.get("member_id")]
+
+        # Resolve every member and price up front: one query each instead of
+        # one per assignment and one per payment type
+        members_by_id = None
+        if self.member_repository:
+            try:
+                members = await self.member_repository.find_by_ids(
+                    [a["member_id"] for a in assignments]
+                )
+                members_by_id = {m.id: m for m in members}
+            except Exception:
+                # If lookup fails, skip every member (same as a failed per-member lookup)
+                members_by_id = {}
+        prices = await self._fetch_prices(assignments)
+
         member_payments: List[MemberPayment] = []
         club_fee_created = False
         # Priority for club fee assignment: admin(3) > shidoin(2) > fukushidoin(1) > first(0)
@@ -388,24 +839,15 @@ class ProcessRedsysWebhookUseCase:
         club_fee_priority = -1
 
         for assignment in assignments:
-            member_id = assignment.get("member_id")
-            member_name = assignment.get("member_name", "")
+            member_id = assignment["member_id"]
             payment_types = assignment.get("payment_types", [])
 
-            # Skip if member_id is missing
-            if not member_id:
-                continue
-
             # Verify member still exists (handle deleted members gracefully)
             member = None
-            if self.member_repository:
-                try:
-                    member = await self.member_repository.find_by_id(member_id)
-                    if not member:
-                        # Member was deleted, skip their payments
-                        continue
-                except Exception:
-                    # If lookup fails, skip this member
+            if members_by_id is not None:
+                member = members_by_id.get(member_id)
+                if not member:
+                    # Member was deleted, skip their payments
                     continue
 
             # Determine best member for club fee assignment
@@ -432,15 +874,7 @@ class ProcessRedsysWebhookUseCase:
                         continue
                     club_fee_created = True
 
-                # Get price for this payment type from database
-                price = 0.0
-                if self.price_configuration_repository:
-                    price_key = PAYMENT_TYPE_TO_PRICE_KEY.get(ptype)
-                    if price_key:
-                        price_config = await self.price_configuration_repository.find_by_key(price_key)
-                        if price_config:
-                            price = price_config.price
-
+                price = prices.get(ptype, 0.0)
                 member_payments.append(MemberPayment(
                     payment_id=payment.id,
                     member_id=member_id,
@@ -461,51 +895,66 @@ class ProcessRedsysWebhookUseCase:
                     item.get("item_type") == "club_fee" for item in line_items
                 )
                 if has_club_fee_item:
-                    price = 0.0
-                    if self.price_configuration_repository:
-                        price_key = PAYMENT_TYPE_TO_PRICE_KEY.get("club_fee")
-                        if price_key:
-                            price_config = await self.price_configuration_repository.find_by_key(price_key)
-                            if price_config:
-                                price = price_config.price
-
                     member_payments.append(MemberPayment(
                         payment_id=payment.id,
                         member_id=club_fee_member_id,
                         payment_year=payment.payment_year,
                         payment_type=MemberPaymentType.CUOTA_CLUB,
                         concept=f"cuota_club - {payment.payment_year}",
-                        amount=price,
+                        amount=prices.get("club_fee", 0.0),
                         status=MemberPaymentStatus.COMPLETED
                     ))
             except (json.JSONDecodeError, TypeError):
                 pass
 
-        # Bulk create all member payments
+        # Bulk create all member payments; a retried notification gets the
+        # records stored by the first attempt back
         if member_payments:
-            await self.member_payment_repository.create_bulk(member_payments)
+            member_payments = await self.member_payment_repository.create_bulk(member_payments)
 
         return member_payments
 
+    async def _fetch_prices(self, assignments: List[dict]) -> Dict[str, float]:
+        """Fetch the price of every payment type in the assignments in one query.
+
+        The club fee is always included since it may come from line items
+        rather than from a member's payment types. Types without a price
+        configuration are left out (callers default them to 0.0).
+
+        Returns:
+            Dict mapping item_type -> price.
+        """
+        if not self.price_configuration_repository:
+            return {}
+
+        item_types = {"club_fee"}
+        for assignment in assignments:
+            item_types.update(assignment.get("payment_types", []))
+        key_to_type = {
+            PAYMENT_TYPE_TO_PRICE_KEY[ptype]: ptype
+            for ptype in item_types
+            if ptype in PAYMENT_TYPE_TO_PRICE_KEY
+        }
+        if not key_to_type:
+            return {}
+
+        configs = await self.price_configuration_repository.get_many(key_to_type)
+        return {key_to_type[key]: config.price for key, config in configs.items()}
+
     # Instructor payment types that implicitly include RC insurance
     INSTRUCTOR_TYPES_WITH_RC = {
         MemberPaymentType.TITULO_FUKUSHIDOIN,
         MemberPaymentType.TITULO_SHIDOIN,
     }
 
-    async def _generate_licenses_and_insurance(
+    def _split_license_and_insurance_payments(
         self,
         member_payments: List[MemberPayment],
-        payment_id: str,
-        payment_year: int,
-    ) -> None:
-        """Auto-generate License and Insurance entities from member payments.
-
-        Filters member payments into license and insurance types, then
-        delegates to the respective use cases for creation.
+    ) -> Tuple[List[MemberPayment], List[MemberPayment]]:
+        """Split member payments into license and insurance payments.
 
         Fukushidoin and Shidoin payments implicitly include RC insurance,
-        so synthetic SEGURO_RC payments are created for those members
+        so synthetic SEGURO_RC payments are added for those members
         unless an explicit SEGURO_RC payment already exists.
         """
         license_payments = [mp for mp in member_payments if mp.is_license_payment]
@@ -532,25 +981,47 @@ class ProcessRedsysWebhookUseCase:
                     status=ip.status,
                 ))
 
-        # Generate licenses
-        if license_payments and self.license_repository:
-            try:
-                use_case = GenerateLicensesFromPaymentUseCase(self.license_repository)
-                await use_case.execute(license_payments, payment_id, payment_year)
-            except Exception:
-                # Log but don't fail the webhook — payments are already recorded
-                import logging
-                logging.getLogger(__name__).exception(
-                    "Failed to auto-generate licenses for payment %s", payment_id
-                )
+        return license_payments, insurance_payments
 
-        # Generate insurance
-        if insurance_payments and self.insurance_repository:
-            try:
-                use_case = GenerateInsuranceFromPaymentUseCase(self.insurance_repository)
-                await use_case.execute(insurance_payments, payment_id, payment_year)
-            except Exception:
-                import logging
-                logging.getLogger(__name__).exception(
-                    "Failed to auto-generate insurance for payment %s", payment_id
-                )
+    async def _generate_licenses_and_insurance(
+        self,
+        member_payments: List[MemberPayment],
+        payment_id: str,
+        payment_year: int,
+        fulfillment: Optional[PaymentFulfillment] = None,
+        steps: Optional[Set[FulfillmentStep]] = None,
+    ) -> None:
+        """Auto-generate License and Insurance entities from member payments.
+
+        Licenses and insurance are generated concurrently as two separate
+        fulfillment steps, each delegating to its own use case. ``steps``
+        limits the run to some of them when resuming.
+        """
+        license_payments, insurance_payments = self._split_license_and_insurance_payments(
+            member_payments
+        )
+        if fulfillment is None:
+            fulfillment = PaymentFulfillment(payment_id=payment_id)
+
+        jobs = []
+        if license_payments and self.license_repository and (
+            steps is None or FulfillmentStep.LICENSES in steps
+        ):
+            use_case = GenerateLicensesFromPaymentUseCase(self.license_repository)
+            jobs.append(self._run_step(
+                fulfillment,
+                FulfillmentStep.LICENSES,
+                lambda: use_case.execute(license_payments, payment_id, payment_year),
+            ))
+
+        if insurance_payments and self.insurance_repository and (
+            steps is None or FulfillmentStep.INSURANCE in steps
+        ):
+            insurance_use_case = GenerateInsuranceFromPaymentUseCase(self.insurance_repository)
+            jobs.append(self._run_step(
+                fulfillment,
+                FulfillmentStep.INSURANCE,
+                lambda: insurance_use_case.execute(insurance_payments, payment_id, payment_year),
+            ))
+
+        await asyncio.gather(*jobs)
@@ -8,12 +8,13 @@ import json
 import logging
 from dataclasses import dataclass
 from datetime import datetime
-from typing import List, Optional
+from typing import Dict, List, Optional, Set, Tuple
 
 from src.domain.entities.payment import Payment, PaymentStatus, PaymentType, PaymentMethod
 from src.domain.entities.member_payment import (
     MemberPayment,
     MemberPaymentStatus,
+    MemberPaymentType,
     ITEM_TYPE_TO_MEMBER_PAYMENT_TYPE,
 )
 from src.domain.entities.invoice import Invoice, InvoiceLineItem, InvoiceStatus
@@ -114,36 +115,27 @@ class RegisterManualPaymentUseCase:
 
         # 2. Duplicate check per (member_id, payment_type, payment_year).
         # club_fee is checked here too — a caller can include it in payment_types directly.
-        for assignment in member_assignments:
-            for ptype in assignment.payment_types:
-                mp_type = ITEM_TYPE_TO_MEMBER_PAYMENT_TYPE.get(ptype)
-                if mp_type is None:
-                    continue
-                already_exists = await self.member_payment_repository.exists_for_member_year_type(
-                    member_id=assignment.member_id,
-                    payment_year=payment_year,
-                    payment_type=mp_type,
-                )
-                if already_exists:
-                    raise DuplicatePaymentForYearError(assignment.member_id, ptype, payment_year)
-
-        # Duplicate check for the standalone include_club_fee path (club_fee assigned to
-        # member_assignments[0]). Only needed when club_fee is NOT already in payment_types
-        # (if it is already in payment_types the loop above already checked it).
-        if include_club_fee:
-            club_fee_types_already_checked = any(
-                "club_fee" in a.payment_types for a in member_assignments
-            )
-            if not club_fee_types_already_checked:
-                cf_member_id = member_assignments[0].member_id
-                cf_mp_type = ITEM_TYPE_TO_MEMBER_PAYMENT_TYPE["club_fee"]
-                cf_exists = await self.member_payment_repository.exists_for_member_year_type(
-                    member_id=cf_member_id,
-                    payment_year=payment_year,
-                    payment_type=cf_mp_type,
-                )
-                if cf_exists:
-                    raise DuplicatePaymentForYearError(cf_member_id, "club_fee", payment_year)
+        # The standalone include_club_fee path assigns club_fee to member_assignments[0];
+        # it only needs checking when club_fee is NOT already in payment_types.
+        checks = [
+            (assignment.member_id, ptype)
+            for assignment in member_assignments
+            for ptype in assignment.payment_types
+            if ptype in ITEM_TYPE_TO_MEMBER_PAYMENT_TYPE
+        ]
+        if include_club_fee and not any(
+            "club_fee" in a.payment_types for a in member_assignments
+        ):
+            checks.append((member_assignments[0].member_id, "club_fee"))
+
+        already_paid = await self._find_already_paid(
+            list({member_id for member_id, _ in checks}), payment_year
+        )
+        for member_id, ptype in checks:
+            if (member_id, ITEM_TYPE_TO_MEMBER_PAYMENT_TYPE[ptype]) in already_paid:
+                raise DuplicatePaymentForYearError(member_id, ptype, payment_year)
+
+        prices = await self._fetch_prices({ptype for _, ptype in checks})
 
         # 3. Build MemberPayment definitions and compute total
         mp_defs: List[dict] = []
@@ -161,7 +153,7 @@ class RegisterManualPaymentUseCase:
                         continue
                     club_fee_created = True
 
-                price = await self._fetch_price(ptype)
+                price = prices[ptype]
                 mp_defs.append({
                     "member_id": assignment.member_id,
                     "mp_type": mp_type,
@@ -179,7 +171,7 @@ class RegisterManualPaymentUseCase:
 
         # Handle standalone club_fee if include_club_fee requested and not yet added
         if include_club_fee and not club_fee_created and member_assignments:
-            price = await self._fetch_price("club_fee")
+            price = prices["club_fee"]
             club_fee_member_id = member_assignments[0].member_id
             mp_type = ITEM_TYPE_TO_MEMBER_PAYMENT_TYPE["club_fee"]
             mp_defs.append({
@@ -244,26 +236,58 @@ class RegisterManualPaymentUseCase:
             invoice=invoice,
         )
 
-    async def _fetch_price(self, item_type: str) -> float:
-        """Fetch price from price_configuration by item_type key.
+    async def _find_already_paid(
+        self,
+        member_ids: List[str],
+        payment_year: int,
+    ) -> Set[Tuple[str, MemberPaymentType]]:
+        """Return the (member_id, payment_type) pairs already pending or paid for the year.
+
+        One query for every member in the request, mirroring
+        MemberPaymentRepositoryPort.exists_for_member_year_type.
+        """
+        if not member_ids:
+            return set()
+        existing = await self.member_payment_repository.find_by_member_ids_year(
+            member_ids, payment_year
+        )
+        return {
+            (mp.member_id, mp.payment_type)
+            for mp in existing
+            if mp.status in (MemberPaymentStatus.PENDING, MemberPaymentStatus.COMPLETED)
+        }
+
+    async def _fetch_prices(self, item_types: Set[str]) -> Dict[str, float]:
+        """Fetch prices from price_configuration for several item_types in one query.
 
-        Returns 0.0 only when item_type has no mapping in PAYMENT_TYPE_TO_PRICE_KEY
-        (i.e. genuinely unmapped — no price applies). For mapped types where the
-        price configuration record is missing from the DB, raises
-        InvalidPaymentDataError to prevent silently-wrong totals.
+        Unmapped item_types (no entry in PAYMENT_TYPE_TO_PRICE_KEY) get 0.0 —
+        no price applies. For mapped types where the price configuration record
+        is missing from the DB, raises InvalidPaymentDataError to prevent
+        silently-wrong totals.
 
         Mirrors InitiateAnnualPaymentUseCase._get_prices error behaviour.
         """
-        price_key = PAYMENT_TYPE_TO_PRICE_KEY.get(item_type)
-        if not price_key:
-            # item_type has no price mapping — not a billable item, return 0.0
-            return 0.0
-        config = await self.price_configuration_repository.find_by_key(price_key)
-        if config is None:
-            raise InvalidPaymentDataError(
-                f"Missing price configuration for '{item_type}'"
-            )
-        return config.price
+        prices = {
+            item_type: 0.0
+            for item_type in item_types
+            if item_type not in PAYMENT_TYPE_TO_PRICE_KEY
+        }
+        mapped = {
+            PAYMENT_TYPE_TO_PRICE_KEY[item_type]: item_type
+            for item_type in item_types
+            if item_type in PAYMENT_TYPE_TO_PRICE_KEY
+        }
+        if not mapped:
+            return prices
+
+        configs = await self.price_configuration_repository.get_many(mapped)
+        for price_key, item_type in sorted(mapped.items()):
+            if price_key not in configs:
+                raise InvalidPaymentDataError(
+                    f"Missing price configuration for '{item_type}'"
+                )
+            prices[item_type] = configs[price_key].price
+        return prices
 
     async def _create_invoice(self, payment: Payment) -> Optional[Invoice]:
         """Create an invoice for the manual payment.
@@ -34,8 +34,7 @@ class GetAnnualPaymentPricesUseCase:
         Raises:
             ValueError: If any required prices are missing or inactive.
         """
-        configs = await self.price_repository.find_by_keys(ANNUAL_PAYMENT_PRICE_KEYS)
-        result = {config.key: config for config in configs}
+        result = await self.price_repository.get_many(ANNUAL_PAYMENT_PRICE_KEYS)
 
         missing = [key for key in ANNUAL_PAYMENT_PRICE_KEYS if key not in result]
         if missing:
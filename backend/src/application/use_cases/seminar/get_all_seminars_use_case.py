@@ -5,6 +5,7 @@ from typing import Optional
 from typing import List, Optional
 
 from src.domain.entities.seminar import Seminar
+from src.application.read_models.page import Page
 from src.application.ports.seminar_repository import SeminarRepositoryPort
 
 
@@ -26,3 +27,13 @@ class GetAllSeminarsUseCase:
         if association_id:
             return await self.seminar_repository.find_by_association_id(association_id, limit)
         return await self.seminar_repository.find_all(limit)
+
+    async def execute_page(
+        self,
+        limit: int,
+        cursor: Optional[str] = None,
+        club_id: Optional[str] = None,
+        association_id: Optional[str] = None
+    ) -> Page[Seminar]:
+        """Get one page of seminars; pass the returned next_cursor to get the next."""
+        return await self.seminar_repository.find_page(limit, cursor, club_id, association_id)
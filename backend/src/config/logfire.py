@@ -1,11 +1,23 @@
 import os
-from fastapi import FastAPI
-import logfire
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from fastapi import FastAPI
 
 # Track configuration status internally
 _logfire_configured = False
 
-def configure_logfire_base(app: FastAPI | None = None):
+def skip_unused_pydantic_plugin():
+    """Keep pydantic from loading logfire's plugin when no token is set.
+
+    Pydantic loads the plugins installed packages register when the first
+    model is defined; logfire's imports all of logfire and its exporters,
+    which only matters once Logfire is configured.
+    """
+    if not os.getenv("LOGFIRE_TOKEN"):
+        os.environ.setdefault("PYDANTIC_DISABLE_PLUGINS", "logfire-plugin")
+
+def configure_logfire_base(app: "FastAPI | None" = None):
     """Configure basic Logfire settings without instrumenting FastAPI"""
     global _logfire_configured
     
@@ -14,6 +26,10 @@ def configure_logfire_base(app: FastAPI | None = None):
         environment = os.getenv("ENVIRONMENT")
         service_name = os.getenv("SERVICE_NAME")
         if token:
+            # Imported only when a token is set: logfire and its
+            # instrumentation packages take long to import
+            import logfire
+
             # Configure logfire with the latest API
             logfire.configure(
                 token=token,
@@ -50,11 +66,11 @@ def logfire_instrument_additional_libraries():
             print("WARNING: Trying to instrument libraries before Logfire is configured")
             return False
             
+        import logfire
+
         logfire.info("Instrumenting additional libraries")
         try:
             logfire.instrument_pymongo()
-            logfire.instrument_mcp()
-            logfire.instrument_openai()
             logfire.instrument_pydantic()
             return True
         except Exception as e:
@@ -64,7 +80,7 @@ def logfire_instrument_additional_libraries():
         print(f"Error instrumenting additional libraries: {e}")
         return False
 
-def configure_logfire(app: FastAPI | None = None):
+def configure_logfire(app: "FastAPI | None" = None):
     """Backwards compatibility function that configures everything at once"""
     if not is_configured():
         base_configured = configure_logfire_base(app)
@@ -1,7 +1,8 @@
 """Application settings and configuration for payment gateway integration."""
 
+import importlib.util
 import os
-from typing import Literal, Optional
+from typing import Any, Dict, List, Literal, Optional
 from dataclasses import dataclass
 from dotenv import load_dotenv
 
@@ -123,6 +124,105 @@ class InvoiceSettings:
         return self.output_directory
 
 
+@dataclass
+class DatabaseSettings:
+    """MongoDB connection and client pool settings."""
+
+    url: str = "mongodb://localhost:27017"
+    name: Optional[str] = None
+    max_pool_size: int = 100
+    min_pool_size: int = 0
+    max_idle_time_ms: Optional[int] = None
+    server_selection_timeout_ms: int = 30000
+    connect_timeout_ms: int = 20000
+    wait_queue_timeout_ms: Optional[int] = None
+    compressors: str = ""  # comma-separated, e.g. "zlib"; zstd and snappy need their packages installed
+    retry_writes: bool = True
+    read_preference: str = "primary"
+    # Used by reads inside @reporting use cases and endpoints
+    reporting_read_preference: str = "secondaryPreferred"
+    reporting_max_staleness_seconds: int = 90  # -1 for no bound; otherwise at least 90
+
+    READ_PREFERENCES = ("primary", "primaryPreferred", "secondary", "secondaryPreferred", "nearest")
+    # Compressor name -> module PyMongo needs for it; without the module
+    # PyMongo drops the compressor silently
+    COMPRESSORS = {"zstd": "zstandard", "snappy": "snappy", "zlib": "zlib"}
+
+    def __post_init__(self):
+        """Load settings from environment variables."""
+        def _optional_int(key: str, default: Optional[int]) -> Optional[int]:
+            value = os.getenv(key)
+            return int(value) if value else default
+
+        self.url = os.getenv("MONGODB_URL", self.url)
+        self.name = os.getenv("DATABASE_NAME", self.name)
+        self.max_pool_size = int(os.getenv("MONGODB_MAX_POOL_SIZE", str(self.max_pool_size)))
+        self.min_pool_size = int(os.getenv("MONGODB_MIN_POOL_SIZE", str(self.min_pool_size)))
+        self.max_idle_time_ms = _optional_int("MONGODB_MAX_IDLE_TIME_MS", self.max_idle_time_ms)
+        self.server_selection_timeout_ms = int(
+            os.getenv("MONGODB_SERVER_SELECTION_TIMEOUT_MS", str(self.server_selection_timeout_ms))
+        )
+        self.connect_timeout_ms = int(os.getenv("MONGODB_CONNECT_TIMEOUT_MS", str(self.connect_timeout_ms)))
+        self.wait_queue_timeout_ms = _optional_int("MONGODB_WAIT_QUEUE_TIMEOUT_MS", self.wait_queue_timeout_ms)
+        self.compressors = os.getenv("MONGODB_COMPRESSORS", self.compressors)
+        self.retry_writes = os.getenv("MONGODB_RETRY_WRITES", "true").lower() == "true"
+        self.read_preference = os.getenv("MONGODB_READ_PREFERENCE", self.read_preference)
+        self.reporting_read_preference = os.getenv(
+            "MONGODB_REPORTING_READ_PREFERENCE", self.reporting_read_preference
+        )
+        self.reporting_max_staleness_seconds = int(
+            os.getenv("MONGODB_REPORTING_MAX_STALENESS_SECONDS", str(self.reporting_max_staleness_seconds))
+        )
+
+    def validate(self) -> None:
+        """Validate the settings.
+
+        Raises:
+            ValueError: If a setting has an unsupported value.
+        """
+        if self.min_pool_size > self.max_pool_size > 0:
+            raise ValueError("MONGODB_MIN_POOL_SIZE cannot exceed MONGODB_MAX_POOL_SIZE")
+        if self.read_preference not in self.READ_PREFERENCES:
+            raise ValueError(f"Unsupported MONGODB_READ_PREFERENCE: {self.read_preference}")
+        if self.reporting_read_preference not in self.READ_PREFERENCES:
+            raise ValueError(
+                f"Unsupported MONGODB_REPORTING_READ_PREFERENCE: {self.reporting_read_preference}"
+            )
+        if self.reporting_max_staleness_seconds != -1 and self.reporting_max_staleness_seconds < 90:
+            raise ValueError("MONGODB_REPORTING_MAX_STALENESS_SECONDS must be -1 or at least 90")
+        unknown = set(self.compressor_list) - set(self.COMPRESSORS)
+        if unknown:
+            raise ValueError(f"Unsupported MONGODB_COMPRESSORS: {', '.join(sorted(unknown))}")
+        for compressor in self.compressor_list:
+            module = self.COMPRESSORS[compressor]
+            if importlib.util.find_spec(module) is None:
+                raise ValueError(
+                    f"MONGODB_COMPRESSORS includes {compressor}, but the {module} module is not installed"
+                )
+
+    @property
+    def compressor_list(self) -> List[str]:
+        return [c.strip() for c in self.compressors.split(",") if c.strip()]
+
+    def client_options(self) -> Dict[str, Any]:
+        """Keyword arguments for the Motor client."""
+        options: Dict[str, Any] = {
+            "maxPoolSize": self.max_pool_size,
+            "minPoolSize": self.min_pool_size,
+            "serverSelectionTimeoutMS": self.server_selection_timeout_ms,
+            "connectTimeoutMS": self.connect_timeout_ms,
+            "retryWrites": self.retry_writes,
+            "readPreference": self.read_preference,
+        }
+        if self.max_idle_time_ms is not None:
+            options["maxIdleTimeMS"] = self.max_idle_time_ms
+        if self.wait_queue_timeout_ms is not None:
+            options["waitQueueTimeoutMS"] = self.wait_queue_timeout_ms
+        if self.compressor_list:
+            options["compressors"] = ",".join(self.compressor_list)
+        return options
+
+
 @dataclass
 class AppSettings:
     """Application-wide settings."""
@@ -148,6 +248,7 @@ _redsys_settings: Optional[RedsysSettings] = None
 _email_settings: Optional[EmailSettings] = None
 _invoice_settings: Optional[InvoiceSettings] = None
 _app_settings: Optional[AppSettings] = None
+_database_settings: Optional[DatabaseSettings] = None
 
 
 def get_redsys_settings() -> RedsysSettings:
@@ -180,3 +281,11 @@ def get_app_settings() -> AppSettings:
     if _app_settings is None:
         _app_settings = AppSettings()
     return _app_settings
+
+
+def get_database_settings() -> DatabaseSettings:
+    """Get database settings instance."""
+    global _database_settings
+    if _database_settings is None:
+        _database_settings = DatabaseSettings()
+    return _database_settings
@@ -12,6 +12,11 @@ from .insurance import Insurance, InsuranceType, InsuranceStatus
 from .price_configuration import PriceConfiguration
 from .invoice import Invoice, InvoiceStatus, InvoiceLineItem
 from .password_reset_token import PasswordResetToken
+from .payment_fulfillment import (
+    PaymentFulfillment, FulfillmentStep,
+    FulfillmentStepStatus, FulfillmentStepState
+)
+from .webhook_ledger_entry import WebhookLedgerEntry, WebhookLedgerStatus
 
 __all__ = [
     "User",
@@ -24,5 +29,8 @@ __all__ = [
     "Insurance", "InsuranceType", "InsuranceStatus",
     "PriceConfiguration",
     "Invoice", "InvoiceStatus", "InvoiceLineItem",
-    "PasswordResetToken"
+    "PasswordResetToken",
+    "PaymentFulfillment", "FulfillmentStep",
+    "FulfillmentStepStatus", "FulfillmentStepState",
+    "WebhookLedgerEntry", "WebhookLedgerStatus"
 ]
\ No newline at end of file
@@ -0,0 +1,104 @@
+"""PaymentFulfillment domain entity for tracking post-payment side effects."""
+
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Dict, Optional
+from enum import Enum
+
+
+class FulfillmentStep(str, Enum):
+    """Side effects run after a payment has been completed."""
+    SEMINAR = "seminar"
+    LICENSES = "licenses"
+    INSURANCE = "insurance"
+    INVOICE = "invoice"
+    EMAIL = "email"
+
+
+class FulfillmentStepStatus(str, Enum):
+    """Status of a single fulfillment step."""
+    PENDING = "pending"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+
+@dataclass
+class FulfillmentStepState:
+    """Progress of one fulfillment step."""
+    status: FulfillmentStepStatus = FulfillmentStepStatus.PENDING
+    attempts: int = 0
+    last_error: Optional[str] = None
+    updated_at: Optional[datetime] = None
+
+
+@dataclass
+class PaymentFulfillment:
+    """Domain entity recording the side effects of a completed payment.
+
+    The payment itself is committed before any of these steps run. Each step
+    (licenses, insurance, invoice, email...) is retried independently and
+    its outcome is stored here, one record per payment.
+    """
+    id: Optional[str] = None
+    payment_id: str = ""
+    steps: Dict[FulfillmentStep, FulfillmentStepState] = field(default_factory=dict)
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+
+    def __post_init__(self):
+        """Validate payment fulfillment entity."""
+        self.created_at = self.created_at or datetime.utcnow()
+        self.updated_at = self.updated_at or datetime.utcnow()
+        if not self.payment_id:
+            raise ValueError("Payment ID is required")
+
+    def start_step(self, step: FulfillmentStep) -> FulfillmentStepState:
+        """Mark a step as running and count the attempt."""
+        state = self.steps.setdefault(step, FulfillmentStepState())
+        state.status = FulfillmentStepStatus.RUNNING
+        state.attempts += 1
+        state.updated_at = datetime.utcnow()
+        self.updated_at = state.updated_at
+        return state
+
+    def complete_step(self, step: FulfillmentStep) -> FulfillmentStepState:
+        """Mark a step as completed."""
+        state = self.steps.setdefault(step, FulfillmentStepState())
+        state.status = FulfillmentStepStatus.COMPLETED
+        state.last_error = None
+        state.updated_at = datetime.utcnow()
+        self.updated_at = state.updated_at
+        return state
+
+    def fail_step(self, step: FulfillmentStep, error: str) -> FulfillmentStepState:
+        """Mark a step as failed with the last error message."""
+        state = self.steps.setdefault(step, FulfillmentStepState())
+        state.status = FulfillmentStepStatus.FAILED
+        state.last_error = error
+        state.updated_at = datetime.utcnow()
+        self.updated_at = state.updated_at
+        return state
+
+    @property
+    def is_completed(self) -> bool:
+        """Check if every step has completed."""
+        return all(
+            state.status == FulfillmentStepStatus.COMPLETED
+            for state in self.steps.values()
+        )
+
+    def resumable_steps(self, max_attempts: int) -> list:
+        """Steps not completed yet that have been attempted fewer than max_attempts times."""
+        return [
+            step for step, state in self.steps.items()
+            if state.status != FulfillmentStepStatus.COMPLETED and state.attempts < max_attempts
+        ]
+
+    @property
+    def failed_steps(self) -> list:
+        """Steps whose last attempt failed."""
+        return [
+            step for step, state in self.steps.items()
+            if state.status == FulfillmentStepStatus.FAILED
+        ]
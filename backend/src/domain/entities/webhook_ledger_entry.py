@@ -0,0 +1,45 @@
+"""WebhookLedgerEntry domain entity for deduplicating payment notifications."""
+
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
+from enum import Enum
+
+
+class WebhookLedgerStatus(str, Enum):
+    """Processing status of a received notification."""
+    PROCESSING = "processing"
+    COMPLETED = "completed"
+
+
+@dataclass
+class WebhookLedgerEntry:
+    """Domain entity recording a Redsys notification that was received.
+
+    A notification is identified by its order ID and signature. The first
+    delivery claims the entry and stores the outcome once processed; later
+    deliveries of the same notification replay that outcome instead of
+    processing the payment again.
+    """
+    id: Optional[str] = None
+    order_id: str = ""
+    ds_signature: str = ""
+    status: WebhookLedgerStatus = WebhookLedgerStatus.PROCESSING
+    payment_id: Optional[str] = None
+    success: Optional[bool] = None
+    message: Optional[str] = None
+    claimed_at: Optional[datetime] = None
+    completed_at: Optional[datetime] = None
+
+    def __post_init__(self):
+        """Validate webhook ledger entry."""
+        self.claimed_at = self.claimed_at or datetime.utcnow()
+        if not self.order_id:
+            raise ValueError("Order ID is required")
+        if not self.ds_signature:
+            raise ValueError("Signature is required")
+
+    @property
+    def is_completed(self) -> bool:
+        """Check if the notification has been fully processed."""
+        return self.status == WebhookLedgerStatus.COMPLETED
@@ -0,0 +1,166 @@
+"""Read-through cache of the price configuration table."""
+
+import asyncio
+import copy
+import logging
+import time
+from typing import Callable, Dict, Iterable, List, Optional
+
+from src.domain.entities.price_configuration import PriceConfiguration
+from src.application.ports.price_configuration_repository import PriceConfigurationRepositoryPort
+from src.application.ports.read_routing import ReadRouting, read_routing
+from src.application.read_models.collection_version import CollectionVersion
+from src.infrastructure.adapters.repositories.mongodb_cache_version_repository import (
+    MongoDBCacheVersionRepository,
+)
+
+logger = logging.getLogger(__name__)
+
+# Name of the price table's counter in the cache_versions collection
+PRICE_CACHE_NAME = "price_configurations"
+
+
+class CachedPriceConfigurationRepository(PriceConfigurationRepositoryPort):
+    """
+    Price configuration repository that serves price lookups from memory.
+
+    The whole table (a few dozen rows that change a few times a year) is
+    loaded at once and stamped with the version counter it was read at.
+    ``create``, ``update`` and ``delete`` write through, bump the shared
+    counter and drop the local copy; other workers compare their stamp with
+    the counter at most every ``check_seconds`` and reload when it moved.
+    Writes that bypass this class (seed scripts, manual edits) are picked up
+    once the copy is ``max_age_seconds`` old.
+
+    Only the lookups are cached. ``find_by_id`` and the ``exists*`` checks
+    back read-modify-write and uniqueness checks, so they always hit the
+    database. Entities are copied on the way out: callers may mutate them.
+    """
+
+    def __init__(
+        self,
+        repository: PriceConfigurationRepositoryPort,
+        versions: MongoDBCacheVersionRepository,
+        check_seconds: float = 5.0,
+        max_age_seconds: float = 300.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.repository = repository
+        self.versions = versions
+        self.check_seconds = check_seconds
+        self.max_age_seconds = max_age_seconds
+        self._clock = clock
+        self._lock = asyncio.Lock()
+        self._by_key: Optional[Dict[str, PriceConfiguration]] = None
+        self._collection_version = CollectionVersion()
+        self._version: Optional[int] = None
+        self._loaded_at = 0.0
+        self._checked_at = 0.0
+
+    def invalidate(self) -> None:
+        """Drop the local copy; the next lookup reloads it."""
+        self._by_key = None
+
+    def _is_fresh(self) -> bool:
+        return self._by_key is not None and self._clock() - self._loaded_at < self.max_age_seconds
+
+    async def _table(self) -> Dict[str, PriceConfiguration]:
+        """The cached table, reloaded first if it is missing, expired or outdated."""
+        if self._is_fresh() and self._clock() - self._checked_at < self.check_seconds:
+            return self._by_key
+        async with self._lock:
+            # Another task may have refreshed the table while this one waited
+            now = self._clock()
+            if self._is_fresh() and now - self._checked_at < self.check_seconds:
+                return self._by_key
+            # The table is shared by every later caller, so read it from the
+            # primary even when the caller is a reporting read
+            with read_routing(ReadRouting.PRIMARY):
+                version = await self.versions.get(PRICE_CACHE_NAME)
+                self._checked_at = now
+                if self._is_fresh() and version == self._version:
+                    return self._by_key
+                # Read the version before the rows: a write in between leaves
+                # a stale stamp, which only causes one extra reload
+                configs = await self.repository.find_all()
+            self._by_key = {config.key: config for config in configs}
+            stamps = [config.updated_at for config in configs if config.updated_at]
+            self._collection_version = CollectionVersion(
+                count=len(configs), last_modified=max(stamps) if stamps else None
+            )
+            self._version = version
+            self._loaded_at = now
+            logger.debug(f"Price cache loaded {len(configs)} configurations at version {version}")
+            return self._by_key
+
+    async def _written(self) -> None:
+        self.invalidate()
+        await self.versions.bump(PRICE_CACHE_NAME)
+
+    @staticmethod
+    def _sorted(configs: Iterable[PriceConfiguration], limit: int) -> List[PriceConfiguration]:
+        ordered = sorted(configs, key=lambda config: config.key)
+        if limit > 0:
+            ordered = ordered[:limit]
+        return [copy.copy(config) for config in ordered]
+
+    async def find_all(self, limit: int = 0) -> List[PriceConfiguration]:
+        return self._sorted((await self._table()).values(), limit)
+
+    async def find_active(self, limit: int = 0) -> List[PriceConfiguration]:
+        return self._sorted((c for c in (await self._table()).values() if c.is_active), limit)
+
+    async def find_by_key(self, key: str) -> Optional[PriceConfiguration]:
+        config = (await self._table()).get(key)
+        return copy.copy(config) if config else None
+
+    async def find_by_license_type(
+        self,
+        technical_grade: str,
+        instructor_category: str,
+        age_category: str
+    ) -> Optional[PriceConfiguration]:
+        config = (await self._table()).get(f"{technical_grade}-{instructor_category}-{age_category}")
+        return copy.copy(config) if config and config.is_active else None
+
+    async def get_many(self, keys: Iterable[str]) -> Dict[str, PriceConfiguration]:
+        table = await self._table()
+        found = {}
+        for key in keys:
+            config = table.get(key)
+            if config and config.is_active:
+                found[key] = copy.copy(config)
+        return found
+
+    async def find_by_keys(self, keys: List[str]) -> List[PriceConfiguration]:
+        return list((await self.get_many(keys)).values())
+
+    async def find_by_id(self, price_id: str) -> Optional[PriceConfiguration]:
+        return await self.repository.find_by_id(price_id)
+
+    async def exists(self, price_id: str) -> bool:
+        return await self.repository.exists(price_id)
+
+    async def exists_by_key(self, key: str) -> bool:
+        return await self.repository.exists_by_key(key)
+
+    async def get_collection_version(self) -> CollectionVersion:
+        """Version of the table being served, so an ETag always matches the listing built from it."""
+        await self._table()
+        return self._collection_version
+
+    async def create(self, price_config: PriceConfiguration) -> PriceConfiguration:
+        created = await self.repository.create(price_config)
+        await self._written()
+        return created
+
+    async def update(self, price_config: PriceConfiguration) -> PriceConfiguration:
+        updated = await self.repository.update(price_config)
+        await self._written()
+        return updated
+
+    async def delete(self, price_id: str) -> bool:
+        deleted = await self.repository.delete(price_id)
+        if deleted:
+            await self._written()
+        return deleted
@@ -0,0 +1,215 @@
+"""Shared write helpers for the MongoDB repository adapters."""
+
+import asyncio
+import base64
+import binascii
+from typing import Any, AsyncIterator, List, Optional
+from bson import ObjectId, json_util
+from pymongo import ASCENDING, DESCENDING, ReturnDocument
+
+from src.application.ports.query_spec import QuerySpec
+from src.application.read_models.collection_version import CollectionVersion
+from src.application.read_models.page import Page
+from src.domain.exceptions.base import ValidationError
+from src.infrastructure.read_routing import routed
+
+# Documents fetched per round trip by the iter_* streaming methods
+DEFAULT_BATCH_SIZE = 500
+
+
+def encode_cursor(sort_value: Any, doc_id: Any) -> str:
+    """Encode the (sort value, _id) position of a document as an opaque token."""
+    raw = json_util.dumps({"k": sort_value, "id": doc_id})
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def decode_cursor(cursor: str) -> tuple:
+    """Decode a token produced by encode_cursor back into (sort value, _id)."""
+    try:
+        data = json_util.loads(base64.urlsafe_b64decode(cursor.encode()).decode())
+        return data["k"], data["id"]
+    except (binascii.Error, ValueError, KeyError, TypeError):
+        raise ValidationError("Cursor de paginación inválido")
+
+
+def keyset_filter(sort_key: str, direction: int, sort_value: Any, doc_id: Any) -> dict:
+    """Match the documents strictly after (sort_value, doc_id) in the given order.
+
+    Missing or null sort values sort first in ascending order and last in
+    descending order, and range operators never match them, so they get
+    their own branches.
+    """
+    after = "$gt" if direction == ASCENDING else "$lt"
+    if sort_value is None:
+        same_key = {sort_key: None, "_id": {after: doc_id}}
+        if direction == ASCENDING:
+            return {"$or": [same_key, {sort_key: {"$ne": None}}]}
+        return same_key
+    branches = [
+        {sort_key: {after: sort_value}},
+        {sort_key: sort_value, "_id": {after: doc_id}},
+    ]
+    if direction != ASCENDING:
+        branches.append({sort_key: None})
+    return {"$or": branches}
+
+
+class MongoDBBaseRepository:
+    """Base for MongoDB repositories that write without reading back.
+
+    Subclasses set ``self.collection`` and implement ``_to_domain``. Inserts
+    build the returned entity from the document just written (the driver
+    fills in ``_id``); updates use ``find_one_and_update`` so the stored
+    document comes back in the same round trip. ``_iter`` streams query
+    results batch by batch for the ``iter_*`` methods, ``_find_page``
+    serves keyset-paginated listings, ``_find_by_spec`` runs a QuerySpec and
+    ``_collection_version`` fingerprints a filter for conditional GETs.
+
+    ``SPEC_FIELDS`` lists the entity fields a QuerySpec may filter or sort
+    on, mapped to their document field names.
+
+    ``collection`` follows the read routing of the calling use case, so
+    reads inside a ``@reporting`` use case may be served by a secondary.
+    """
+
+    SPEC_FIELDS: dict = {}
+
+    @property
+    def collection(self) -> Any:
+        return routed(self._collection)
+
+    @collection.setter
+    def collection(self, collection: Any) -> None:
+        self._collection = collection
+
+    def _to_domain(self, doc: dict) -> Any:
+        raise NotImplementedError
+
+    async def _insert(self, doc: dict) -> Any:
+        """Insert a new document and return it as a domain entity."""
+        doc.pop("_id", None)
+        result = await self.collection.insert_one(doc)
+        doc["_id"] = result.inserted_id
+        return self._to_domain(doc)
+
+    async def _insert_many(self, docs: List[dict]) -> List[Any]:
+        """Insert several new documents and return them as domain entities."""
+        if not docs:
+            return []
+        for doc in docs:
+            doc.pop("_id", None)
+        result = await self.collection.insert_many(docs)
+        for doc, inserted_id in zip(docs, result.inserted_ids):
+            doc["_id"] = inserted_id
+        return [self._to_domain(doc) for doc in docs]
+
+    async def _update(self, entity_id: str, doc: dict) -> Optional[Any]:
+        """$set the given fields and return the stored document as a domain entity.
+
+        Returns None when no document has the given id.
+        """
+        doc.pop("_id", None)
+        updated_doc = await self.collection.find_one_and_update(
+            {"_id": ObjectId(entity_id)},
+            {"$set": doc},
+            return_document=ReturnDocument.AFTER,
+        )
+        return self._to_domain(updated_doc)
+
+    async def _iter(
+        self,
+        query: dict,
+        projection: Optional[dict] = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+    ) -> AsyncIterator[Any]:
+        """Yield domain entities for a query, holding one batch in memory at a time."""
+        if batch_size <= 0:
+            raise ValueError("batch_size must be positive")
+        cursor = self.collection.find(query, projection).batch_size(batch_size)
+        async for doc in cursor:
+            yield self._to_domain(doc)
+
+    async def _find_page(
+        self,
+        query: dict,
+        sort_key: str,
+        direction: int,
+        limit: int,
+        cursor: Optional[str] = None,
+    ) -> Page:
+        """Return up to ``limit`` entities ordered by (sort_key, _id) after ``cursor``.
+
+        The cursor pins the position of the last document served, so every
+        page is an index range scan no matter how deep it is.
+        """
+        if limit <= 0:
+            raise ValidationError("El tamaño de página debe ser positivo")
+        if cursor:
+            position = keyset_filter(sort_key, direction, *decode_cursor(cursor))
+            query = {"$and": [query, position]} if query else position
+        documents = await (
+            self.collection.find(query)
+            .sort([(sort_key, direction), ("_id", direction)])
+            .limit(limit + 1)
+            .to_list(length=limit + 1)
+        )
+        next_cursor = None
+        if len(documents) > limit:
+            documents = documents[:limit]
+            last = documents[-1]
+            next_cursor = encode_cursor(last.get(sort_key), last["_id"])
+        return Page(items=[self._to_domain(doc) for doc in documents], next_cursor=next_cursor)
+
+    def _compile_spec(self, spec: QuerySpec) -> tuple:
+        """Translate a QuerySpec into a Mongo filter and sort list."""
+        def _field(name: str) -> str:
+            if name not in self.SPEC_FIELDS:
+                raise ValueError(f"Unsupported query field for {type(self).__name__}: {name}")
+            return self.SPEC_FIELDS[name]
+
+        query = {}
+        for name, value in spec.filters.items():
+            query[_field(name)] = {"$in": list(value)} if isinstance(value, tuple) else value
+        sort = [(_field(name), DESCENDING if descending else ASCENDING) for name, descending in spec.sort]
+        return query, sort
+
+    async def _find_by_spec(self, spec: QuerySpec, extra_query: Optional[dict] = None) -> List[Any]:
+        """Run a QuerySpec, ANDed with ``extra_query``, as a single find."""
+        query, sort = self._compile_spec(spec)
+        if extra_query:
+            query = {"$and": [query, extra_query]} if query else extra_query
+        cursor = self.collection.find(query)
+        if sort:
+            cursor = cursor.sort(sort)
+        if spec.limit > 0:
+            cursor = cursor.limit(spec.limit)
+        documents = await cursor.to_list(length=spec.limit if spec.limit > 0 else None)
+        return [self._to_domain(doc) for doc in documents]
+
+    async def _collection_version(self, query: Optional[dict] = None) -> CollectionVersion:
+        """Count the documents matching ``query`` and read their latest ``updated_at``.
+
+        Both reads stay on indexes created by ``_ensure_version_indexes``:
+        the latest update is the first entry of an ``updated_at`` index, and
+        a collection-wide count comes from the collection metadata.
+        """
+        if query:
+            count = self.collection.count_documents(query)
+        else:
+            count = self.collection.estimated_document_count()
+        latest = (
+            self.collection.find(query or {}, {"_id": 0, "updated_at": 1})
+            .sort("updated_at", DESCENDING)
+            .limit(1)
+            .to_list(length=1)
+        )
+        count, latest = await asyncio.gather(count, latest)
+        return CollectionVersion(count=count, last_modified=latest[0].get("updated_at") if latest else None)
+
+    async def _ensure_version_indexes(self, *scope_fields: str) -> None:
+        """Create the ``updated_at`` indexes behind ``_collection_version``, one per scope field."""
+        await self.collection.create_index([("updated_at", DESCENDING)], name="updated_at")
+        for field in scope_fields:
+            await self.collection.create_index(
+                [(field, ASCENDING), ("updated_at", DESCENDING)], name=f"{field}_updated_at"
+            )
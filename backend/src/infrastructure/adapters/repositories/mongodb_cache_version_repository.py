@@ -0,0 +1,45 @@
+"""MongoDB store of the version counters behind the in-process caches."""
+
+from typing import Dict, Iterable
+
+from pymongo import ReturnDocument
+
+from src.infrastructure.database import get_database
+
+
+class MongoDBCacheVersionRepository:
+    """Version counter per cached dataset, shared by every worker.
+
+    Writers bump the counter of the dataset they changed; each worker
+    compares it with the version its copy was loaded at to know when to
+    reload. Works on a standalone server, unlike change streams, which
+    need a replica set. Reads always go to the primary: a lagging
+    secondary would hide the bump.
+    """
+
+    def __init__(self):
+        self.db = get_database()
+        self.collection = self.db["cache_versions"]
+
+    async def get(self, name: str) -> int:
+        """Current version of a dataset; 0 if it was never bumped."""
+        doc = await self.collection.find_one({"_id": name})
+        return doc["version"] if doc else 0
+
+    async def get_many(self, names: Iterable[str]) -> Dict[str, int]:
+        """Current version of each dataset; 0 for those never bumped."""
+        names = list(names)
+        versions = dict.fromkeys(names, 0)
+        async for doc in self.collection.find({"_id": {"$in": names}}):
+            versions[doc["_id"]] = doc["version"]
+        return versions
+
+    async def bump(self, name: str) -> int:
+        """Increment the version of a dataset and return the new value."""
+        doc = await self.collection.find_one_and_update(
+            {"_id": name},
+            {"$inc": {"version": 1}},
+            upsert=True,
+            return_document=ReturnDocument.AFTER,
+        )
+        return doc["version"]
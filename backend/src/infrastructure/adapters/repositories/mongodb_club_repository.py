@@ -6,10 +6,12 @@ from datetime import datetime
 
 from src.domain.entities.club import Club
 from src.application.ports.club_repository import ClubRepositoryPort
+from src.application.read_models.collection_version import CollectionVersion
 from src.infrastructure.database import get_database
+from src.infrastructure.adapters.repositories.mongodb_base_repository import MongoDBBaseRepository
 
 
-class MongoDBClubRepository(ClubRepositoryPort):
+class MongoDBClubRepository(MongoDBBaseRepository, ClubRepositoryPort):
     """MongoDB implementation of Club Repository.
 
     Note: After migration 009, all club _id values are ObjectId.
@@ -20,6 +22,10 @@ class MongoDBClubRepository(ClubRepositoryPort):
         self.db = get_database()
         self.collection = self.db["clubs"]
 
+    async def ensure_indexes(self) -> None:
+        """Create the index backing the collection version."""
+        await self._ensure_version_indexes()
+
     def _to_domain(self, doc: dict) -> Optional[Club]:
         if doc is None:
             return None
@@ -93,22 +99,12 @@ class MongoDBClubRepository(ClubRepositoryPort):
         return [self._to_domain(doc) for doc in documents]
 
     async def create(self, club: Club) -> Club:
-        doc = self._to_document(club)
-        if "_id" in doc:
-            del doc["_id"]
-        result = await self.collection.insert_one(doc)
-        created_doc = await self.collection.find_one({"_id": result.inserted_id})
-        return self._to_domain(created_doc)
+        return await self._insert(self._to_document(club))
 
     async def update(self, club: Club) -> Club:
         if not club.id:
             raise ValueError("Club ID is required for update")
-        doc = self._to_document(club)
-        if "_id" in doc:
-            del doc["_id"]
-        await self.collection.update_one({"_id": ObjectId(club.id)}, {"$set": doc})
-        updated_doc = await self.collection.find_one({"_id": ObjectId(club.id)})
-        return self._to_domain(updated_doc)
+        return await self._update(club.id, self._to_document(club))
 
     async def delete(self, club_id: str) -> bool:
         try:
@@ -123,3 +119,6 @@ class MongoDBClubRepository(ClubRepositoryPort):
             return count > 0
         except Exception:
             return False
+
+    async def get_collection_version(self, club_id: Optional[str] = None) -> CollectionVersion:
+        return await self._collection_version({"_id": ObjectId(club_id)} if club_id else None)
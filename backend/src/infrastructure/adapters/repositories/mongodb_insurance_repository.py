@@ -1,21 +1,30 @@
 """MongoDB Insurance Repository Adapter."""
 
-from typing import List, Optional
+from typing import AsyncIterator, List, Optional
 from bson import ObjectId
 from datetime import datetime, timedelta
 
 from src.domain.entities.insurance import Insurance, InsuranceStatus, InsuranceType
 from src.application.ports.insurance_repository import InsuranceRepositoryPort
+from src.application.read_models.collection_version import CollectionVersion
 from src.infrastructure.database import get_database
+from src.infrastructure.adapters.repositories.mongodb_base_repository import (
+    DEFAULT_BATCH_SIZE,
+    MongoDBBaseRepository,
+)
 
 
-class MongoDBInsuranceRepository(InsuranceRepositoryPort):
+class MongoDBInsuranceRepository(MongoDBBaseRepository, InsuranceRepositoryPort):
     """MongoDB implementation of Insurance Repository."""
 
     def __init__(self):
         self.db = get_database()
         self.collection = self.db["insurances"]
 
+    async def ensure_indexes(self) -> None:
+        """Create the index backing the collection version."""
+        await self._ensure_version_indexes()
+
     def _to_domain(self, doc: dict) -> Optional[Insurance]:
         if doc is None:
             return None
@@ -64,6 +73,18 @@ class MongoDBInsuranceRepository(InsuranceRepositoryPort):
         documents = await cursor.to_list(length=limit if limit > 0 else None)
         return [self._to_domain(doc) for doc in documents]
 
+    async def iter_all(self, batch_size: int = DEFAULT_BATCH_SIZE) -> AsyncIterator[Insurance]:
+        async for item in self._iter({}, batch_size=batch_size):
+            yield item
+
+    async def iter_by_member_ids(
+        self, member_ids: List[str], batch_size: int = DEFAULT_BATCH_SIZE
+    ) -> AsyncIterator[Insurance]:
+        if not member_ids:
+            return
+        async for item in self._iter({"member_id": {"$in": member_ids}}, batch_size=batch_size):
+            yield item
+
     async def find_by_id(self, insurance_id: str) -> Optional[Insurance]:
         try:
             doc = await self.collection.find_one({"_id": ObjectId(insurance_id)})
@@ -125,22 +146,25 @@ class MongoDBInsuranceRepository(InsuranceRepositoryPort):
         return self._to_domain(doc) if doc else None
 
     async def create(self, insurance: Insurance) -> Insurance:
-        doc = self._to_document(insurance)
-        if "_id" in doc:
-            del doc["_id"]
-        result = await self.collection.insert_one(doc)
-        created_doc = await self.collection.find_one({"_id": result.inserted_id})
-        return self._to_domain(created_doc)
+        return await self._insert(self._to_document(insurance))
+
+    async def create_bulk(self, insurances: List[Insurance]) -> List[Insurance]:
+        if not insurances:
+            return []
+        documents = []
+        for insurance in insurances:
+            insurance.id = insurance.id or str(ObjectId())
+            doc = self._to_document(insurance)
+            insurance.created_at = doc["created_at"]
+            insurance.updated_at = doc["updated_at"]
+            documents.append(doc)
+        await self.collection.insert_many(documents, ordered=True)
+        return insurances
 
     async def update(self, insurance: Insurance) -> Insurance:
         if not insurance.id:
             raise ValueError("Insurance ID is required for update")
-        doc = self._to_document(insurance)
-        if "_id" in doc:
-            del doc["_id"]
-        await self.collection.update_one({"_id": ObjectId(insurance.id)}, {"$set": doc})
-        updated_doc = await self.collection.find_one({"_id": ObjectId(insurance.id)})
-        return self._to_domain(updated_doc)
+        return await self._update(insurance.id, self._to_document(insurance))
 
     async def delete(self, insurance_id: str) -> bool:
         try:
@@ -155,3 +179,6 @@ class MongoDBInsuranceRepository(InsuranceRepositoryPort):
             return count > 0
         except Exception:
             return False
+
+    async def get_collection_version(self) -> CollectionVersion:
+        return await self._collection_version()
@@ -2,14 +2,17 @@
 
 from typing import List, Optional
 from bson import ObjectId
+from pymongo import ASCENDING, DESCENDING
 from datetime import datetime, date
 
 from src.domain.entities.invoice import Invoice, InvoiceLineItem, InvoiceStatus
 from src.application.ports.invoice_repository import InvoiceRepositoryPort
+from src.application.read_models.page import Page
 from src.infrastructure.database import get_database
+from src.infrastructure.adapters.repositories.mongodb_base_repository import MongoDBBaseRepository
 
 
-class MongoDBInvoiceRepository(InvoiceRepositoryPort):
+class MongoDBInvoiceRepository(MongoDBBaseRepository, InvoiceRepositoryPort):
     """MongoDB implementation of Invoice Repository."""
 
     def __init__(self):
@@ -38,6 +41,20 @@ class MongoDBInvoiceRepository(InvoiceRepositoryPort):
             for item in items_data
         ]
 
+    # Keyset pagination order: (created_at, _id), newest first, as in find_all
+    PAGE_SORT = ("created_at", DESCENDING)
+
+    async def ensure_indexes(self) -> None:
+        """Create the compound indexes backing find_page."""
+        key, direction = self.PAGE_SORT
+        await self.collection.create_index([(key, direction), ("_id", direction)], name="page_created_at")
+        await self.collection.create_index(
+            [("status", ASCENDING), (key, direction), ("_id", direction)], name="page_status_created_at"
+        )
+        await self.collection.create_index(
+            [("club_id", ASCENDING), (key, direction), ("_id", direction)], name="page_club_id_created_at"
+        )
+
     def _to_domain(self, doc: dict) -> Optional[Invoice]:
         if doc is None:
             return None
@@ -100,6 +117,20 @@ class MongoDBInvoiceRepository(InvoiceRepositoryPort):
         documents = await cursor.to_list(length=limit if limit > 0 else None)
         return [self._to_domain(doc) for doc in documents]
 
+    async def find_page(
+        self,
+        limit: int,
+        cursor: Optional[str] = None,
+        status: Optional[InvoiceStatus] = None,
+        club_id: Optional[str] = None,
+    ) -> Page[Invoice]:
+        query = {}
+        if status:
+            query["status"] = status.value
+        if club_id:
+            query["club_id"] = club_id
+        return await self._find_page(query, *self.PAGE_SORT, limit=limit, cursor=cursor)
+
     async def find_by_id(self, invoice_id: str) -> Optional[Invoice]:
         try:
             doc = await self.collection.find_one({"_id": ObjectId(invoice_id)})
@@ -169,25 +200,12 @@ class MongoDBInvoiceRepository(InvoiceRepositoryPort):
         return f"{year}-{sequence:06d}"
 
     async def create(self, invoice: Invoice) -> Invoice:
-        doc = self._to_document(invoice)
-        if "_id" in doc:
-            del doc["_id"]
-        result = await self.collection.insert_one(doc)
-        created_doc = await self.collection.find_one({"_id": result.inserted_id})
-        return self._to_domain(created_doc)
+        return await self._insert(self._to_document(invoice))
 
     async def update(self, invoice: Invoice) -> Invoice:
         if not invoice.id:
             raise ValueError("Invoice ID is required for update")
-        doc = self._to_document(invoice)
-        if "_id" in doc:
-            del doc["_id"]
-        await self.collection.update_one(
-            {"_id": ObjectId(invoice.id)},
-            {"$set": doc}
-        )
-        updated_doc = await self.collection.find_one({"_id": ObjectId(invoice.id)})
-        return self._to_domain(updated_doc)
+        return await self._update(invoice.id, self._to_document(invoice))
 
     async def delete(self, invoice_id: str) -> bool:
         try:
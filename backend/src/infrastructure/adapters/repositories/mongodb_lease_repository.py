@@ -0,0 +1,46 @@
+"""MongoDB store of the leases electing one worker for background jobs."""
+
+from pymongo.errors import DuplicateKeyError
+
+from src.infrastructure.database import get_database
+
+
+class MongoDBLeaseRepository:
+    """Named leases held by one worker at a time until they expire.
+
+    A lease document records its holder and expiry. Taking it succeeds
+    when it does not exist, has expired, or is already held by the caller
+    (a renewal); the unique ``_id`` makes the insert fail for everyone else.
+    Like the cache versions, it always reads and writes on the primary.
+    """
+
+    def __init__(self):
+        self.db = get_database()
+        self.collection = self.db["leases"]
+
+    async def try_acquire(self, name: str, holder: str, ttl_seconds: float) -> bool:
+        """Take or renew the lease for ttl_seconds; False if another holder has it."""
+        # Expiry is computed with the server's clock ($$NOW), so workers on
+        # hosts with skewed clocks still agree on when a lease is free
+        try:
+            await self.collection.find_one_and_update(
+                {
+                    "_id": name,
+                    "$or": [
+                        {"holder": holder},
+                        {"$expr": {"$lte": ["$expires_at", "$$NOW"]}},
+                    ],
+                },
+                [{"$set": {
+                    "holder": holder,
+                    "expires_at": {"$add": ["$$NOW", int(ttl_seconds * 1000)]},
+                }}],
+                upsert=True,
+            )
+        except DuplicateKeyError:
+            return False
+        return True
+
+    async def release(self, name: str, holder: str) -> None:
+        """Give the lease up, if the holder still has it, so another worker can take it at once."""
+        await self.collection.delete_one({"_id": name, "holder": holder})
@@ -1,23 +1,37 @@
 """MongoDB License Repository Adapter."""
 
-from typing import List, Optional
+from typing import AsyncIterator, List, Optional
 from bson import ObjectId
 from datetime import datetime, timedelta
+from pymongo import InsertOne, ReturnDocument, UpdateOne
 
 from src.domain.entities.license import (
     License, LicenseStatus, LicenseType,
     TechnicalGrade, InstructorCategory, AgeCategory
 )
 from src.application.ports.license_repository import LicenseRepositoryPort
+from src.application.read_models.license_ref import LicenseRef
+from src.application.read_models.collection_version import CollectionVersion
 from src.infrastructure.database import get_database
+from src.infrastructure.read_routing import routed
+from src.infrastructure.adapters.repositories.mongodb_base_repository import (
+    DEFAULT_BATCH_SIZE,
+    MongoDBBaseRepository,
+)
 
 
-class MongoDBLicenseRepository(LicenseRepositoryPort):
+class MongoDBLicenseRepository(MongoDBBaseRepository, LicenseRepositoryPort):
     """MongoDB implementation of License Repository."""
 
     def __init__(self):
         self.db = get_database()
         self.collection = self.db["licenses"]
+        # One counter document per license number prefix: {_id: prefix, value: n}
+        self.sequences = self.db["license_number_sequences"]
+
+    async def ensure_indexes(self) -> None:
+        """Create the index backing the collection version."""
+        await self._ensure_version_indexes()
 
     def _to_domain(self, doc: dict) -> Optional[License]:
         if doc is None:
@@ -60,6 +74,34 @@ class MongoDBLicenseRepository(LicenseRepositoryPort):
         license.check_and_update_status()
         return license
 
+    REF_PROJECTION = {
+        "member_id": 1, "license_number": 1, "status": 1,
+        "technical_grade": 1, "instructor_category": 1,
+        "grado_tecnico": 1, "categoria_instructor": 1,
+        "issue_date": 1, "expiration_date": 1,
+    }
+
+    def _to_ref(self, doc: dict) -> LicenseRef:
+        """Build a LicenseRef from a projected document (same fallbacks as _to_domain)."""
+        technical_grade_val = doc.get("technical_grade") or doc.get("grado_tecnico", "kyu")
+        instructor_category_val = doc.get("instructor_category") or doc.get("categoria_instructor", "none")
+        issue_date = doc.get("issue_date")
+        expiration_date = doc.get("expiration_date")
+        if not expiration_date and issue_date:
+            expiration_date = datetime(issue_date.year, 12, 31, 23, 59, 59)
+        status = LicenseStatus(doc.get("status", "active"))
+        if status == LicenseStatus.ACTIVE and expiration_date and expiration_date < datetime.now():
+            status = LicenseStatus.EXPIRED
+        return LicenseRef(
+            id=str(doc.get("_id")),
+            member_id=doc.get("member_id"),
+            license_number=doc.get("license_number", ""),
+            status=status,
+            technical_grade=TechnicalGrade(technical_grade_val),
+            instructor_category=InstructorCategory(instructor_category_val),
+            expiration_date=expiration_date,
+        )
+
     def _to_document(self, license: License) -> dict:
         # Note: club_id is no longer stored - it's derived via member
         doc = {
@@ -95,6 +137,25 @@ class MongoDBLicenseRepository(LicenseRepositoryPort):
         documents = await cursor.to_list(length=limit if limit > 0 else None)
         return [self._to_domain(doc) for doc in documents]
 
+    async def iter_all(self, batch_size: int = DEFAULT_BATCH_SIZE) -> AsyncIterator[License]:
+        async for item in self._iter({}, batch_size=batch_size):
+            yield item
+
+    async def iter_by_member_ids(
+        self, member_ids: List[str], batch_size: int = DEFAULT_BATCH_SIZE
+    ) -> AsyncIterator[License]:
+        if not member_ids:
+            return
+        async for item in self._iter({"member_id": {"$in": member_ids}}, batch_size=batch_size):
+            yield item
+
+    async def iter_by_club_id(
+        self, club_id: str, batch_size: int = DEFAULT_BATCH_SIZE
+    ) -> AsyncIterator[License]:
+        member_ids = await routed(self.db["members"]).distinct("_id", {"club_id": club_id})
+        async for license in self.iter_by_member_ids([str(m) for m in member_ids], batch_size):
+            yield license
+
     async def find_by_id(self, license_id: str) -> Optional[License]:
         try:
             doc = await self.collection.find_one({"_id": ObjectId(license_id)})
@@ -121,6 +182,13 @@ class MongoDBLicenseRepository(LicenseRepositoryPort):
         documents = await cursor.to_list(length=limit if limit > 0 else None)
         return [self._to_domain(doc) for doc in documents]
 
+    async def find_refs_by_member_ids(self, member_ids: List[str]) -> List[LicenseRef]:
+        if not member_ids:
+            return []
+        cursor = self.collection.find({"member_id": {"$in": member_ids}}, self.REF_PROJECTION)
+        documents = await cursor.to_list(length=None)
+        return [self._to_ref(doc) for doc in documents]
+
     async def find_by_club_id(self, club_id: str, limit: int = 0) -> List[License]:
         """Find licenses by club ID.
 
@@ -131,7 +199,7 @@ class MongoDBLicenseRepository(LicenseRepositoryPort):
         Note: For better performance, consider creating an index on members.club_id
         """
         # Get all member IDs for this club
-        members_collection = self.db["members"]
+        members_collection = routed(self.db["members"])
         member_ids = await members_collection.distinct("_id", {"club_id": club_id})
 
         if not member_ids:
@@ -191,23 +259,61 @@ class MongoDBLicenseRepository(LicenseRepositoryPort):
             {"license_number": {"$regex": pattern}}
         )
 
+    async def reserve_license_numbers(self, prefix: str, count: int) -> List[str]:
+        """Atomically reserve ``count`` consecutive license numbers for a prefix.
+
+        The counter is seeded from the licenses already numbered with the
+        prefix the first time it is used, so numbering continues where
+        count_by_license_number_prefix left off.
+        """
+        if count <= 0:
+            return []
+        if await self.sequences.count_documents({"_id": prefix}, limit=1) == 0:
+            existing = await self.count_by_license_number_prefix(prefix)
+            # $max with upsert is a no-op if a concurrent caller seeded it first
+            await self.sequences.update_one(
+                {"_id": prefix}, {"$max": {"value": existing}}, upsert=True
+            )
+        doc = await self.sequences.find_one_and_update(
+            {"_id": prefix},
+            {"$inc": {"value": count}},
+            upsert=True,
+            return_document=ReturnDocument.AFTER,
+        )
+        last = doc["value"]
+        return [f"{prefix}{n:04d}" for n in range(last - count + 1, last + 1)]
+
+    async def upsert_bulk(self, licenses: List[License]) -> List[License]:
+        """Create new licenses and update existing ones in a single bulk_write.
+
+        Ids for new licenses are generated client-side so the written
+        entities can be returned without reading them back.
+        """
+        if not licenses:
+            return []
+        operations = []
+        for license in licenses:
+            is_new = not license.id
+            if is_new:
+                license.id = str(ObjectId())
+            doc = self._to_document(license)
+            license.updated_at = doc["updated_at"]
+            license.created_at = doc["created_at"]
+            if is_new:
+                operations.append(InsertOne(doc))
+            else:
+                del doc["_id"]
+                operations.append(UpdateOne({"_id": ObjectId(license.id)}, {"$set": doc}))
+        await self.collection.bulk_write(operations, ordered=True)
+        return licenses
+
     async def create(self, license: License) -> License:
-        doc = self._to_document(license)
-        if "_id" in doc:
-            del doc["_id"]
-        result = await self.collection.insert_one(doc)
-        created_doc = await self.collection.find_one({"_id": result.inserted_id})
-        return self._to_domain(created_doc)
+        return await self._insert(self._to_document(license))
 
     async def update(self, license: License) -> License:
         if not license.id:
             raise ValueError("License ID is required for update")
-        doc = self._to_document(license)
-        if "_id" in doc:
-            del doc["_id"]
-        await self.collection.update_one({"_id": ObjectId(license.id)}, {"$set": doc})
-        updated_doc = await self.collection.find_one({"_id": ObjectId(license.id)})
-        return self._to_domain(updated_doc)
+        return await self._update(license.id, self._to_document(license))
 
     async def delete(self, license_id: str) -> bool:
         try:
@@ -222,3 +328,6 @@ class MongoDBLicenseRepository(LicenseRepositoryPort):
             return count > 0
         except Exception:
             return False
+
+    async def get_collection_version(self) -> CollectionVersion:
+        return await self._collection_version()
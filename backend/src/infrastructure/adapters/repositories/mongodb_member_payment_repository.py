@@ -1,19 +1,28 @@
 """MongoDB MemberPayment Repository Adapter."""
 
-from typing import List, Optional
+from typing import AsyncIterator, List, Optional
 from bson import ObjectId
 from datetime import datetime
+from pymongo import ASCENDING, UpdateOne
+from pymongo.errors import BulkWriteError
 
 from src.domain.entities.member_payment import (
     MemberPayment,
     MemberPaymentStatus,
     MemberPaymentType
 )
-from src.application.ports.member_payment_repository import MemberPaymentRepositoryPort
+from src.application.ports.member_payment_repository import (
+    MemberPaymentRepositoryPort,
+    PartialBulkWriteError,
+)
 from src.infrastructure.database import get_database
+from src.infrastructure.adapters.repositories.mongodb_base_repository import (
+    DEFAULT_BATCH_SIZE,
+    MongoDBBaseRepository,
+)
 
 
-class MongoDBMemberPaymentRepository(MemberPaymentRepositoryPort):
+class MongoDBMemberPaymentRepository(MongoDBBaseRepository, MemberPaymentRepositoryPort):
     """MongoDB implementation of MemberPayment Repository.
 
     Note: club_id has been removed from the entity. Queries that previously
@@ -27,6 +36,15 @@ class MongoDBMemberPaymentRepository(MemberPaymentRepositoryPort):
         # {member_id: 1, payment_year: -1}
         # {payment_id: 1}
 
+    async def ensure_indexes(self) -> None:
+        """Create the unique index create_bulk upserts on and the index iter_by_year reads."""
+        await self.collection.create_index(
+            [("payment_id", ASCENDING), ("member_id", ASCENDING), ("payment_type", ASCENDING)],
+            unique=True,
+            name="payment_member_type_unique",
+        )
+        await self.collection.create_index([("payment_year", ASCENDING)], name="payment_year")
+
     def _to_domain(self, doc: dict) -> Optional[MemberPayment]:
         """Convert MongoDB document to domain entity."""
         if doc is None:
@@ -66,31 +84,51 @@ class MongoDBMemberPaymentRepository(MemberPaymentRepositoryPort):
 
     async def create(self, member_payment: MemberPayment) -> MemberPayment:
         """Create a new member payment record."""
-        doc = self._to_document(member_payment)
-        if "_id" in doc:
-            del doc["_id"]
-        result = await self.collection.insert_one(doc)
-        created_doc = await self.collection.find_one({"_id": result.inserted_id})
-        return self._to_domain(created_doc)
+        return await self._insert(self._to_document(member_payment))
+
+    @staticmethod
+    def _bulk_key(member_payment: MemberPayment) -> dict:
+        return {
+            "payment_id": member_payment.payment_id,
+            "member_id": member_payment.member_id,
+            "payment_type": member_payment.payment_type.value,
+        }
 
     async def create_bulk(self, payments: List[MemberPayment]) -> List[MemberPayment]:
-        """Create multiple member payment records in bulk."""
+        """Create member payment records in bulk, one per (payment, member, payment type).
+
+        Records already stored for a key are kept and returned in place of
+        the new ones, so repeating the call (a retried webhook) is harmless.
+        """
         if not payments:
             return []
 
-        docs = []
+        operations = []
         for payment in payments:
             doc = self._to_document(payment)
-            if "_id" in doc:
-                del doc["_id"]
-            docs.append(doc)
+            doc.pop("_id", None)
+            operations.append(UpdateOne(self._bulk_key(payment), {"$setOnInsert": doc}, upsert=True))
+        result = await self.collection.bulk_write(operations, ordered=False)
 
-        result = await self.collection.insert_many(docs)
-        created_docs = await self.collection.find(
-            {"_id": {"$in": result.inserted_ids}}
-        ).to_list(length=len(result.inserted_ids))
+        upserted_ids = result.upserted_ids or {}
+        if len(upserted_ids) == len(payments):
+            for index, payment in enumerate(payments):
+                payment.id = str(upserted_ids[index])
+            return payments
 
-        return [self._to_domain(doc) for doc in created_docs]
+        # Some keys were already stored: read every record of these payments back
+        documents = await self.collection.find(
+            {"payment_id": {"$in": list({payment.payment_id for payment in payments})}}
+        ).to_list(length=None)
+        stored = {
+            (doc.get("payment_id"), doc.get("member_id"), doc.get("payment_type")): doc
+            for doc in documents
+        }
+        return [
+            self._to_domain(stored[key])
+            for key in dict.fromkeys(tuple(self._bulk_key(payment).values()) for payment in payments)
+            if key in stored
+        ]
 
     async def find_by_id(self, member_payment_id: str) -> Optional[MemberPayment]:
         """Find a member payment by ID."""
@@ -150,6 +188,28 @@ class MongoDBMemberPaymentRepository(MemberPaymentRepositoryPort):
         documents = await cursor.to_list(length=limit if limit > 0 else None)
         return [self._to_domain(doc) for doc in documents]
 
+    async def iter_by_year(
+        self, payment_year: int, batch_size: int = DEFAULT_BATCH_SIZE
+    ) -> AsyncIterator[MemberPayment]:
+        async for item in self._iter({"payment_year": payment_year}, batch_size=batch_size):
+            yield item
+
+    async def find_by_member_ids_years(
+        self,
+        member_ids: List[str],
+        payment_years: List[int]
+    ) -> List[MemberPayment]:
+        """Find all member payments for a list of members across several years."""
+        if not member_ids or not payment_years:
+            return []
+
+        cursor = self.collection.find({
+            "member_id": {"$in": member_ids},
+            "payment_year": {"$in": payment_years}
+        })
+        documents = await cursor.to_list(length=None)
+        return [self._to_domain(doc) for doc in documents]
+
     async def find_by_payment_id(self, payment_id: str) -> List[MemberPayment]:
         """Find all member payments linked to a parent payment."""
         cursor = self.collection.find({"payment_id": payment_id})
@@ -160,17 +220,33 @@ class MongoDBMemberPaymentRepository(MemberPaymentRepositoryPort):
         """Update a member payment record."""
         if not member_payment.id:
             raise ValueError("MemberPayment ID is required for update")
-        doc = self._to_document(member_payment)
-        if "_id" in doc:
+        return await self._update(member_payment.id, self._to_document(member_payment))
+
+    async def upsert_bulk(self, payments: List[MemberPayment]) -> List[MemberPayment]:
+        """Create or update multiple member payment records in one bulk write."""
+        if not payments:
+            return []
+
+        operations = []
+        for payment in payments:
+            if not payment.id:
+                payment.id = str(ObjectId())
+            doc = self._to_document(payment)
             del doc["_id"]
-        await self.collection.update_one(
-            {"_id": ObjectId(member_payment.id)},
-            {"$set": doc}
-        )
-        updated_doc = await self.collection.find_one(
-            {"_id": ObjectId(member_payment.id)}
-        )
-        return self._to_domain(updated_doc)
+            operations.append(UpdateOne(
+                {"_id": ObjectId(payment.id)},
+                {"$set": doc},
+                upsert=True
+            ))
+
+        try:
+            await self.collection.bulk_write(operations, ordered=True)
+        except BulkWriteError as e:
+            # An ordered bulk write applies every operation before the first
+            # error and none after it
+            first_error = e.details["writeErrors"][0]
+            raise PartialBulkWriteError(first_error["index"], first_error.get("errmsg", str(e))) from e
+        return payments
 
     async def update_status_by_payment_id(
         self,
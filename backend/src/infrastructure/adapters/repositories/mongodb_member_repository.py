@@ -1,21 +1,101 @@
 """MongoDB Member Repository Adapter."""
 
-from typing import List, Optional
+import re
+from typing import AsyncIterator, Iterable, List, Optional
 from bson import ObjectId
+from pymongo import ASCENDING, UpdateOne
 from datetime import datetime
 
 from src.domain.entities.member import Member, MemberStatus, ClubRole
 from src.application.ports.member_repository import MemberRepositoryPort
+from src.application.read_models.member_ref import MemberRef
+from src.application.ports.query_spec import QuerySpec
+from src.application.read_models.page import Page
+from src.application.read_models.collection_version import CollectionVersion
+from src.application.search.member_search import member_search_keys, name_tokens
 from src.infrastructure.database import get_database
+from src.infrastructure.adapters.repositories.mongodb_base_repository import (
+    DEFAULT_BATCH_SIZE,
+    MongoDBBaseRepository,
+)
 
 
-class MongoDBMemberRepository(MemberRepositoryPort):
+class MongoDBMemberRepository(MongoDBBaseRepository, MemberRepositoryPort):
     """MongoDB implementation of Member Repository."""
 
     def __init__(self):
         self.db = get_database()
         self.collection = self.db["members"]
 
+    # Fields every MemberRef needs; extra fields are added per query
+    REF_PROJECTION = {"first_name": 1, "last_name": 1, "club_id": 1, "status": 1}
+
+    @staticmethod
+    def _clean_email(email: Optional[str]) -> str:
+        # Sanitize invalid email values from MariaDB migration
+        if email is None or email == "null" or (email and "@" not in email):
+            return ""
+        return email
+
+    # Keyset pagination order: (last_name, _id)
+    PAGE_SORT = ("last_name", ASCENDING)
+
+    SPEC_FIELDS = {
+        "club_id": "club_id",
+        "status": "status",
+        "club_role": "club_role",
+        "first_name": "first_name",
+        "last_name": "last_name",
+        "created_at": "created_at",
+        # Exact-match search keys; values must be normalized with
+        # norm_dni / normalize_email
+        "dni": "search_dni",
+        "email": "search_email",
+    }
+
+    # Source fields of the search keys written by _to_document
+    SEARCH_SOURCE_PROJECTION = {"first_name": 1, "last_name": 1, "dni": 1, "email": 1}
+
+    async def ensure_indexes(self) -> None:
+        """Create the indexes backing find_page, search and the collection version, then backfill search keys."""
+        key, direction = self.PAGE_SORT
+        await self.collection.create_index([(key, direction), ("_id", direction)], name="page_last_name")
+        await self.collection.create_index(
+            [("club_id", ASCENDING), (key, direction), ("_id", direction)], name="page_club_last_name"
+        )
+        await self.collection.create_index([("club_id", ASCENDING), ("status", ASCENDING)], name="club_status")
+        await self.collection.create_index([("status", ASCENDING)], name="status")
+        await self.collection.create_index(
+            [("club_id", ASCENDING), ("search_tokens", ASCENDING)], name="club_search_tokens"
+        )
+        await self.collection.create_index([("search_tokens", ASCENDING)], name="search_tokens")
+        await self.collection.create_index([("search_dni", ASCENDING)], name="search_dni")
+        await self.collection.create_index([("search_email", ASCENDING)], name="search_email")
+        await self._ensure_version_indexes("club_id")
+        await self.backfill_search_keys()
+
+    async def backfill_search_keys(self, batch_size: int = DEFAULT_BATCH_SIZE) -> int:
+        """Write search keys on members stored without them; returns how many were updated."""
+        cursor = self.collection.find(
+            {"search_tokens": {"$exists": False}}, self.SEARCH_SOURCE_PROJECTION
+        ).batch_size(batch_size)
+        updated = 0
+        updates = []
+        async for doc in cursor:
+            keys = member_search_keys(
+                doc.get("first_name"), doc.get("last_name"), doc.get("dni"),
+                self._clean_email(doc.get("email")),
+            )
+            updates.append(UpdateOne({"_id": doc["_id"]}, {"$set": keys}))
+            if len(updates) >= batch_size:
+                await self.collection.bulk_write(updates, ordered=False)
+                updated += len(updates)
+                updates = []
+        if updates:
+            await self.collection.bulk_write(updates, ordered=False)
+            updated += len(updates)
+        return updated
+
     def _to_domain(self, doc: dict) -> Optional[Member]:
         if doc is None:
             return None
@@ -23,10 +103,7 @@ class MongoDBMemberRepository(MemberRepositoryPort):
         # Read club_role with fallback to default "member" for existing documents
         club_role_val = doc.get("club_role", "member")
 
-        # Sanitize invalid email values from MariaDB migration
-        email = doc.get("email", "")
-        if email is None or email == "null" or (email and "@" not in email):
-            email = ""
+        email = self._clean_email(doc.get("email", ""))
 
         return Member(
             id=str(doc.get("_id")),
@@ -49,6 +126,24 @@ class MongoDBMemberRepository(MemberRepositoryPort):
             updated_at=doc.get("updated_at")
         )
 
+    def _ref_projection(self, extra_fields: Iterable[str]) -> dict:
+        extra_fields = set(extra_fields)
+        unknown = extra_fields - MemberRef.EXTRA_FIELDS
+        if unknown:
+            raise ValueError(f"Unsupported MemberRef fields: {', '.join(sorted(unknown))}")
+        return {**self.REF_PROJECTION, **{field: 1 for field in extra_fields}}
+
+    def _to_ref(self, doc: dict) -> MemberRef:
+        """Build a MemberRef from a projected document."""
+        return MemberRef(
+            id=str(doc["_id"]),
+            full_name=f"{doc.get('first_name', '')} {doc.get('last_name', '')}",
+            club_id=doc.get("club_id"),
+            status=MemberStatus(doc.get("status", "active")),
+            email=self._clean_email(doc["email"]) if "email" in doc else None,
+            dni=doc.get("dni"),
+        )
+
     def _to_document(self, member: Member) -> dict:
         doc = {
             "first_name": member.first_name,
@@ -66,7 +161,10 @@ class MongoDBMemberRepository(MemberRepositoryPort):
             "status": member.status.value,
             "club_role": member.club_role.value,
             "registration_date": member.registration_date,
-            "updated_at": datetime.utcnow()
+            "updated_at": datetime.utcnow(),
+            **member_search_keys(
+                member.first_name, member.last_name, member.dni, self._clean_email(member.email)
+            ),
         }
         if member.id:
             doc["_id"] = ObjectId(member.id)
@@ -83,6 +181,25 @@ class MongoDBMemberRepository(MemberRepositoryPort):
         documents = await cursor.to_list(length=limit if limit > 0 else None)
         return [self._to_domain(doc) for doc in documents]
 
+    async def find_by_spec(self, spec: QuerySpec) -> List[Member]:
+        return await self._find_by_spec(spec)
+
+    async def find_page(
+        self, limit: int, cursor: Optional[str] = None, club_id: Optional[str] = None
+    ) -> Page[Member]:
+        query = {"club_id": club_id} if club_id else {}
+        return await self._find_page(query, *self.PAGE_SORT, limit=limit, cursor=cursor)
+
+    async def iter_all(self, batch_size: int = DEFAULT_BATCH_SIZE) -> AsyncIterator[Member]:
+        async for item in self._iter({}, batch_size=batch_size):
+            yield item
+
+    async def iter_by_club_id(
+        self, club_id: str, batch_size: int = DEFAULT_BATCH_SIZE
+    ) -> AsyncIterator[Member]:
+        async for member in self._iter({"club_id": club_id}, batch_size=batch_size):
+            yield member
+
     async def find_by_id(self, member_id: str) -> Optional[Member]:
         try:
             doc = await self.collection.find_one({"_id": ObjectId(member_id)})
@@ -90,10 +207,25 @@ class MongoDBMemberRepository(MemberRepositoryPort):
         except Exception:
             return None
 
+    async def find_by_ids(self, member_ids: List[str]) -> List[Member]:
+        object_ids = [ObjectId(mid) for mid in member_ids if mid and ObjectId.is_valid(mid)]
+        if not object_ids:
+            return []
+        cursor = self.collection.find({"_id": {"$in": object_ids}})
+        documents = await cursor.to_list(length=len(object_ids))
+        return [self._to_domain(doc) for doc in documents]
+
     async def find_by_dni(self, dni: str) -> Optional[Member]:
         doc = await self.collection.find_one({"dni": dni})
         return self._to_domain(doc) if doc else None
 
+    async def find_by_dnis(self, dnis: List[str]) -> List[Member]:
+        if not dnis:
+            return []
+        cursor = self.collection.find({"dni": {"$in": dnis}})
+        documents = await cursor.to_list(length=None)
+        return [self._to_domain(doc) for doc in documents]
+
     async def find_by_email(self, email: str) -> Optional[Member]:
         doc = await self.collection.find_one({"email": email})
         return self._to_domain(doc) if doc else None
@@ -110,33 +242,23 @@ class MongoDBMemberRepository(MemberRepositoryPort):
         documents = await cursor.to_list(length=limit if limit > 0 else None)
         return [self._to_domain(doc) for doc in documents]
 
-    async def search_by_name(self, name: str, limit: int = 0) -> List[Member]:
-        cursor = self.collection.find({
-            "$or": [
-                {"first_name": {"$regex": name, "$options": "i"}},
-                {"last_name": {"$regex": name, "$options": "i"}}
-            ]
-        }).limit(limit)
-        documents = await cursor.to_list(length=limit if limit > 0 else None)
-        return [self._to_domain(doc) for doc in documents]
+    async def search_by_name(self, name: str, spec: Optional[QuerySpec] = None) -> List[Member]:
+        terms = name_tokens(name)
+        if not terms:
+            return []
+        # Anchored, case-sensitive prefixes on the lowercased tokens are index range scans
+        prefixes = [{"search_tokens": {"$regex": f"^{re.escape(term)}"}} for term in terms]
+        return await self._find_by_spec(
+            spec or QuerySpec(), prefixes[0] if len(prefixes) == 1 else {"$and": prefixes}
+        )
 
     async def create(self, member: Member) -> Member:
-        doc = self._to_document(member)
-        if "_id" in doc:
-            del doc["_id"]
-        result = await self.collection.insert_one(doc)
-        created_doc = await self.collection.find_one({"_id": result.inserted_id})
-        return self._to_domain(created_doc)
+        return await self._insert(self._to_document(member))
 
     async def update(self, member: Member) -> Member:
         if not member.id:
             raise ValueError("Member ID is required for update")
-        doc = self._to_document(member)
-        if "_id" in doc:
-            del doc["_id"]
-        await self.collection.update_one({"_id": ObjectId(member.id)}, {"$set": doc})
-        updated_doc = await self.collection.find_one({"_id": ObjectId(member.id)})
-        return self._to_domain(updated_doc)
+        return await self._update(member.id, self._to_document(member))
 
     async def delete(self, member_id: str) -> bool:
         try:
@@ -151,3 +273,25 @@ class MongoDBMemberRepository(MemberRepositoryPort):
             return count > 0
         except Exception:
             return False
+
+    async def find_refs_by_club_id(
+        self, club_id: str, extra_fields: Iterable[str] = ()
+    ) -> List[MemberRef]:
+        cursor = self.collection.find({"club_id": club_id}, self._ref_projection(extra_fields))
+        documents = await cursor.to_list(length=None)
+        return [self._to_ref(doc) for doc in documents]
+
+    async def find_refs_by_ids(
+        self, member_ids: List[str], extra_fields: Iterable[str] = ()
+    ) -> List[MemberRef]:
+        member_ids = [mid for mid in member_ids if mid]
+        if not member_ids:
+            return []
+        # Match both ObjectId and legacy string _ids
+        ids = member_ids + [ObjectId(mid) for mid in member_ids if ObjectId.is_valid(mid)]
+        cursor = self.collection.find({"_id": {"$in": ids}}, self._ref_projection(extra_fields))
+        documents = await cursor.to_list(length=None)
+        return [self._to_ref(doc) for doc in documents]
+
+    async def get_collection_version(self, club_id: Optional[str] = None) -> CollectionVersion:
+        return await self._collection_version({"club_id": club_id} if club_id else None)
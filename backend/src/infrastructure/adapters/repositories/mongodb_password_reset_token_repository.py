@@ -7,9 +7,10 @@ from datetime import datetime
 from src.domain.entities.password_reset_token import PasswordResetToken
 from src.application.ports.password_reset_token_repository import PasswordResetTokenRepositoryPort
 from src.infrastructure.database import get_database
+from src.infrastructure.adapters.repositories.mongodb_base_repository import MongoDBBaseRepository
 
 
-class MongoDBPasswordResetTokenRepository(PasswordResetTokenRepositoryPort):
+class MongoDBPasswordResetTokenRepository(MongoDBBaseRepository, PasswordResetTokenRepositoryPort):
     """MongoDB implementation of Password Reset Token Repository."""
 
     def __init__(self):
@@ -67,30 +68,13 @@ class MongoDBPasswordResetTokenRepository(PasswordResetTokenRepositoryPort):
 
     async def create(self, token: PasswordResetToken) -> PasswordResetToken:
         """Create a new password reset token."""
-        doc = self._to_document(token)
-        if "_id" in doc:
-            del doc["_id"]
-
-        result = await self.collection.insert_one(doc)
-        created_doc = await self.collection.find_one({"_id": result.inserted_id})
-        return self._to_domain(created_doc)
+        return await self._insert(self._to_document(token))
 
     async def update(self, token: PasswordResetToken) -> PasswordResetToken:
         """Update an existing password reset token."""
         if not token.id:
             raise ValueError("Token ID is required for update")
-
-        doc = self._to_document(token)
-        if "_id" in doc:
-            del doc["_id"]
-
-        await self.collection.update_one(
-            {"_id": ObjectId(token.id)},
-            {"$set": doc}
-        )
-
-        updated_doc = await self.collection.find_one({"_id": ObjectId(token.id)})
-        return self._to_domain(updated_doc)
+        return await self._update(token.id, self._to_document(token))
 
     async def invalidate_user_tokens(self, user_id: str) -> int:
         """Invalidate all active tokens for a user."""
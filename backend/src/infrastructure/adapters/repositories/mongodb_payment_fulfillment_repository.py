@@ -0,0 +1,138 @@
+"""MongoDB PaymentFulfillment Repository Adapter."""
+
+from typing import List, Optional
+from datetime import datetime
+from pymongo import ASCENDING
+
+from src.domain.entities.payment_fulfillment import (
+    PaymentFulfillment,
+    FulfillmentStep,
+    FulfillmentStepState,
+    FulfillmentStepStatus,
+)
+from src.application.ports.payment_fulfillment_repository import PaymentFulfillmentRepositoryPort
+from src.infrastructure.database import get_database
+
+
+class MongoDBPaymentFulfillmentRepository(PaymentFulfillmentRepositoryPort):
+    """MongoDB implementation of PaymentFulfillment Repository.
+
+    One document per payment, keyed by payment_id. Step states live in an
+    embedded ``steps`` map so each step can be updated with a targeted $set.
+    """
+
+    def __init__(self):
+        self.db = get_database()
+        self.collection = self.db["payment_fulfillments"]
+
+    async def ensure_indexes(self) -> None:
+        """Create the unique payment index and the index the resume sweep reads."""
+        await self.collection.create_index(
+            [("payment_id", ASCENDING)],
+            unique=True,
+            name="payment_id_unique"
+        )
+        await self.collection.create_index(
+            [("updated_at", ASCENDING)],
+            name="updated_at"
+        )
+
+    def _step_to_document(self, state: FulfillmentStepState) -> dict:
+        return {
+            "status": state.status.value,
+            "attempts": state.attempts,
+            "last_error": state.last_error,
+            "updated_at": state.updated_at,
+        }
+
+    def _step_to_domain(self, doc: dict) -> FulfillmentStepState:
+        return FulfillmentStepState(
+            status=FulfillmentStepStatus(doc.get("status", "pending")),
+            attempts=doc.get("attempts", 0),
+            last_error=doc.get("last_error"),
+            updated_at=doc.get("updated_at"),
+        )
+
+    def _to_domain(self, doc: dict) -> Optional[PaymentFulfillment]:
+        """Convert MongoDB document to domain entity."""
+        if doc is None:
+            return None
+        return PaymentFulfillment(
+            id=str(doc.get("_id")),
+            payment_id=doc.get("payment_id", ""),
+            steps={
+                FulfillmentStep(name): self._step_to_domain(step_doc)
+                for name, step_doc in (doc.get("steps") or {}).items()
+            },
+            created_at=doc.get("created_at"),
+            updated_at=doc.get("updated_at"),
+        )
+
+    def _to_document(self, fulfillment: PaymentFulfillment) -> dict:
+        """Convert domain entity to MongoDB document."""
+        return {
+            "payment_id": fulfillment.payment_id,
+            "steps": {
+                step.value: self._step_to_document(state)
+                for step, state in fulfillment.steps.items()
+            },
+            "created_at": fulfillment.created_at or datetime.utcnow(),
+            "updated_at": datetime.utcnow(),
+        }
+
+    async def create(self, fulfillment: PaymentFulfillment) -> PaymentFulfillment:
+        """Create (or reset) the fulfillment record of a payment."""
+        doc = self._to_document(fulfillment)
+        result = await self.collection.update_one(
+            {"payment_id": fulfillment.payment_id},
+            {"$set": doc},
+            upsert=True
+        )
+        if result.upserted_id is not None:
+            fulfillment.id = str(result.upserted_id)
+        return fulfillment
+
+    async def find_by_payment_id(self, payment_id: str) -> Optional[PaymentFulfillment]:
+        """Find the fulfillment record of a payment."""
+        doc = await self.collection.find_one({"payment_id": payment_id})
+        return self._to_domain(doc)
+
+    async def find_unfinished(
+        self,
+        updated_before: datetime,
+        max_attempts: int,
+        limit: int = 100
+    ) -> List[PaymentFulfillment]:
+        """Find fulfillments left with a step not completed."""
+        unfinished = [
+            FulfillmentStepStatus.PENDING.value,
+            FulfillmentStepStatus.RUNNING.value,
+            FulfillmentStepStatus.FAILED.value,
+        ]
+        query = {
+            "updated_at": {"$lt": updated_before},
+            "$or": [
+                {
+                    f"steps.{step.value}.status": {"$in": unfinished},
+                    f"steps.{step.value}.attempts": {"$lt": max_attempts},
+                }
+                for step in FulfillmentStep
+            ],
+        }
+        cursor = self.collection.find(query).sort("updated_at", ASCENDING).limit(limit)
+        return [self._to_domain(doc) async for doc in cursor]
+
+    async def update_step(
+        self,
+        payment_id: str,
+        step: FulfillmentStep,
+        state: FulfillmentStepState
+    ) -> None:
+        """Persist the state of a single step."""
+        await self.collection.update_one(
+            {"payment_id": payment_id},
+            {"$set": {
+                f"steps.{step.value}": self._step_to_document(state),
+                "updated_at": datetime.utcnow(),
+            }}
+        )
@@ -1,21 +1,55 @@
 """MongoDB Payment Repository Adapter."""
 
-from typing import List, Optional
+from typing import AsyncIterator, List, Optional
 from bson import ObjectId
+from pymongo import ASCENDING, DESCENDING
 from datetime import datetime
 
 from src.domain.entities.payment import Payment, PaymentMethod, PaymentStatus, PaymentType
 from src.application.ports.payment_repository import PaymentRepositoryPort
+from src.application.ports.query_spec import QuerySpec
+from src.application.read_models.page import Page
 from src.infrastructure.database import get_database
+from src.infrastructure.adapters.repositories.mongodb_base_repository import (
+    DEFAULT_BATCH_SIZE,
+    MongoDBBaseRepository,
+)
 
 
-class MongoDBPaymentRepository(PaymentRepositoryPort):
+class MongoDBPaymentRepository(MongoDBBaseRepository, PaymentRepositoryPort):
     """MongoDB implementation of Payment Repository."""
 
     def __init__(self):
         self.db = get_database()
         self.collection = self.db["transactions"]
 
+    # Keyset pagination order: (created_at, _id), newest first
+    PAGE_SORT = ("created_at", DESCENDING)
+
+    SPEC_FIELDS = {
+        "club_id": "club_id",
+        "member_id": "member_id",
+        "payment_year": "payment_year",
+        "payment_type": "payment_type",
+        "status": "status",
+        "created_at": "created_at",
+    }
+
+    async def ensure_indexes(self) -> None:
+        """Create the compound indexes backing find_page."""
+        key, direction = self.PAGE_SORT
+        await self.collection.create_index([(key, direction), ("_id", direction)], name="page_created_at")
+        for field in ("club_id", "member_id", "payment_year"):
+            await self.collection.create_index(
+                [(field, ASCENDING), (key, direction), ("_id", direction)], name=f"page_{field}_created_at"
+            )
+        # Year listings narrowed to a club or member (GetAllPaymentsUseCase)
+        for field in ("club_id", "member_id"):
+            await self.collection.create_index(
+                [("payment_year", ASCENDING), (field, ASCENDING), (key, direction)],
+                name=f"payment_year_{field}_created_at",
+            )
+
     def _to_domain(self, doc: dict) -> Optional[Payment]:
         if doc is None:
             return None
@@ -76,6 +110,30 @@ class MongoDBPaymentRepository(PaymentRepositoryPort):
         documents = await cursor.to_list(length=limit if limit > 0 else None)
         return [self._to_domain(doc) for doc in documents]
 
+    async def find_by_spec(self, spec: QuerySpec) -> List[Payment]:
+        return await self._find_by_spec(spec)
+
+    async def find_page(
+        self,
+        limit: int,
+        cursor: Optional[str] = None,
+        club_id: Optional[str] = None,
+        member_id: Optional[str] = None,
+        payment_year: Optional[int] = None,
+    ) -> Page[Payment]:
+        query = {}
+        if club_id:
+            query["club_id"] = club_id
+        if member_id:
+            query["member_id"] = member_id
+        if payment_year:
+            query["payment_year"] = payment_year
+        return await self._find_page(query, *self.PAGE_SORT, limit=limit, cursor=cursor)
+
+    async def iter_all(self, batch_size: int = DEFAULT_BATCH_SIZE) -> AsyncIterator[Payment]:
+        async for item in self._iter({}, batch_size=batch_size):
+            yield item
+
     async def find_by_id(self, payment_id: str) -> Optional[Payment]:
         try:
             doc = await self.collection.find_one({"_id": ObjectId(payment_id)})
@@ -125,22 +183,12 @@ class MongoDBPaymentRepository(PaymentRepositoryPort):
         return [self._to_domain(doc) for doc in documents]
 
     async def create(self, payment: Payment) -> Payment:
-        doc = self._to_document(payment)
-        if "_id" in doc:
-            del doc["_id"]
-        result = await self.collection.insert_one(doc)
-        created_doc = await self.collection.find_one({"_id": result.inserted_id})
-        return self._to_domain(created_doc)
+        return await self._insert(self._to_document(payment))
 
     async def update(self, payment: Payment) -> Payment:
         if not payment.id:
             raise ValueError("Payment ID is required for update")
-        doc = self._to_document(payment)
-        if "_id" in doc:
-            del doc["_id"]
-        await self.collection.update_one({"_id": ObjectId(payment.id)}, {"$set": doc})
-        updated_doc = await self.collection.find_one({"_id": ObjectId(payment.id)})
-        return self._to_domain(updated_doc)
+        return await self._update(payment.id, self._to_document(payment))
 
     async def delete(self, payment_id: str) -> bool:
         try:
@@ -1,15 +1,17 @@
 """MongoDB PriceConfiguration Repository Adapter."""
 
-from typing import List, Optional
+from typing import Dict, Iterable, List, Optional
 from bson import ObjectId
 from datetime import datetime
 
 from src.domain.entities.price_configuration import PriceConfiguration
 from src.application.ports.price_configuration_repository import PriceConfigurationRepositoryPort
+from src.application.read_models.collection_version import CollectionVersion
 from src.infrastructure.database import get_database
+from src.infrastructure.adapters.repositories.mongodb_base_repository import MongoDBBaseRepository
 
 
-class MongoDBPriceConfigurationRepository(PriceConfigurationRepositoryPort):
+class MongoDBPriceConfigurationRepository(MongoDBBaseRepository, PriceConfigurationRepositoryPort):
     """MongoDB implementation of PriceConfiguration Repository."""
 
     def __init__(self):
@@ -83,25 +85,12 @@ class MongoDBPriceConfigurationRepository(PriceConfigurationRepositoryPort):
         return self._to_domain(doc) if doc else None
 
     async def create(self, price_config: PriceConfiguration) -> PriceConfiguration:
-        doc = self._to_document(price_config)
-        if "_id" in doc:
-            del doc["_id"]
-        result = await self.collection.insert_one(doc)
-        created_doc = await self.collection.find_one({"_id": result.inserted_id})
-        return self._to_domain(created_doc)
+        return await self._insert(self._to_document(price_config))
 
     async def update(self, price_config: PriceConfiguration) -> PriceConfiguration:
         if not price_config.id:
             raise ValueError("PriceConfiguration ID is required for update")
-        doc = self._to_document(price_config)
-        if "_id" in doc:
-            del doc["_id"]
-        await self.collection.update_one(
-            {"_id": ObjectId(price_config.id)},
-            {"$set": doc}
-        )
-        updated_doc = await self.collection.find_one({"_id": ObjectId(price_config.id)})
-        return self._to_domain(updated_doc)
+        return await self._update(price_config.id, self._to_document(price_config))
 
     async def delete(self, price_id: str) -> bool:
         try:
@@ -135,3 +124,9 @@ class MongoDBPriceConfigurationRepository(PriceConfigurationRepositoryPort):
         cursor = self.collection.find({"key": {"$in": keys}, "is_active": True})
         documents = await cursor.to_list(length=len(keys))
         return [self._to_domain(doc) for doc in documents]
+
+    async def get_many(self, keys: Iterable[str]) -> Dict[str, PriceConfiguration]:
+        return {config.key: config for config in await self.find_by_keys(list(keys))}
+
+    async def get_collection_version(self) -> CollectionVersion:
+        return await self._collection_version()
@@ -2,20 +2,37 @@
 
 from typing import List, Optional
 from bson import ObjectId
+from pymongo import ASCENDING, DESCENDING
 from datetime import datetime
 
 from src.domain.entities.seminar import Seminar, SeminarStatus
 from src.application.ports.seminar_repository import SeminarRepositoryPort
+from src.application.read_models.page import Page
+from src.application.read_models.collection_version import CollectionVersion
 from src.infrastructure.database import get_database
+from src.infrastructure.adapters.repositories.mongodb_base_repository import MongoDBBaseRepository
 
 
-class MongoDBSeminarRepository(SeminarRepositoryPort):
+class MongoDBSeminarRepository(MongoDBBaseRepository, SeminarRepositoryPort):
     """MongoDB implementation of Seminar Repository."""
 
     def __init__(self):
         self.db = get_database()
         self.collection = self.db["seminars"]
 
+    # Keyset pagination order: (start_date, _id), latest first
+    PAGE_SORT = ("start_date", DESCENDING)
+
+    async def ensure_indexes(self) -> None:
+        """Create the compound indexes backing find_page and the collection version."""
+        key, direction = self.PAGE_SORT
+        await self.collection.create_index([(key, direction), ("_id", direction)], name="page_start_date")
+        for field in ("club_id", "association_id"):
+            await self.collection.create_index(
+                [(field, ASCENDING), (key, direction), ("_id", direction)], name=f"page_{field}_start_date"
+            )
+        await self._ensure_version_indexes("club_id")
+
     def _to_domain(self, doc: dict) -> Optional[Seminar]:
         if doc is None:
             return None
@@ -76,6 +93,20 @@ class MongoDBSeminarRepository(SeminarRepositoryPort):
         documents = await cursor.to_list(length=limit if limit > 0 else None)
         return [self._to_domain(doc) for doc in documents]
 
+    async def find_page(
+        self,
+        limit: int,
+        cursor: Optional[str] = None,
+        club_id: Optional[str] = None,
+        association_id: Optional[str] = None,
+    ) -> Page[Seminar]:
+        query = {}
+        if club_id:
+            query["club_id"] = club_id
+        if association_id:
+            query["association_id"] = association_id
+        return await self._find_page(query, *self.PAGE_SORT, limit=limit, cursor=cursor)
+
     async def find_by_id(self, seminar_id: str) -> Optional[Seminar]:
         try:
             doc = await self.collection.find_one({"_id": ObjectId(seminar_id)})
@@ -112,22 +143,12 @@ class MongoDBSeminarRepository(SeminarRepositoryPort):
         return [self._to_domain(doc) for doc in documents]
 
     async def create(self, seminar: Seminar) -> Seminar:
-        doc = self._to_document(seminar)
-        if "_id" in doc:
-            del doc["_id"]
-        result = await self.collection.insert_one(doc)
-        created_doc = await self.collection.find_one({"_id": result.inserted_id})
-        return self._to_domain(created_doc)
+        return await self._insert(self._to_document(seminar))
 
     async def update(self, seminar: Seminar) -> Seminar:
         if not seminar.id:
             raise ValueError("Seminar ID is required for update")
-        doc = self._to_document(seminar)
-        if "_id" in doc:
-            del doc["_id"]
-        await self.collection.update_one({"_id": ObjectId(seminar.id)}, {"$set": doc})
-        updated_doc = await self.collection.find_one({"_id": ObjectId(seminar.id)})
-        return self._to_domain(updated_doc)
+        return await self._update(seminar.id, self._to_document(seminar))
 
     async def delete(self, seminar_id: str) -> bool:
         try:
@@ -142,3 +163,6 @@ class MongoDBSeminarRepository(SeminarRepositoryPort):
             return count > 0
         except Exception:
             return False
+
+    async def get_collection_version(self, club_id: Optional[str] = None) -> CollectionVersion:
+        return await self._collection_version({"club_id": club_id} if club_id else None)
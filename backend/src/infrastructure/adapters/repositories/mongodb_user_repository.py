@@ -7,9 +7,10 @@ from datetime import datetime
 from src.domain.entities.user import User, GlobalRole
 from src.application.ports.repositories import UserRepositoryPort
 from src.infrastructure.database import get_database
+from src.infrastructure.adapters.repositories.mongodb_base_repository import MongoDBBaseRepository
 
 
-class MongoDBUserRepository(UserRepositoryPort):
+class MongoDBUserRepository(MongoDBBaseRepository, UserRepositoryPort):
     """MongoDB implementation of User Repository."""
 
     def __init__(self):
@@ -93,32 +94,13 @@ class MongoDBUserRepository(UserRepositoryPort):
 
     async def create(self, user: User) -> User:
         """Create a new user."""
-        doc = self._to_document(user)
-        # Remove _id for creation
-        if "_id" in doc:
-            del doc["_id"]
-            
-        result = await self.collection.insert_one(doc)
-        created_doc = await self.collection.find_one({"_id": result.inserted_id})
-        return self._to_domain(created_doc)
+        return await self._insert(self._to_document(user))
 
     async def update(self, user: User) -> User:
         """Update an existing user."""
         if not user.id:
             raise ValueError("User ID is required for update")
-            
-        doc = self._to_document(user)
-        # Remove _id from update data
-        if "_id" in doc:
-            del doc["_id"]
-            
-        await self.collection.update_one(
-            {"_id": ObjectId(user.id)}, 
-            {"$set": doc}
-        )
-        
-        updated_doc = await self.collection.find_one({"_id": ObjectId(user.id)})
-        return self._to_domain(updated_doc)
+        return await self._update(user.id, self._to_document(user))
 
     async def delete(self, user_id: str) -> bool:
         """Delete a user by ID."""
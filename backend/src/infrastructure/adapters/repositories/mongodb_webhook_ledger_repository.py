@@ -0,0 +1,112 @@
+"""MongoDB Webhook Ledger Repository Adapter."""
+
+from typing import Optional
+from datetime import datetime, timedelta
+
+from pymongo import ASCENDING, ReturnDocument
+from pymongo.errors import DuplicateKeyError
+
+from src.domain.entities.webhook_ledger_entry import WebhookLedgerEntry, WebhookLedgerStatus
+from src.application.ports.webhook_ledger_repository import WebhookLedgerRepositoryPort
+from src.infrastructure.database import get_database
+
+
+class MongoDBWebhookLedgerRepository(WebhookLedgerRepositoryPort):
+    """MongoDB implementation of the webhook notification ledger.
+
+    Claims rely on a unique index on (order_id, ds_signature): the claim is
+    an upsert that only writes on insert, so the first delivery creates the
+    entry and every later delivery gets the existing one back.
+    """
+
+    # A claim still processing after this long is assumed to belong to a
+    # worker that died, and may be taken over by a new delivery.
+    STALE_CLAIM_AFTER = timedelta(minutes=5)
+
+    def __init__(self):
+        self.db = get_database()
+        self.collection = self.db["webhook_ledger"]
+
+    async def ensure_indexes(self) -> None:
+        """Create the unique index the claim relies on."""
+        await self.collection.create_index(
+            [("order_id", ASCENDING), ("ds_signature", ASCENDING)],
+            unique=True,
+            name="order_id_ds_signature_unique"
+        )
+
+    def _to_domain(self, doc: dict) -> Optional[WebhookLedgerEntry]:
+        """Convert MongoDB document to domain entity."""
+        if doc is None:
+            return None
+        return WebhookLedgerEntry(
+            id=str(doc.get("_id")),
+            order_id=doc.get("order_id", ""),
+            ds_signature=doc.get("ds_signature", ""),
+            status=WebhookLedgerStatus(doc.get("status", "processing")),
+            payment_id=doc.get("payment_id"),
+            success=doc.get("success"),
+            message=doc.get("message"),
+            claimed_at=doc.get("claimed_at"),
+            completed_at=doc.get("completed_at")
+        )
+
+    async def claim(self, order_id: str, ds_signature: str) -> Optional[WebhookLedgerEntry]:
+        """Claim a notification for processing in a single round trip."""
+        key = {"order_id": order_id, "ds_signature": ds_signature}
+        now = datetime.utcnow()
+        try:
+            existing = await self.collection.find_one_and_update(
+                key,
+                {"$setOnInsert": {
+                    **key,
+                    "status": WebhookLedgerStatus.PROCESSING.value,
+                    "claimed_at": now
+                }},
+                upsert=True,
+                return_document=ReturnDocument.BEFORE
+            )
+        except DuplicateKeyError:
+            # Two upserts raced on the unique index; the other one won
+            existing = await self.collection.find_one(key)
+
+        if existing is None:
+            return None
+
+        entry = self._to_domain(existing)
+        if not entry.is_completed and entry.claimed_at < now - self.STALE_CLAIM_AFTER:
+            result = await self.collection.update_one(
+                {**key, "status": WebhookLedgerStatus.PROCESSING.value, "claimed_at": entry.claimed_at},
+                {"$set": {"claimed_at": now}}
+            )
+            if result.modified_count == 1:
+                return None
+        return entry
+
+    async def complete(
+        self,
+        order_id: str,
+        ds_signature: str,
+        payment_id: Optional[str],
+        success: bool,
+        message: str
+    ) -> None:
+        """Store the outcome of a processed notification."""
+        await self.collection.update_one(
+            {"order_id": order_id, "ds_signature": ds_signature},
+            {"$set": {
+                "status": WebhookLedgerStatus.COMPLETED.value,
+                "payment_id": payment_id,
+                "success": success,
+                "message": message,
+                "completed_at": datetime.utcnow()
+            }}
+        )
+
+    async def release(self, order_id: str, ds_signature: str) -> None:
+        """Drop a claim whose processing failed."""
+        await self.collection.delete_one({
+            "order_id": order_id,
+            "ds_signature": ds_signature,
+            "status": WebhookLedgerStatus.PROCESSING.value
+        })
@@ -6,8 +6,8 @@ import logging
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from email.mime.application import MIMEApplication
+from functools import cached_property
 from typing import Optional
-from jinja2 import Environment, BaseLoader
 
 from src.application.ports.email_service import (
     EmailServicePort,
@@ -15,6 +15,12 @@ from src.application.ports.email_service import (
     EmailAttachment
 )
 from src.config.settings import get_email_settings
+from src.infrastructure.monitoring.prometheus import (
+    EMAIL_OUTBOX_DEPTH,
+    EMAIL_SEND_DURATION,
+    EMAILS_SENT,
+    observe_duration,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -217,7 +223,13 @@ class EmailService(EmailServicePort):
 
     def __init__(self):
         self.settings = get_email_settings()
-        self.jinja_env = Environment(loader=BaseLoader())
+
+    @cached_property
+    def jinja_env(self):
+        """Jinja2 environment, created (and jinja2 imported) on the first render."""
+        from jinja2 import BaseLoader, Environment
+
+        return Environment(loader=BaseLoader())
 
     def is_available(self) -> bool:
         """Check if SMTP settings are properly configured."""
@@ -274,6 +286,17 @@ class EmailService(EmailServicePort):
             logger.error("SMTP settings not configured")
             return False
 
+        EMAIL_OUTBOX_DEPTH.inc()
+        try:
+            with observe_duration(EMAIL_SEND_DURATION):
+                sent = self._deliver(message)
+        finally:
+            EMAIL_OUTBOX_DEPTH.dec()
+        EMAILS_SENT.labels(result="sent" if sent else "failed").inc()
+        return sent
+
+    def _deliver(self, message: EmailMessage) -> bool:
+        """Hand the message to the SMTP server; False if it was not accepted."""
         try:
             msg = self._build_mime_message(message)
 
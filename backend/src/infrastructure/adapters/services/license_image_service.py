@@ -3,15 +3,21 @@
 import os
 from io import BytesIO
 from pathlib import Path
-
-from PIL import Image, ImageDraw, ImageFont
+from typing import TYPE_CHECKING
 
 from src.application.ports.license_image_service import LicenseImageServicePort, LicenseImageData
 from src.domain.exceptions.license import LicenseImageGenerationError
+from src.infrastructure.monitoring.prometheus import RENDER_DURATION, timed
+
+if TYPE_CHECKING:
+    from PIL import ImageFont
 
 
 class LicenseImageService(LicenseImageServicePort):
-    """Implementation of license image generation service using Pillow."""
+    """Implementation of license image generation service using Pillow.
+
+    Pillow is imported on the first render, not with the module.
+    """
 
     # Text positions (x, y) from PHP implementation
     POSITIONS = {
@@ -53,8 +59,10 @@ class LicenseImageService(LicenseImageServicePort):
                 f"Font file not found at {self.font_path}"
             )
 
-    def _get_font(self, size: int) -> ImageFont.FreeTypeFont:
+    def _get_font(self, size: int) -> "ImageFont.FreeTypeFont":
         """Get font with specified size."""
+        from PIL import ImageFont
+
         try:
             return ImageFont.truetype(str(self.font_path), size)
         except Exception as e:
@@ -69,6 +77,7 @@ class LicenseImageService(LicenseImageServicePort):
         except (ValueError, AttributeError):
             return ""
 
+    @timed(RENDER_DURATION, format="image", document="license")
     async def generate_license_image(self, data: LicenseImageData) -> bytes:
         """Generate a license image with member data overlaid on template.
 
@@ -78,6 +87,8 @@ class LicenseImageService(LicenseImageServicePort):
         Returns:
             PNG image bytes.
         """
+        from PIL import Image, ImageDraw
+
         try:
             # Load template image
             image = Image.open(self.template_path)
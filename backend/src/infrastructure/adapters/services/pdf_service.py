@@ -2,67 +2,73 @@
 
 import os
 from datetime import datetime
+from functools import cached_property
 from typing import Optional
 from io import BytesIO
 
-from reportlab.lib import colors
-from reportlab.lib.pagesizes import A4
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.lib.units import cm, mm
-from reportlab.platypus import (
-    SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, Image
-)
-from reportlab.lib.enums import TA_CENTER, TA_RIGHT, TA_LEFT
-
 from src.application.ports.pdf_service import PDFServicePort
 from src.domain.entities.invoice import Invoice
+from src.infrastructure.monitoring.prometheus import RENDER_DURATION, timed
 
 
 class PDFService(PDFServicePort):
-    """Implementation of PDF generation service using ReportLab."""
+    """Implementation of PDF generation service using ReportLab.
+
+    ReportLab is imported on the first render rather than with the module:
+    it is slow to import and most processes never build a PDF.
+    """
+
+    @cached_property
+    def styles(self):
+        """Paragraph styles, built on first use."""
+        from reportlab.lib.styles import getSampleStyleSheet
 
-    def __init__(self):
-        self.styles = getSampleStyleSheet()
-        self._setup_custom_styles()
+        styles = getSampleStyleSheet()
+        self._setup_custom_styles(styles)
+        return styles
 
-    def _setup_custom_styles(self):
+    def _setup_custom_styles(self, styles):
         """Setup custom paragraph styles."""
-        self.styles.add(ParagraphStyle(
+        from reportlab.lib import colors
+        from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_RIGHT
+        from reportlab.lib.styles import ParagraphStyle
+
+        styles.add(ParagraphStyle(
             name="InvoiceTitle",
-            parent=self.styles["Heading1"],
+            parent=styles["Heading1"],
             fontSize=24,
             alignment=TA_CENTER,
             spaceAfter=30
         ))
-        self.styles.add(ParagraphStyle(
+        styles.add(ParagraphStyle(
             name="InvoiceHeader",
-            parent=self.styles["Normal"],
+            parent=styles["Normal"],
             fontSize=10,
             alignment=TA_RIGHT
         ))
-        self.styles.add(ParagraphStyle(
+        styles.add(ParagraphStyle(
             name="CompanyInfo",
-            parent=self.styles["Normal"],
+            parent=styles["Normal"],
             fontSize=10,
             alignment=TA_LEFT
         ))
-        self.styles.add(ParagraphStyle(
+        styles.add(ParagraphStyle(
             name="CustomerInfo",
-            parent=self.styles["Normal"],
+            parent=styles["Normal"],
             fontSize=10,
             alignment=TA_LEFT,
             leftIndent=0
         ))
-        self.styles.add(ParagraphStyle(
+        styles.add(ParagraphStyle(
             name="TableHeader",
-            parent=self.styles["Normal"],
+            parent=styles["Normal"],
             fontSize=10,
             textColor=colors.white,
             alignment=TA_CENTER
         ))
-        self.styles.add(ParagraphStyle(
+        styles.add(ParagraphStyle(
             name="Footer",
-            parent=self.styles["Normal"],
+            parent=styles["Normal"],
             fontSize=8,
             alignment=TA_CENTER,
             textColor=colors.grey
@@ -80,6 +86,7 @@ class PDFService(PDFServicePort):
         except (ValueError, AttributeError):
             return date_str or ""
 
+    @timed(RENDER_DURATION, format="pdf", document="invoice")
     async def generate_invoice_pdf(
         self,
         invoice: Invoice,
@@ -89,6 +96,11 @@ class PDFService(PDFServicePort):
         logo_path: Optional[str] = None
     ) -> bytes:
         """Generate a PDF for an invoice and return the bytes."""
+        from reportlab.lib import colors
+        from reportlab.lib.pagesizes import A4
+        from reportlab.lib.units import cm
+        from reportlab.platypus import Image, Paragraph, SimpleDocTemplate, Spacer, Table, TableStyle
+
         buffer = BytesIO()
 
         doc = SimpleDocTemplate(
@@ -247,6 +259,7 @@ class PDFService(PDFServicePort):
 
         return filepath
 
+    @timed(RENDER_DURATION, format="pdf", document="license_certificate")
     async def generate_license_certificate_pdf(
         self,
         member_name: str,
@@ -257,6 +270,10 @@ class PDFService(PDFServicePort):
         club_name: str
     ) -> bytes:
         """Generate a license certificate PDF."""
+        from reportlab.lib.pagesizes import A4
+        from reportlab.lib.units import cm
+        from reportlab.platypus import Paragraph, SimpleDocTemplate, Spacer, Table, TableStyle
+
         buffer = BytesIO()
 
         doc = SimpleDocTemplate(
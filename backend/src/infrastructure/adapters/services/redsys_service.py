@@ -6,7 +6,6 @@ import hmac
 import json
 import re
 from typing import Optional
-from Crypto.Cipher import DES3
 
 from src.application.ports.redsys_service import (
     RedsysServicePort,
@@ -101,6 +100,9 @@ class RedsysService(RedsysServicePort):
 
     def _encrypt_3des(self, data: bytes, key: bytes) -> bytes:
         """Encrypt data using 3DES CBC mode."""
+        # Imported on first use: only payment requests and notifications need it
+        from Crypto.Cipher import DES3
+
         try:
             # Pad data to 8-byte boundary
             padding_length = 8 - (len(data) % 8)
@@ -116,6 +118,8 @@ class RedsysService(RedsysServicePort):
 
     def _decrypt_3des(self, data: bytes, key: bytes) -> bytes:
         """Decrypt data using 3DES CBC mode."""
+        from Crypto.Cipher import DES3
+
         try:
             iv = bytes([0] * 8)
             cipher = DES3.new(key, DES3.MODE_CBC, iv)
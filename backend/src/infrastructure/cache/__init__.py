@@ -0,0 +1,13 @@
+"""Cache infrastructure: single-flight caches over in-process and MongoDB backends."""
+from .backend import MISSING, CacheBackend
+from .cache import Cache
+from .memory import InMemoryCacheBackend
+from .mongodb import MongoDBCacheBackend
+
+__all__ = [
+    "MISSING",
+    "Cache",
+    "CacheBackend",
+    "InMemoryCacheBackend",
+    "MongoDBCacheBackend",
+]
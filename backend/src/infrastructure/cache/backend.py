@@ -0,0 +1,34 @@
+"""Storage interface of the cache backends."""
+
+from abc import ABC, abstractmethod
+from typing import Any, Iterable
+
+# Returned by ``CacheBackend.get`` on a miss, since None is a valid value
+MISSING = object()
+
+
+class CacheBackend(ABC):
+    """Key-value storage with per-entry expiry and tags.
+
+    Keys and tags arrive already namespaced by the ``Cache`` in front.
+    """
+
+    @abstractmethod
+    async def get(self, key: str) -> Any:
+        """The live value stored under key, or ``MISSING``."""
+        pass
+
+    @abstractmethod
+    async def set(self, key: str, value: Any, ttl: float, tags: Iterable[str]) -> None:
+        """Store value under key for ttl seconds."""
+        pass
+
+    @abstractmethod
+    async def delete(self, key: str) -> None:
+        """Drop the value stored under key, if any."""
+        pass
+
+    @abstractmethod
+    async def delete_tags(self, tags: Iterable[str]) -> None:
+        """Drop every value stored with any of the tags."""
+        pass
@@ -0,0 +1,107 @@
+"""Namespaced cache with single-flight loading over a storage backend."""
+
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Dict, Iterable, Optional
+
+from src.application.ports.cache import CachePort
+from src.infrastructure.cache.backend import MISSING, CacheBackend
+from src.infrastructure.monitoring.prometheus import CACHE_LOAD_DURATION, CACHE_LOOKUPS, observe_duration
+
+logger = logging.getLogger(__name__)
+
+
+class Cache(CachePort):
+    """
+    Cache of computed values stored in a backend under the ``name`` namespace.
+
+    Concurrent misses for one key in this process share a single load;
+    loader errors are passed to every waiter and nothing is stored. A load
+    that overlaps a ``delete`` or ``invalidate_tags`` in this process is
+    returned but not stored, so it cannot outlive the invalidation. Backend
+    errors are logged and treated as misses: a cache outage slows requests
+    down but does not fail them. Lookups are counted in the
+    ``cache_lookups_total`` metric under ``name``.
+    """
+
+    def __init__(self, name: str, backend: CacheBackend, default_ttl: float = 60.0):
+        self.name = name
+        self.backend = backend
+        self.default_ttl = default_ttl
+        self._in_flight: Dict[str, asyncio.Future] = {}
+        # Bumped by every invalidation, to spot loads that overlapped one
+        self._generation = 0
+
+    def _key(self, key: str) -> str:
+        return f"{self.name}:{key}"
+
+    def _count(self, result: str) -> None:
+        CACHE_LOOKUPS.labels(cache=self.name, result=result).inc()
+
+    async def _get(self, key: str) -> Any:
+        try:
+            return await self.backend.get(key)
+        except Exception as e:
+            logger.warning(f"Cache {self.name} read failed for {key}: {e}")
+            return MISSING
+
+    async def _set(self, key: str, value: Any, ttl: float, tags: Iterable[str]) -> None:
+        try:
+            await self.backend.set(key, value, ttl, [self._key(tag) for tag in tags])
+        except Exception as e:
+            logger.warning(f"Cache {self.name} write failed for {key}: {e}")
+
+    async def get_or_load(
+        self,
+        key: str,
+        loader: Callable[[], Awaitable[Any]],
+        ttl: Optional[float] = None,
+        tags: Iterable[str] = (),
+    ) -> Any:
+        full_key = self._key(key)
+        value = await self._get(full_key)
+        if value is not MISSING:
+            self._count("hit")
+            return value
+
+        in_flight = self._in_flight.get(full_key)
+        if in_flight is not None:
+            self._count("coalesced")
+            try:
+                return await asyncio.shield(in_flight)
+            except asyncio.CancelledError:
+                # The task that was loading got cancelled, not this one: load again
+                if in_flight.cancelled() and not asyncio.current_task().cancelling():
+                    return await self.get_or_load(key, loader, ttl, tags)
+                raise
+
+        self._count("miss")
+        future = asyncio.get_running_loop().create_future()
+        self._in_flight[full_key] = future
+        generation = self._generation
+        try:
+            with observe_duration(CACHE_LOAD_DURATION, cache=self.name):
+                value = await loader()
+            future.set_result(value)
+            if generation == self._generation:
+                await self._set(full_key, value, self.default_ttl if ttl is None else ttl, tags)
+            return value
+        except Exception as e:
+            self._count("error")
+            future.set_exception(e)
+            # Mark the exception retrieved when no other task was waiting
+            future.exception()
+            raise
+        finally:
+            if not future.done():
+                # Cancelled: the waiters load again themselves
+                future.cancel()
+            self._in_flight.pop(full_key, None)
+
+    async def delete(self, key: str) -> None:
+        self._generation += 1
+        await self.backend.delete(self._key(key))
+
+    async def invalidate_tags(self, *tags: str) -> None:
+        self._generation += 1
+        await self.backend.delete_tags([self._key(tag) for tag in tags])
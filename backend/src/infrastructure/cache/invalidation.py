@@ -0,0 +1,103 @@
+"""Relay of invalidations of per-process state to every worker."""
+import asyncio
+import logging
+from typing import Callable, Dict, List, Optional
+
+from src.infrastructure.adapters.repositories.mongodb_cache_version_repository import (
+    MongoDBCacheVersionRepository,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class WorkerInvalidation:
+    """
+    Runs invalidation hooks in every worker when one of them publishes a change.
+
+    Each worker registers hooks that drop its own copy of a dataset (the
+    club directory, for instance). ``publish`` runs the local hooks at once
+    and bumps the dataset's counter in ``cache_versions``; the other
+    workers poll the counters every ``interval_seconds`` and run their
+    hooks when one moved, so their copies lag a write by at most that long.
+    """
+
+    def __init__(self, versions: MongoDBCacheVersionRepository, interval_seconds: float = 5.0):
+        self.versions = versions
+        self.interval_seconds = interval_seconds
+        self._hooks: Dict[str, List[Callable[[], None]]] = {}
+        self._seen: Dict[str, int] = {}
+        self._task: Optional[asyncio.Task] = None
+        self._running = False
+
+    def register(self, name: str, hook: Callable[[], None]) -> None:
+        """Run hook whenever the dataset called name changes in any worker."""
+        self._hooks.setdefault(name, []).append(hook)
+
+    def _run_hooks(self, name: str) -> None:
+        for hook in self._hooks.get(name, ()):
+            try:
+                hook()
+            except Exception as e:
+                logger.error(f"Invalidation hook for {name} failed: {e}")
+
+    async def publish(self, name: str, local: bool = True) -> None:
+        """Invalidate the dataset here and signal the other workers.
+
+        Pass ``local=False`` when this worker has already applied the change
+        to its own copy, so only the other workers run their hooks.
+        """
+        if local:
+            self._run_hooks(name)
+        try:
+            version = await self.versions.bump(name)
+            # Only skip our own bump: if another worker bumped since the last
+            # poll, the next poll must still see the counter move
+            if self._seen.get(name) == version - 1:
+                self._seen[name] = version
+        except Exception as e:
+            logger.error(f"Failed to publish invalidation of {name}: {e}")
+
+    async def poll(self) -> List[str]:
+        """Run the hooks of the datasets changed since the last poll; returns their names."""
+        versions = await self.versions.get_many(self._hooks)
+        changed = []
+        for name, version in versions.items():
+            # The first poll only records where the counters stand
+            if name in self._seen and self._seen[name] != version:
+                self._run_hooks(name)
+                changed.append(name)
+            self._seen[name] = version
+        return changed
+
+    async def start(self) -> None:
+        """Record the current counters, then poll them in the background."""
+        if self._running:
+            logger.warning("Worker invalidation is already running")
+            return
+
+        self._running = True
+        try:
+            await self.poll()
+        except Exception as e:
+            logger.error(f"Failed to read invalidation counters: {e}")
+        self._task = asyncio.create_task(self._poll_loop())
+
+    async def stop(self) -> None:
+        """Stop polling."""
+        self._running = False
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+
+    async def _poll_loop(self) -> None:
+        while self._running:
+            try:
+                await asyncio.sleep(self.interval_seconds)
+                await self.poll()
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                logger.error(f"Failed to poll invalidation counters: {e}")
@@ -0,0 +1,108 @@
+"""In-process cache backend with TTL and LRU eviction."""
+
+import pickle
+import sys
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, FrozenSet, Iterable, Set
+
+from src.infrastructure.cache.backend import MISSING, CacheBackend
+from src.infrastructure.monitoring.prometheus import CACHE_EVICTIONS
+
+
+@dataclass
+class _Entry:
+    value: Any
+    expires_at: float
+    tags: FrozenSet[str]
+    size: int
+
+
+def estimate_size(value: Any) -> int:
+    """Approximate memory held by value, in bytes.
+
+    Bytes and strings count their length; anything else its pickled size,
+    which follows nested objects where ``sys.getsizeof`` does not.
+    """
+    if isinstance(value, (bytes, bytearray, str)):
+        return len(value)
+    try:
+        return len(pickle.dumps(value, pickle.HIGHEST_PROTOCOL))
+    except Exception:
+        return sys.getsizeof(value)
+
+
+class InMemoryCacheBackend(CacheBackend):
+    """
+    Per-process cache bounded by entry count and approximate size.
+
+    Values are kept as they are, not copied: callers must not mutate what
+    they get back. Expired entries are dropped when read; when a new value
+    would exceed ``max_entries`` or ``max_bytes``, the least recently used
+    entries go first. A value larger than ``max_bytes`` is not stored.
+    """
+
+    def __init__(
+        self,
+        name: str = "memory",
+        max_entries: int = 1024,
+        max_bytes: int = 32 * 1024 * 1024,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.name = name
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._clock = clock
+        self._entries: "OrderedDict[str, _Entry]" = OrderedDict()
+        self._keys_by_tag: Dict[str, Set[str]] = {}
+        self.size = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _remove(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        self.size -= entry.size
+        for tag in entry.tags:
+            keys = self._keys_by_tag.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._keys_by_tag[tag]
+
+    async def get(self, key: str) -> Any:
+        entry = self._entries.get(key)
+        if entry is None:
+            return MISSING
+        if entry.expires_at <= self._clock():
+            self._remove(key)
+            return MISSING
+        self._entries.move_to_end(key)
+        return entry.value
+
+    async def set(self, key: str, value: Any, ttl: float, tags: Iterable[str]) -> None:
+        self._remove(key)
+        size = estimate_size(value)
+        if size > self.max_bytes:
+            return
+        while self._entries and (
+            len(self._entries) >= self.max_entries or self.size + size > self.max_bytes
+        ):
+            self._remove(next(iter(self._entries)))
+            CACHE_EVICTIONS.labels(backend=self.name).inc()
+        entry = _Entry(value=value, expires_at=self._clock() + ttl, tags=frozenset(tags), size=size)
+        self._entries[key] = entry
+        self.size += size
+        for tag in entry.tags:
+            self._keys_by_tag.setdefault(tag, set()).add(key)
+
+    async def delete(self, key: str) -> None:
+        self._remove(key)
+
+    async def delete_tags(self, tags: Iterable[str]) -> None:
+        for tag in tags:
+            for key in list(self._keys_by_tag.get(tag, ())):
+                self._remove(key)
@@ -0,0 +1,61 @@
+"""MongoDB cache backend, shared by every worker."""
+
+import pickle
+from datetime import datetime, timedelta
+from typing import Any, Iterable
+
+from bson import Binary
+from pymongo import ASCENDING
+
+from src.infrastructure.cache.backend import MISSING, CacheBackend
+from src.infrastructure.database import get_database
+
+
+class MongoDBCacheBackend(CacheBackend):
+    """
+    Cache entries stored in a collection with a TTL index on ``expires_at``.
+
+    Lets workers share values that are expensive to compute, at the price
+    of one primary read per lookup. The TTL monitor only sweeps about once
+    a minute, so reads also filter on ``expires_at``. Values are pickled:
+    they must be picklable, and the collection is trusted like the rest of
+    the database.
+    """
+
+    def __init__(self, collection_name: str = "cache_entries"):
+        self.db = get_database()
+        self.collection = self.db[collection_name]
+
+    async def ensure_indexes(self) -> None:
+        """Create the TTL index that purges expired entries and the tag index."""
+        await self.collection.create_index(
+            [("expires_at", ASCENDING)], expireAfterSeconds=0, name="expires_at_ttl"
+        )
+        await self.collection.create_index([("tags", ASCENDING)], name="tags")
+
+    async def get(self, key: str) -> Any:
+        doc = await self.collection.find_one(
+            {"_id": key, "expires_at": {"$gt": datetime.utcnow()}}, {"value": 1}
+        )
+        if doc is None:
+            return MISSING
+        return pickle.loads(doc["value"])
+
+    async def set(self, key: str, value: Any, ttl: float, tags: Iterable[str]) -> None:
+        await self.collection.replace_one(
+            {"_id": key},
+            {
+                "value": Binary(pickle.dumps(value, pickle.HIGHEST_PROTOCOL)),
+                "tags": list(tags),
+                "expires_at": datetime.utcnow() + timedelta(seconds=ttl),
+            },
+            upsert=True,
+        )
+
+    async def delete(self, key: str) -> None:
+        await self.collection.delete_one({"_id": key})
+
+    async def delete_tags(self, tags: Iterable[str]) -> None:
+        tags = list(tags)
+        if tags:
+            await self.collection.delete_many({"tags": {"$in": tags}})
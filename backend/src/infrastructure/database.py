@@ -1,20 +1,43 @@
 """Database infrastructure module."""
 
-import os
+import logging
+import time
+
 import motor.motor_asyncio
 from dotenv import load_dotenv
 load_dotenv()
 
+from src.config.settings import get_database_settings
+from src.infrastructure.monitoring.pool_metrics import PoolMetricsListener
+from src.infrastructure.monitoring.prometheus import CommandLatencyListener
+from src.infrastructure.monitoring.query_metrics import QueryMetricsListener
+
+logger = logging.getLogger(__name__)
+
 _client = None
 _database = None
+# Outlives client restarts so the metrics stay cumulative
+_pool_metrics = PoolMetricsListener()
+_query_metrics = QueryMetricsListener()
+_command_latency = CommandLatencyListener()
+
+
+def get_pool_metrics() -> PoolMetricsListener:
+    """Get the connection pool listener registered on the client."""
+    return _pool_metrics
 
 
 def get_client():
     """Get MongoDB client singleton."""
     global _client
     if _client is None:
-        mongo_uri = os.getenv("MONGODB_URL", "mongodb://localhost:27017")
-        _client = motor.motor_asyncio.AsyncIOMotorClient(mongo_uri)
+        settings = get_database_settings()
+        settings.validate()
+        _client = motor.motor_asyncio.AsyncIOMotorClient(
+            settings.url,
+            event_listeners=[_pool_metrics, _query_metrics, _command_latency],
+            **settings.client_options(),
+        )
     return _client
 
 
@@ -23,15 +46,32 @@ def get_database():
     global _database
     if _database is None:
         client = get_client()
-        db_name = os.getenv("DATABASE_NAME")
-        _database = client[db_name]
+        _database = client[get_database_settings().name]
     return _database
 
 
+async def ping_database() -> float:
+    """Round-trip a ping to the server; returns the latency in milliseconds."""
+    started = time.perf_counter()
+    await get_database().command("ping")
+    return (time.perf_counter() - started) * 1000
+
+
+async def connect_to_database() -> None:
+    """Create the client and warm it up with a ping before serving requests."""
+    settings = get_database_settings()
+    latency_ms = await ping_database()
+    logger.info(
+        f"Connected to MongoDB database {settings.name!r} in {latency_ms:.1f} ms "
+        f"(pool {settings.min_pool_size}-{settings.max_pool_size}, "
+        f"read preference {settings.read_preference})"
+    )
+
+
 async def close_database_connection():
     """Close database connection."""
     global _client, _database
     if _client:
         _client.close()
         _client = None
-        _database = None
\ No newline at end of file
+        _database = None
@@ -0,0 +1,46 @@
+"""MongoDB index bootstrap run at application startup."""
+
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+async def ensure_indexes() -> None:
+    """Create the indexes repositories rely on for correctness.
+
+    Each repository exposing ``ensure_indexes`` is asked to create its own
+    indexes; ``create_index`` is a no-op when the index already exists.
+    """
+    # Import here to avoid circular imports
+    from src.infrastructure.web.dependencies import (
+        get_club_repository,
+        get_insurance_repository,
+        get_invoice_repository,
+        get_license_repository,
+        get_member_payment_repository,
+        get_member_repository,
+        get_mongodb_cache_backend,
+        get_payment_fulfillment_repository,
+        get_payment_repository,
+        get_seminar_repository,
+        get_webhook_ledger_repository,
+    )
+
+    repositories = [
+        get_webhook_ledger_repository(),
+        get_member_repository(),
+        get_club_repository(),
+        get_license_repository(),
+        get_insurance_repository(),
+        get_payment_repository(),
+        get_member_payment_repository(),
+        get_payment_fulfillment_repository(),
+        get_invoice_repository(),
+        get_seminar_repository(),
+        get_mongodb_cache_backend(),
+    ]
+    for repository in repositories:
+        try:
+            await repository.ensure_indexes()
+        except Exception as e:
+            logger.error(f"Failed to ensure indexes for {type(repository).__name__}: {e}")
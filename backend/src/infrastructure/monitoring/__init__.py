@@ -0,0 +1,17 @@
+"""Monitoring: connection pool metrics, per-request query accounting and Prometheus metrics."""
+from .pool_metrics import PoolMetricsListener
+from .prometheus import CommandLatencyListener, observe_duration, render_metrics, scheduler_job, timed
+from .query_metrics import QueryMetricsListener, QueryStats, current_query_stats, track_queries
+
+__all__ = [
+    "CommandLatencyListener",
+    "PoolMetricsListener",
+    "QueryMetricsListener",
+    "QueryStats",
+    "current_query_stats",
+    "observe_duration",
+    "render_metrics",
+    "scheduler_job",
+    "timed",
+    "track_queries",
+]
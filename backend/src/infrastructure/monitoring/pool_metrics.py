@@ -0,0 +1,105 @@
+"""MongoDB connection pool listener that keeps pool size and checkout wait metrics."""
+
+import threading
+from collections import defaultdict
+from typing import Dict
+
+from pymongo import monitoring
+
+
+class _ServerPoolStats:
+    __slots__ = (
+        "open_connections",
+        "checked_out",
+        "checkouts",
+        "checkout_failures",
+        "checkout_wait_seconds_total",
+        "checkout_wait_seconds_max",
+        "clears",
+    )
+
+    def __init__(self):
+        for name in self.__slots__:
+            setattr(self, name, 0)
+
+
+class PoolMetricsListener(monitoring.ConnectionPoolListener):
+    """Aggregate connection pool events per server address.
+
+    Tracks open connections (the pool size), connections currently checked
+    out, and how long operations waited to check a connection out. The
+    driver publishes events from its own threads, so updates take a lock.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._servers: Dict[str, _ServerPoolStats] = defaultdict(_ServerPoolStats)
+
+    @staticmethod
+    def _key(address) -> str:
+        host, port = address
+        return f"{host}:{port}"
+
+    def snapshot(self) -> Dict[str, dict]:
+        """Current metrics keyed by "host:port"."""
+        with self._lock:
+            return {
+                address: {name: getattr(stats, name) for name in _ServerPoolStats.__slots__}
+                for address, stats in self._servers.items()
+            }
+
+    def pool_created(self, event: monitoring.PoolCreatedEvent) -> None:
+        with self._lock:
+            self._servers.setdefault(self._key(event.address), _ServerPoolStats())
+
+    def pool_ready(self, event: monitoring.PoolReadyEvent) -> None:
+        pass
+
+    def pool_cleared(self, event: monitoring.PoolClearedEvent) -> None:
+        with self._lock:
+            self._servers[self._key(event.address)].clears += 1
+
+    def pool_closed(self, event: monitoring.PoolClosedEvent) -> None:
+        with self._lock:
+            self._servers.pop(self._key(event.address), None)
+
+    def connection_created(self, event: monitoring.ConnectionCreatedEvent) -> None:
+        with self._lock:
+            self._servers[self._key(event.address)].open_connections += 1
+
+    def connection_ready(self, event: monitoring.ConnectionReadyEvent) -> None:
+        pass
+
+    def connection_closed(self, event: monitoring.ConnectionClosedEvent) -> None:
+        with self._lock:
+            stats = self._servers[self._key(event.address)]
+            stats.open_connections = max(stats.open_connections - 1, 0)
+
+    def connection_check_out_started(self, event: monitoring.ConnectionCheckOutStartedEvent) -> None:
+        pass
+
+    def connection_check_out_failed(self, event: monitoring.ConnectionCheckOutFailedEvent) -> None:
+        with self._lock:
+            stats = self._servers[self._key(event.address)]
+            stats.checkout_failures += 1
+            self._record_wait(stats, event.duration)
+
+    def connection_checked_out(self, event: monitoring.ConnectionCheckedOutEvent) -> None:
+        with self._lock:
+            stats = self._servers[self._key(event.address)]
+            stats.checkouts += 1
+            stats.checked_out += 1
+            self._record_wait(stats, event.duration)
+
+    def connection_checked_in(self, event: monitoring.ConnectionCheckedInEvent) -> None:
+        with self._lock:
+            stats = self._servers[self._key(event.address)]
+            stats.checked_out = max(stats.checked_out - 1, 0)
+
+    @staticmethod
+    def _record_wait(stats: _ServerPoolStats, duration) -> None:
+        # The driver reports the checkout duration in seconds
+        if duration is None:
+            return
+        stats.checkout_wait_seconds_total += duration
+        stats.checkout_wait_seconds_max = max(stats.checkout_wait_seconds_max, duration)
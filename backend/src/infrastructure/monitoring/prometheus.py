@@ -0,0 +1,206 @@
+"""Prometheus metrics exposed on ``/metrics``.
+
+Every API worker records into the process-wide default registry. When
+``PROMETHEUS_MULTIPROC_DIR`` is set (it must point to an empty, writable
+directory and be set before the workers start), prometheus_client keeps the
+values in per-process files there and ``render_metrics`` merges the files of
+all workers, so a scrape reports the whole server and not only the worker
+that happened to answer it.
+"""
+
+import functools
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, Tuple
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+from pymongo import monitoring
+
+MULTIPROC_DIR_ENV = "PROMETHEUS_MULTIPROC_DIR"
+
+# Buckets for work measured in milliseconds: database commands and renders
+FAST_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+# Buckets for background jobs, which may run for minutes
+JOB_BUCKETS = (0.1, 0.5, 1.0, 5.0, 15.0, 30.0, 60.0, 120.0, 300.0, 900.0)
+
+HTTP_REQUESTS = Counter(
+    "http_requests_total",
+    "HTTP requests served, by route template and status code.",
+    ["method", "route", "status"],
+)
+HTTP_REQUEST_DURATION = Histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency, by route template.",
+    ["method", "route"],
+)
+HTTP_REQUESTS_IN_PROGRESS = Gauge(
+    "http_requests_in_progress",
+    "HTTP requests being served.",
+    ["method"],
+    multiprocess_mode="livesum",
+)
+MONGODB_COMMAND_DURATION = Histogram(
+    "mongodb_command_duration_seconds",
+    "MongoDB command latency, by collection and command.",
+    ["collection", "command"],
+    buckets=FAST_BUCKETS,
+)
+MONGODB_COMMAND_FAILURES = Counter(
+    "mongodb_command_failures_total",
+    "MongoDB commands that returned an error.",
+    ["collection", "command"],
+)
+RENDER_DURATION = Histogram(
+    "document_render_duration_seconds",
+    "Time spent rendering PDF documents and license images.",
+    ["format", "document"],
+    buckets=FAST_BUCKETS,
+)
+EMAIL_OUTBOX_DEPTH = Gauge(
+    "email_outbox_depth",
+    "Emails handed to the email service and not yet accepted by the SMTP server.",
+    multiprocess_mode="livesum",
+)
+EMAIL_SEND_DURATION = Histogram(
+    "email_send_duration_seconds",
+    "Time spent delivering one email to the SMTP server.",
+    buckets=FAST_BUCKETS,
+)
+EMAILS_SENT = Counter(
+    "emails_sent_total",
+    "Emails delivered to the SMTP server, by result.",
+    ["result"],
+)
+SCHEDULER_JOB_DURATION = Histogram(
+    "scheduler_job_duration_seconds",
+    "Duration of background scheduler job runs.",
+    ["job"],
+    buckets=JOB_BUCKETS,
+)
+SCHEDULER_JOB_FAILURES = Counter(
+    "scheduler_job_failures_total",
+    "Background scheduler job runs that raised.",
+    ["job"],
+)
+CACHE_LOOKUPS = Counter(
+    "cache_lookups_total",
+    "Cache lookups, by cache and result (hit, miss, coalesced, error).",
+    ["cache", "result"],
+)
+CACHE_LOAD_DURATION = Histogram(
+    "cache_load_duration_seconds",
+    "Time spent computing values on cache misses.",
+    ["cache"],
+    buckets=FAST_BUCKETS,
+)
+CACHE_EVICTIONS = Counter(
+    "cache_evictions_total",
+    "Entries dropped from in-process caches to stay within their limits.",
+    ["backend"],
+)
+
+
+def multiprocess_enabled() -> bool:
+    """Whether metrics are aggregated across worker processes."""
+    return bool(os.getenv(MULTIPROC_DIR_ENV))
+
+
+def render_metrics() -> Tuple[bytes, str]:
+    """Return the exposition body and its content type for a scrape."""
+    if multiprocess_enabled():
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry = REGISTRY
+    return generate_latest(registry), CONTENT_TYPE_LATEST
+
+
+def mark_worker_dead(pid: int) -> None:
+    """Drop the live gauges of a worker that exited (call from the process manager)."""
+    if multiprocess_enabled():
+        multiprocess.mark_process_dead(pid)
+
+
+@contextmanager
+def observe_duration(histogram: Histogram, **labels: str) -> Iterator[None]:
+    """Observe the wall time of the block, whether or not it raises."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        metric = histogram.labels(**labels) if labels else histogram
+        metric.observe(time.perf_counter() - start)
+
+
+def timed(histogram: Histogram, **labels: str) -> Callable:
+    """Decorator for coroutine functions: observe each call's duration."""
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            with observe_duration(histogram, **labels):
+                return await func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+@contextmanager
+def scheduler_job(job: str) -> Iterator[None]:
+    """Record the duration, and the failure if it raises, of one job run."""
+    try:
+        with observe_duration(SCHEDULER_JOB_DURATION, job=job):
+            yield
+    except Exception:
+        SCHEDULER_JOB_FAILURES.labels(job=job).inc()
+        raise
+
+
+class CommandLatencyListener(monitoring.CommandListener):
+    """Feed MongoDB command latency into the ``mongodb_command_*`` metrics.
+
+    The collection is only present on the started event, so it is kept
+    until the matching succeeded or failed event arrives.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._collections: Dict[tuple, str] = {}
+
+    @staticmethod
+    def _key(event: Any) -> tuple:
+        return event.connection_id, event.request_id
+
+    def started(self, event: monitoring.CommandStartedEvent) -> None:
+        # getMore names its collection under "collection"
+        collection = event.command.get(event.command_name)
+        if not isinstance(collection, str):
+            collection = event.command.get("collection")
+        if not isinstance(collection, str):
+            collection = ""
+        with self._lock:
+            self._collections[self._key(event)] = collection
+
+    def _finished(self, event: Any) -> str:
+        with self._lock:
+            collection = self._collections.pop(self._key(event), "")
+        MONGODB_COMMAND_DURATION.labels(collection=collection, command=event.command_name).observe(
+            event.duration_micros / 1_000_000
+        )
+        return collection
+
+    def succeeded(self, event: monitoring.CommandSucceededEvent) -> None:
+        self._finished(event)
+
+    def failed(self, event: monitoring.CommandFailedEvent) -> None:
+        collection = self._finished(event)
+        MONGODB_COMMAND_FAILURES.labels(collection=collection, command=event.command_name).inc()
@@ -0,0 +1,139 @@
+"""Per-request MongoDB command accounting and N+1 detection.
+
+``QueryMetricsListener`` is registered on the Motor client. Motor runs each
+driver call in the context of the awaiting task, so the listener can
+attribute every command to the ``QueryStats`` of the request being served,
+which ``track_queries`` installs in a context variable.
+"""
+
+import threading
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+from pymongo import monitoring
+
+# (command, collection, sorted filter fields)
+QueryShape = Tuple[str, str, Tuple[str, ...]]
+
+# Commands that are driver housekeeping rather than application queries
+_IGNORED_COMMANDS = frozenset({"endSessions", "killCursors", "ping", "hello", "isMaster", "ismaster"})
+# Where each command keeps its filter
+_FILTER_FIELDS = {"find": "filter", "count": "query", "distinct": "query", "findAndModify": "query"}
+
+
+def _shape(command_name: str, command: dict) -> QueryShape:
+    collection = command.get(command_name)
+    collection = collection if isinstance(collection, str) else ""
+    if command_name == "aggregate":
+        pipeline = command.get("pipeline") or [{}]
+        query = pipeline[0].get("$match", {}) if pipeline else {}
+    elif command_name in ("update", "delete"):
+        statements = command.get("updates") or command.get("deletes") or [{}]
+        query = statements[0].get("q", {})
+    else:
+        query = command.get(_FILTER_FIELDS.get(command_name, ""), {})
+    fields = tuple(sorted(query)) if isinstance(query, dict) else ()
+    return command_name, collection, fields
+
+
+def describe_shape(shape: QueryShape) -> str:
+    """Readable form of a shape, e.g. ``find members {_id}``."""
+    command_name, collection, fields = shape
+    return f"{command_name} {collection} {{{', '.join(fields)}}}"
+
+
+class QueryStats:
+    """Commands run on behalf of one request: count, time and shapes."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._pending: Dict[tuple, QueryShape] = {}
+        self.count = 0
+        self.failures = 0
+        self.total_ms = 0.0
+        self.shapes: Counter = Counter()
+
+    def started(self, key: tuple, shape: QueryShape) -> None:
+        with self._lock:
+            self._pending[key] = shape
+
+    def finished(self, key: tuple, duration_ms: float, failed: bool = False) -> None:
+        with self._lock:
+            shape = self._pending.pop(key, None)
+            if shape is None:
+                return
+            self.count += 1
+            self.failures += failed
+            self.total_ms += duration_ms
+            # Cursor batches of one query are expected to repeat
+            if shape[0] != "getMore":
+                self.shapes[shape] += 1
+
+    def repeated_shapes(self, threshold: int) -> List[Tuple[QueryShape, int]]:
+        """Shapes run at least ``threshold`` times: likely N+1 loops."""
+        with self._lock:
+            return [(shape, n) for shape, n in self.shapes.most_common() if n >= threshold]
+
+    def server_timing(self) -> str:
+        """Value for the ``Server-Timing`` response header."""
+        return f'db;dur={self.total_ms:.1f};desc="{self.count} queries"'
+
+
+_current_stats: ContextVar[Optional[QueryStats]] = ContextVar("query_stats", default=None)
+
+RequestObserver = Callable[[str, str, QueryStats], None]
+_observers: List[RequestObserver] = []
+
+
+def current_query_stats() -> Optional[QueryStats]:
+    """Stats of the request being served, if it is being tracked."""
+    return _current_stats.get()
+
+
+@contextmanager
+def track_queries() -> Iterator[QueryStats]:
+    """Attribute the commands run inside the block to a fresh QueryStats."""
+    stats = QueryStats()
+    token = _current_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        _current_stats.reset(token)
+
+
+def add_request_observer(observer: RequestObserver) -> Callable[[], None]:
+    """Call ``observer(method, path, stats)`` after each tracked request; returns a remover."""
+    _observers.append(observer)
+    return lambda: _observers.remove(observer)
+
+
+def publish_request(method: str, path: str, stats: QueryStats) -> None:
+    """Hand a finished request's stats to the registered observers."""
+    for observer in list(_observers):
+        observer(method, path, stats)
+
+
+class QueryMetricsListener(monitoring.CommandListener):
+    """Attribute driver commands to the QueryStats of the current request."""
+
+    @staticmethod
+    def _key(event) -> tuple:
+        return event.connection_id, event.request_id
+
+    def started(self, event: monitoring.CommandStartedEvent) -> None:
+        stats = _current_stats.get()
+        if stats is None or event.command_name in _IGNORED_COMMANDS:
+            return
+        stats.started(self._key(event), _shape(event.command_name, event.command))
+
+    def succeeded(self, event: monitoring.CommandSucceededEvent) -> None:
+        stats = _current_stats.get()
+        if stats is not None:
+            stats.finished(self._key(event), event.duration_micros / 1000)
+
+    def failed(self, event: monitoring.CommandFailedEvent) -> None:
+        stats = _current_stats.get()
+        if stats is not None:
+            stats.finished(self._key(event), event.duration_micros / 1000, failed=True)
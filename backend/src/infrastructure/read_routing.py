@@ -0,0 +1,39 @@
+"""Apply the read routing requested by use cases to Motor collections and databases."""
+
+from functools import lru_cache
+from typing import Any
+
+from pymongo.read_preferences import (
+    Nearest,
+    Primary,
+    PrimaryPreferred,
+    Secondary,
+    SecondaryPreferred,
+)
+
+from src.application.ports.read_routing import ReadRouting, current_read_routing
+from src.config.settings import get_database_settings
+
+_MODES = {
+    "primaryPreferred": PrimaryPreferred,
+    "secondary": Secondary,
+    "secondaryPreferred": SecondaryPreferred,
+    "nearest": Nearest,
+}
+
+
+@lru_cache()
+def reporting_read_preference() -> Any:
+    """Read preference for reporting reads, built from the database settings."""
+    settings = get_database_settings()
+    mode = _MODES.get(settings.reporting_read_preference)
+    if mode is None:
+        return Primary()
+    return mode(max_staleness=settings.reporting_max_staleness_seconds)
+
+
+def routed(target):
+    """Return ``target`` (a collection or database) with the current read routing applied."""
+    if current_read_routing() is ReadRouting.REPORTING:
+        return target.with_options(read_preference=reporting_read_preference())
+    return target
@@ -1,4 +1,16 @@
 """Scheduler infrastructure module."""
 from .notification_scheduler import NotificationScheduler, create_notification_scheduler
+from .member_suggestion_refresher import MemberSuggestionRefresher, create_member_suggestion_refresher
+from .leader_lease import LeaderLease, create_scheduler_lease
+from .fulfillment_sweeper import FulfillmentSweeper, create_fulfillment_sweeper
 
-__all__ = ["NotificationScheduler", "create_notification_scheduler"]
+__all__ = [
+    "NotificationScheduler",
+    "create_notification_scheduler",
+    "MemberSuggestionRefresher",
+    "create_member_suggestion_refresher",
+    "LeaderLease",
+    "create_scheduler_lease",
+    "FulfillmentSweeper",
+    "create_fulfillment_sweeper",
+]
@@ -0,0 +1,95 @@
+"""Background task that resumes payment fulfillments cut short by a restart."""
+import asyncio
+import logging
+import os
+from typing import Optional
+
+from src.application.use_cases.payment.process_redsys_webhook_use_case import ProcessRedsysWebhookUseCase
+from src.infrastructure.monitoring.prometheus import scheduler_job
+
+logger = logging.getLogger(__name__)
+
+
+class FulfillmentSweeper:
+    """
+    Re-runs the unfinished steps recorded in ``payment_fulfillments``.
+
+    Sweeps as soon as it starts and then every ``interval_seconds``. With
+    several workers, only the one holding ``leader_lease`` sweeps, so a
+    step is never resumed twice at the same time.
+    """
+
+    def __init__(
+        self,
+        webhook_use_case: ProcessRedsysWebhookUseCase,
+        interval_seconds: int = 300,
+        stale_after_seconds: int = 600,
+        leader_lease=None,
+    ):
+        self.webhook_use_case = webhook_use_case
+        self.interval_seconds = interval_seconds
+        self.stale_after_seconds = stale_after_seconds
+        self.leader_lease = leader_lease
+        self._task: Optional[asyncio.Task] = None
+        self._running = False
+
+    async def start(self) -> None:
+        """Start sweeping in the background."""
+        if self._running:
+            logger.warning("Fulfillment sweeper is already running")
+            return
+
+        self._running = True
+        self._task = asyncio.create_task(self._sweep_loop())
+        logger.info(f"Fulfillment sweeper started. Sweeping every {self.interval_seconds}s")
+
+    async def stop(self) -> None:
+        """Stop the sweeper."""
+        self._running = False
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        logger.info("Fulfillment sweeper stopped")
+
+    async def sweep(self) -> int:
+        """Resume the stale unfinished fulfillments once; returns how many were resumed."""
+        if self.leader_lease and not self.leader_lease.is_leader:
+            logger.debug("Skipping fulfillment sweep: another worker is the leader")
+            return 0
+        with scheduler_job("payment_fulfillment_sweep"):
+            resumed = await self.webhook_use_case.resume_unfinished_fulfillments(
+                stale_after_seconds=self.stale_after_seconds
+            )
+        if resumed:
+            logger.info(f"Resumed {resumed} unfinished payment fulfillments")
+        return resumed
+
+    async def _sweep_loop(self) -> None:
+        """Sweep right away, then once per interval."""
+        while self._running:
+            try:
+                await self.sweep()
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                logger.error(f"Error resuming payment fulfillments: {e}")
+            try:
+                await asyncio.sleep(self.interval_seconds)
+            except asyncio.CancelledError:
+                break
+
+
+def create_fulfillment_sweeper(leader_lease=None) -> FulfillmentSweeper:
+    """Factory function to create the fulfillment sweeper with dependencies."""
+    # Import here to avoid circular imports
+    from src.infrastructure.web.dependencies import get_process_redsys_webhook_use_case
+
+    return FulfillmentSweeper(
+        webhook_use_case=get_process_redsys_webhook_use_case(),
+        interval_seconds=int(os.getenv("FULFILLMENT_SWEEP_SECONDS", "300")),
+        stale_after_seconds=int(os.getenv("FULFILLMENT_STALE_SECONDS", "600")),
+        leader_lease=leader_lease,
+    )
@@ -0,0 +1,110 @@
+"""Leader election between API workers through a MongoDB lease."""
+import asyncio
+import logging
+import os
+import socket
+import time
+import uuid
+from typing import Callable, Optional
+
+from src.infrastructure.adapters.repositories.mongodb_lease_repository import MongoDBLeaseRepository
+
+logger = logging.getLogger(__name__)
+
+
+class LeaderLease:
+    """
+    Keeps trying to hold a named lease so that one worker acts as leader.
+
+    Every worker runs one; whichever holds the lease renews it every
+    ``ttl_seconds / 3``. When the leader dies, its lease expires and another
+    worker takes over within ``ttl_seconds``. ``is_leader`` turns False as
+    soon as the last successful renewal is older than the TTL, so a worker
+    cut off from the database stops acting as leader before anyone else
+    can take the lease.
+    """
+
+    def __init__(
+        self,
+        lease_repository: MongoDBLeaseRepository,
+        name: str,
+        ttl_seconds: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.lease_repository = lease_repository
+        self.name = name
+        self.ttl_seconds = ttl_seconds
+        self.holder = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self._clock = clock
+        self._held_until = 0.0
+        self._task: Optional[asyncio.Task] = None
+        self._running = False
+
+    @property
+    def is_leader(self) -> bool:
+        """Whether this worker currently holds the lease."""
+        return self._clock() < self._held_until
+
+    async def renew(self) -> bool:
+        """Try to take or renew the lease once; returns whether this worker holds it."""
+        was_leader = self.is_leader
+        # Counted from before the call: the server's expiry is at least this late
+        started = self._clock()
+        try:
+            acquired = await self.lease_repository.try_acquire(self.name, self.holder, self.ttl_seconds)
+        except Exception as e:
+            logger.error(f"Failed to renew lease {self.name}: {e}")
+            acquired = False
+        if acquired:
+            self._held_until = started + self.ttl_seconds
+        else:
+            self._held_until = 0.0
+        if acquired != was_leader:
+            logger.info(f"Worker {self.holder} {'became' if acquired else 'is no longer'} leader for {self.name}")
+        return acquired
+
+    async def start(self) -> None:
+        """Try to take the lease now, then keep renewing it in the background."""
+        if self._running:
+            logger.warning(f"Lease {self.name} is already running")
+            return
+
+        self._running = True
+        await self.renew()
+        self._task = asyncio.create_task(self._renew_loop())
+
+    async def stop(self) -> None:
+        """Stop renewing and release the lease so another worker takes over at once."""
+        self._running = False
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        if self.is_leader:
+            self._held_until = 0.0
+            try:
+                await self.lease_repository.release(self.name, self.holder)
+            except Exception as e:
+                logger.error(f"Failed to release lease {self.name}: {e}")
+
+    async def _renew_loop(self) -> None:
+        while self._running:
+            try:
+                await asyncio.sleep(self.ttl_seconds / 3)
+                await self.renew()
+            except asyncio.CancelledError:
+                break
+
+
+def create_scheduler_lease() -> LeaderLease:
+    """Factory function to create the lease electing the worker that runs scheduled jobs."""
+    # Import here to avoid circular imports
+    from src.infrastructure.web.dependencies import get_lease_repository
+
+    return LeaderLease(
+        lease_repository=get_lease_repository(),
+        name="scheduler",
+        ttl_seconds=float(os.getenv("SCHEDULER_LEASE_SECONDS", "30")),
+    )
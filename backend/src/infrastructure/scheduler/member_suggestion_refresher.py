@@ -0,0 +1,95 @@
+"""Background task that builds and reconciles the member autocomplete index."""
+import asyncio
+import logging
+import os
+from typing import Optional
+
+from src.application.ports.member_repository import MemberRepositoryPort
+from src.application.search.member_suggestion_index import MemberSuggestionIndex
+from src.infrastructure.monitoring.prometheus import scheduler_job
+
+logger = logging.getLogger(__name__)
+
+
+class MemberSuggestionRefresher:
+    """
+    Keeps the per-process member suggestion index in line with the database.
+
+    Builds the index as soon as it starts, then rebuilds it every
+    ``interval_seconds`` to pick up writes that bypass the member use cases
+    (imports, the Excel sync), and as soon as another worker reports a
+    member write through the index's ``invalidate``.
+    """
+
+    def __init__(
+        self,
+        suggestion_index: MemberSuggestionIndex,
+        member_repository: MemberRepositoryPort,
+        interval_seconds: int = 600,
+    ):
+        self.suggestion_index = suggestion_index
+        self.member_repository = member_repository
+        self.interval_seconds = interval_seconds
+        self._task: Optional[asyncio.Task] = None
+        self._running = False
+
+    async def start(self) -> None:
+        """Start building and periodically reconciling the index."""
+        if self._running:
+            logger.warning("Member suggestion refresher is already running")
+            return
+
+        self._running = True
+        self._task = asyncio.create_task(self._refresh_loop())
+        logger.info(
+            f"Member suggestion refresher started. Reconciling every {self.interval_seconds}s"
+        )
+
+    async def stop(self) -> None:
+        """Stop the refresher."""
+        self._running = False
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        logger.info("Member suggestion refresher stopped")
+
+    async def refresh(self) -> int:
+        """Rebuild the index from the member collection; returns how many members were indexed."""
+        with scheduler_job("member_suggestion_rebuild"):
+            count = await self.suggestion_index.rebuild(self.member_repository.iter_all())
+        logger.debug(f"Member suggestion index rebuilt with {count} members")
+        return count
+
+    async def _refresh_loop(self) -> None:
+        """Rebuild right away, then once per interval or when the index goes stale."""
+        while self._running:
+            try:
+                await self.refresh()
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                logger.error(f"Error rebuilding member suggestion index: {e}")
+            try:
+                await self.suggestion_index.wait_stale(self.interval_seconds)
+            except asyncio.CancelledError:
+                break
+
+
+def create_member_suggestion_refresher() -> MemberSuggestionRefresher:
+    """Factory function to create the member suggestion refresher with dependencies."""
+    # Import here to avoid circular imports
+    from src.infrastructure.web.dependencies import (
+        get_member_repository,
+        get_member_suggestion_index,
+    )
+
+    interval_seconds = int(os.getenv("MEMBER_SUGGEST_RECONCILE_SECONDS", "600"))
+
+    return MemberSuggestionRefresher(
+        suggestion_index=get_member_suggestion_index(),
+        member_repository=get_member_repository(),
+        interval_seconds=interval_seconds,
+    )
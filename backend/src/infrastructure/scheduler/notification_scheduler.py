@@ -5,6 +5,8 @@ from datetime import datetime, time
 from typing import Optional
 import os
 
+from src.infrastructure.monitoring.prometheus import scheduler_job
+
 logger = logging.getLogger(__name__)
 
 
@@ -13,7 +15,8 @@ class NotificationScheduler:
     Background scheduler for license expiration notifications.
 
     Runs daily at a configured time (default: 08:00 UTC) to check for
-    expiring licenses and send notifications.
+    expiring licenses and send notifications. With several workers, each
+    runs a scheduler and only the one holding ``leader_lease`` runs the job.
     """
 
     def __init__(
@@ -21,10 +24,12 @@ class NotificationScheduler:
         notification_use_case,
         run_hour: int = 8,
         run_minute: int = 0,
+        leader_lease=None,
     ):
         self.notification_use_case = notification_use_case
         self.run_hour = run_hour
         self.run_minute = run_minute
+        self.leader_lease = leader_lease
         self._task: Optional[asyncio.Task] = None
         self._running = False
 
@@ -54,7 +59,12 @@ class NotificationScheduler:
     async def run_now(self) -> dict:
         """Run the notification job immediately (for testing/manual trigger)."""
         logger.info("Running notification job manually")
-        return await self.notification_use_case.execute()
+        return await self._run_job()
+
+    async def _run_job(self) -> dict:
+        """Run the notification use case once, recording its duration."""
+        with scheduler_job("license_expiration_notifications"):
+            return await self.notification_use_case.execute()
 
     async def _scheduler_loop(self) -> None:
         """Main scheduler loop that runs the job at the configured time."""
@@ -78,9 +88,11 @@ class NotificationScheduler:
                 # Wait until the scheduled time
                 await asyncio.sleep(wait_seconds)
 
-                if self._running:
+                if self._running and self.leader_lease and not self.leader_lease.is_leader:
+                    logger.debug("Skipping notification job: another worker is the leader")
+                elif self._running:
                     try:
-                        result = await self.notification_use_case.execute()
+                        result = await self._run_job()
                         logger.info(
                             f"Notification job completed: {result['notifications_sent']} sent, "
                             f"{len(result['errors'])} errors"
@@ -96,7 +108,7 @@ class NotificationScheduler:
                 await asyncio.sleep(60)
 
 
-def create_notification_scheduler():
+def create_notification_scheduler(leader_lease=None):
     """
     Factory function to create the notification scheduler with dependencies.
 
@@ -131,4 +143,5 @@ def create_notification_scheduler():
         notification_use_case=notification_use_case,
         run_hour=run_hour,
         run_minute=run_minute,
+        leader_lease=leader_lease,
     )
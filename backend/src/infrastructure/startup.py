@@ -0,0 +1,38 @@
+"""Timing of the startup phases of an API process, reported in the logs."""
+
+import logging
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator
+
+logger = logging.getLogger(__name__)
+
+
+class StartupPhases:
+    """Durations of the named startup phases of this process, in the order they ran."""
+
+    def __init__(self, clock: Callable[[], float] = time.perf_counter):
+        self._clock = clock
+        self.durations: Dict[str, float] = {}
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Time the block as the phase called name, whether or not it raises."""
+        start = self._clock()
+        try:
+            yield
+        finally:
+            self.durations[name] = self._clock() - start
+            logger.debug(f"Startup phase {name} took {self.durations[name] * 1000:.0f} ms")
+
+    def report(self) -> str:
+        """Log the total and per-phase startup time; returns the logged summary."""
+        total = sum(self.durations.values())
+        phases = ", ".join(f"{name} {seconds * 1000:.0f} ms" for name, seconds in self.durations.items())
+        summary = f"Startup finished in {total * 1000:.0f} ms ({phases})"
+        logger.info(summary)
+        return summary
+
+
+# Phases of this process; the entry point and the lifespan record into it
+startup_phases = StartupPhases()
@@ -0,0 +1,79 @@
+"""Conditional GET (ETag / If-None-Match) for list endpoints.
+
+A listing is revalidated against the ``CollectionVersion`` of every
+collection it is built from, plus a ``scope`` holding whatever else shapes
+the payload but is not stored with it (the club a club admin is confined
+to, today's date for statuses derived from expiry dates). Query parameters
+need not be part of the scope: clients cache per URL.
+
+Only ``If-None-Match`` is honored. ``Last-Modified`` is sent for
+information, but deleting a document leaves the latest ``updated_at``
+unchanged, so ``If-Modified-Since`` alone cannot tell that a listing
+changed.
+"""
+
+import asyncio
+import hashlib
+from datetime import datetime
+from typing import Any, Awaitable, Optional
+
+from fastapi import Request, Response, status
+
+from src.application.read_models.collection_version import CollectionVersion
+
+# Revalidate on every use; the payload depends on who is asking, so
+# shared caches must not store it
+CACHE_CONTROL = "private, no-cache"
+
+
+def collection_etag(*versions: CollectionVersion, scope: Any = ()) -> str:
+    """Weak ETag for a listing built from ``versions`` under ``scope``.
+
+    Weak because the compression middleware changes the bytes on the wire
+    but not the listing they encode.
+    """
+    fingerprint = repr((
+        scope,
+        [(version.count, version.last_modified and version.last_modified.isoformat()) for version in versions],
+    ))
+    return f'W/"{hashlib.blake2b(fingerprint.encode(), digest_size=16).hexdigest()}"'
+
+
+def _last_modified(versions: tuple) -> Optional[datetime]:
+    stamps = [version.last_modified for version in versions if version.last_modified]
+    return max(stamps) if stamps else None
+
+
+def etag_matches(if_none_match: str, etag: str) -> bool:
+    """Weak comparison of ``etag`` against an If-None-Match header value."""
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(
+        candidate.strip().removeprefix("W/") == opaque
+        for candidate in if_none_match.split(",")
+    )
+
+
+async def not_modified(
+    request: Request,
+    response: Response,
+    *versions: Awaitable[CollectionVersion],
+    scope: Any = (),
+) -> Optional[Response]:
+    """Stamp the listing's validators on ``response``; return a 304 if the client's copy is current.
+
+    ``versions`` are the repositories' ``get_collection_version`` calls,
+    awaited concurrently.
+    """
+    resolved = tuple(await asyncio.gather(*versions))
+    headers = {"ETag": collection_etag(*resolved, scope=scope), "Cache-Control": CACHE_CONTROL}
+    last_modified = _last_modified(resolved)
+    if last_modified is not None:
+        headers["Last-Modified"] = last_modified.strftime("%a, %d %b %Y %H:%M:%S GMT")
+
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and etag_matches(if_none_match, headers["ETag"]):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    response.headers.update(headers)
+    return None
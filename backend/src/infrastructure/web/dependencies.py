@@ -1,5 +1,6 @@
 """FastAPI dependency injection."""
 
+import os
 from functools import lru_cache
 from typing import Optional
 from fastapi.security import OAuth2PasswordBearer
@@ -12,15 +13,24 @@ from src.infrastructure.adapters.repositories.mongodb_seminar_repository import
 from src.infrastructure.adapters.repositories.mongodb_payment_repository import MongoDBPaymentRepository
 from src.infrastructure.adapters.repositories.mongodb_insurance_repository import MongoDBInsuranceRepository
 from src.infrastructure.adapters.repositories.mongodb_price_configuration_repository import MongoDBPriceConfigurationRepository
+from src.infrastructure.adapters.repositories.mongodb_cache_version_repository import MongoDBCacheVersionRepository
+from src.infrastructure.adapters.repositories.cached_price_configuration_repository import CachedPriceConfigurationRepository
+from src.infrastructure.adapters.repositories.mongodb_lease_repository import MongoDBLeaseRepository
 from src.infrastructure.adapters.repositories.mongodb_invoice_repository import MongoDBInvoiceRepository
 from src.infrastructure.adapters.repositories.mongodb_password_reset_token_repository import MongoDBPasswordResetTokenRepository
 from src.infrastructure.adapters.repositories.mongodb_member_payment_repository import MongoDBMemberPaymentRepository
+from src.infrastructure.adapters.repositories.mongodb_payment_fulfillment_repository import MongoDBPaymentFulfillmentRepository
+from src.infrastructure.adapters.repositories.mongodb_webhook_ledger_repository import MongoDBWebhookLedgerRepository
 from src.infrastructure.adapters.services.redsys_service import RedsysService
 from src.infrastructure.adapters.services.email_service import EmailService
 from src.infrastructure.adapters.services.pdf_service import PDFService
 from src.infrastructure.adapters.services.license_image_service import LicenseImageService
 from src.infrastructure.web.security import decode_access_token
 from src.infrastructure.web.dto.user_dto import TokenData
+from src.application.search.member_suggestion_index import MemberSuggestionIndex
+from src.application.directory.club_directory import ClubDirectory
+from src.infrastructure.cache import Cache, InMemoryCacheBackend, MongoDBCacheBackend
+from src.infrastructure.cache.invalidation import WorkerInvalidation
 from src.domain.entities.user import User
 from src.domain.exceptions.user import UserNotFoundError
 from src.application.use_cases.user_use_cases import (
@@ -41,6 +51,7 @@ from src.application.use_cases import (
     GetMemberUseCase,
     GetAllMembersUseCase,
     SearchMembersUseCase,
+    SuggestMembersUseCase,
     CreateMemberUseCase,
     UpdateMemberUseCase,
     DeleteMemberUseCase,
@@ -131,6 +142,14 @@ def get_club_repository() -> MongoDBClubRepository:
     """Get club repository instance."""
     return MongoDBClubRepository()
 
+@lru_cache()
+def get_club_directory() -> ClubDirectory:
+    """Get the per-process club directory."""
+    return ClubDirectory(
+        get_club_repository(),
+        publish=lambda: get_worker_invalidation().publish(CLUB_DIRECTORY_NAME),
+    )
+
 @lru_cache()
 def get_all_clubs_use_case() -> GetAllClubsUseCase:
     """Get all clubs use case."""
@@ -144,17 +163,17 @@ def get_club_use_case() -> GetClubUseCase:
 @lru_cache()
 def get_create_club_use_case() -> CreateClubUseCase:
     """Create club use case."""
-    return CreateClubUseCase(get_club_repository())
+    return CreateClubUseCase(get_club_repository(), get_club_directory())
 
 @lru_cache()
 def get_update_club_use_case() -> UpdateClubUseCase:
     """Update club use case."""
-    return UpdateClubUseCase(get_club_repository())
+    return UpdateClubUseCase(get_club_repository(), get_club_directory())
 
 @lru_cache()
 def get_delete_club_use_case() -> DeleteClubUseCase:
     """Delete club use case."""
-    return DeleteClubUseCase(get_club_repository())
+    return DeleteClubUseCase(get_club_repository(), get_club_directory())
 
 # Member repository and use cases
 @lru_cache()
@@ -162,6 +181,14 @@ def get_member_repository() -> MongoDBMemberRepository:
     """Get member repository instance."""
     return MongoDBMemberRepository()
 
+@lru_cache()
+def get_member_suggestion_index() -> MemberSuggestionIndex:
+    """Get the per-process member autocomplete index."""
+    # This worker's index already holds its own writes
+    return MemberSuggestionIndex(
+        publish=lambda: get_worker_invalidation().publish(MEMBER_SUGGESTIONS_NAME, local=False),
+    )
+
 @lru_cache()
 def get_all_members_use_case() -> GetAllMembersUseCase:
     """Get all members use case."""
@@ -177,20 +204,27 @@ def get_search_members_use_case() -> SearchMembersUseCase:
     """Search members use case."""
     return SearchMembersUseCase(get_member_repository())
 
+@lru_cache()
+def get_suggest_members_use_case() -> SuggestMembersUseCase:
+    """Suggest members use case."""
+    return SuggestMembersUseCase(get_member_suggestion_index(), get_search_members_use_case())
+
 @lru_cache()
 def get_create_member_use_case() -> CreateMemberUseCase:
     """Create member use case."""
-    return CreateMemberUseCase(get_member_repository(), get_club_repository())
+    return CreateMemberUseCase(
+        get_member_repository(), get_club_repository(), get_member_suggestion_index()
+    )
 
 @lru_cache()
 def get_update_member_use_case() -> UpdateMemberUseCase:
     """Update member use case."""
-    return UpdateMemberUseCase(get_member_repository())
+    return UpdateMemberUseCase(get_member_repository(), get_member_suggestion_index())
 
 @lru_cache()
 def get_delete_member_use_case() -> DeleteMemberUseCase:
     """Delete member use case."""
-    return DeleteMemberUseCase(get_member_repository())
+    return DeleteMemberUseCase(get_member_repository(), get_member_suggestion_index())
 
 @lru_cache()
 def get_change_member_status_use_case() -> ChangeMemberStatusUseCase:
@@ -243,13 +277,32 @@ def get_license_image_service() -> LicenseImageService:
     """Get license image service instance."""
     return LicenseImageService()
 
+@lru_cache()
+def get_mongodb_cache_backend() -> MongoDBCacheBackend:
+    """Cache storage shared by every worker."""
+    return MongoDBCacheBackend()
+
+@lru_cache()
+def get_dashboard_cache() -> Cache:
+    """Dashboard statistics, shared by every worker for 30 seconds."""
+    return Cache("dashboard", get_mongodb_cache_backend(), default_ttl=30)
+
+@lru_cache()
+def get_license_image_cache() -> Cache:
+    """Rendered license images, kept per process."""
+    return Cache(
+        "license_images",
+        InMemoryCacheBackend(name="license_images", max_entries=256, max_bytes=64 * 1024 * 1024),
+    )
+
 @lru_cache()
 def get_generate_license_image_use_case() -> GenerateLicenseImageUseCase:
     """Generate license image use case."""
     return GenerateLicenseImageUseCase(
         get_license_repository(),
         get_member_repository(),
-        get_license_image_service()
+        get_license_image_service(),
+        cache=get_license_image_cache()
     )
 
 # Seminar repository and use cases
@@ -334,6 +387,16 @@ def get_create_payment_use_case() -> CreatePaymentUseCase:
     """Create payment use case."""
     return CreatePaymentUseCase(get_payment_repository())
 
+@lru_cache()
+def get_payment_fulfillment_repository() -> MongoDBPaymentFulfillmentRepository:
+    """Get payment fulfillment repository instance."""
+    return MongoDBPaymentFulfillmentRepository()
+
+@lru_cache()
+def get_webhook_ledger_repository() -> MongoDBWebhookLedgerRepository:
+    """Get webhook ledger repository instance."""
+    return MongoDBWebhookLedgerRepository()
+
 @lru_cache()
 def get_redsys_service() -> RedsysService:
     """Get Redsys service instance."""
@@ -393,6 +456,8 @@ def get_process_redsys_webhook_use_case() -> ProcessRedsysWebhookUseCase:
         pdf_service=get_pdf_service(),
         price_configuration_repository=get_price_configuration_repository(),
         seminar_repository=get_seminar_repository(),
+        payment_fulfillment_repository=get_payment_fulfillment_repository(),
+        webhook_ledger_repository=get_webhook_ledger_repository(),
     )
 
 @lru_cache()
@@ -497,9 +562,38 @@ def get_delete_insurance_use_case() -> DeleteInsuranceUseCase:
 
 # Price configuration repository and use cases
 @lru_cache()
-def get_price_configuration_repository() -> MongoDBPriceConfigurationRepository:
-    """Get price configuration repository instance."""
-    return MongoDBPriceConfigurationRepository()
+def get_cache_version_repository() -> MongoDBCacheVersionRepository:
+    """Get the version counters shared by the in-process caches."""
+    return MongoDBCacheVersionRepository()
+
+# Name of the club directory's counter in the cache_versions collection
+CLUB_DIRECTORY_NAME = "clubs"
+# Name of the member suggestion index's counter in the cache_versions collection
+MEMBER_SUGGESTIONS_NAME = "members"
+
+@lru_cache()
+def get_worker_invalidation() -> WorkerInvalidation:
+    """Get the relay that invalidates per-process copies in every worker."""
+    invalidation = WorkerInvalidation(
+        get_cache_version_repository(),
+        interval_seconds=float(os.getenv("WORKER_INVALIDATION_SECONDS", "5")),
+    )
+    invalidation.register(CLUB_DIRECTORY_NAME, get_club_directory().invalidate)
+    invalidation.register(MEMBER_SUGGESTIONS_NAME, get_member_suggestion_index().invalidate)
+    return invalidation
+
+@lru_cache()
+def get_lease_repository() -> MongoDBLeaseRepository:
+    """Get the leases electing one worker for background jobs."""
+    return MongoDBLeaseRepository()
+
+@lru_cache()
+def get_price_configuration_repository() -> CachedPriceConfigurationRepository:
+    """Get price configuration repository instance, cached per process."""
+    return CachedPriceConfigurationRepository(
+        MongoDBPriceConfigurationRepository(),
+        get_cache_version_repository(),
+    )
 
 @lru_cache()
 def get_all_prices_use_case() -> GetAllPricesUseCase:
@@ -729,6 +823,7 @@ def get_club_payment_summary_use_case() -> GetClubPaymentSummaryUseCase:
         club_repository=get_club_repository(),
         member_repository=get_member_repository(),
         license_repository=get_license_repository(),
+        club_directory=get_club_directory(),
     )
 
 
@@ -747,5 +842,6 @@ def get_all_clubs_payment_summary_use_case() -> GetAllClubsPaymentSummaryUseCase
     return GetAllClubsPaymentSummaryUseCase(
         member_payment_repository=get_member_payment_repository(),
         club_repository=get_club_repository(),
-        member_repository=get_member_repository()
+        member_repository=get_member_repository(),
+        club_directory=get_club_directory(),
     )
\ No newline at end of file
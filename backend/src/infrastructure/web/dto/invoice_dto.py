@@ -45,6 +45,12 @@ class InvoiceResponse(BaseModel):
         from_attributes = True
 
 
+class InvoicePageResponse(BaseModel):
+    """DTO for a keyset-paginated invoice list; pass next_cursor back as cursor."""
+    items: List[InvoiceResponse]
+    next_cursor: Optional[str] = None
+
+
 class InvoiceListResponse(BaseModel):
     """DTO for invoice list response."""
     invoices: List[InvoiceResponse]
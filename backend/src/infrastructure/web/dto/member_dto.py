@@ -107,3 +107,16 @@ class MemberResponse(MemberBase):
 
     class Config:
         from_attributes = True
+
+
+class MemberSuggestionResponse(BaseModel):
+    """DTO for a member autocomplete suggestion."""
+    id: str
+    name: str
+    club_id: Optional[str] = None
+
+
+class MemberPageResponse(BaseModel):
+    """DTO for a keyset-paginated member list; pass next_cursor back as cursor."""
+    items: List[MemberResponse]
+    next_cursor: Optional[str] = None
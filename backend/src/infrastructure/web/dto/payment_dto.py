@@ -1,7 +1,7 @@
 """Payment DTOs for request/response validation."""
 
 from pydantic import BaseModel, HttpUrl
-from typing import Optional, Dict, Any
+from typing import Any, Dict, List, Optional
 from datetime import datetime
 
 
@@ -38,6 +38,12 @@ class PaymentResponse(PaymentBase):
         from_attributes = True
 
 
+class PaymentPageResponse(BaseModel):
+    """DTO for a keyset-paginated payment list; pass next_cursor back as cursor."""
+    items: List[PaymentResponse]
+    next_cursor: Optional[str] = None
+
+
 class PaymentRefundRequest(BaseModel):
     """DTO for refunding a payment."""
     refund_amount: Optional[float] = None
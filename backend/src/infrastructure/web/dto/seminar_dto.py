@@ -1,7 +1,7 @@
 """Seminar DTOs for request/response validation."""
 
 from pydantic import BaseModel
-from typing import Optional
+from typing import List, Optional
 from datetime import datetime
 
 
@@ -55,3 +55,9 @@ class SeminarResponse(SeminarBase):
 
     class Config:
         from_attributes = True
+
+
+class SeminarPageResponse(BaseModel):
+    """DTO for a keyset-paginated seminar list; pass next_cursor back as cursor."""
+    items: List[SeminarResponse]
+    next_cursor: Optional[str] = None
@@ -0,0 +1,6 @@
+"""ASGI middleware."""
+from .compression import CompressionMiddleware
+from .prometheus import PrometheusMiddleware
+from .query_metrics import QueryMetricsMiddleware
+
+__all__ = ["CompressionMiddleware", "PrometheusMiddleware", "QueryMetricsMiddleware"]
@@ -0,0 +1,170 @@
+"""Middleware compressing responses with brotli or gzip."""
+
+import zlib
+from typing import Optional
+
+import brotli
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+# Responses smaller than this are sent as they are: the framing overhead
+# outweighs the saving and compressing them only costs CPU
+DEFAULT_MINIMUM_SIZE = 1000
+
+# Content types that are already compressed. XLSX exports are ZIP archives,
+# so a second pass over them would only add latency.
+INCOMPRESSIBLE_TYPES = (
+    "image/",
+    "application/pdf",
+    "application/zip",
+    "application/gzip",
+    "application/vnd.openxmlformats",
+)
+
+# Preferred first when the client accepts both with the same weight
+SUPPORTED_ENCODINGS = ("br", "gzip")
+
+GZIP_LEVEL = 6
+# Brotli's default quality (11) is meant for static assets; 4 compresses
+# about as well as gzip -6 in a fraction of the time
+BROTLI_QUALITY = 4
+
+
+def choose_encoding(accept_encoding: str) -> Optional[str]:
+    """Pick the supported encoding the client ranks highest, or None."""
+    weights = {}
+    for item in accept_encoding.split(","):
+        coding, _, params = item.strip().partition(";")
+        coding = coding.strip().lower()
+        weight = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                weight = float(params[2:])
+            except ValueError:
+                weight = 0.0
+        if coding:
+            weights[coding] = weight
+    wildcard = weights.get("*", 0.0)
+    best, best_weight = None, 0.0
+    for coding in SUPPORTED_ENCODINGS:
+        weight = weights.get(coding, wildcard)
+        if weight > best_weight:
+            best, best_weight = coding, weight
+    return best
+
+
+class _Encoder:
+    """Incremental compressor for one response body."""
+
+    def __init__(self, encoding: str):
+        if encoding == "br":
+            compressor = brotli.Compressor(quality=BROTLI_QUALITY)
+            self._compress, self._finish = compressor.process, compressor.finish
+        else:
+            compressor = zlib.compressobj(GZIP_LEVEL, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+            self._compress, self._finish = compressor.compress, compressor.flush
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compress(data)
+
+    def finish(self) -> bytes:
+        return self._finish()
+
+
+class _CompressionResponder:
+    """Hold back the response start until the first body chunk shows whether to compress."""
+
+    def __init__(self, send: Send, encoding: str, minimum_size: int):
+        self.send = send
+        self.encoding = encoding
+        self.minimum_size = minimum_size
+        self.start: Optional[Message] = None
+        self.encoder: Optional[_Encoder] = None
+        self.passthrough = False
+
+    def _compressible(self, start: Message) -> bool:
+        headers = Headers(raw=start["headers"])
+        if start["status"] < 200 or start["status"] in (204, 304):
+            return False
+        if "content-encoding" in headers:
+            return False
+        content_type = headers.get("content-type", "")
+        return not content_type.startswith(INCOMPRESSIBLE_TYPES)
+
+    def _encode_headers(self, start: Message, length: Optional[int]) -> None:
+        headers = MutableHeaders(scope=start)
+        headers["Content-Encoding"] = self.encoding
+        headers.add_vary_header("Accept-Encoding")
+        if length is None:
+            del headers["Content-Length"]
+        else:
+            headers["Content-Length"] = str(length)
+
+    async def __call__(self, message: Message) -> None:
+        if message["type"] == "http.response.start":
+            self.passthrough = not self._compressible(message)
+            if self.passthrough:
+                await self.send(message)
+            else:
+                self.start = message
+            return
+        if self.passthrough or message["type"] != "http.response.body":
+            if self.start is not None:
+                await self.send(self.start)
+                self.start = None
+            self.passthrough = True
+            await self.send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+        if self.start is not None:
+            start, self.start = self.start, None
+            if not more_body:
+                # The whole body is known: compress it in one go, or not at all
+                if len(body) < self.minimum_size:
+                    self.passthrough = True
+                    await self.send(start)
+                    await self.send(message)
+                    return
+                encoder = _Encoder(self.encoding)
+                body = encoder.compress(body) + encoder.finish()
+                self._encode_headers(start, len(body))
+                await self.send(start)
+                await self.send({"type": "http.response.body", "body": body})
+                return
+            # Streaming response: compress chunk by chunk, length unknown
+            self.encoder = _Encoder(self.encoding)
+            self._encode_headers(start, None)
+            await self.send(start)
+
+        chunk = self.encoder.compress(body)
+        if not more_body:
+            chunk += self.encoder.finish()
+        await self.send({"type": "http.response.body", "body": chunk, "more_body": more_body})
+
+
+class CompressionMiddleware:
+    """
+    Compress response bodies with brotli or gzip, as the client accepts.
+
+    Complete bodies under ``minimum_size`` bytes, responses that already
+    carry a ``Content-Encoding`` and already-compressed content types
+    (images, PDFs, XLSX) are sent unchanged. Streaming responses are
+    compressed chunk by chunk.
+    """
+
+    def __init__(self, app: ASGIApp, minimum_size: int = DEFAULT_MINIMUM_SIZE):
+        self.app = app
+        self.minimum_size = minimum_size
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        encoding = choose_encoding(Headers(scope=scope).get("accept-encoding", ""))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+        await self.app(scope, receive, _CompressionResponder(send, encoding, self.minimum_size))
@@ -0,0 +1,60 @@
+"""Middleware recording request latency for the Prometheus endpoint."""
+
+import time
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.infrastructure.monitoring.prometheus import (
+    HTTP_REQUEST_DURATION,
+    HTTP_REQUESTS,
+    HTTP_REQUESTS_IN_PROGRESS,
+)
+
+# Label for requests that matched no route (404s, static files), so that
+# arbitrary paths never become label values
+UNMATCHED_ROUTE = "unmatched"
+
+
+def route_template(scope: Scope) -> str:
+    """Path template of the route that served the request, e.g. ``/api/v1/members/{member_id}``."""
+    route = scope.get("route")
+    return getattr(route, "path", None) or UNMATCHED_ROUTE
+
+
+class PrometheusMiddleware:
+    """
+    Record count, latency and in-flight requests per route template.
+
+    The router stores the matched route in the scope while handling the
+    request, so the template is read once the app has responded.
+    ``skip_paths`` are left out (the scrape endpoint itself).
+    """
+
+    def __init__(self, app: ASGIApp, skip_paths: tuple = ("/metrics",)):
+        self.app = app
+        self.skip_paths = frozenset(skip_paths)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["path"] in self.skip_paths:
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        status_code = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        in_progress = HTTP_REQUESTS_IN_PROGRESS.labels(method=method)
+        in_progress.inc()
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            route = route_template(scope)
+            HTTP_REQUEST_DURATION.labels(method=method, route=route).observe(time.perf_counter() - start)
+            HTTP_REQUESTS.labels(method=method, route=route, status=str(status_code)).inc()
+            in_progress.dec()
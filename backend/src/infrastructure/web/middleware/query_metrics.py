@@ -0,0 +1,47 @@
+"""Middleware reporting the database commands each request ran."""
+
+import logging
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.infrastructure.monitoring.query_metrics import (
+    describe_shape,
+    publish_request,
+    track_queries,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class QueryMetricsMiddleware:
+    """
+    Track the MongoDB commands of every HTTP request.
+
+    Adds a ``Server-Timing`` header with the query count and total database
+    time, logs a summary line per request and warns when the same query
+    shape runs ``repeat_threshold`` times or more (a likely N+1 loop).
+    """
+
+    def __init__(self, app: ASGIApp, repeat_threshold: int = 10):
+        self.app = app
+        self.repeat_threshold = repeat_threshold
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        with track_queries() as stats:
+            async def send_with_timing(message: Message) -> None:
+                if message["type"] == "http.response.start":
+                    MutableHeaders(scope=message).append("Server-Timing", stats.server_timing())
+                await send(message)
+
+            await self.app(scope, receive, send_with_timing)
+
+        method, path = scope["method"], scope["path"]
+        logger.debug(f"{method} {path} queries={stats.count} db_ms={stats.total_ms:.1f}")
+        for shape, times in stats.repeated_shapes(self.repeat_threshold):
+            logger.warning(f"Possible N+1 in {method} {path}: {describe_shape(shape)} ran {times} times")
+        publish_request(method, path, stats)
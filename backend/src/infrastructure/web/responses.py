@@ -0,0 +1,110 @@
+"""JSON response rendering through pydantic-core.
+
+``PydanticJSONResponse`` is the application's default response class: it
+encodes with ``pydantic_core.to_json`` (Rust) instead of ``json.dumps``.
+
+``FastJSONRoute`` is opted into per router (``APIRouter(route_class=...)``)
+for endpoints that return large lists of DTOs. FastAPI validates every
+returned value against the route's ``response_model`` again, converts it
+to plain Python objects and then encodes those; this route serializes the
+DTOs built by the endpoint straight to JSON with a ``TypeAdapter`` of the
+response model. Values that are not already instances of the response
+model (dicts, entities) are still validated first, so the response model
+keeps filtering what goes out. Headers and a status code set on an
+injected ``Response`` parameter are carried over, as FastAPI does.
+"""
+
+import functools
+import inspect
+import typing
+from typing import Any, Callable, Optional
+
+from fastapi.concurrency import run_in_threadpool
+from fastapi.datastructures import DefaultPlaceholder
+from fastapi.responses import JSONResponse
+from fastapi.routing import APIRoute
+from pydantic import BaseModel, TypeAdapter
+from pydantic_core import to_json
+from starlette.responses import Response
+
+
+class PydanticJSONResponse(JSONResponse):
+    """JSONResponse encoded by pydantic-core."""
+
+    def render(self, content: Any) -> bytes:
+        return to_json(content)
+
+
+def _is_built(value: Any, response_model: Any) -> bool:
+    """Whether ``value`` already is an instance of the response model, or a list of them."""
+    if inspect.isclass(response_model) and issubclass(response_model, BaseModel):
+        return isinstance(value, response_model)
+    if typing.get_origin(response_model) in (list, typing.List) and isinstance(value, list):
+        (item_model,) = typing.get_args(response_model) or (Any,)
+        if inspect.isclass(item_model) and issubclass(item_model, BaseModel):
+            return all(isinstance(item, item_model) for item in value)
+    return False
+
+
+def _json_endpoint(
+    endpoint: Callable,
+    response_model: Any,
+    status_code: Optional[int],
+    exclude_none: bool,
+) -> Callable:
+    adapter = TypeAdapter(response_model)
+    is_coroutine = inspect.iscoroutinefunction(endpoint)
+
+    @functools.wraps(endpoint)
+    async def wrapper(*args: Any, **kwargs: Any) -> Any:
+        if is_coroutine:
+            result = await endpoint(*args, **kwargs)
+        else:
+            result = await run_in_threadpool(endpoint, *args, **kwargs)
+        if isinstance(result, Response):
+            return result
+        if not _is_built(result, response_model):
+            result = adapter.validate_python(result, from_attributes=True)
+        body = adapter.dump_json(result, by_alias=True, exclude_none=exclude_none)
+        sub_response = next((value for value in kwargs.values() if isinstance(value, Response)), None)
+        response = Response(
+            content=body,
+            status_code=getattr(sub_response, "status_code", None) or status_code or 200,
+            media_type="application/json",
+        )
+        if sub_response is not None:
+            response.headers.raw.extend(sub_response.headers.raw)
+        return response
+
+    return wrapper
+
+
+class FastJSONRoute(APIRoute):
+    """APIRoute that writes its ``response_model`` to JSON without re-validating built DTOs.
+
+    Routes without an explicit ``response_model``, or using the include/
+    exclude options this route does not implement, keep FastAPI's
+    standard serialization.
+    """
+
+    def __init__(self, path: str, endpoint: Callable, **kwargs: Any):
+        response_model = kwargs.get("response_model")
+        unsupported = any(
+            kwargs.get(option)
+            for option in ("response_model_include", "response_model_exclude",
+                           "response_model_exclude_unset", "response_model_exclude_defaults")
+        )
+        if (
+            response_model is not None
+            and not isinstance(response_model, DefaultPlaceholder)
+            and kwargs.get("response_model_by_alias", True)
+            and not unsupported
+        ):
+            status_code = kwargs.get("status_code")
+            endpoint = _json_endpoint(
+                endpoint,
+                response_model,
+                None if isinstance(status_code, DefaultPlaceholder) else status_code,
+                bool(kwargs.get("response_model_exclude_none")),
+            )
+        super().__init__(path, endpoint, **kwargs)
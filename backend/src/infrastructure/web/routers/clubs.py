@@ -2,7 +2,7 @@
 
 from typing import List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
 
 from src.infrastructure.web.dto.club_dto import (
     ClubCreate,
@@ -17,26 +17,40 @@ from src.infrastructure.web.dependencies import (
     get_update_club_use_case,
     get_delete_club_use_case,
     get_auth_context,
+    get_club_repository,
 )
 from src.infrastructure.web.authorization import (
     AuthContext,
     check_club_access_ctx,
     require_super_admin,
 )
+from src.infrastructure.web.conditional import not_modified
 
 router = APIRouter(prefix="/clubs", tags=["clubs"])
 
 
 @router.get("", response_model=List[ClubResponse])
 async def get_clubs(
+    request: Request,
+    response: Response,
     limit: int = 0,
     get_all_use_case = Depends(get_all_clubs_use_case),
     get_single_club_use_case = Depends(get_club_use_case),
-    ctx: AuthContext = Depends(get_auth_context)
+    ctx: AuthContext = Depends(get_auth_context),
+    club_repo = Depends(get_club_repository),
 ):
     """Get all clubs."""
+    own_club_only = ctx.is_club_admin and not ctx.is_super_admin
+    scope_club_id = ctx.club_id if own_club_only else None
+    if not own_club_only or scope_club_id:
+        unchanged = await not_modified(
+            request, response, club_repo.get_collection_version(scope_club_id), scope=scope_club_id
+        )
+        if unchanged:
+            return unchanged
+
     # Club admins only see their own club
-    if ctx.is_club_admin and not ctx.is_super_admin:
+    if own_club_only:
         if ctx.club_id:
             club = await get_single_club_use_case.execute(ctx.club_id)
             return ClubMapper.to_response_list([club])
@@ -1,14 +1,16 @@
 """Dashboard routes for statistics and metrics."""
 
 from datetime import datetime, timedelta
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 from bson import ObjectId
 from fastapi import APIRouter, Depends
 from pydantic import BaseModel
 
+from src.application.ports.read_routing import reporting
 from src.infrastructure.database import get_database
-from src.infrastructure.web.dependencies import get_auth_context
+from src.infrastructure.read_routing import routed
+from src.infrastructure.web.dependencies import get_auth_context, get_club_directory, get_dashboard_cache
 from src.infrastructure.web.authorization import AuthContext, get_club_filter_ctx
 
 router = APIRouter(prefix="/dashboard", tags=["dashboard"])
@@ -64,15 +66,30 @@ class DashboardData(BaseModel):
 
 
 @router.get("/stats", response_model=DashboardData)
+@reporting
 async def get_dashboard_stats(
-    ctx: AuthContext = Depends(get_auth_context)
+    ctx: AuthContext = Depends(get_auth_context),
+    club_directory = Depends(get_club_directory),
+    dashboard_cache = Depends(get_dashboard_cache),
 ):
-    """Get dashboard statistics and data."""
-    db = get_database()
-    now = datetime.utcnow()
+    """Get dashboard statistics and data.
 
+    The figures are shared by every user of the same scope (one club, or
+    the whole federation) and may be up to 30 seconds old.
+    """
     # Club-scoped filtering
     club_id = get_club_filter_ctx(ctx)
+    return await dashboard_cache.get_or_load(
+        f"club:{club_id}" if club_id else "all",
+        lambda: _build_dashboard(club_id, club_directory),
+    )
+
+
+async def _build_dashboard(club_id: Optional[str], club_directory) -> DashboardData:
+    """Compute the dashboard figures for one club, or all clubs when club_id is None."""
+    db = routed(get_database())
+    now = datetime.utcnow()
+
     member_filter = {"club_id": club_id} if club_id else {}
     license_filter = {"club_id": club_id} if club_id else {}
     payment_filter = {"club_id": club_id} if club_id else {}
@@ -138,18 +155,35 @@ async def get_dashboard_stats(
     }).sort("expiration_date", 1).limit(5)
 
     expiring_licenses_docs = await expiring_licenses_cursor.to_list(length=5)
-    expiring_licenses = []
 
+    # Recent activity (last 24 hours): new members, payments and license renewals
+    recent_members_cursor = db["members"].find({
+        **member_filter,
+        "created_at": {"$gte": now - timedelta(hours=24)}
+    }).sort("created_at", -1).limit(3)
+    recent_members = await recent_members_cursor.to_list(length=3)
+
+    recent_payments_cursor = db["transactions"].find({
+        **payment_filter,
+        "created_at": {"$gte": now - timedelta(hours=24)}
+    }).sort("created_at", -1).limit(3)
+    recent_payments = await recent_payments_cursor.to_list(length=3)
+
+    recent_licenses_cursor = db["licenses"].find({
+        **license_filter,
+        "updated_at": {"$gte": now - timedelta(hours=24)},
+        "is_renewed": True
+    }).sort("updated_at", -1).limit(2)
+    recent_licenses = await recent_licenses_cursor.to_list(length=2)
+
+    # Resolve every member name shown on the dashboard in one query
+    member_names = await _member_names(db, [
+        doc.get("member_id") for doc in expiring_licenses_docs + recent_payments + recent_licenses
+    ])
+
+    expiring_licenses = []
     for lic in expiring_licenses_docs:
-        # Get member name
-        member_id = lic.get("member_id")
-        member = None
-        if member_id:
-            try:
-                member = await db["members"].find_one({"_id": ObjectId(member_id)})
-            except Exception:
-                pass
-        member_name = f"{member.get('first_name', '')} {member.get('last_name', '')}".strip() if member else "Desconocido"
+        member_name = member_names.get(str(lic.get("member_id")), "Desconocido")
 
         expiry_date = lic.get("expiration_date")
         days_remaining = (expiry_date - now).days if expiry_date else 0
@@ -184,16 +218,9 @@ async def get_dashboard_stats(
             price=float(sem.get("price") or 0)
         ))
 
-    # Get recent activity (combine recent members, payments, licenses)
+    # Combine recent members, payments and licenses
     recent_activity = []
 
-    # Recent members (last 24 hours)
-    recent_members_cursor = db["members"].find({
-        **member_filter,
-        "created_at": {"$gte": now - timedelta(hours=24)}
-    }).sort("created_at", -1).limit(3)
-    recent_members = await recent_members_cursor.to_list(length=3)
-
     for member in recent_members:
         created_at = member.get("created_at")
         time_diff = _format_time_diff(now, created_at)
@@ -205,35 +232,17 @@ async def get_dashboard_stats(
             time=time_diff
         ))
 
-    # Recent payments (last 24 hours)
-    recent_payments_cursor = db["transactions"].find({
-        **payment_filter,
-        "created_at": {"$gte": now - timedelta(hours=24)}
-    }).sort("created_at", -1).limit(3)
-    recent_payments = await recent_payments_cursor.to_list(length=3)
-
     for payment in recent_payments:
         created_at = payment.get("created_at")
         time_diff = _format_time_diff(now, created_at)
         # Get payer name: member if available, otherwise club
-        member_id = payment.get("member_id")
-        payer_name = "Desconocido"
-        if member_id:
-            try:
-                member = await db["members"].find_one({"_id": ObjectId(member_id)})
-                if member:
-                    payer_name = f"{member.get('first_name', '')} {member.get('last_name', '')}".strip()
-            except Exception:
-                pass
+        payer_name = member_names.get(str(payment.get("member_id")), "Desconocido")
         if payer_name == "Desconocido":
             payment_club_id = payment.get("club_id")
             if payment_club_id:
-                try:
-                    club = await db["clubs"].find_one({"_id": ObjectId(payment_club_id)})
-                    if club:
-                        payer_name = club.get("name", "Desconocido")
-                except Exception:
-                    pass
+                club = await club_directory.get(payment_club_id)
+                if club:
+                    payer_name = club.name
         recent_activity.append(RecentActivity(
             id=str(payment.get("_id")),
             type="payment",
@@ -242,25 +251,10 @@ async def get_dashboard_stats(
             time=time_diff
         ))
 
-    # Recent license renewals (last 24 hours)
-    recent_licenses_cursor = db["licenses"].find({
-        **license_filter,
-        "updated_at": {"$gte": now - timedelta(hours=24)},
-        "is_renewed": True
-    }).sort("updated_at", -1).limit(2)
-    recent_licenses = await recent_licenses_cursor.to_list(length=2)
-
     for lic in recent_licenses:
         updated_at = lic.get("updated_at")
         time_diff = _format_time_diff(now, updated_at)
-        member_id = lic.get("member_id")
-        member = None
-        if member_id:
-            try:
-                member = await db["members"].find_one({"_id": ObjectId(member_id)})
-            except Exception:
-                pass
-        member_name = f"{member.get('first_name', '')} {member.get('last_name', '')}".strip() if member else "Desconocido"
+        member_name = member_names.get(str(lic.get("member_id")), "Desconocido")
         recent_activity.append(RecentActivity(
             id=str(lic.get("_id")),
             type="license",
@@ -284,6 +278,23 @@ async def get_dashboard_stats(
     )
 
 
+async def _member_names(db, member_ids: List[Optional[str]]) -> Dict[str, str]:
+    """Full names of the given members by id; ids that are missing or invalid are skipped."""
+    object_ids = set()
+    for member_id in member_ids:
+        if member_id and ObjectId.is_valid(member_id):
+            object_ids.add(ObjectId(member_id))
+    if not object_ids:
+        return {}
+    docs = await db["members"].find(
+        {"_id": {"$in": list(object_ids)}}, {"first_name": 1, "last_name": 1}
+    ).to_list(length=None)
+    return {
+        str(doc["_id"]): f"{doc.get('first_name', '')} {doc.get('last_name', '')}".strip()
+        for doc in docs
+    }
+
+
 def _format_time_diff(now: datetime, timestamp: Optional[datetime]) -> str:
     """Format time difference as human readable string."""
     if not timestamp:
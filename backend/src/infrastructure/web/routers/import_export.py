@@ -1,13 +1,11 @@
 """Import/Export routes."""
 
-from typing import Optional
-from io import BytesIO
+import tempfile
+from typing import AsyncIterable, AsyncIterator, Iterator, Optional, Tuple
 from datetime import datetime
 
 from fastapi import APIRouter, Depends, Query, HTTPException
 from fastapi.responses import StreamingResponse
-import openpyxl
-from openpyxl.styles import Font, PatternFill, Alignment
 
 from src.infrastructure.web.dto.import_export_dto import (
     ImportMembersRequest,
@@ -30,8 +28,10 @@ from src.infrastructure.web.dependencies import (
     get_license_repository,
     get_insurance_repository,
     get_member_payment_repository,
-    get_club_repository
+    get_club_directory
 )
+from src.application.ports.member_payment_repository import PartialBulkWriteError
+from src.application.ports.read_routing import reporting
 from src.infrastructure.web.dependencies import get_auth_context
 from src.infrastructure.web.authorization import AuthContext, get_club_filter_ctx
 from src.domain.entities.license import LicenseStatus, TechnicalGrade, InstructorCategory, AgeCategory
@@ -196,12 +196,50 @@ def _split_last_name(last_name: str) -> tuple:
     return (parts[0], parts[1] if len(parts) > 1 else '')
 
 
-def _build_excel(title: str, column_registry: list, data_rows: list, columns: Optional[str] = None):
+# Exports stream entities from the repositories and resolve their members
+# with one query per batch.
+EXPORT_BATCH_SIZE = 500
+
+
+async def _with_members(items: AsyncIterable, member_repo) -> AsyncIterator[Tuple]:
+    """Yield (item, member) pairs, looking members up once per batch of items."""
+    async def _member_map(batch):
+        member_ids = list({item.member_id for item in batch if item.member_id})
+        members = await member_repo.find_by_ids(member_ids) if member_ids else []
+        return {m.id: m for m in members}
+
+    batch = []
+    async for item in items:
+        batch.append(item)
+        if len(batch) >= EXPORT_BATCH_SIZE:
+            member_map = await _member_map(batch)
+            for entry in batch:
+                yield entry, member_map.get(entry.member_id)
+            batch = []
+    if batch:
+        member_map = await _member_map(batch)
+        for entry in batch:
+            yield entry, member_map.get(entry.member_id)
+
+
+# A write-only sheet needs its column widths before the first row, so they
+# are estimated from this many leading rows
+EXCEL_WIDTH_SAMPLE_ROWS = 200
+# Built workbooks stay in memory up to this size, then spill to a temp file
+EXCEL_SPOOL_MAX_SIZE = 8 * 1024 * 1024
+
+
+async def _build_excel(
+    title: str, column_registry: list, data_rows: AsyncIterable, columns: Optional[str] = None
+):
     """Build an Excel workbook using column registry and optional column filter.
 
     column_registry: list of (key, header_label, value_extractor_fn) tuples
-    data_rows: list of data objects to iterate over
+    data_rows: async iterable of data objects, written as they arrive
     columns: optional comma-separated column keys to include
+
+    The sheet is write-only, so rows are not kept once written, and the file
+    is returned as a spooled temporary file positioned at its start.
     """
     selected_keys = _parse_columns(columns)
     if selected_keys:
@@ -209,40 +247,57 @@ def _build_excel(title: str, column_registry: list, data_rows: list, columns: Op
     else:
         registry = column_registry
 
-    wb = openpyxl.Workbook()
-    ws = wb.active
-    ws.title = title
+    # Imported here: openpyxl is slow to import and only exports need it
+    import openpyxl
+    from openpyxl.cell import WriteOnlyCell
+    from openpyxl.styles import Alignment, Font, PatternFill
+    from openpyxl.utils import get_column_letter
 
-    header_font = Font(bold=True, color="FFFFFF")
-    header_fill = PatternFill(start_color="4A5568", end_color="4A5568", fill_type="solid")
+    wb = openpyxl.Workbook(write_only=True)
+    ws = wb.create_sheet(title)
+
+    items = data_rows.__aiter__()
+    sample = []
+    async for item in items:
+        sample.append([extractor(item) for _, _, extractor in registry])
+        if len(sample) >= EXCEL_WIDTH_SAMPLE_ROWS:
+            break
 
     for col_idx, (_, header, _) in enumerate(registry, 1):
-        cell = ws.cell(row=1, column=col_idx, value=header)
+        width = max([len(str(header))] + [len(str(row[col_idx - 1])) for row in sample])
+        ws.column_dimensions[get_column_letter(col_idx)].width = min(width + 2, 50)
+
+    header_font = Font(bold=True, color="FFFFFF")
+    header_fill = PatternFill(start_color="4A5568", end_color="4A5568", fill_type="solid")
+    header_cells = []
+    for _, header, _ in registry:
+        cell = WriteOnlyCell(ws, value=header)
         cell.font = header_font
         cell.fill = header_fill
         cell.alignment = Alignment(horizontal="center")
+        header_cells.append(cell)
+    ws.append(header_cells)
 
-    for row_idx, item in enumerate(data_rows, 2):
-        for col_idx, (_, _, extractor) in enumerate(registry, 1):
-            ws.cell(row=row_idx, column=col_idx, value=extractor(item))
+    for row in sample:
+        ws.append(row)
+    async for item in items:
+        ws.append([extractor(item) for _, _, extractor in registry])
 
-    for col in ws.columns:
-        max_length = 0
-        column_letter = col[0].column_letter
-        for cell in col:
-            try:
-                if len(str(cell.value)) > max_length:
-                    max_length = len(str(cell.value))
-            except:
-                pass
-        ws.column_dimensions[column_letter].width = min(max_length + 2, 50)
-
-    output = BytesIO()
+    output = tempfile.SpooledTemporaryFile(max_size=EXCEL_SPOOL_MAX_SIZE)
     wb.save(output)
     output.seek(0)
     return output
 
 
+def _file_chunks(output, chunk_size: int = 64 * 1024) -> Iterator[bytes]:
+    """Yield a built export in chunks, closing the file once it is sent."""
+    try:
+        while chunk := output.read(chunk_size):
+            yield chunk
+    finally:
+        output.close()
+
+
 # --- Column registries ---
 
 MEMBERS_COLUMN_REGISTRY = [
@@ -266,6 +321,7 @@ MEMBERS_COLUMN_REGISTRY = [
 
 
 @router.get("/members/export")
+@reporting
 async def export_members(
     club_id: Optional[str] = Query(None),
     columns: Optional[str] = Query(None, description="Comma-separated column keys to include"),
@@ -275,23 +331,24 @@ async def export_members(
     """Export members to Excel file. No limit — exports all matching members."""
     effective_club_id = get_club_filter_ctx(ctx)
     if effective_club_id is not None:
-        members = await get_all_use_case.execute(0, effective_club_id)
+        members = get_all_use_case.iterate(effective_club_id, EXPORT_BATCH_SIZE)
     elif club_id:
-        members = await get_all_use_case.execute(0, club_id)
+        members = get_all_use_case.iterate(club_id, EXPORT_BATCH_SIZE)
     else:
-        members = await get_all_use_case.execute(0, None)
+        members = get_all_use_case.iterate(None, EXPORT_BATCH_SIZE)
 
-    output = _build_excel("Miembros", MEMBERS_COLUMN_REGISTRY, members, columns)
+    output = await _build_excel("Miembros", MEMBERS_COLUMN_REGISTRY, members, columns)
     filename = f"miembros_export_{datetime.now().strftime('%Y%m%d_%H%M%S')}.xlsx"
 
     return StreamingResponse(
-        output,
+        _file_chunks(output),
         media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
         headers={"Content-Disposition": f"attachment; filename={filename}"}
     )
 
 
 @router.get("/licenses/export")
+@reporting
 async def export_licenses(
     club_id: Optional[str] = Query(None),
     status: Optional[str] = Query(None),
@@ -309,38 +366,30 @@ async def export_licenses(
             detail="Solo los super administradores pueden exportar licencias"
         )
 
-    licenses = await get_all_use_case.execute(limit=0, club_id=club_id)
+    licenses = get_all_use_case.iterate(club_id=club_id, batch_size=EXPORT_BATCH_SIZE)
 
     if status:
         try:
             status_enum = LicenseStatus(status)
-            licenses = [lic for lic in licenses if lic.status == status_enum]
+            licenses = (lic async for lic in licenses if lic.status == status_enum)
         except ValueError:
             pass
 
     if technical_grade:
         try:
             grade_enum = TechnicalGrade(technical_grade)
-            licenses = [lic for lic in licenses if lic.technical_grade == grade_enum]
+            licenses = (lic async for lic in licenses if lic.technical_grade == grade_enum)
         except ValueError:
             pass
 
     if age_category:
         try:
             age_enum = AgeCategory(age_category)
-            licenses = [lic for lic in licenses if lic.age_category == age_enum]
+            licenses = (lic async for lic in licenses if lic.age_category == age_enum)
         except ValueError:
             pass
 
-    member_ids = list(set([lic.member_id for lic in licenses if lic.member_id]))
-    member_map = {}
-    for mid in member_ids:
-        member = await member_repo.find_by_id(mid)
-        if member:
-            member_map[mid] = member
-
-    def _make_lic_row(lic):
-        member = member_map.get(lic.member_id)
+    def _make_lic_row(lic, member):
         member_dni = (member.dni if member else '') or ''
         return type('Row', (), {
             'license_number': lic.license_number,
@@ -358,7 +407,7 @@ async def export_licenses(
             'is_renewed': 'Sí' if lic.is_renewed else 'No',
         })()
 
-    rows = [_make_lic_row(lic) for lic in licenses]
+    rows = (_make_lic_row(lic, member) async for lic, member in _with_members(licenses, member_repo))
 
     registry = [
         ("license_number", "Nº Licencia", lambda r: r.license_number),
@@ -376,17 +425,18 @@ async def export_licenses(
         ("is_renewed", "Renovada", lambda r: r.is_renewed),
     ]
 
-    output = _build_excel("Licencias", registry, rows, columns)
+    output = await _build_excel("Licencias", registry, rows, columns)
     filename = f"licencias_export_{datetime.now().strftime('%Y%m%d_%H%M%S')}.xlsx"
 
     return StreamingResponse(
-        output,
+        _file_chunks(output),
         media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
         headers={"Content-Disposition": f"attachment; filename={filename}"}
     )
 
 
 @router.get("/insurances/export")
+@reporting
 async def export_insurances(
     club_id: Optional[str] = Query(None),
     status: Optional[str] = Query(None),
@@ -403,31 +453,23 @@ async def export_insurances(
             detail="Solo los super administradores pueden exportar seguros"
         )
 
-    insurances = await get_all_use_case.execute(limit=0, club_id=club_id)
+    insurances = get_all_use_case.iterate(club_id=club_id, batch_size=EXPORT_BATCH_SIZE)
 
     if status:
         try:
             status_enum = InsuranceStatus(status)
-            insurances = [ins for ins in insurances if ins.status == status_enum]
+            insurances = (ins async for ins in insurances if ins.status == status_enum)
         except ValueError:
             pass
 
     if insurance_type:
         try:
             type_enum = InsuranceType(insurance_type)
-            insurances = [ins for ins in insurances if ins.insurance_type == type_enum]
+            insurances = (ins async for ins in insurances if ins.insurance_type == type_enum)
         except ValueError:
             pass
 
-    member_ids = list(set([ins.member_id for ins in insurances if ins.member_id]))
-    member_map = {}
-    for mid in member_ids:
-        member = await member_repo.find_by_id(mid)
-        if member:
-            member_map[mid] = member
-
-    def _make_ins_row(ins):
-        member = member_map.get(ins.member_id)
+    def _make_ins_row(ins, member):
         member_dni = (member.dni if member else '') or ''
         return type('Row', (), {
             'policy_number': ins.policy_number,
@@ -444,7 +486,7 @@ async def export_insurances(
             'end_date': ins.end_date.strftime('%d/%m/%Y') if ins.end_date else '',
         })()
 
-    rows = [_make_ins_row(ins) for ins in insurances]
+    rows = (_make_ins_row(ins, member) async for ins, member in _with_members(insurances, member_repo))
 
     registry = [
         ("policy_number", "Nº Póliza", lambda r: r.policy_number),
@@ -461,11 +503,11 @@ async def export_insurances(
         ("end_date", "Fecha Fin", lambda r: r.end_date),
     ]
 
-    output = _build_excel("Seguros", registry, rows, columns)
+    output = await _build_excel("Seguros", registry, rows, columns)
     filename = f"seguros_export_{datetime.now().strftime('%Y%m%d_%H%M%S')}.xlsx"
 
     return StreamingResponse(
-        output,
+        _file_chunks(output),
         media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
         headers={"Content-Disposition": f"attachment; filename={filename}"}
     )
@@ -780,12 +822,13 @@ PAYMENT_TYPE_FROM_LABEL.update({k: k for k in PAYMENT_TYPE_LABELS})
 
 
 @router.get("/payments/export")
+@reporting
 async def export_payments(
     payment_year: int = Query(..., description="Year to export payments for"),
     columns: Optional[str] = Query(None, description="Comma-separated column keys to include"),
     member_payment_repo=Depends(get_member_payment_repository),
     member_repo=Depends(get_member_repository),
-    club_repo=Depends(get_club_repository),
+    club_directory=Depends(get_club_directory),
     ctx: AuthContext = Depends(get_auth_context)
 ):
     """Export payments to Excel. Super admin only."""
@@ -795,41 +838,29 @@ async def export_payments(
             detail="Solo los super administradores pueden exportar pagos"
         )
 
-    clubs = await club_repo.find_all()
-
-    # Collect all payment rows with denormalized data
-    all_rows = []
-    for club in clubs:
-        if not club.id or not club.is_active:
-            continue
-
-        members = await member_repo.find_by_club_id(club.id)
-        member_map = {m.id: m for m in members if m.id}
-        member_ids = list(member_map.keys())
+    club_names = {club.id: club.name for club in await club_directory.all() if club.id and club.is_active}
 
-        if not member_ids:
-            continue
-
-        payments = await member_payment_repo.find_by_member_ids_year(
-            member_ids=member_ids,
-            payment_year=payment_year
-        )
-
-        for payment in payments:
-            member = member_map.get(payment.member_id)
-            dni = (member.dni or '') if member else ''
-            all_rows.append(type('Row', (), {
-                'club': club.name,
-                'first_name': member.first_name if member else '',
-                'last_name_1': _split_last_name(member.last_name if member else '')[0],
-                'last_name_2': _split_last_name(member.last_name if member else '')[1],
+    async def _payment_rows():
+        """Yield denormalized rows for the year's payments of members of active clubs."""
+        payments = member_payment_repo.iter_by_year(payment_year, EXPORT_BATCH_SIZE)
+        async for payment, member in _with_members(payments, member_repo):
+            club_name = club_names.get(member.club_id) if member else None
+            if club_name is None:
+                continue
+            dni = member.dni or ''
+            last_name_1, last_name_2 = _split_last_name(member.last_name)
+            yield type('Row', (), {
+                'club': club_name,
+                'first_name': member.first_name,
+                'last_name_1': last_name_1,
+                'last_name_2': last_name_2,
                 'dni': '' if dni == 'null' else dni,
                 'payment_type': PAYMENT_TYPE_LABELS.get(payment.payment_type.value, payment.payment_type.value),
                 'concept': payment.concept,
                 'amount': payment.amount,
                 'status': payment.status.value,
                 'payment_year': payment.payment_year,
-            })())
+            })()
 
     registry = [
         ("club", "Club", lambda r: r.club),
@@ -844,16 +875,82 @@ async def export_payments(
         ("payment_year", "Año", lambda r: r.payment_year),
     ]
 
-    output = _build_excel("Pagos", registry, all_rows, columns)
+    output = await _build_excel("Pagos", registry, _payment_rows(), columns)
     filename = f"pagos_export_{payment_year}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.xlsx"
 
     return StreamingResponse(
-        output,
+        _file_chunks(output),
         media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
         headers={"Content-Disposition": f"attachment; filename={filename}"}
     )
 
 
+# Rows are resolved and written in batches: one member lookup, one existing
+# payment lookup and one bulk write per batch instead of per row.
+IMPORT_PAYMENTS_BATCH_SIZE = 500
+
+
+def _parse_payment_row(idx: int, row: dict, is_upsert: bool):
+    """Validate one payment import row.
+
+    Returns a tuple ``(parsed, error)``. ``parsed`` is None when the row
+    must be skipped, either silently (upsert rows without DNI) or because
+    ``error`` describes why it is invalid.
+    """
+    dni = row.get('dni') or row.get('DNI') or row.get('Dni') or ''
+    # Treat the string "null" as empty (bad data in DB)
+    if isinstance(dni, str) and dni.strip().lower() == 'null':
+        dni = ''
+    tipo_pago = row.get('tipo_pago') or row.get('Tipo Pago') or row.get('payment_type') or ''
+    year_raw = row.get('ano') or row.get('Año') or row.get('Ano') or row.get('payment_year') or ''
+    monto_raw = row.get('monto') or row.get('Monto') or row.get('amount') or 0
+    estado = row.get('estado') or row.get('Estado') or row.get('status') or 'completed'
+    concepto = row.get('concepto') or row.get('Concepto') or row.get('concept') or ''
+
+    if not dni:
+        if is_upsert:
+            # In upsert mode, skip rows without DNI (can't match member)
+            return None, None
+        return None, f"Fila {idx + 1}: DNI es obligatorio"
+
+    if not tipo_pago:
+        return None, f"Fila {idx + 1}: Tipo de pago es obligatorio"
+
+    try:
+        payment_year = int(year_raw)
+    except (ValueError, TypeError):
+        return None, f"Fila {idx + 1}: Año inválido '{year_raw}'"
+
+    try:
+        amount = float(str(monto_raw).replace(',', '.'))
+    except (ValueError, TypeError):
+        return None, f"Fila {idx + 1}: Monto inválido '{monto_raw}'"
+
+    tipo_normalized = tipo_pago.lower().strip()
+    payment_type_value = PAYMENT_TYPE_FROM_LABEL.get(tipo_normalized, tipo_normalized)
+    try:
+        payment_type = MemberPaymentType(payment_type_value)
+    except ValueError:
+        valid = ', '.join(PAYMENT_TYPE_LABELS.values())
+        return None, f"Fila {idx + 1}: Tipo de pago inválido '{tipo_pago}'. Use: {valid}"
+
+    estado_normalized = estado.lower().strip()
+    try:
+        payment_status = MemberPaymentStatus(estado_normalized)
+    except ValueError:
+        return None, f"Fila {idx + 1}: Estado inválido '{estado}'. Use: pending, completed, refunded"
+
+    return {
+        "idx": idx,
+        "dni": dni,
+        "payment_type": payment_type,
+        "payment_year": payment_year,
+        "amount": amount,
+        "status": payment_status,
+        "concept": concepto,
+    }, None
+
+
 @router.post("/payments/import", response_model=ImportMembersResponse)
 async def import_payments(
     request: ImportPaymentsRequest,
@@ -871,111 +968,147 @@ async def import_payments(
     imported = 0
     updated = 0
     failed = 0
-    errors = []
+    # (row index, message) so errors are reported in row order across batches
+    row_errors: list = []
     is_upsert = request.mode == "upsert"
-
-    for idx, row in enumerate(request.payments):
-        try:
-            dni = row.get('dni') or row.get('DNI') or row.get('Dni') or ''
-            # Treat the string "null" as empty (bad data in DB)
-            if isinstance(dni, str) and dni.strip().lower() == 'null':
-                dni = ''
-            tipo_pago = row.get('tipo_pago') or row.get('Tipo Pago') or row.get('payment_type') or ''
-            year_raw = row.get('ano') or row.get('Año') or row.get('Ano') or row.get('payment_year') or ''
-            monto_raw = row.get('monto') or row.get('Monto') or row.get('amount') or 0
-            estado = row.get('estado') or row.get('Estado') or row.get('status') or 'completed'
-            concepto = row.get('concepto') or row.get('Concepto') or row.get('concept') or ''
-
-            if not dni:
-                if is_upsert:
-                    # In upsert mode, skip rows without DNI (can't match member)
-                    continue
-                errors.append(f"Fila {idx + 1}: DNI es obligatorio")
-                failed += 1
-                continue
-
-            if not tipo_pago:
-                errors.append(f"Fila {idx + 1}: Tipo de pago es obligatorio")
-                failed += 1
-                continue
-
-            try:
-                payment_year = int(year_raw)
-            except (ValueError, TypeError):
-                errors.append(f"Fila {idx + 1}: Año inválido '{year_raw}'")
-                failed += 1
-                continue
-
+    import_stamp = datetime.now().strftime('%Y%m%d%H%M%S')
+
+    # Existing payments indexed by (member_id, year, type). Payments created
+    # earlier in this import are added too, so a repeated row updates them
+    # instead of creating a duplicate, as the row-by-row import did.
+    existing_index: dict = {}
+    loaded_keys: set = set()
+
+    rows = request.payments
+    for start in range(0, len(rows), IMPORT_PAYMENTS_BATCH_SIZE):
+        batch = []
+        for idx in range(start, min(start + IMPORT_PAYMENTS_BATCH_SIZE, len(rows))):
             try:
-                amount = float(str(monto_raw).replace(',', '.'))
-            except (ValueError, TypeError):
-                errors.append(f"Fila {idx + 1}: Monto inválido '{monto_raw}'")
+                parsed, error = _parse_payment_row(idx, rows[idx], is_upsert)
+            except Exception as e:
+                parsed, error = None, f"Fila {idx + 1}: {str(e)}"
+            if error:
+                row_errors.append((idx, error))
                 failed += 1
-                continue
-
-            tipo_normalized = tipo_pago.lower().strip()
-            payment_type_value = PAYMENT_TYPE_FROM_LABEL.get(tipo_normalized, tipo_normalized)
-            try:
-                payment_type = MemberPaymentType(payment_type_value)
-            except ValueError:
-                valid = ', '.join(PAYMENT_TYPE_LABELS.values())
-                errors.append(f"Fila {idx + 1}: Tipo de pago inválido '{tipo_pago}'. Use: {valid}")
-                failed += 1
-                continue
+            elif parsed:
+                batch.append(parsed)
 
-            estado_normalized = estado.lower().strip()
-            try:
-                payment_status = MemberPaymentStatus(estado_normalized)
-            except ValueError:
-                errors.append(f"Fila {idx + 1}: Estado inválido '{estado}'. Use: pending, completed, refunded")
-                failed += 1
-                continue
+        if not batch:
+            continue
 
-            member = await member_repo.find_by_dni(dni)
-            if not member:
-                errors.append(f"Fila {idx + 1}: No se encontró miembro con DNI {dni}")
-                failed += 1
-                continue
+        try:
+            members = await member_repo.find_by_dnis(list({p["dni"] for p in batch}))
+            member_by_dni = {m.dni: m for m in members}
 
             if is_upsert:
-                existing_payments = await member_payment_repo.find_by_member_year(
-                    member_id=member.id,
-                    payment_year=payment_year
-                )
-                existing = None
-                for ep in existing_payments:
-                    if ep.payment_type == payment_type:
-                        existing = ep
-                        break
+                pending_lookup = {
+                    (member_by_dni[p["dni"]].id, p["payment_year"])
+                    for p in batch if p["dni"] in member_by_dni
+                } - loaded_keys
+                if pending_lookup:
+                    existing_payments = await member_payment_repo.find_by_member_ids_years(
+                        member_ids=list({member_id for member_id, _ in pending_lookup}),
+                        payment_years=list({year for _, year in pending_lookup})
+                    )
+                    for ep in existing_payments:
+                        if (ep.member_id, ep.payment_year) in pending_lookup:
+                            existing_index.setdefault(
+                                (ep.member_id, ep.payment_year, ep.payment_type), ep
+                            )
+                    loaded_keys |= pending_lookup
+        except Exception as e:
+            for p in batch:
+                row_errors.append((p["idx"], f"Fila {p['idx'] + 1}: {str(e)}"))
+            failed += len(batch)
+            continue
+
+        to_write: dict = {}
+        # Rows behind each payment to write, with whether the row created it
+        rows_by_payment: dict = {}
+        batch_failed = []
+        for p in batch:
+            idx = p["idx"]
+            try:
+                member = member_by_dni.get(p["dni"])
+                if not member:
+                    batch_failed.append((idx, f"Fila {idx + 1}: No se encontró miembro con DNI {p['dni']}"))
+                    continue
 
+                key = (member.id, p["payment_year"], p["payment_type"])
+                existing = existing_index.get(key) if is_upsert else None
                 if existing:
-                    existing.amount = amount
-                    existing.status = payment_status
-                    if concepto:
-                        existing.concept = concepto
+                    existing.amount = p["amount"]
+                    existing.status = p["status"]
+                    if p["concept"]:
+                        existing.concept = p["concept"]
                     existing.updated_at = datetime.utcnow()
-                    await member_payment_repo.update(existing)
-                    updated += 1
+                    to_write[id(existing)] = existing
+                    rows_by_payment.setdefault(id(existing), []).append((idx, False))
                     continue
 
-            if not concepto:
-                concepto = f"{PAYMENT_TYPE_LABELS.get(payment_type.value, payment_type.value)} {payment_year}"
-
-            new_payment = MemberPayment(
-                payment_id=f"import_{datetime.now().strftime('%Y%m%d%H%M%S')}_{idx}",
-                member_id=member.id,
-                payment_year=payment_year,
-                payment_type=payment_type,
-                concept=concepto,
-                amount=amount,
-                status=payment_status
-            )
-            await member_payment_repo.create(new_payment)
-            imported += 1
+                concepto = p["concept"] or (
+                    f"{PAYMENT_TYPE_LABELS.get(p['payment_type'].value, p['payment_type'].value)} "
+                    f"{p['payment_year']}"
+                )
+                new_payment = MemberPayment(
+                    payment_id=f"import_{import_stamp}_{idx}",
+                    member_id=member.id,
+                    payment_year=p["payment_year"],
+                    payment_type=p["payment_type"],
+                    concept=concepto,
+                    amount=p["amount"],
+                    status=p["status"]
+                )
+                to_write[id(new_payment)] = new_payment
+                rows_by_payment[id(new_payment)] = [(idx, True)]
+                if is_upsert:
+                    existing_index[key] = new_payment
+            except Exception as e:
+                batch_failed.append((idx, f"Fila {idx + 1}: {str(e)}"))
 
+        payments = list(to_write.values())
+        written = len(payments)
+        write_error = None
+        try:
+            if payments:
+                await member_payment_repo.upsert_bulk(payments)
+        except PartialBulkWriteError as e:
+            # The bulk write is ordered: the payments before the failing one
+            # were saved, the failing one and those after it were not
+            written, write_error = e.written, str(e)
         except Exception as e:
-            failed += 1
-            errors.append(f"Fila {idx + 1}: {str(e)}")
+            # Nothing tells which payments were saved, so every row of the
+            # batch is reported as failed. Re-running the import in upsert
+            # mode completes it; in create mode it may duplicate saved rows.
+            written, write_error = 0, str(e)
+
+        batch_imported = 0
+        batch_updated = 0
+        for position, payment in enumerate(payments):
+            payment_rows = rows_by_payment[id(payment)]
+            if position < written:
+                batch_imported += sum(1 for _, created in payment_rows if created)
+                batch_updated += sum(1 for _, created in payment_rows if not created)
+                continue
+
+            for idx, _ in payment_rows:
+                if position == written:
+                    batch_failed.append((idx, f"Fila {idx + 1}: {write_error}"))
+                else:
+                    batch_failed.append((idx, f"Fila {idx + 1}: No se guardó porque falló una fila anterior"))
+            if is_upsert:
+                # Forget the unsaved in-memory state so a later row reloads
+                # the payment as it is stored
+                existing_index.pop((payment.member_id, payment.payment_year, payment.payment_type), None)
+                loaded_keys.discard((payment.member_id, payment.payment_year))
+
+        imported += batch_imported
+        updated += batch_updated
+        failed += len(batch_failed)
+        row_errors.extend(batch_failed)
+
+    row_errors.sort(key=lambda e: e[0])
+    errors = [message for _, message in row_errors]
 
     return ImportMembersResponse(
         success=failed == 0,
@@ -50,19 +50,18 @@ async def _get_member_club_id(member_id: Optional[str]) -> Optional[str]:
 
 
 async def _populate_member_names(items: List[InsuranceResponse]) -> List[InsuranceResponse]:
-    """Populate member_name for insurance items."""
-    db = get_database()
+    """Populate member_name for insurance items with a single projected query."""
+    member_ids = list({item.member_id for item in items if item.member_id})
+    if not member_ids:
+        return items
+    try:
+        refs = await get_member_repository().find_refs_by_ids(member_ids)
+    except Exception:
+        return items
+    name_by_id = {ref.id: ref.full_name.strip() for ref in refs}
     for item in items:
-        if item.member_id:
-            try:
-                # Try string ID first (current schema), then ObjectId (legacy)
-                member = await db["members"].find_one({"_id": item.member_id})
-                if not member:
-                    member = await db["members"].find_one({"_id": ObjectId(item.member_id)})
-                if member:
-                    item.member_name = f"{member.get('first_name', '')} {member.get('last_name', '')}".strip()
-            except Exception:
-                pass
+        if item.member_id in name_by_id:
+            item.member_name = name_by_id[item.member_id]
     return items
 
 
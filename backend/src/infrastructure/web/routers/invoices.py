@@ -3,14 +3,15 @@
 from typing import List, Optional
 from datetime import date
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from fastapi.responses import StreamingResponse
 from io import BytesIO
 
 from src.infrastructure.web.dto.invoice_dto import (
     InvoiceResponse,
     InvoiceLineItemResponse,
-    InvoiceListResponse
+    InvoiceListResponse,
+    InvoicePageResponse
 )
 from src.infrastructure.web.dependencies import (
     get_all_invoices_use_case,
@@ -20,7 +21,8 @@ from src.infrastructure.web.dependencies import (
     get_regenerate_invoice_pdf_use_case
 )
 from src.infrastructure.web.dependencies import get_auth_context
-from src.infrastructure.web.authorization import AuthContext
+from src.infrastructure.web.authorization import AuthContext, get_club_filter_ctx
+from src.domain.entities.invoice import InvoiceStatus
 from src.domain.exceptions.invoice import InvoiceNotFoundError, InvoicePDFGenerationError
 
 router = APIRouter(prefix="/invoices", tags=["invoices"])
@@ -64,7 +66,7 @@ def _invoice_to_response(invoice) -> InvoiceResponse:
 
 @router.get("", response_model=List[InvoiceResponse])
 async def get_all_invoices(
-    status: Optional[str] = None,
+    status: Optional[InvoiceStatus] = None,
     start_date: Optional[date] = None,
     end_date: Optional[date] = None,
     limit: int = 0,
@@ -81,6 +83,26 @@ async def get_all_invoices(
     return [_invoice_to_response(inv) for inv in invoices]
 
 
+@router.get("/page", response_model=InvoicePageResponse)
+async def get_invoices_page(
+    limit: int = Query(50, gt=0, le=500),
+    cursor: Optional[str] = None,
+    status: Optional[InvoiceStatus] = None,
+    club_id: Optional[str] = None,
+    get_all_use_case = Depends(get_all_invoices_use_case),
+    ctx: AuthContext = Depends(get_auth_context)
+):
+    """Get one page of invoices, newest first; pass next_cursor back as cursor."""
+    effective_club_id = get_club_filter_ctx(ctx)
+    if effective_club_id is None:
+        effective_club_id = club_id
+    page = await get_all_use_case.execute_page(limit, cursor, status, effective_club_id)
+    return InvoicePageResponse(
+        items=[_invoice_to_response(inv) for inv in page.items],
+        next_cursor=page.next_cursor,
+    )
+
+
 @router.get("/member/{member_id}", response_model=List[InvoiceResponse])
 async def get_member_invoices(
     member_id: str,
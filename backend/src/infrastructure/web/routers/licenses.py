@@ -4,11 +4,10 @@ from typing import List, Optional
 from io import BytesIO
 import uuid
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
 from fastapi.responses import StreamingResponse
-from datetime import datetime
+from datetime import date, datetime
 
-from bson import ObjectId
 from src.infrastructure.web.dto.license_dto import (
     LicenseCreate,
     LicenseUpdate,
@@ -16,8 +15,9 @@ from src.infrastructure.web.dto.license_dto import (
     LicenseResponse,
     LicenseListResponse
 )
-from src.infrastructure.database import get_database
 from src.infrastructure.web.mappers_license import LicenseMapper
+from src.infrastructure.web.responses import FastJSONRoute
+from src.infrastructure.web.conditional import not_modified
 from src.infrastructure.web.dependencies import (
     get_all_licenses_use_case,
     get_license_use_case,
@@ -27,6 +27,9 @@ from src.infrastructure.web.dependencies import (
     get_update_license_use_case,
     get_delete_license_use_case,
     get_generate_license_image_use_case,
+    get_member_repository,
+    get_license_repository,
+    get_search_members_use_case,
     get_auth_context
 )
 from src.infrastructure.web.authorization import (
@@ -38,7 +41,7 @@ from src.infrastructure.web.authorization import (
 from src.domain.exceptions.license import LicenseNotFoundError, LicenseImageGenerationError
 from src.domain.exceptions.member import MemberNotFoundError
 
-router = APIRouter(prefix="/licenses", tags=["licenses"])
+router = APIRouter(prefix="/licenses", tags=["licenses"], route_class=FastJSONRoute)
 
 GRADE_GROUP_ORDER = {"shidoin": 0, "fukushidoin": 1, "dan": 2, "kyu": 3, "unknown": 4}
 
@@ -77,32 +80,26 @@ def _get_expiration_date(license_data: LicenseCreate) -> Optional[datetime]:
     return license_data.expiration_date or license_data.expiry_date
 
 
-async def _get_club_member_ids(club_id: str) -> set:
-    """Get the set of member ID strings for a given club."""
-    db = get_database()
-    member_ids = await db["members"].distinct("_id", {"club_id": club_id})
-    return {str(m) for m in member_ids}
-
-
 async def _populate_member_names(items: List[LicenseResponse]) -> List[LicenseResponse]:
-    """Populate member_name for license items."""
-    db = get_database()
+    """Populate member_name for license items with a single projected query."""
+    member_ids = list({item.member_id for item in items if item.member_id})
+    if not member_ids:
+        return items
+    try:
+        refs = await get_member_repository().find_refs_by_ids(member_ids)
+    except Exception:
+        return items
+    name_by_id = {ref.id: ref.full_name.strip() for ref in refs}
     for item in items:
-        if item.member_id:
-            try:
-                # Try string ID first (current schema), then ObjectId (legacy)
-                member = await db["members"].find_one({"_id": item.member_id})
-                if not member:
-                    member = await db["members"].find_one({"_id": ObjectId(item.member_id)})
-                if member:
-                    item.member_name = f"{member.get('first_name', '')} {member.get('last_name', '')}".strip()
-            except Exception:
-                pass
+        if item.member_id in name_by_id:
+            item.member_name = name_by_id[item.member_id]
     return items
 
 
 @router.get("", response_model=LicenseListResponse)
 async def get_licenses(
+    request: Request,
+    response: Response,
     limit: int = 20,
     offset: int = 0,
     club_id: Optional[str] = None,
@@ -110,43 +107,46 @@ async def get_licenses(
     search: Optional[str] = None,
     status: Optional[str] = None,
     get_all_use_case = Depends(get_all_licenses_use_case),
-    ctx: AuthContext = Depends(get_auth_context)
+    search_members_use_case = Depends(get_search_members_use_case),
+    ctx: AuthContext = Depends(get_auth_context),
+    license_repo = Depends(get_license_repository),
+    member_repo = Depends(get_member_repository),
 ):
-    """Get all licenses, optionally filtered by club, member, status, or member name search."""
+    """Get all licenses, optionally filtered by club, member, status, or member search."""
     # Club admins are forced to their club only
     effective_club_id = get_club_filter_ctx(ctx)
 
+    # Licenses carry no club: the club filter and member names come from members
+    unchanged = await not_modified(
+        request,
+        response,
+        license_repo.get_collection_version(),
+        member_repo.get_collection_version(effective_club_id),
+        # Status is derived from the expiration date
+        scope=(effective_club_id, date.today()),
+    )
+    if unchanged:
+        return unchanged
+
     # Status is computed in-domain (based on expiration_date), so we must
     # fetch all matching licenses from the DB and filter/paginate in memory.
     # Use 0 (unlimited) for the DB query; pagination is applied later.
     db_limit = 0
 
-    # If search is provided, find matching member IDs first
+    # If search is provided, find matching member IDs first (name, DNI or email)
     effective_member_id = member_id
     member_ids_from_search: Optional[List[str]] = None
     if search:
-        db = get_database()
-        member_query = {
-            "$or": [
-                {"first_name": {"$regex": search, "$options": "i"}},
-                {"last_name": {"$regex": search, "$options": "i"}}
-            ]
-        }
-        matching_members = await db["members"].find(member_query, {"_id": 1}).to_list(length=None)
-        member_ids_from_search = [str(m["_id"]) for m in matching_members]
+        matching_members = await search_members_use_case.execute(
+            search, club_id=effective_club_id if effective_club_id is not None else club_id
+        )
+        member_ids_from_search = [m.id for m in matching_members]
         if not member_ids_from_search:
             return LicenseListResponse(items=[], total=0, offset=offset, limit=limit)
 
     if member_ids_from_search is not None:
-        # Search by member name - use find_by_member_ids
+        # The member search is already scoped to the club
         licenses = await get_all_use_case.license_repository.find_by_member_ids(member_ids_from_search, db_limit)
-        # Apply club filter
-        if effective_club_id is not None:
-            club_member_ids = await _get_club_member_ids(effective_club_id)
-            licenses = [lic for lic in licenses if lic.member_id in club_member_ids]
-        elif club_id:
-            club_member_ids = await _get_club_member_ids(club_id)
-            licenses = [lic for lic in licenses if lic.member_id in club_member_ids]
     elif effective_club_id is not None:
         licenses = await get_all_use_case.execute(db_limit, effective_club_id, effective_member_id)
     elif club_id:
@@ -1,9 +1,10 @@
 """Member routes."""
 
 from collections import defaultdict
+from datetime import date
 from typing import List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Request, Response
 
 from src.domain.entities.license import License
 from src.domain.entities.insurance import Insurance
@@ -12,22 +13,28 @@ from src.infrastructure.web.dto.member_dto import (
     MemberUpdate,
     MemberStatusChange,
     MemberResponse,
+    MemberPageResponse,
+    MemberSuggestionResponse,
     LicenseSummary,
     InsuranceSummary,
 )
 from src.infrastructure.web.mappers_member import MemberMapper
+from src.infrastructure.web.responses import FastJSONRoute
+from src.infrastructure.web.conditional import not_modified
 from src.infrastructure.web.dependencies import (
     get_all_members_use_case,
     get_member_use_case,
     get_search_members_use_case,
+    get_suggest_members_use_case,
     get_create_member_use_case,
     get_update_member_use_case,
     get_delete_member_use_case,
     get_change_member_status_use_case,
     get_auth_context,
+    get_member_repository,
     get_license_repository,
     get_insurance_repository,
-    get_club_repository,
+    get_club_directory,
 )
 from src.infrastructure.web.authorization import (
     AuthContext,
@@ -35,7 +42,7 @@ from src.infrastructure.web.authorization import (
     get_club_filter_ctx,
 )
 
-router = APIRouter(prefix="/members", tags=["members"])
+router = APIRouter(prefix="/members", tags=["members"], route_class=FastJSONRoute)
 
 
 def _pick_primary_license(licenses: List[License]) -> Optional[License]:
@@ -119,18 +126,17 @@ async def _enrich_members_with_summaries(
 
 async def _enrich_members_with_club_names(
     responses: List[MemberResponse],
-    club_repo,
+    club_directory,
 ) -> List[MemberResponse]:
-    """Batch-enrich member responses with club names (1 query total)."""
+    """Enrich member responses with club names from the club directory."""
     if not responses:
         return responses
 
-    club_ids = list({r.club_id for r in responses if r.club_id})
+    club_ids = {r.club_id for r in responses if r.club_id}
     if not club_ids:
         return responses
 
-    clubs = await club_repo.find_by_ids(club_ids)
-    club_map = {c.id: c.name for c in clubs}
+    club_map = await club_directory.names_by_id(club_ids)
 
     for resp in responses:
         if resp.club_id:
@@ -139,8 +145,35 @@ async def _enrich_members_with_club_names(
     return responses
 
 
+async def _members_not_modified(
+    request: Request,
+    response: Response,
+    club_id: Optional[str],
+    member_repo,
+    license_repo,
+    insurance_repo,
+    club_directory,
+) -> Optional[Response]:
+    """Conditional GET for member listings, which embed license, insurance and club data."""
+    return await not_modified(
+        request,
+        response,
+        member_repo.get_collection_version(club_id),
+        # The summaries embedded in every item; licenses and insurances carry
+        # no club, so these cannot be scoped like the members
+        license_repo.get_collection_version(),
+        insurance_repo.get_collection_version(),
+        # The clubs the names are read from, which may lag the database
+        club_directory.version(),
+        # License and insurance statuses follow their expiry dates
+        scope=(club_id, date.today()),
+    )
+
+
 @router.get("", response_model=List[MemberResponse])
 async def get_members(
+    request: Request,
+    response: Response,
     limit: int = 0,
     club_id: Optional[str] = Query(None),
     search: Optional[str] = Query(None),
@@ -148,36 +181,107 @@ async def get_members(
     get_all_use_case = Depends(get_all_members_use_case),
     get_search_use_case = Depends(get_search_members_use_case),
     ctx: AuthContext = Depends(get_auth_context),
+    member_repo = Depends(get_member_repository),
     license_repo = Depends(get_license_repository),
     insurance_repo = Depends(get_insurance_repository),
-    club_repo = Depends(get_club_repository),
+    club_directory = Depends(get_club_directory),
 ):
     """Get all members, optionally filtered by club, search term, or status."""
+    # Club admins are forced to their club only
+    effective_club_id = get_club_filter_ctx(ctx)
+    if effective_club_id is None:
+        effective_club_id = club_id
+
+    unchanged = await _members_not_modified(
+        request, response, effective_club_id, member_repo, license_repo, insurance_repo, club_directory
+    )
+    if unchanged:
+        return unchanged
+
+    # Club and status are part of the query, so the limit applies after filtering
     if search:
-        members = await get_search_use_case.execute(search, limit)
-        # For club admins, filter to only return members from their club
-        effective_club_id = get_club_filter_ctx(ctx)
-        if effective_club_id is not None:
-            members = [m for m in members if m.club_id == effective_club_id]
-        elif club_id:
-            members = [m for m in members if m.club_id == club_id]
+        members = await get_search_use_case.execute(search, limit, effective_club_id, status)
+    else:
+        members = await get_all_use_case.execute(limit, effective_club_id, status)
+
+    responses = MemberMapper.to_response_list(members)
+    responses = await _enrich_members_with_summaries(responses, license_repo, insurance_repo)
+    return await _enrich_members_with_club_names(responses, club_directory)
+
+
+@router.get("/page", response_model=MemberPageResponse)
+async def get_members_page(
+    request: Request,
+    response: Response,
+    limit: int = Query(50, gt=0, le=500),
+    cursor: Optional[str] = Query(None),
+    club_id: Optional[str] = Query(None),
+    get_all_use_case = Depends(get_all_members_use_case),
+    ctx: AuthContext = Depends(get_auth_context),
+    member_repo = Depends(get_member_repository),
+    license_repo = Depends(get_license_repository),
+    insurance_repo = Depends(get_insurance_repository),
+    club_directory = Depends(get_club_directory),
+):
+    """Get one page of members ordered by last name; pass next_cursor back as cursor."""
+    effective_club_id = get_club_filter_ctx(ctx)
+    if effective_club_id is None:
+        effective_club_id = club_id
+    unchanged = await _members_not_modified(
+        request, response, effective_club_id, member_repo, license_repo, insurance_repo, club_directory
+    )
+    if unchanged:
+        return unchanged
+    page = await get_all_use_case.execute_page(limit, cursor, effective_club_id)
+    responses = MemberMapper.to_response_list(page.items)
+    responses = await _enrich_members_with_summaries(responses, license_repo, insurance_repo)
+    responses = await _enrich_members_with_club_names(responses, club_directory)
+    return MemberPageResponse(items=responses, next_cursor=page.next_cursor)
+
+
+@router.get("/suggest", response_model=List[MemberSuggestionResponse])
+async def suggest_members(
+    q: str = Query(..., min_length=1),
+    limit: int = Query(10, gt=0, le=50),
+    club_id: Optional[str] = Query(None),
+    suggest_use_case = Depends(get_suggest_members_use_case),
+    ctx: AuthContext = Depends(get_auth_context),
+):
+    """Autocomplete members by name or DNI prefix for member pickers."""
+    if ctx.is_super_admin:
+        effective_club_id = club_id
+    elif ctx.club_id:
+        effective_club_id = ctx.club_id
     else:
-        # Club admins are forced to their club only
-        effective_club_id = get_club_filter_ctx(ctx)
+        return []
+    refs = await suggest_use_case.execute(q, limit, effective_club_id)
+    return [
+        MemberSuggestionResponse(id=ref.id, name=ref.full_name, club_id=ref.club_id)
+        for ref in refs
+    ]
 
-        if effective_club_id is not None:
-            members = await get_all_use_case.execute(limit, effective_club_id)
-        elif club_id:
-            members = await get_all_use_case.execute(limit, club_id)
-        else:
-            members = await get_all_use_case.execute(limit, None)
 
-    if status:
-        members = [m for m in members if m.status.value == status]
+@router.get("/search", response_model=List[MemberResponse])
+async def search_members(
+    name: str = Query(...),
+    limit: int = 0,
+    get_search_use_case = Depends(get_search_members_use_case),
+    ctx: AuthContext = Depends(get_auth_context),
+    license_repo = Depends(get_license_repository),
+    insurance_repo = Depends(get_insurance_repository),
+    club_directory = Depends(get_club_directory),
+):
+    """Search members by name."""
+    # For club admins, only search members from their club
+    if ctx.is_club_admin and not ctx.club_id:
+        return []
+    members = await get_search_use_case.execute(
+        name, limit, ctx.club_id if ctx.is_club_admin else None
+    )
 
     responses = MemberMapper.to_response_list(members)
     responses = await _enrich_members_with_summaries(responses, license_repo, insurance_repo)
-    return await _enrich_members_with_club_names(responses, club_repo)
+    return await _enrich_members_with_club_names(responses, club_directory)
 
 
 @router.get("/{member_id}", response_model=MemberResponse)
@@ -187,7 +291,7 @@ async def get_member(
     ctx: AuthContext = Depends(get_auth_context),
     license_repo = Depends(get_license_repository),
     insurance_repo = Depends(get_insurance_repository),
-    club_repo = Depends(get_club_repository),
+    club_directory = Depends(get_club_directory),
 ):
     """Get member by ID."""
     member = await get_member_use_case.execute(member_id)
@@ -204,7 +308,7 @@ async def get_member(
 
     response = MemberMapper.to_response_dto(member)
     enriched = await _enrich_members_with_summaries([response], license_repo, insurance_repo)
-    enriched = await _enrich_members_with_club_names(enriched, club_repo)
+    enriched = await _enrich_members_with_club_names(enriched, club_directory)
     return enriched[0]
 
 
@@ -216,36 +320,14 @@ async def get_members_by_club(
     ctx: AuthContext = Depends(get_auth_context),
     license_repo = Depends(get_license_repository),
     insurance_repo = Depends(get_insurance_repository),
-    club_repo = Depends(get_club_repository),
+    club_directory = Depends(get_club_directory),
 ):
     """Get members by club ID."""
     check_club_access_ctx(ctx, club_id)
     members = await get_all_use_case.execute(limit, club_id)
     responses = MemberMapper.to_response_list(members)
     responses = await _enrich_members_with_summaries(responses, license_repo, insurance_repo)
-    return await _enrich_members_with_club_names(responses, club_repo)
-
-
-@router.get("/search", response_model=List[MemberResponse])
-async def search_members(
-    name: str = Query(...),
-    limit: int = 0,
-    get_search_use_case = Depends(get_search_members_use_case),
-    ctx: AuthContext = Depends(get_auth_context),
-    license_repo = Depends(get_license_repository),
-    insurance_repo = Depends(get_insurance_repository),
-    club_repo = Depends(get_club_repository),
-):
-    """Search members by name."""
-    members = await get_search_use_case.execute(name, limit)
-
-    # For club admins, filter to only return members from their club
-    if ctx.is_club_admin:
-        members = [m for m in members if m.club_id == ctx.club_id]
-
-    responses = MemberMapper.to_response_list(members)
-    responses = await _enrich_members_with_summaries(responses, license_repo, insurance_repo)
-    return await _enrich_members_with_club_names(responses, club_repo)
+    return await _enrich_members_with_club_names(responses, club_directory)
 
 
 @router.post("", response_model=MemberResponse, status_code=status.HTTP_201_CREATED)
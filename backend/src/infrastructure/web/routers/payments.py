@@ -2,11 +2,12 @@
 
 from typing import List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, status, Form
+from fastapi import APIRouter, Depends, HTTPException, status, Form, Query
 
 from src.infrastructure.web.dto.payment_dto import (
     PaymentCreate,
     PaymentResponse,
+    PaymentPageResponse,
     PaymentRefundRequest,
     InitiatePaymentRequest,
     InitiatePaymentResponse,
@@ -23,6 +24,7 @@ from src.infrastructure.web.dto.annual_payment_dto import (
 )
 from src.application.use_cases.payment.initiate_annual_payment_use_case import MemberAssignment
 from src.infrastructure.web.mappers_payment import PaymentMapper
+from src.infrastructure.web.responses import FastJSONRoute
 from src.infrastructure.web.dependencies import (
     get_all_payments_use_case,
     get_payment_use_case,
@@ -35,7 +37,7 @@ from src.infrastructure.web.dependencies import (
     get_process_redsys_webhook_use_case
 )
 from src.infrastructure.web.dependencies import get_auth_context
-from src.infrastructure.web.authorization import AuthContext, require_super_admin
+from src.infrastructure.web.authorization import AuthContext, get_club_filter_ctx, require_super_admin
 from src.domain.exceptions.payment import (
     DuplicatePaymentForYearError,
     PaymentNotFoundError,
@@ -54,7 +56,7 @@ from src.infrastructure.web.dependencies import (
 from src.application.use_cases.payment.register_manual_payment_use_case import ManualMemberAssignment
 from src.config.settings import get_app_settings
 
-router = APIRouter(prefix="/payments", tags=["payments"])
+router = APIRouter(prefix="/payments", tags=["payments"], route_class=FastJSONRoute)
 
 
 @router.get("", response_model=List[PaymentResponse])
@@ -71,6 +73,27 @@ async def get_payments(
     return PaymentMapper.to_response_list(payments)
 
 
+@router.get("/page", response_model=PaymentPageResponse)
+async def get_payments_page(
+    limit: int = Query(50, gt=0, le=500),
+    cursor: Optional[str] = None,
+    club_id: Optional[str] = None,
+    member_id: Optional[str] = None,
+    payment_year: Optional[int] = None,
+    get_all_use_case = Depends(get_all_payments_use_case),
+    ctx: AuthContext = Depends(get_auth_context)
+):
+    """Get one page of payments, newest first; pass next_cursor back as cursor."""
+    effective_club_id = get_club_filter_ctx(ctx)
+    if effective_club_id is None:
+        effective_club_id = club_id
+    page = await get_all_use_case.execute_page(limit, cursor, effective_club_id, member_id, payment_year)
+    return PaymentPageResponse(
+        items=PaymentMapper.to_response_list(page.items),
+        next_cursor=page.next_cursor,
+    )
+
+
 @router.get("/annual/prefill", response_model=PrefillAnnualPaymentResponse)
 async def prefill_annual_payment(
     club_id: str,
@@ -257,7 +280,7 @@ async def redsys_webhook(
         return RedsysWebhookResponse(
             success=result.success,
             message=result.message,
-            payment_id=result.payment.id,
+            payment_id=result.payment_id,
             invoice_number=result.invoice.invoice_number if result.invoice else None
         )
     except Exception as e:
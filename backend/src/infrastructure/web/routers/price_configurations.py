@@ -2,7 +2,7 @@
 
 from typing import Dict, List
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
 
 from src.infrastructure.web.dto.price_configuration_dto import (
     PriceConfigurationCreate,
@@ -23,6 +23,7 @@ from src.infrastructure.web.dependencies import (
 )
 from src.infrastructure.web.dependencies import get_auth_context
 from src.infrastructure.web.authorization import AuthContext, require_super_admin
+from src.infrastructure.web.conditional import not_modified
 from src.domain.exceptions.price_configuration import (
     PriceConfigurationNotFoundError,
     PriceConfigurationAlreadyExistsError,
@@ -50,13 +51,19 @@ def _to_response(p) -> PriceConfigurationResponse:
 
 @router.get("", response_model=List[PriceConfigurationResponse])
 async def get_all_prices(
+    request: Request,
+    response: Response,
     active_only: bool = False,
     limit: int = 0,
     get_all_use_case = Depends(get_all_prices_use_case),
-    ctx: AuthContext = Depends(get_auth_context)
+    ctx: AuthContext = Depends(get_auth_context),
+    price_repo = Depends(get_price_configuration_repository),
 ):
     """Get all price configurations. Requires super_admin."""
     require_super_admin(ctx)
+    unchanged = await not_modified(request, response, price_repo.get_collection_version())
+    if unchanged:
+        return unchanged
     prices = await get_all_use_case.execute(active_only=active_only, limit=limit)
     return [_to_response(p) for p in prices]
 
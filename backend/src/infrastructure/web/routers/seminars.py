@@ -4,13 +4,13 @@ from typing import List, Optional
 from pathlib import Path
 from io import BytesIO
 
-from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, status
-from PIL import Image, ImageOps
+from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Query, Request, Response, status
 
 from src.infrastructure.web.dto.seminar_dto import (
     SeminarCreate,
     SeminarUpdate,
-    SeminarResponse
+    SeminarResponse,
+    SeminarPageResponse
 )
 from src.infrastructure.web.mappers_seminar import SeminarMapper
 from src.infrastructure.web.dependencies import (
@@ -24,9 +24,11 @@ from src.infrastructure.web.dependencies import (
     get_upload_seminar_cover_image_use_case,
     get_delete_seminar_cover_image_use_case,
     get_initiate_seminar_oficialidad_use_case,
+    get_seminar_repository,
 )
 from src.infrastructure.web.dependencies import get_auth_context
 from src.infrastructure.web.authorization import AuthContext, check_club_access_ctx
+from src.infrastructure.web.conditional import not_modified
 from src.domain.entities.seminar import SeminarStatus
 from src.infrastructure.web.dto.payment_dto import InitiatePaymentResponse
 from src.domain.exceptions.seminar import SeminarAlreadyOfficialError
@@ -57,6 +59,9 @@ def validate_image_magic_bytes(content: bytes) -> None:
 
 def process_image(content: bytes) -> bytes:
     """Resize and convert image to 800x450 JPEG."""
+    # Imported here: Pillow is slow to import and only cover uploads need it
+    from PIL import Image, ImageOps
+
     image = Image.open(BytesIO(content))
     if image.mode not in ("RGB",):
         image = image.convert("RGB")
@@ -71,13 +76,23 @@ router = APIRouter(prefix="/seminars", tags=["seminars"])
 
 @router.get("", response_model=List[SeminarResponse])
 async def get_seminars(
+    request: Request,
+    response: Response,
     limit: int = 0,
     club_id: Optional[str] = None,
     association_id: Optional[str] = None,
     get_all_use_case = Depends(get_all_seminars_use_case),
-    ctx: AuthContext = Depends(get_auth_context)
+    ctx: AuthContext = Depends(get_auth_context),
+    seminar_repo = Depends(get_seminar_repository),
 ):
     """Get all seminars, optionally filtered by club or association."""
+    scope_club_id = club_id if ctx.is_super_admin else ctx.club_id
+    if ctx.is_super_admin or scope_club_id:
+        unchanged = await not_modified(
+            request, response, seminar_repo.get_collection_version(scope_club_id), scope=scope_club_id
+        )
+        if unchanged:
+            return unchanged
     if not ctx.is_super_admin:
         effective_club_id = ctx.club_id
         if not effective_club_id:
@@ -88,6 +103,38 @@ async def get_seminars(
     return SeminarMapper.to_response_list(seminars)
 
 
+@router.get("/page", response_model=SeminarPageResponse)
+async def get_seminars_page(
+    request: Request,
+    response: Response,
+    limit: int = Query(50, gt=0, le=500),
+    cursor: Optional[str] = None,
+    club_id: Optional[str] = None,
+    association_id: Optional[str] = None,
+    get_all_use_case = Depends(get_all_seminars_use_case),
+    ctx: AuthContext = Depends(get_auth_context),
+    seminar_repo = Depends(get_seminar_repository),
+):
+    """Get one page of seminars, latest first; pass next_cursor back as cursor."""
+    scope_club_id = club_id if ctx.is_super_admin else ctx.club_id
+    if ctx.is_super_admin or scope_club_id:
+        unchanged = await not_modified(
+            request, response, seminar_repo.get_collection_version(scope_club_id), scope=scope_club_id
+        )
+        if unchanged:
+            return unchanged
+    if not ctx.is_super_admin:
+        if not ctx.club_id:
+            return SeminarPageResponse(items=[])
+        page = await get_all_use_case.execute_page(limit, cursor, ctx.club_id)
+    else:
+        page = await get_all_use_case.execute_page(limit, cursor, club_id, association_id)
+    return SeminarPageResponse(
+        items=SeminarMapper.to_response_list(page.items),
+        next_cursor=page.next_cursor,
+    )
+
+
 @router.get("/upcoming", response_model=List[SeminarResponse])
 async def get_upcoming_seminars(
     limit: int = 0,
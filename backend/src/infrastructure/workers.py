@@ -0,0 +1,105 @@
+"""Multi-worker deployment: worker count and the check for per-process globals.
+
+With ``gunicorn -c gunicorn.conf.py src.main:app`` each worker is its own
+process with its own module globals. A global that a function rebinds at
+runtime (``global _x; _x = ...``) therefore holds a different value in
+every worker; that is only safe when the code was written for it.
+"""
+
+import dis
+import inspect
+import logging
+import os
+import sys
+import types
+from typing import Iterator, List, Set
+
+logger = logging.getLogger(__name__)
+
+# Read by gunicorn.conf.py and the startup check
+WORKERS_ENV = "WEB_CONCURRENCY"
+
+# Module globals rebound at runtime that are known to be safe with several
+# workers, and why. Anything else rebound at runtime is reported at startup.
+WORKER_SAFE_GLOBALS = {
+    "src.app._scheduler": "every worker runs one; the scheduler lease elects the one that runs jobs",
+    "src.app._scheduler_lease": "every worker competes for the same MongoDB lease",
+    "src.app._suggestion_refresher": "each worker rebuilds its own suggestion index",
+    "src.app._worker_invalidation": "each worker polls the shared invalidation counters",
+    "src.app._fulfillment_sweeper": "every worker runs one; the scheduler lease elects the one that sweeps",
+    "src.infrastructure.database._client": "each worker opens its own connection pool after the fork",
+    "src.infrastructure.database._database": "bound to this worker's client",
+    "src.config.logfire._logfire_configured": "instrumentation is configured once per process",
+    "src.config.settings._redsys_settings": "read-only settings loaded from the environment",
+    "src.config.settings._email_settings": "read-only settings loaded from the environment",
+    "src.config.settings._invoice_settings": "read-only settings loaded from the environment",
+    "src.config.settings._app_settings": "read-only settings loaded from the environment",
+    "src.config.settings._database_settings": "read-only settings loaded from the environment",
+}
+
+
+def worker_count() -> int:
+    """Number of API worker processes this deployment runs."""
+    try:
+        return max(1, int(os.getenv(WORKERS_ENV, "1")))
+    except ValueError:
+        return 1
+
+
+def _code_objects(module: types.ModuleType) -> Iterator[types.CodeType]:
+    """Code of the functions and methods defined in module, nested code included."""
+    pending = []
+    for value in vars(module).values():
+        members = vars(value).values() if inspect.isclass(value) else (value,)
+        for member in members:
+            if isinstance(member, (staticmethod, classmethod)):
+                member = member.__func__
+            elif isinstance(member, property):
+                pending.extend(f.__code__ for f in (member.fget, member.fset, member.fdel) if f)
+                continue
+            try:
+                member = inspect.unwrap(member)
+            except Exception:
+                continue
+            if inspect.isfunction(member) and member.__module__ == module.__name__:
+                pending.append(member.__code__)
+    seen: Set[int] = set()
+    while pending:
+        code = pending.pop()
+        if id(code) in seen:
+            continue
+        seen.add(id(code))
+        yield code
+        pending.extend(const for const in code.co_consts if isinstance(const, types.CodeType))
+
+
+def rebound_globals(package: str = "src") -> List[str]:
+    """Qualified names of the module globals that functions of the loaded package modules rebind."""
+    found = set()
+    for name, module in list(sys.modules.items()):
+        if module is None or not (name == package or name.startswith(package + ".")):
+            continue
+        for code in _code_objects(module):
+            for instruction in dis.get_instructions(code):
+                if instruction.opname in ("STORE_GLOBAL", "DELETE_GLOBAL"):
+                    found.add(f"{name}.{instruction.argval}")
+    return sorted(found)
+
+
+def unsafe_globals(package: str = "src") -> List[str]:
+    """Rebound module globals not listed in ``WORKER_SAFE_GLOBALS``."""
+    return [name for name in rebound_globals(package) if name not in WORKER_SAFE_GLOBALS]
+
+
+def check_worker_safety() -> List[str]:
+    """Warn about per-process globals when running several workers; returns their names."""
+    workers = worker_count()
+    if workers <= 1:
+        return []
+    unsafe = unsafe_globals()
+    for name in unsafe:
+        logger.warning(
+            f"{name} is rebound at runtime and holds a different value in each of the "
+            f"{workers} workers; add it to WORKER_SAFE_GLOBALS once it is safe"
+        )
+    return unsafe
@@ -1,11 +1,15 @@
 """Main entry point for the FastAPI application."""
 
-from src.app import create_app
+from src.infrastructure.startup import startup_phases
+
+with startup_phases.phase("imports"):
+    from src.app import create_app
 from dotenv import load_dotenv
 load_dotenv()
 
-app = create_app()
+with startup_phases.phase("create_app"):
+    app = create_app()
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run("main:app", host="0.0.0.0", port=8000, reload=True)
\ No newline at end of file
+    uvicorn.run("main:app", host="0.0.0.0", port=8000, reload=True)
@@ -0,0 +1,167 @@
+"""API tests for the streaming Excel export endpoints.
+
+Pattern:
+- Minimal FastAPI app with the import/export router.
+- Use cases and repositories replaced through app.dependency_overrides.
+- Assertions focus on entities being streamed and members being resolved
+  once per batch instead of once per row.
+"""
+
+import pytest
+from io import BytesIO
+from unittest.mock import AsyncMock, MagicMock
+
+import openpyxl
+from fastapi import FastAPI, status
+from fastapi.testclient import TestClient
+
+from src.domain.entities.user import User, GlobalRole
+from src.domain.entities.club import Club
+from src.domain.entities.member import Member
+from src.domain.entities.member_payment import MemberPayment, MemberPaymentType
+from src.domain.entities.license import License, LicenseStatus
+from src.infrastructure.web.authorization import AuthContext
+from src.infrastructure.web.dependencies import (
+    get_auth_context,
+    get_all_licenses_use_case,
+    get_all_members_use_case,
+    get_club_directory,
+    get_member_payment_repository,
+    get_member_repository,
+)
+
+
+def _make_super_admin_ctx() -> AuthContext:
+    return AuthContext(user=User(
+        id="user-super-admin-001",
+        email="superadmin@test.com",
+        username="superadmin",
+        hashed_password="hash",
+        global_role=GlobalRole.SUPER_ADMIN,
+    ))
+
+
+async def _stream(items):
+    for item in items:
+        yield item
+
+
+def _rows(response):
+    wb = openpyxl.load_workbook(BytesIO(response.content))
+    return list(wb.active.iter_rows(values_only=True))
+
+
+@pytest.fixture
+def test_app():
+    from src.infrastructure.web.routers.import_export import router
+    app = FastAPI()
+    app.include_router(router, prefix="/api/v1")
+    app.dependency_overrides[get_auth_context] = _make_super_admin_ctx
+    return app
+
+
+@pytest.mark.unit
+class TestStreamingExports:
+
+    def test_members_export_writes_streamed_members(self, test_app):
+        use_case = MagicMock()
+        use_case.iterate = MagicMock(return_value=_stream([
+            Member(id=f"m{n}", first_name=f"Name{n}", last_name="Garcia") for n in range(3)
+        ]))
+        test_app.dependency_overrides[get_all_members_use_case] = lambda: use_case
+
+        response = TestClient(test_app).get(
+            "/api/v1/import-export/members/export?club_id=club-1&columns=id,first_name"
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert _rows(response) == [("ID", "Nombre"), ("m0", "Name0"), ("m1", "Name1"), ("m2", "Name2")]
+        assert use_case.iterate.call_args.args[0] == "club-1"
+
+    def test_licenses_export_resolves_members_in_one_batch(self, test_app):
+        licenses = [
+            License(id=f"l{n}", license_number=f"LIC-{n}", member_id=f"m{n % 2}", grade="Kyu",
+                    status=LicenseStatus.ACTIVE if n != 2 else LicenseStatus.REVOKED)
+            for n in range(4)
+        ]
+        use_case = MagicMock()
+        use_case.iterate = MagicMock(return_value=_stream(licenses))
+        member_repo = MagicMock()
+        member_repo.find_by_ids = AsyncMock(return_value=[
+            Member(id="m0", first_name="Ana", last_name="Garcia Lopez"),
+            Member(id="m1", first_name="Luis", last_name="Perez"),
+        ])
+        member_repo.find_by_id = AsyncMock()
+        test_app.dependency_overrides[get_all_licenses_use_case] = lambda: use_case
+        test_app.dependency_overrides[get_member_repository] = lambda: member_repo
+
+        response = TestClient(test_app).get(
+            "/api/v1/import-export/licenses/export?status=active&columns=license_number,first_name"
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert _rows(response)[1:] == [("LIC-0", "Ana"), ("LIC-1", "Luis"), ("LIC-3", "Luis")]
+        member_repo.find_by_ids.assert_awaited_once()
+        member_repo.find_by_id.assert_not_called()
+
+    def test_payments_export_streams_the_year_and_resolves_members_in_one_batch(self, test_app):
+        payments = [
+            MemberPayment(id=f"mp{n}", payment_id="p1", member_id=f"m{n}", payment_year=2026,
+                          payment_type=MemberPaymentType.LICENCIA_KYU, concept=f"Licencia {n}", amount=30.0)
+            for n in range(3)
+        ]
+        member_payment_repo = MagicMock()
+        member_payment_repo.iter_by_year = MagicMock(return_value=_stream(payments))
+        member_repo = MagicMock()
+        member_repo.find_by_ids = AsyncMock(return_value=[
+            Member(id="m0", first_name="Ana", last_name="Garcia Lopez", club_id="c1"),
+            Member(id="m1", first_name="Luis", last_name="Perez", club_id="c2"),
+            Member(id="m2", first_name="Eva", last_name="Ruiz", club_id="c1"),
+        ])
+        member_repo.find_by_club_id = AsyncMock()
+        club_directory = MagicMock()
+        club_directory.all = AsyncMock(return_value=[
+            Club(id="c1", name="Club Ávila", email="c1@test.com"),
+            Club(id="c2", name="Club Cerrado", email="c2@test.com", is_active=False),
+        ])
+        test_app.dependency_overrides[get_member_payment_repository] = lambda: member_payment_repo
+        test_app.dependency_overrides[get_member_repository] = lambda: member_repo
+        test_app.dependency_overrides[get_club_directory] = lambda: club_directory
+
+        response = TestClient(test_app).get(
+            "/api/v1/import-export/payments/export?payment_year=2026&columns=club,first_name,concept"
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        # Members of inactive clubs are left out, as before
+        assert _rows(response)[1:] == [("Club Ávila", "Ana", "Licencia 0"), ("Club Ávila", "Eva", "Licencia 2")]
+        assert member_payment_repo.iter_by_year.call_args.args[0] == 2026
+        member_repo.find_by_ids.assert_awaited_once()
+        member_repo.find_by_club_id.assert_not_called()
+
+    def test_large_export_spills_to_disk_and_keeps_every_row(self, test_app, monkeypatch):
+        monkeypatch.setattr(
+            "src.infrastructure.web.routers.import_export.EXCEL_SPOOL_MAX_SIZE", 1024
+        )
+        monkeypatch.setattr(
+            "src.infrastructure.web.routers.import_export.EXCEL_WIDTH_SAMPLE_ROWS", 10
+        )
+        use_case = MagicMock()
+        use_case.iterate = MagicMock(return_value=_stream([
+            Member(id=f"m{n}", first_name="N" * (5 if n < 10 else 40), last_name="Garcia")
+            for n in range(300)
+        ]))
+        test_app.dependency_overrides[get_all_members_use_case] = lambda: use_case
+
+        response = TestClient(test_app).get(
+            "/api/v1/import-export/members/export?columns=id,first_name"
+        )
+
+        wb = openpyxl.load_workbook(BytesIO(response.content))
+        sheet = wb.active
+        rows = list(sheet.iter_rows(values_only=True))
+        assert len(rows) == 301
+        assert rows[-1] == ("m299", "N" * 40)
+        assert sheet["A1"].font.bold
+        # Widths come from the header and the sampled rows only
+        assert sheet.column_dimensions["B"].width == len("Nombre") + 2
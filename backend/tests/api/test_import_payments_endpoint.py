@@ -0,0 +1,217 @@
+"""API tests for the batched member payment import endpoint.
+
+Pattern:
+- Minimal FastAPI app with the import/export router.
+- Repositories replaced by AsyncMock through app.dependency_overrides.
+- Assertions focus on the number of repository round trips per import.
+"""
+
+import pytest
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock
+from fastapi import FastAPI, status
+from fastapi.testclient import TestClient
+
+from src.domain.entities.user import User, GlobalRole
+from src.domain.entities.member import Member
+from src.application.ports.member_payment_repository import PartialBulkWriteError
+from src.domain.entities.member_payment import MemberPayment, MemberPaymentStatus, MemberPaymentType
+from src.infrastructure.web.authorization import AuthContext
+from src.infrastructure.web.dependencies import (
+    get_auth_context,
+    get_member_repository,
+    get_member_payment_repository,
+)
+
+
+def _make_super_admin_ctx() -> AuthContext:
+    return AuthContext(user=User(
+        id="user-super-admin-001",
+        email="superadmin@test.com",
+        username="superadmin",
+        hashed_password="hash",
+        global_role=GlobalRole.SUPER_ADMIN,
+    ))
+
+
+def _make_member(member_id: str, dni: str) -> Member:
+    return Member(id=member_id, first_name="Ana", last_name="Garcia", dni=dni)
+
+
+@pytest.fixture
+def test_app():
+    from src.infrastructure.web.routers.import_export import router
+    app = FastAPI()
+    app.include_router(router, prefix="/api/v1")
+    return app
+
+
+@pytest.fixture
+def member_repo():
+    repo = MagicMock()
+    repo.find_by_dnis = AsyncMock(return_value=[
+        _make_member("member-001", "11111111A"),
+        _make_member("member-002", "22222222B"),
+    ])
+    return repo
+
+
+@pytest.fixture
+def member_payment_repo():
+    repo = MagicMock()
+    repo.find_by_member_ids_years = AsyncMock(return_value=[
+        MemberPayment(
+            id="507f1f77bcf86cd799439011",
+            payment_id="pay-001",
+            member_id="member-001",
+            payment_year=2026,
+            payment_type=MemberPaymentType.LICENCIA_KYU,
+            concept="Licencia Kyu 2026",
+            amount=30.0,
+            status=MemberPaymentStatus.PENDING,
+            created_at=datetime(2026, 1, 1),
+        )
+    ])
+    repo.upsert_bulk = AsyncMock(side_effect=lambda payments: payments)
+    return repo
+
+
+@pytest.fixture
+def client(test_app, member_repo, member_payment_repo):
+    test_app.dependency_overrides[get_auth_context] = _make_super_admin_ctx
+    test_app.dependency_overrides[get_member_repository] = lambda: member_repo
+    test_app.dependency_overrides[get_member_payment_repository] = lambda: member_payment_repo
+    return TestClient(test_app)
+
+
+@pytest.mark.api
+@pytest.mark.unit
+class TestImportPayments:
+    """Tests for POST /api/v1/import-export/payments/import."""
+
+    def test_upsert_resolves_rows_with_one_query_per_lookup(
+        self, client, member_repo, member_payment_repo
+    ):
+        """All rows are resolved with one member query, one payment query and one bulk write."""
+        payload = {
+            "mode": "upsert",
+            "payments": [
+                {"dni": "11111111A", "tipo_pago": "licencia_kyu", "ano": 2026, "monto": "45,5"},
+                {"dni": "22222222B", "tipo_pago": "licencia_dan", "ano": 2026, "monto": 60},
+                {"dni": "99999999Z", "tipo_pago": "licencia_dan", "ano": 2026, "monto": 60},
+            ],
+        }
+
+        response = client.post("/api/v1/import-export/payments/import", json=payload)
+
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+        assert data["updated"] == 1
+        assert data["imported"] == 1
+        assert data["failed"] == 1
+        assert "99999999Z" in data["errors"][0]
+
+        member_repo.find_by_dnis.assert_awaited_once()
+        member_payment_repo.find_by_member_ids_years.assert_awaited_once()
+        member_payment_repo.upsert_bulk.assert_awaited_once()
+
+        written = member_payment_repo.upsert_bulk.await_args.args[0]
+        assert len(written) == 2
+        updated = next(p for p in written if p.id == "507f1f77bcf86cd799439011")
+        assert updated.amount == 45.5
+
+    def test_repeated_row_updates_payment_created_earlier_in_import(
+        self, client, member_payment_repo
+    ):
+        """A second row for the same member, year and type updates the first instead of duplicating."""
+        member_payment_repo.find_by_member_ids_years.return_value = []
+        payload = {
+            "mode": "upsert",
+            "payments": [
+                {"dni": "22222222B", "tipo_pago": "licencia_dan", "ano": 2026, "monto": 60},
+                {"dni": "22222222B", "tipo_pago": "licencia_dan", "ano": 2026, "monto": 70},
+            ],
+        }
+
+        response = client.post("/api/v1/import-export/payments/import", json=payload)
+
+        data = response.json()
+        assert data["imported"] == 1
+        assert data["updated"] == 1
+        written = member_payment_repo.upsert_bulk.await_args.args[0]
+        assert len(written) == 1
+        assert written[0].amount == 70.0
+
+    def test_create_mode_does_not_load_existing_payments(self, client, member_payment_repo):
+        """Create mode never looks up existing payments."""
+        payload = {
+            "mode": "create",
+            "payments": [
+                {"dni": "11111111A", "tipo_pago": "licencia_kyu", "ano": 2026, "monto": 30},
+                {"dni": "", "tipo_pago": "licencia_kyu", "ano": 2026, "monto": 30},
+            ],
+        }
+
+        response = client.post("/api/v1/import-export/payments/import", json=payload)
+
+        data = response.json()
+        assert data["imported"] == 1
+        assert data["failed"] == 1
+        assert data["errors"] == ["Fila 2: DNI es obligatorio"]
+        member_payment_repo.find_by_member_ids_years.assert_not_called()
+
+    def test_partial_bulk_write_reports_saved_and_failed_rows(self, client, member_payment_repo):
+        """Rows written before the failing payment are counted; the failing one and later ones fail."""
+        member_payment_repo.find_by_member_ids_years.return_value = []
+        member_payment_repo.upsert_bulk.side_effect = PartialBulkWriteError(1, "duplicate key")
+        payload = {
+            "mode": "create",
+            "payments": [
+                {"dni": "11111111A", "tipo_pago": "licencia_kyu", "ano": 2026, "monto": 30},
+                {"dni": "22222222B", "tipo_pago": "licencia_dan", "ano": 2026, "monto": 60},
+                {"dni": "22222222B", "tipo_pago": "licencia_kyu", "ano": 2026, "monto": 30},
+            ],
+        }
+
+        response = client.post("/api/v1/import-export/payments/import", json=payload)
+
+        data = response.json()
+        assert data["imported"] == 1
+        assert data["failed"] == 2
+        assert data["errors"][0] == "Fila 2: duplicate key"
+        assert data["errors"][1].startswith("Fila 3: No se guardó")
+
+    def test_unsaved_upsert_row_is_reloaded_by_a_later_batch(
+        self, client, member_payment_repo, monkeypatch
+    ):
+        """A payment whose write failed is looked up again instead of reusing the unsaved copy."""
+        monkeypatch.setattr(
+            "src.infrastructure.web.routers.import_export.IMPORT_PAYMENTS_BATCH_SIZE", 1
+        )
+        member_payment_repo.upsert_bulk.side_effect = _fail_first_write()
+        payload = {
+            "mode": "upsert",
+            "payments": [
+                {"dni": "11111111A", "tipo_pago": "licencia_kyu", "ano": 2026, "monto": 45},
+                {"dni": "11111111A", "tipo_pago": "licencia_kyu", "ano": 2026, "monto": 50},
+            ],
+        }
+
+        response = client.post("/api/v1/import-export/payments/import", json=payload)
+
+        data = response.json()
+        assert data["updated"] == 1
+        assert data["failed"] == 1
+        assert member_payment_repo.find_by_member_ids_years.await_count == 2
+
+
+def _fail_first_write():
+    calls = []
+
+    async def upsert_bulk(payments):
+        calls.append(payments)
+        if len(calls) == 1:
+            raise PartialBulkWriteError(0, "write conflict")
+        return payments
+
+    return upsert_bulk
@@ -0,0 +1,245 @@
+"""Query budgets for the list endpoints most prone to N+1 loops.
+
+Pattern:
+- Minimal FastAPI app with QueryMetricsMiddleware and the router under test.
+- Repositories are mocks wrapped in CountingRepository, and the dashboard
+  reads a fake database, so every repository call or collection command
+  counts against the test's ``query_budget``.
+- Each test serves enough rows that a per-row lookup would exceed it.
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+from bson import ObjectId
+from unittest.mock import AsyncMock, MagicMock
+from fastapi import FastAPI, status
+from fastapi.testclient import TestClient
+
+from src.application.directory.club_directory import ClubDirectory
+from src.application.read_models.collection_version import CollectionVersion
+from src.application.read_models.member_ref import MemberRef
+from src.application.use_cases.license.get_all_licenses_use_case import GetAllLicensesUseCase
+from src.application.use_cases.member.get_all_members_use_case import GetAllMembersUseCase
+from src.domain.entities.club import Club
+from src.domain.entities.insurance import Insurance
+from src.domain.entities.license import License
+from src.domain.entities.member import Member
+from src.domain.entities.user import User, GlobalRole
+from src.infrastructure.web.authorization import AuthContext
+from src.infrastructure.web.dependencies import (
+    get_all_licenses_use_case,
+    get_all_members_use_case,
+    get_auth_context,
+    get_club_directory,
+    get_dashboard_cache,
+    get_insurance_repository,
+    get_license_repository,
+    get_member_repository,
+    get_search_members_use_case,
+)
+from src.infrastructure.web.middleware import QueryMetricsMiddleware
+from tests.plugins.query_budget import CountingRepository, record_query
+
+ROWS = 25
+
+
+def _make_super_admin_ctx() -> AuthContext:
+    return AuthContext(user=User(
+        id="user-super-admin-001",
+        email="superadmin@test.com",
+        username="superadmin",
+        hashed_password="hash",
+        global_role=GlobalRole.SUPER_ADMIN,
+    ))
+
+
+def _versioned_repository(collection: str) -> CountingRepository:
+    repository = MagicMock()
+    repository.get_collection_version = AsyncMock(
+        return_value=CollectionVersion(count=ROWS, last_modified=datetime(2026, 1, 1))
+    )
+    return CountingRepository(repository, collection)
+
+
+def _club_directory() -> ClubDirectory:
+    club_repo = MagicMock()
+    club_repo.find_all = AsyncMock(return_value=[
+        Club(id=f"c{n}", name=f"Club {n}", email=f"club{n}@test.com") for n in range(5)
+    ])
+    return ClubDirectory(CountingRepository(club_repo, "clubs"))
+
+
+@pytest.fixture
+def test_app():
+    from src.infrastructure.web.routers.dashboard import router as dashboard_router
+    from src.infrastructure.web.routers.licenses import router as licenses_router
+    from src.infrastructure.web.routers.members import router as members_router
+    app = FastAPI()
+    app.add_middleware(QueryMetricsMiddleware)
+    app.include_router(dashboard_router, prefix="/api/v1")
+    app.include_router(licenses_router, prefix="/api/v1")
+    app.include_router(members_router, prefix="/api/v1")
+    app.dependency_overrides[get_auth_context] = _make_super_admin_ctx
+    app.dependency_overrides[get_search_members_use_case] = lambda: MagicMock()
+    return app
+
+
+class _FakeCursor:
+    """Motor cursor over fixed documents; ``to_list`` runs the command."""
+
+    def __init__(self, collection: "_FakeCollection", command_name: str, query: dict, docs: list):
+        self._collection = collection
+        self._command_name = command_name
+        self._query = query
+        self._docs = docs
+        self._limit = 0
+
+    def sort(self, *args, **kwargs) -> "_FakeCursor":
+        return self
+
+    def limit(self, limit: int) -> "_FakeCursor":
+        self._limit = limit
+        return self
+
+    async def to_list(self, length=None) -> list:
+        record_query(self._command_name, self._collection.name, self._query)
+        return self._docs[:self._limit] if self._limit else list(self._docs)
+
+
+class _FakeCollection:
+    def __init__(self, name: str, docs: list):
+        self.name = name
+        self.docs = docs
+
+    async def count_documents(self, query: dict) -> int:
+        record_query("count", self.name, query)
+        return len(self.docs)
+
+    def aggregate(self, pipeline: list) -> _FakeCursor:
+        # Only the dashboard's count of paid clubs aggregates
+        return _FakeCursor(self, "aggregate", pipeline[0].get("$match", {}), [{"total": 1}])
+
+    def find(self, query: dict, projection=None) -> _FakeCursor:
+        return _FakeCursor(self, "find", query, self.docs)
+
+    async def find_one(self, query: dict):
+        record_query("find", self.name, query)
+        return self.docs[0] if self.docs else None
+
+
+class _FakeDatabase:
+    """Just enough of a Motor database for the dashboard, with fixed documents per collection."""
+
+    def __init__(self, docs_by_collection: dict):
+        self._collections = {name: _FakeCollection(name, docs) for name, docs in docs_by_collection.items()}
+
+    def __getitem__(self, name: str) -> _FakeCollection:
+        return self._collections.setdefault(name, _FakeCollection(name, []))
+
+    def with_options(self, **kwargs) -> "_FakeDatabase":
+        return self
+
+
+def _dashboard_database() -> _FakeDatabase:
+    now = datetime.utcnow()
+    member_ids = [ObjectId() for _ in range(ROWS)]
+    return _FakeDatabase({
+        "clubs": [{"_id": ObjectId()} for _ in range(5)],
+        "members": [
+            {"_id": member_id, "first_name": f"Name{n}", "last_name": "Garcia", "created_at": now}
+            for n, member_id in enumerate(member_ids)
+        ],
+        "licenses": [
+            {"_id": ObjectId(), "member_id": str(member_id), "license_number": f"LIC-{n}",
+             "expiration_date": now + timedelta(days=10), "updated_at": now}
+            for n, member_id in enumerate(member_ids)
+        ],
+        "transactions": [
+            {"_id": ObjectId(), "member_id": str(member_id), "club_id": "c0", "created_at": now}
+            for member_id in member_ids
+        ],
+        "seminars": [],
+    })
+
+
+@pytest.mark.api
+@pytest.mark.unit
+class TestListQueryBudgets:
+
+    @pytest.mark.query_budget(4)
+    def test_license_list_resolves_member_names_in_one_query(self, test_app, monkeypatch):
+        license_repo = _versioned_repository("licenses")
+        license_repo._repository.find_all = AsyncMock(return_value=[
+            License(id=f"l{n}", license_number=f"LIC-{n}", member_id=f"m{n}", grade="Kyu")
+            for n in range(ROWS)
+        ])
+        member_repo = _versioned_repository("members")
+        member_repo._repository.find_refs_by_ids = AsyncMock(return_value=[
+            MemberRef(id=f"m{n}", full_name=f"Name{n} Garcia") for n in range(ROWS)
+        ])
+        monkeypatch.setattr(
+            "src.infrastructure.web.routers.licenses.get_member_repository", lambda: member_repo
+        )
+        test_app.dependency_overrides[get_all_licenses_use_case] = lambda: GetAllLicensesUseCase(license_repo)
+        test_app.dependency_overrides[get_license_repository] = lambda: license_repo
+        test_app.dependency_overrides[get_member_repository] = lambda: member_repo
+
+        response = TestClient(test_app).get("/api/v1/licenses?limit=0")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert {item["member_name"] for item in response.json()["items"]} == {
+            f"Name{n} Garcia" for n in range(ROWS)
+        }
+
+    @pytest.mark.query_budget(7)
+    def test_member_list_enriches_members_in_batches(self, test_app):
+        member_repo = _versioned_repository("members")
+        member_repo._repository.find_by_spec = AsyncMock(return_value=[
+            Member(id=f"m{n}", first_name=f"Name{n}", last_name="Garcia", club_id=f"c{n % 5}")
+            for n in range(ROWS)
+        ])
+        license_repo = _versioned_repository("licenses")
+        license_repo._repository.find_by_member_ids = AsyncMock(return_value=[
+            License(id=f"l{n}", license_number=f"LIC-{n}", member_id=f"m{n}", grade="Kyu")
+            for n in range(ROWS)
+        ])
+        insurance_repo = _versioned_repository("insurances")
+        insurance_repo._repository.find_by_member_ids = AsyncMock(return_value=[
+            Insurance(id=f"i{n}", member_id=f"m{n}", policy_number=f"P-{n}", insurance_company="Mapfre") for n in range(ROWS)
+        ])
+        test_app.dependency_overrides[get_all_members_use_case] = lambda: GetAllMembersUseCase(member_repo)
+        test_app.dependency_overrides[get_member_repository] = lambda: member_repo
+        test_app.dependency_overrides[get_license_repository] = lambda: license_repo
+        test_app.dependency_overrides[get_insurance_repository] = lambda: insurance_repo
+        test_app.dependency_overrides[get_club_directory] = _club_directory
+
+        response = TestClient(test_app).get("/api/v1/members")
+
+        assert response.status_code == status.HTTP_200_OK
+        members = response.json()
+        assert len(members) == ROWS
+        assert all(m["license_summary"] and m["insurance_summary"] and m["club_name"] for m in members)
+
+    @pytest.mark.query_budget(12)
+    def test_dashboard_resolves_member_names_in_one_query(self, test_app, monkeypatch):
+        monkeypatch.setattr(
+            "src.infrastructure.web.routers.dashboard.get_database", _dashboard_database
+        )
+        dashboard_cache = MagicMock()
+
+        async def get_or_load(key, loader):
+            return await loader()
+
+        dashboard_cache.get_or_load = AsyncMock(side_effect=get_or_load)
+        test_app.dependency_overrides[get_dashboard_cache] = lambda: dashboard_cache
+        test_app.dependency_overrides[get_club_directory] = _club_directory
+
+        response = TestClient(test_app).get("/api/v1/dashboard/stats")
+
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+        assert [lic["member_name"] for lic in data["expiring_licenses"]] == [
+            f"Name{n} Garcia" for n in range(5)
+        ]
+        assert {"Name0 Garcia"} <= {activity["user"] for activity in data["recent_activity"]}
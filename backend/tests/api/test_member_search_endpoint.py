@@ -0,0 +1,114 @@
+"""API tests for the member name search endpoint.
+
+Pattern:
+- Minimal FastAPI app with the members router.
+- Use case and repositories replaced through app.dependency_overrides.
+- Assertions focus on the route being reachable next to /{member_id} and on
+  the club scoping passed to the use case.
+"""
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+from fastapi import FastAPI, status
+from fastapi.testclient import TestClient
+
+from src.domain.entities.member import ClubRole, Member
+from src.domain.entities.user import User, GlobalRole
+from src.infrastructure.web.authorization import AuthContext
+from src.infrastructure.web.dependencies import (
+    get_auth_context,
+    get_club_directory,
+    get_insurance_repository,
+    get_license_repository,
+    get_member_use_case,
+    get_search_members_use_case,
+)
+
+
+def _make_super_admin_ctx() -> AuthContext:
+    return AuthContext(user=User(
+        id="user-super-admin-001",
+        email="superadmin@test.com",
+        username="superadmin",
+        hashed_password="hash",
+        global_role=GlobalRole.SUPER_ADMIN,
+    ))
+
+
+def _make_club_admin_ctx(club_id="club-own") -> AuthContext:
+    return AuthContext(
+        user=User(
+            id="user-club-admin-001",
+            email="admin@test.com",
+            username="clubadmin",
+            hashed_password="hash",
+            global_role=GlobalRole.USER,
+        ),
+        member=Member(id="member-admin", first_name="Ana", last_name="Garcia",
+                      club_id=club_id, club_role=ClubRole.ADMIN),
+    )
+
+
+@pytest.fixture
+def search_use_case():
+    use_case = MagicMock()
+    use_case.execute = AsyncMock(return_value=[
+        Member(id="m1", first_name="Luis", last_name="Perez", club_id="club-own"),
+    ])
+    return use_case
+
+
+@pytest.fixture
+def member_use_case():
+    use_case = MagicMock()
+    use_case.execute = AsyncMock()
+    return use_case
+
+
+@pytest.fixture
+def test_app(search_use_case, member_use_case):
+    from src.infrastructure.web.routers.members import router
+    app = FastAPI()
+    app.include_router(router, prefix="/api/v1")
+    repository = MagicMock()
+    repository.find_by_member_ids = AsyncMock(return_value=[])
+    club_directory = MagicMock()
+    club_directory.names_by_id = AsyncMock(return_value={"club-own": "Club Ávila"})
+    app.dependency_overrides[get_search_members_use_case] = lambda: search_use_case
+    app.dependency_overrides[get_member_use_case] = lambda: member_use_case
+    app.dependency_overrides[get_license_repository] = lambda: repository
+    app.dependency_overrides[get_insurance_repository] = lambda: repository
+    app.dependency_overrides[get_club_directory] = lambda: club_directory
+    return app
+
+
+@pytest.mark.api
+@pytest.mark.unit
+class TestSearchMembers:
+
+    def test_search_is_not_taken_for_a_member_id(self, test_app, search_use_case, member_use_case):
+        test_app.dependency_overrides[get_auth_context] = _make_super_admin_ctx
+
+        response = TestClient(test_app).get("/api/v1/members/search?name=perez")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert [(m["id"], m["club_name"]) for m in response.json()] == [("m1", "Club Ávila")]
+        member_use_case.execute.assert_not_called()
+        assert search_use_case.execute.await_args.args == ("perez", 0, None)
+
+    def test_club_admin_searches_only_their_club(self, test_app, search_use_case):
+        test_app.dependency_overrides[get_auth_context] = _make_club_admin_ctx
+
+        response = TestClient(test_app).get("/api/v1/members/search?name=perez&limit=5")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert search_use_case.execute.await_args.args == ("perez", 5, "club-own")
+
+    def test_club_admin_without_club_gets_no_results(self, test_app, search_use_case):
+        test_app.dependency_overrides[get_auth_context] = lambda: _make_club_admin_ctx(club_id=None)
+
+        response = TestClient(test_app).get("/api/v1/members/search?name=perez")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json() == []
+        search_use_case.execute.assert_not_called()
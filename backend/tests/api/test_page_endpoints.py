@@ -0,0 +1,102 @@
+"""API tests for the keyset-paged payment and invoice list endpoints.
+
+Pattern:
+- Minimal FastAPI app with the payments and invoices routers.
+- Use cases replaced by AsyncMock through app.dependency_overrides.
+- Assertions focus on the club scoping and filter validation applied
+  before the use case is called.
+"""
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+from fastapi import FastAPI, status
+from fastapi.testclient import TestClient
+
+from src.application.read_models.page import Page
+from src.domain.entities.invoice import InvoiceStatus
+from src.domain.entities.member import Member
+from src.domain.entities.user import User, GlobalRole
+from src.infrastructure.web.authorization import AuthContext
+from src.infrastructure.web.dependencies import (
+    get_auth_context,
+    get_all_invoices_use_case,
+    get_all_payments_use_case,
+)
+
+
+def _make_super_admin_ctx() -> AuthContext:
+    return AuthContext(user=User(
+        id="user-super-admin-001",
+        email="superadmin@test.com",
+        username="superadmin",
+        hashed_password="hash",
+        global_role=GlobalRole.SUPER_ADMIN,
+    ))
+
+
+def _make_club_user_ctx() -> AuthContext:
+    return AuthContext(
+        user=User(
+            id="user-regular-001",
+            email="user@test.com",
+            username="regularuser",
+            hashed_password="hash",
+            global_role=GlobalRole.USER,
+        ),
+        member=Member(id="member-001", first_name="Ana", last_name="Garcia", club_id="club-own"),
+    )
+
+
+@pytest.fixture
+def use_case():
+    use_case = MagicMock()
+    use_case.execute_page = AsyncMock(return_value=Page(items=[], next_cursor=None))
+    return use_case
+
+
+@pytest.fixture
+def test_app(use_case):
+    from src.infrastructure.web.routers.invoices import router as invoices_router
+    from src.infrastructure.web.routers.payments import router as payments_router
+    app = FastAPI()
+    app.include_router(invoices_router, prefix="/api/v1")
+    app.include_router(payments_router, prefix="/api/v1")
+    app.dependency_overrides[get_all_invoices_use_case] = lambda: use_case
+    app.dependency_overrides[get_all_payments_use_case] = lambda: use_case
+    return app
+
+
+@pytest.mark.api
+@pytest.mark.unit
+class TestPageEndpoints:
+
+    def test_payments_page_is_scoped_to_the_users_club(self, test_app, use_case):
+        test_app.dependency_overrides[get_auth_context] = _make_club_user_ctx
+
+        response = TestClient(test_app).get("/api/v1/payments/page?club_id=club-other")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert use_case.execute_page.await_args.args[2] == "club-own"
+
+    def test_super_admin_pages_payments_of_any_club(self, test_app, use_case):
+        test_app.dependency_overrides[get_auth_context] = _make_super_admin_ctx
+
+        TestClient(test_app).get("/api/v1/payments/page?club_id=club-other")
+
+        assert use_case.execute_page.await_args.args[2] == "club-other"
+
+    def test_invoices_page_is_scoped_to_the_users_club(self, test_app, use_case):
+        test_app.dependency_overrides[get_auth_context] = _make_club_user_ctx
+
+        response = TestClient(test_app).get("/api/v1/invoices/page?status=paid")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert use_case.execute_page.await_args.args[2:] == (InvoiceStatus.PAID, "club-own")
+
+    def test_unknown_invoice_status_is_rejected(self, test_app, use_case):
+        test_app.dependency_overrides[get_auth_context] = _make_super_admin_ctx
+
+        response = TestClient(test_app).get("/api/v1/invoices/page?status=bogus")
+
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+        use_case.execute_page.assert_not_called()
@@ -0,0 +1,157 @@
+"""Tests for the in-process club directory."""
+
+import asyncio
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.domain.entities.club import Club
+from src.application.ports.read_routing import ReadRouting, current_read_routing, reporting
+from src.application.directory import ClubDirectory
+
+
+def _club(club_id, name, updated_at=None) -> Club:
+    return Club(id=club_id, name=name, email=f"{club_id}@example.com", updated_at=updated_at)
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def repository():
+    repository = MagicMock()
+    repository.find_all = AsyncMock(return_value=[
+        _club("c1", "Club Ávila", datetime(2026, 1, 1)),
+        _club("c2", "Aikido Madrid", datetime(2026, 3, 1)),
+    ])
+    return repository
+
+
+@pytest.fixture
+def clock():
+    return _Clock()
+
+
+@pytest.fixture
+def directory(repository, clock):
+    return ClubDirectory(repository, ttl_seconds=60, clock=clock)
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestClubDirectoryLookups:
+
+    async def test_clubs_are_loaded_once_for_many_lookups(self, directory, repository):
+        for _ in range(10):
+            await directory.get("c1")
+            await directory.names_by_id(["c1", "c2"])
+
+        repository.find_all.assert_awaited_once()
+
+    async def test_batch_lookups_skip_unknown_ids(self, directory):
+        assert await directory.names_by_id(["c1", "missing"]) == {"c1": "Club Ávila"}
+        assert list(await directory.get_many(["c2", "missing"])) == ["c2"]
+        assert await directory.get("missing") is None
+        assert await directory.get(None) is None
+
+    async def test_load_reads_the_primary_inside_a_reporting_call(self, directory, repository):
+        routings = []
+
+        async def find_all():
+            routings.append(current_read_routing())
+            return [_club("c1", "Club Ávila")]
+
+        repository.find_all = AsyncMock(side_effect=find_all)
+
+        @reporting
+        async def report():
+            await directory.all()
+            return current_read_routing()
+
+        assert await report() == ReadRouting.REPORTING
+        assert routings == [ReadRouting.PRIMARY]
+
+    async def test_all_is_ordered_by_name(self, directory):
+        assert [club.id for club in await directory.all()] == ["c2", "c1"]
+
+    async def test_name_lookup_ignores_case_and_accents(self, directory):
+        assert await directory.id_for_name("club avila") == "c1"
+        assert await directory.id_for_name("Unknown") is None
+
+    async def test_version_reflects_the_loaded_clubs(self, directory):
+        version = await directory.version()
+
+        assert (version.count, version.last_modified) == (2, datetime(2026, 3, 1))
+
+    async def test_callers_get_copies(self, directory):
+        club = await directory.get("c1")
+        club.name = "Changed"
+
+        assert (await directory.get("c1")).name == "Club Ávila"
+
+    async def test_concurrent_first_lookups_load_once(self, directory, repository):
+        await asyncio.gather(*(directory.get("c1") for _ in range(20)))
+
+        repository.find_all.assert_awaited_once()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestClubDirectoryRefresh:
+
+    async def test_clubs_are_reloaded_after_the_ttl(self, directory, repository, clock):
+        await directory.get("c1")
+        clock.now += 59
+        await directory.get("c1")
+        clock.now += 2
+        await directory.get("c1")
+
+        assert repository.find_all.await_count == 2
+
+    async def test_invalidate_forces_a_reload(self, directory, repository):
+        await directory.get("c1")
+        repository.find_all.return_value = [_club("c1", "Club Renamed")]
+
+        directory.invalidate()
+
+        assert (await directory.get("c1")).name == "Club Renamed"
+
+    async def test_load_overlapping_an_invalidate_is_not_kept(self, directory, repository):
+        started, release = asyncio.Event(), asyncio.Event()
+
+        async def slow_find_all():
+            started.set()
+            await release.wait()
+            return [_club("c1", "Old name")]
+
+        repository.find_all = AsyncMock(side_effect=slow_find_all)
+        lookup = asyncio.create_task(directory.get("c1"))
+        await started.wait()
+        directory.invalidate()
+        release.set()
+        await lookup
+
+        repository.find_all = AsyncMock(return_value=[_club("c1", "New name")])
+        assert (await directory.get("c1")).name == "New name"
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestClubDirectoryWrites:
+
+    async def test_written_invalidates_and_publishes(self, repository, clock):
+        publish = AsyncMock()
+        directory = ClubDirectory(repository, ttl_seconds=60, clock=clock, publish=publish)
+        await directory.get("c1")
+
+        await directory.written()
+        await directory.get("c1")
+
+        publish.assert_awaited_once()
+        assert repository.find_all.await_count == 2
@@ -0,0 +1,108 @@
+"""Tests for the in-memory member autocomplete index."""
+
+import pytest
+from unittest.mock import AsyncMock
+
+from src.domain.entities.member import Member
+from src.application.search.member_suggestion_index import MemberSuggestionIndex
+
+
+def _member(member_id, first_name, last_name, dni="", club_id="club-1") -> Member:
+    return Member(id=member_id, first_name=first_name, last_name=last_name, dni=dni, club_id=club_id)
+
+
+def _ids(refs):
+    return [ref.id for ref in refs]
+
+
+async def _stream(members):
+    for member in members:
+        yield member
+
+
+@pytest.fixture
+def index():
+    index = MemberSuggestionIndex()
+    index.upsert(_member("1", "José", "Núñez Ortega", dni="12345678Z"))
+    index.upsert(_member("2", "Josefa", "Ortiz", club_id="club-2"))
+    index.upsert(_member("3", "Ana", "Josa"))
+    return index
+
+
+@pytest.mark.unit
+class TestMemberSuggestionIndex:
+
+    def test_prefix_ignores_accents_and_case(self, index):
+        assert _ids(index.suggest("NUÑ")) == ["1"]
+
+    def test_every_query_word_must_match(self, index):
+        assert _ids(index.suggest("jos ort")) == ["1", "2"]
+
+    def test_full_word_matches_rank_first(self, index):
+        assert _ids(index.suggest("jose")) == ["1", "2"]
+        assert _ids(index.suggest("jos", limit=2)) == ["3", "1"]
+
+    def test_dni_prefix(self, index):
+        assert _ids(index.suggest("12.345")) == ["1"]
+
+    def test_club_filter(self, index):
+        assert _ids(index.suggest("jos", club_id="club-2")) == ["2"]
+
+    def test_update_replaces_old_keys(self, index):
+        index.upsert(_member("3", "Ana", "Lopez"))
+
+        assert "3" not in _ids(index.suggest("josa"))
+        assert _ids(index.suggest("lop")) == ["3"]
+
+    def test_remove_keeps_shared_prefixes_of_other_members(self, index):
+        index.remove("1")
+
+        assert _ids(index.suggest("jos")) == ["3", "2"]
+        assert index.suggest("12345") == []
+        assert len(index) == 2
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestMemberSuggestionIndexRebuild:
+
+    async def test_rebuild_replays_writes_made_while_streaming(self):
+        index = MemberSuggestionIndex()
+
+        async def members():
+            yield _member("1", "Ana", "Ruiz")
+            # Written through the use cases while the rebuild is streaming
+            index.upsert(_member("1", "Ana", "Serrano"))
+            index.remove("2")
+            yield _member("2", "Luis", "Ruiz")
+
+        assert not index.ready
+        await index.rebuild(members())
+
+        assert index.ready
+        assert index.suggest("ruiz") == []
+        assert _ids(index.suggest("serr")) == ["1"]
+
+    async def test_rebuild_drops_members_missing_from_source(self, index):
+        await index.rebuild(_stream([_member("9", "Marta", "Gil")]))
+
+        assert index.suggest("jos") == []
+        assert _ids(index.suggest("mar")) == ["9"]
+
+    async def test_written_publishes_to_the_other_workers(self):
+        publish = AsyncMock()
+        index = MemberSuggestionIndex(publish=publish)
+
+        index.upsert(_member("1", "Ana", "Ruiz"))
+        await index.written()
+
+        publish.assert_awaited_once()
+
+    async def test_invalidate_wakes_a_waiter_until_the_next_rebuild(self, index):
+        assert not await index.wait_stale(0)
+
+        index.invalidate()
+
+        assert await index.wait_stale(0)
+        await index.rebuild(_stream([]))
+        assert not await index.wait_stale(0)
@@ -16,8 +16,8 @@ from src.application.use_cases.insurance.generate_insurance_from_payment_use_cas
 def mock_insurance_repository():
     """Mock insurance repository for use case testing."""
     mock_repo = MagicMock()
-    mock_repo.find_active_by_member_year_type = AsyncMock(return_value=None)
-    mock_repo.create = AsyncMock()
+    mock_repo.find_by_member_ids = AsyncMock(return_value=[])
+    mock_repo.create_bulk = AsyncMock(side_effect=lambda insurances: insurances)
     return mock_repo
 
 
@@ -85,8 +85,7 @@ class TestGenerateInsuranceFromPaymentUseCase:
         payment_id = "payment123"
         payment_year = 2026
 
-        mock_insurance_repository.find_active_by_member_year_type.return_value = None
-        mock_insurance_repository.create.return_value = sample_insurance
+        mock_insurance_repository.create_bulk = AsyncMock(return_value=[sample_insurance])
 
         use_case = GenerateInsuranceFromPaymentUseCase(mock_insurance_repository)
 
@@ -96,11 +95,11 @@ class TestGenerateInsuranceFromPaymentUseCase:
         # Assert
         assert len(result) == 1
         assert result[0] == sample_insurance
-        mock_insurance_repository.find_active_by_member_year_type.assert_called_once()
-        mock_insurance_repository.create.assert_called_once()
+        mock_insurance_repository.find_by_member_ids.assert_called_once()
+        mock_insurance_repository.create_bulk.assert_called_once()
 
         # Verify the created insurance attributes
-        created_insurance = mock_insurance_repository.create.call_args[0][0]
+        created_insurance = mock_insurance_repository.create_bulk.call_args[0][0][0]
         assert created_insurance.member_id == "member123"
         assert created_insurance.insurance_type == InsuranceType.ACCIDENT
         assert created_insurance.policy_number == "PENDIENTE"
@@ -127,7 +126,7 @@ class TestGenerateInsuranceFromPaymentUseCase:
             payment_id="payment123"
         )
 
-        mock_insurance_repository.create.return_value = expected_insurance
+        mock_insurance_repository.create_bulk = AsyncMock(return_value=[expected_insurance])
         use_case = GenerateInsuranceFromPaymentUseCase(mock_insurance_repository)
 
         # Act
@@ -135,7 +134,7 @@ class TestGenerateInsuranceFromPaymentUseCase:
 
         # Assert
         assert len(result) == 1
-        created_insurance = mock_insurance_repository.create.call_args[0][0]
+        created_insurance = mock_insurance_repository.create_bulk.call_args[0][0][0]
         assert created_insurance.insurance_type == InsuranceType.CIVIL_LIABILITY
         assert created_insurance.member_id == "member456"
         assert created_insurance.policy_number == "PENDIENTE"
@@ -145,10 +144,6 @@ class TestGenerateInsuranceFromPaymentUseCase:
     ):
         """Test that execute uses default policy_number='PENDIENTE' for new insurance."""
         # Arrange
-        def create_side_effect(insurance):
-            return insurance
-
-        mock_insurance_repository.create.side_effect = create_side_effect
         use_case = GenerateInsuranceFromPaymentUseCase(mock_insurance_repository)
 
         # Act
@@ -163,10 +158,6 @@ class TestGenerateInsuranceFromPaymentUseCase:
     ):
         """Test that execute uses default insurance_company='Spain Aikikai'."""
         # Arrange
-        def create_side_effect(insurance):
-            return insurance
-
-        mock_insurance_repository.create.side_effect = create_side_effect
         use_case = GenerateInsuranceFromPaymentUseCase(mock_insurance_repository)
 
         # Act
@@ -193,7 +184,7 @@ class TestGenerateInsuranceFromPaymentUseCase:
             payment_id="payment123"
         )
 
-        mock_insurance_repository.find_active_by_member_year_type.return_value = existing_insurance
+        mock_insurance_repository.find_by_member_ids.return_value = [existing_insurance]
         use_case = GenerateInsuranceFromPaymentUseCase(mock_insurance_repository)
 
         # Act
@@ -201,8 +192,8 @@ class TestGenerateInsuranceFromPaymentUseCase:
 
         # Assert
         assert len(result) == 0  # No new insurance created
-        mock_insurance_repository.find_active_by_member_year_type.assert_called_once()
-        mock_insurance_repository.create.assert_not_called()
+        mock_insurance_repository.find_by_member_ids.assert_called_once()
+        mock_insurance_repository.create_bulk.assert_not_called()
 
     async def test_execute_skips_unrecognized_payment_types(self, mock_insurance_repository):
         """Test that execute skips payment types not in the insurance mapping."""
@@ -224,8 +215,8 @@ class TestGenerateInsuranceFromPaymentUseCase:
 
         # Assert
         assert len(result) == 0
-        mock_insurance_repository.find_active_by_member_year_type.assert_not_called()
-        mock_insurance_repository.create.assert_not_called()
+        mock_insurance_repository.find_by_member_ids.assert_not_called()
+        mock_insurance_repository.create_bulk.assert_not_called()
 
     async def test_execute_returns_empty_list_for_empty_member_payments(self, mock_insurance_repository):
         """Test that execute returns empty list when no member payments provided."""
@@ -237,8 +228,8 @@ class TestGenerateInsuranceFromPaymentUseCase:
 
         # Assert
         assert result == []
-        mock_insurance_repository.find_active_by_member_year_type.assert_not_called()
-        mock_insurance_repository.create.assert_not_called()
+        mock_insurance_repository.find_by_member_ids.assert_not_called()
+        mock_insurance_repository.create_bulk.assert_not_called()
 
     async def test_execute_creates_multiple_insurances_for_multiple_members(self, mock_insurance_repository):
         """Test that execute creates insurance for multiple members in a single call."""
@@ -256,10 +247,6 @@ class TestGenerateInsuranceFromPaymentUseCase:
             for i in range(3)
         ]
 
-        def create_side_effect(insurance):
-            return insurance
-
-        mock_insurance_repository.create.side_effect = create_side_effect
         use_case = GenerateInsuranceFromPaymentUseCase(mock_insurance_repository)
 
         # Act
@@ -286,10 +273,6 @@ class TestGenerateInsuranceFromPaymentUseCase:
             status=MemberPaymentStatus.COMPLETED
         )
 
-        def create_side_effect(insurance):
-            return insurance
-
-        mock_insurance_repository.create.side_effect = create_side_effect
         use_case = GenerateInsuranceFromPaymentUseCase(mock_insurance_repository)
 
         # Act
@@ -297,7 +280,7 @@ class TestGenerateInsuranceFromPaymentUseCase:
 
         # Assert
         assert len(result) == 1
-        created_insurance = mock_insurance_repository.create.call_args[0][0]
+        created_insurance = mock_insurance_repository.create_bulk.call_args[0][0][0]
         assert created_insurance.start_date == datetime(2027, 1, 1)
         assert created_insurance.end_date == datetime(2027, 12, 31, 23, 59, 59)
 
@@ -325,10 +308,6 @@ class TestGenerateInsuranceFromPaymentUseCase:
             )
         ]
 
-        def create_side_effect(insurance):
-            return insurance
-
-        mock_insurance_repository.create.side_effect = create_side_effect
         use_case = GenerateInsuranceFromPaymentUseCase(mock_insurance_repository)
 
         # Act
@@ -353,10 +332,6 @@ class TestGenerateInsuranceFromPaymentUseCase:
             status=MemberPaymentStatus.COMPLETED
         )
 
-        def create_side_effect(insurance):
-            return insurance
-
-        mock_insurance_repository.create.side_effect = create_side_effect
         use_case = GenerateInsuranceFromPaymentUseCase(mock_insurance_repository)
 
         # Act
@@ -369,10 +344,10 @@ class TestGenerateInsuranceFromPaymentUseCase:
     async def test_execute_propagates_repository_exceptions_from_find(
         self, mock_insurance_repository, sample_accident_member_payment
     ):
-        """Test that execute propagates repository exceptions from find_active_by_member_year_type."""
+        """Test that execute propagates repository exceptions from find_by_member_ids."""
         # Arrange
         repository_error = Exception("Database connection failed")
-        mock_insurance_repository.find_active_by_member_year_type.side_effect = repository_error
+        mock_insurance_repository.find_by_member_ids.side_effect = repository_error
         use_case = GenerateInsuranceFromPaymentUseCase(mock_insurance_repository)
 
         # Act & Assert
@@ -384,10 +359,10 @@ class TestGenerateInsuranceFromPaymentUseCase:
     async def test_execute_propagates_repository_exceptions_from_create(
         self, mock_insurance_repository, sample_accident_member_payment
     ):
-        """Test that execute propagates repository exceptions from create operation."""
+        """Test that execute propagates repository exceptions from create_bulk operation."""
         # Arrange
         repository_error = Exception("Insert operation failed")
-        mock_insurance_repository.create.side_effect = repository_error
+        mock_insurance_repository.create_bulk.side_effect = repository_error
         use_case = GenerateInsuranceFromPaymentUseCase(mock_insurance_repository)
 
         # Act & Assert
@@ -420,10 +395,6 @@ class TestGenerateInsuranceFromPaymentUseCase:
             )
         ]
 
-        def create_side_effect(insurance):
-            return insurance
-
-        mock_insurance_repository.create.side_effect = create_side_effect
         use_case = GenerateInsuranceFromPaymentUseCase(mock_insurance_repository)
 
         # Act
@@ -466,10 +437,6 @@ class TestGenerateInsuranceFromPaymentUseCase:
             )
         ]
 
-        def create_side_effect(insurance):
-            return insurance
-
-        mock_insurance_repository.create.side_effect = create_side_effect
         use_case = GenerateInsuranceFromPaymentUseCase(mock_insurance_repository)
 
         # Act
@@ -477,10 +444,10 @@ class TestGenerateInsuranceFromPaymentUseCase:
 
         # Assert
         assert len(result) == 2  # Only insurance types processed
-        assert mock_insurance_repository.create.call_count == 2
+        assert len(mock_insurance_repository.create_bulk.call_args[0][0]) == 2
 
-    async def test_execute_calls_find_with_correct_parameters(self, mock_insurance_repository):
-        """Test that execute calls find_active_by_member_year_type with correct parameters."""
+    async def test_execute_loads_existing_insurances_in_one_query(self, mock_insurance_repository):
+        """Test that execute loads existing insurances for the payment's members in one query."""
         # Arrange
         member_payment = MemberPayment(
             payment_id="payment123",
@@ -492,21 +459,13 @@ class TestGenerateInsuranceFromPaymentUseCase:
             status=MemberPaymentStatus.COMPLETED
         )
 
-        def create_side_effect(insurance):
-            return insurance
-
-        mock_insurance_repository.create.side_effect = create_side_effect
         use_case = GenerateInsuranceFromPaymentUseCase(mock_insurance_repository)
 
         # Act
         result = await use_case.execute([member_payment], "payment123", 2026)
 
         # Assert
-        mock_insurance_repository.find_active_by_member_year_type.assert_called_once_with(
-            member_id="member_test_123",
-            payment_year=2026,
-            insurance_type=InsuranceType.ACCIDENT
-        )
+        mock_insurance_repository.find_by_member_ids.assert_called_once_with(["member_test_123"])
 
     async def test_execute_handles_partial_idempotency(self, mock_insurance_repository):
         """Test that execute creates only non-existing insurances when some already exist."""
@@ -544,20 +503,8 @@ class TestGenerateInsuranceFromPaymentUseCase:
             status=InsuranceStatus.ACTIVE
         )
 
-        call_count = [0]
-
-        def find_side_effect(member_id, payment_year, insurance_type):
-            call_count[0] += 1
-            if member_id == "member1":
-                return existing_insurance
-            return None
-
-        mock_insurance_repository.find_active_by_member_year_type.side_effect = find_side_effect
-
-        def create_side_effect(insurance):
-            return insurance
+        mock_insurance_repository.find_by_member_ids.return_value = [existing_insurance]
 
-        mock_insurance_repository.create.side_effect = create_side_effect
         use_case = GenerateInsuranceFromPaymentUseCase(mock_insurance_repository)
 
         # Act
@@ -566,7 +513,7 @@ class TestGenerateInsuranceFromPaymentUseCase:
         # Assert
         assert len(result) == 1  # Only member2 insurance created
         assert result[0].member_id == "member2"
-        assert mock_insurance_repository.create.call_count == 1
+        assert len(mock_insurance_repository.create_bulk.call_args[0][0]) == 1
 
 
 @pytest.mark.unit
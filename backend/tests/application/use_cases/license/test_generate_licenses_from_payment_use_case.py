@@ -15,15 +15,20 @@ from src.application.use_cases.license.generate_licenses_from_payment_use_case i
 )
 
 
+def _reserve_numbers(already_issued):
+    """Build a reserve_license_numbers fake continuing after ``already_issued``."""
+    def reserve(prefix, count):
+        return [f"{prefix}{n:04d}" for n in range(already_issued + 1, already_issued + count + 1)]
+    return reserve
+
+
 @pytest.fixture
 def mock_license_repository():
     """Mock license repository for use case testing."""
     mock_repo = MagicMock()
-    mock_repo.find_active_by_member_year = AsyncMock(return_value=None)
-    mock_repo.find_by_member_id = AsyncMock(return_value=[])
-    mock_repo.count_by_license_number_prefix = AsyncMock(return_value=0)
-    mock_repo.create = AsyncMock()
-    mock_repo.update = AsyncMock()
+    mock_repo.find_by_member_ids = AsyncMock(return_value=[])
+    mock_repo.reserve_license_numbers = AsyncMock(side_effect=_reserve_numbers(0))
+    mock_repo.upsert_bulk = AsyncMock(side_effect=lambda licenses: licenses)
     return mock_repo
 
 
@@ -75,9 +80,8 @@ class TestGenerateLicensesFromPaymentUseCase:
         payment_id = "payment123"
         payment_year = 2026
 
-        mock_license_repository.find_active_by_member_year.return_value = None
-        mock_license_repository.count_by_license_number_prefix.return_value = 0
-        mock_license_repository.create.return_value = sample_license
+        mock_license_repository.reserve_license_numbers.side_effect = _reserve_numbers(0)
+        mock_license_repository.upsert_bulk = AsyncMock(return_value=[sample_license])
 
         use_case = GenerateLicensesFromPaymentUseCase(mock_license_repository)
 
@@ -87,12 +91,12 @@ class TestGenerateLicensesFromPaymentUseCase:
         # Assert
         assert len(result) == 1
         assert result[0] == sample_license
-        mock_license_repository.find_active_by_member_year.assert_called_once()
-        mock_license_repository.count_by_license_number_prefix.assert_called_once_with("LIC-2026-")
-        mock_license_repository.create.assert_called_once()
+        mock_license_repository.find_by_member_ids.assert_called_once()
+        mock_license_repository.reserve_license_numbers.assert_called_once_with("LIC-2026-", 1)
+        mock_license_repository.upsert_bulk.assert_called_once()
 
         # Verify the created license attributes
-        created_license = mock_license_repository.create.call_args[0][0]
+        created_license = mock_license_repository.upsert_bulk.call_args[0][0][0]
         assert created_license.license_number == "LIC-2026-0001"
         assert created_license.member_id == "member123"
         assert created_license.grade == "Kyu"
@@ -133,7 +137,7 @@ class TestGenerateLicensesFromPaymentUseCase:
             last_payment_id="payment123"
         )
 
-        mock_license_repository.create.return_value = expected_license
+        mock_license_repository.upsert_bulk = AsyncMock(return_value=[expected_license])
         use_case = GenerateLicensesFromPaymentUseCase(mock_license_repository)
 
         # Act
@@ -141,7 +145,7 @@ class TestGenerateLicensesFromPaymentUseCase:
 
         # Assert
         assert len(result) == 1
-        created_license = mock_license_repository.create.call_args[0][0]
+        created_license = mock_license_repository.upsert_bulk.call_args[0][0][0]
         assert created_license.age_category == AgeCategory.INFANTIL
         assert created_license.grade == "Kyu Infantil"
 
@@ -173,7 +177,7 @@ class TestGenerateLicensesFromPaymentUseCase:
             last_payment_id="payment123"
         )
 
-        mock_license_repository.create.return_value = expected_license
+        mock_license_repository.upsert_bulk = AsyncMock(return_value=[expected_license])
         use_case = GenerateLicensesFromPaymentUseCase(mock_license_repository)
 
         # Act
@@ -181,7 +185,7 @@ class TestGenerateLicensesFromPaymentUseCase:
 
         # Assert
         assert len(result) == 1
-        created_license = mock_license_repository.create.call_args[0][0]
+        created_license = mock_license_repository.upsert_bulk.call_args[0][0][0]
         assert created_license.technical_grade == TechnicalGrade.DAN
         assert created_license.license_type == LicenseType.DAN
         assert created_license.grade == "Dan"
@@ -214,7 +218,7 @@ class TestGenerateLicensesFromPaymentUseCase:
             last_payment_id="payment123"
         )
 
-        mock_license_repository.create.return_value = expected_license
+        mock_license_repository.upsert_bulk = AsyncMock(return_value=[expected_license])
         use_case = GenerateLicensesFromPaymentUseCase(mock_license_repository)
 
         # Act
@@ -222,7 +226,7 @@ class TestGenerateLicensesFromPaymentUseCase:
 
         # Assert
         assert len(result) == 1
-        created_license = mock_license_repository.create.call_args[0][0]
+        created_license = mock_license_repository.upsert_bulk.call_args[0][0][0]
         assert created_license.technical_grade == TechnicalGrade.DAN
         assert created_license.instructor_category == InstructorCategory.FUKUSHIDOIN
         assert created_license.license_type == LicenseType.INSTRUCTOR
@@ -245,7 +249,7 @@ class TestGenerateLicensesFromPaymentUseCase:
             age_category=AgeCategory.ADULTO
         )
 
-        mock_license_repository.find_active_by_member_year.return_value = existing_license
+        mock_license_repository.find_by_member_ids.return_value = [existing_license]
         use_case = GenerateLicensesFromPaymentUseCase(mock_license_repository)
 
         # Act
@@ -253,9 +257,9 @@ class TestGenerateLicensesFromPaymentUseCase:
 
         # Assert
         assert len(result) == 0  # No new licenses created
-        mock_license_repository.find_active_by_member_year.assert_called_once()
-        mock_license_repository.count_by_license_number_prefix.assert_not_called()
-        mock_license_repository.create.assert_not_called()
+        mock_license_repository.find_by_member_ids.assert_called_once()
+        mock_license_repository.reserve_license_numbers.assert_not_called()
+        mock_license_repository.upsert_bulk.assert_not_called()
 
     async def test_execute_creates_shidoin_license_successfully(self, mock_license_repository):
         """Test that execute creates a SHIDOIN instructor license with correct categories."""
@@ -270,11 +274,7 @@ class TestGenerateLicensesFromPaymentUseCase:
             status=MemberPaymentStatus.COMPLETED
         )
 
-        def create_side_effect(license):
-            return license
-
-        mock_license_repository.create.side_effect = create_side_effect
-        mock_license_repository.count_by_license_number_prefix.return_value = 0
+        mock_license_repository.reserve_license_numbers.side_effect = _reserve_numbers(0)
         use_case = GenerateLicensesFromPaymentUseCase(mock_license_repository)
 
         # Act
@@ -282,7 +282,7 @@ class TestGenerateLicensesFromPaymentUseCase:
 
         # Assert
         assert len(result) == 1
-        created_license = mock_license_repository.create.call_args[0][0]
+        created_license = mock_license_repository.upsert_bulk.call_args[0][0][0]
         assert created_license.technical_grade == TechnicalGrade.DAN
         assert created_license.instructor_category == InstructorCategory.SHIDOIN
         assert created_license.license_type == LicenseType.INSTRUCTOR
@@ -308,9 +308,9 @@ class TestGenerateLicensesFromPaymentUseCase:
 
         # Assert
         assert len(result) == 0
-        mock_license_repository.find_active_by_member_year.assert_not_called()
-        mock_license_repository.count_by_license_number_prefix.assert_not_called()
-        mock_license_repository.create.assert_not_called()
+        mock_license_repository.find_by_member_ids.assert_not_called()
+        mock_license_repository.reserve_license_numbers.assert_not_called()
+        mock_license_repository.upsert_bulk.assert_not_called()
 
     async def test_execute_returns_empty_list_for_empty_member_payments(self, mock_license_repository):
         """Test that execute returns empty list when no member payments provided."""
@@ -322,9 +322,9 @@ class TestGenerateLicensesFromPaymentUseCase:
 
         # Assert
         assert result == []
-        mock_license_repository.find_active_by_member_year.assert_not_called()
-        mock_license_repository.count_by_license_number_prefix.assert_not_called()
-        mock_license_repository.create.assert_not_called()
+        mock_license_repository.find_by_member_ids.assert_not_called()
+        mock_license_repository.reserve_license_numbers.assert_not_called()
+        mock_license_repository.upsert_bulk.assert_not_called()
 
     async def test_execute_generates_sequential_license_numbers(self, mock_license_repository):
         """Test that execute generates sequential license numbers for multiple members."""
@@ -342,21 +342,6 @@ class TestGenerateLicensesFromPaymentUseCase:
             for i in range(3)
         ]
 
-        # Mock count to return incrementing values
-        call_count = [0]
-
-        def count_side_effect(prefix):
-            result = call_count[0]
-            call_count[0] += 1
-            return result
-
-        mock_license_repository.count_by_license_number_prefix.side_effect = count_side_effect
-
-        # Mock create to return license with the same number
-        def create_side_effect(license):
-            return license
-
-        mock_license_repository.create.side_effect = create_side_effect
 
         use_case = GenerateLicensesFromPaymentUseCase(mock_license_repository)
 
@@ -398,8 +383,8 @@ class TestGenerateLicensesFromPaymentUseCase:
             last_payment_id="payment123"
         )
 
-        mock_license_repository.count_by_license_number_prefix.return_value = 4  # Next should be 0005
-        mock_license_repository.create.return_value = expected_license
+        mock_license_repository.reserve_license_numbers.side_effect = _reserve_numbers(4)  # Next should be 0005
+        mock_license_repository.upsert_bulk = AsyncMock(return_value=[expected_license])
         use_case = GenerateLicensesFromPaymentUseCase(mock_license_repository)
 
         # Act
@@ -407,9 +392,9 @@ class TestGenerateLicensesFromPaymentUseCase:
 
         # Assert
         assert len(result) == 1
-        mock_license_repository.count_by_license_number_prefix.assert_called_once_with("LIC-2027-")
+        mock_license_repository.reserve_license_numbers.assert_called_once_with("LIC-2027-", 1)
 
-        created_license = mock_license_repository.create.call_args[0][0]
+        created_license = mock_license_repository.upsert_bulk.call_args[0][0][0]
         assert created_license.license_number == "LIC-2027-0005"
         assert created_license.issue_date == datetime(2027, 1, 1)
         assert created_license.expiration_date == datetime(2027, 12, 31, 23, 59, 59)
@@ -447,11 +432,7 @@ class TestGenerateLicensesFromPaymentUseCase:
             )
         ]
 
-        def create_side_effect(license):
-            return license
-
-        mock_license_repository.create.side_effect = create_side_effect
-        mock_license_repository.count_by_license_number_prefix.return_value = 0
+        mock_license_repository.reserve_license_numbers.side_effect = _reserve_numbers(0)
 
         use_case = GenerateLicensesFromPaymentUseCase(mock_license_repository)
 
@@ -465,10 +446,10 @@ class TestGenerateLicensesFromPaymentUseCase:
         assert result[2].instructor_category == InstructorCategory.FUKUSHIDOIN
 
     async def test_execute_propagates_repository_exceptions_from_find(self, mock_license_repository, sample_member_payment):
-        """Test that execute propagates repository exceptions from find_active_by_member_year."""
+        """Test that execute propagates repository exceptions from find_by_member_ids."""
         # Arrange
         repository_error = Exception("Database connection failed")
-        mock_license_repository.find_active_by_member_year.side_effect = repository_error
+        mock_license_repository.find_by_member_ids.side_effect = repository_error
         use_case = GenerateLicensesFromPaymentUseCase(mock_license_repository)
 
         # Act & Assert
@@ -477,11 +458,11 @@ class TestGenerateLicensesFromPaymentUseCase:
 
         assert str(exc_info.value) == "Database connection failed"
 
-    async def test_execute_propagates_repository_exceptions_from_count(self, mock_license_repository, sample_member_payment):
-        """Test that execute propagates repository exceptions from count_by_license_number_prefix."""
+    async def test_execute_propagates_repository_exceptions_from_reserve(self, mock_license_repository, sample_member_payment):
+        """Test that execute propagates repository exceptions from reserve_license_numbers."""
         # Arrange
         repository_error = Exception("Count operation failed")
-        mock_license_repository.count_by_license_number_prefix.side_effect = repository_error
+        mock_license_repository.reserve_license_numbers.side_effect = repository_error
         use_case = GenerateLicensesFromPaymentUseCase(mock_license_repository)
 
         # Act & Assert
@@ -491,10 +472,10 @@ class TestGenerateLicensesFromPaymentUseCase:
         assert str(exc_info.value) == "Count operation failed"
 
     async def test_execute_propagates_repository_exceptions_from_create(self, mock_license_repository, sample_member_payment):
-        """Test that execute propagates repository exceptions from create operation."""
+        """Test that execute propagates repository exceptions from upsert_bulk operation."""
         # Arrange
         repository_error = Exception("Insert operation failed")
-        mock_license_repository.create.side_effect = repository_error
+        mock_license_repository.upsert_bulk.side_effect = repository_error
         use_case = GenerateLicensesFromPaymentUseCase(mock_license_repository)
 
         # Act & Assert
@@ -516,12 +497,8 @@ class TestGenerateLicensesFromPaymentUseCase:
             status=MemberPaymentStatus.COMPLETED
         )
 
-        mock_license_repository.count_by_license_number_prefix.return_value = 999  # Next is 1000
-
-        def create_side_effect(license):
-            return license
+        mock_license_repository.reserve_license_numbers.side_effect = _reserve_numbers(999)  # Next is 1000
 
-        mock_license_repository.create.side_effect = create_side_effect
         use_case = GenerateLicensesFromPaymentUseCase(mock_license_repository)
 
         # Act
@@ -564,11 +541,7 @@ class TestGenerateLicensesFromPaymentUseCase:
             )
         ]
 
-        def create_side_effect(license):
-            return license
-
-        mock_license_repository.create.side_effect = create_side_effect
-        mock_license_repository.count_by_license_number_prefix.return_value = 0
+        mock_license_repository.reserve_license_numbers.side_effect = _reserve_numbers(0)
 
         use_case = GenerateLicensesFromPaymentUseCase(mock_license_repository)
 
@@ -577,7 +550,7 @@ class TestGenerateLicensesFromPaymentUseCase:
 
         # Assert
         assert len(result) == 2  # KYU and SHIDOIN processed, SEGURO skipped
-        assert mock_license_repository.create.call_count == 2
+        assert len(mock_license_repository.upsert_bulk.call_args[0][0]) == 2
 
     async def test_execute_renews_existing_license_instead_of_skipping(self, mock_license_repository):
         """Test that when an older license exists for a member, it renews it."""
@@ -607,9 +580,7 @@ class TestGenerateLicensesFromPaymentUseCase:
             last_payment_id="old_payment_123"
         )
 
-        mock_license_repository.find_active_by_member_year.return_value = None
-        mock_license_repository.find_by_member_id.return_value = [existing_license]
-        mock_license_repository.update = AsyncMock(side_effect=lambda lic: lic)
+        mock_license_repository.find_by_member_ids.return_value = [existing_license]
 
         use_case = GenerateLicensesFromPaymentUseCase(mock_license_repository)
 
@@ -618,10 +589,10 @@ class TestGenerateLicensesFromPaymentUseCase:
 
         # Assert — license was renewed, not created
         assert len(result) == 1
-        mock_license_repository.create.assert_not_called()
-        mock_license_repository.update.assert_called_once()
+        mock_license_repository.reserve_license_numbers.assert_not_called()
+        mock_license_repository.upsert_bulk.assert_called_once()
 
-        renewed = mock_license_repository.update.call_args[0][0]
+        renewed = mock_license_repository.upsert_bulk.call_args[0][0][0]
         assert renewed.id == "existing_lic_id"
         assert renewed.expiration_date == datetime(2026, 12, 31, 23, 59, 59)
         assert renewed.status == LicenseStatus.ACTIVE
@@ -631,10 +602,9 @@ class TestGenerateLicensesFromPaymentUseCase:
     async def test_execute_creates_new_license_when_no_existing_license_for_member(self, mock_license_repository, sample_member_payment, sample_license):
         """Test that when no license exists at all for the member, a new one is created."""
         # Arrange
-        mock_license_repository.find_active_by_member_year.return_value = None
-        mock_license_repository.find_by_member_id.return_value = []
-        mock_license_repository.count_by_license_number_prefix.return_value = 0
-        mock_license_repository.create.return_value = sample_license
+        mock_license_repository.find_by_member_ids.return_value = []
+        mock_license_repository.reserve_license_numbers.side_effect = _reserve_numbers(0)
+        mock_license_repository.upsert_bulk = AsyncMock(return_value=[sample_license])
 
         use_case = GenerateLicensesFromPaymentUseCase(mock_license_repository)
 
@@ -643,8 +613,35 @@ class TestGenerateLicensesFromPaymentUseCase:
 
         # Assert
         assert len(result) == 1
-        mock_license_repository.create.assert_called_once()
+        mock_license_repository.upsert_bulk.assert_called_once()
+
+
+    async def test_execute_batches_lookups_and_writes(self, mock_license_repository):
+        """Existing licenses are loaded once, numbers reserved as a block and written once."""
+        member_payments = [
+            MemberPayment(
+                payment_id="payment123",
+                member_id=member_id,
+                payment_year=2026,
+                payment_type=payment_type,
+                concept="Licencia",
+                amount=50.0,
+                status=MemberPaymentStatus.COMPLETED
+            )
+            for member_id, payment_type in [
+                ("member1", MemberPaymentType.LICENCIA_KYU),
+                ("member2", MemberPaymentType.LICENCIA_DAN),
+                ("member1", MemberPaymentType.LICENCIA_KYU),  # same license twice
+            ]
+        ]
+        use_case = GenerateLicensesFromPaymentUseCase(mock_license_repository)
+
+        result = await use_case.execute(member_payments, "payment123", 2026)
 
+        assert [lic.member_id for lic in result] == ["member1", "member2"]
+        mock_license_repository.find_by_member_ids.assert_called_once_with(["member1", "member2"])
+        mock_license_repository.reserve_license_numbers.assert_called_once_with("LIC-2026-", 2)
+        mock_license_repository.upsert_bulk.assert_called_once()
 
 @pytest.mark.unit
 class TestPaymentTypeToLicenseAttrsMapping:
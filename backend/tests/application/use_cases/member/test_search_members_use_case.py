@@ -0,0 +1,80 @@
+"""Tests for SearchMembersUseCase.
+
+A complete DNI/NIE or an email address is an exact-match lookup; other text
+is a token prefix search whose results are ranked in the use case. Club and
+status scoping always travel inside the repository query.
+"""
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from src.domain.entities.member import Member
+from src.application.search.member_search import name_tokens, rank_members
+from src.application.use_cases.member.search_members_use_case import (
+    CANDIDATES_PER_RESULT,
+    SearchMembersUseCase,
+)
+
+
+def _member(member_id: str, first_name: str, last_name: str) -> Member:
+    return Member(id=member_id, first_name=first_name, last_name=last_name)
+
+
+@pytest.fixture
+def member_repository():
+    repo = MagicMock()
+    repo.find_by_spec = AsyncMock(return_value=[])
+    repo.search_by_name = AsyncMock(return_value=[])
+    return repo
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestSearchMembersUseCase:
+
+    async def test_dni_is_matched_exactly_within_club(self, member_repository):
+        await SearchMembersUseCase(member_repository).execute("12.345.678-z", club_id="club-1")
+
+        spec = member_repository.find_by_spec.await_args.args[0]
+        assert spec.filters == {"club_id": "club-1", "dni": "12345678Z"}
+        member_repository.search_by_name.assert_not_called()
+
+    async def test_email_is_matched_exactly(self, member_repository):
+        await SearchMembersUseCase(member_repository).execute(" Ana@Example.COM ", status="active")
+
+        spec = member_repository.find_by_spec.await_args.args[0]
+        assert spec.filters == {"status": "active", "email": "ana@example.com"}
+
+    async def test_name_search_ranks_candidates_and_applies_limit(self, member_repository):
+        member_repository.search_by_name.return_value = [
+            _member("1", "Marta", "Anaya Ruiz"),
+            _member("2", "Ana", "García López"),
+            _member("3", "Anabel", "García"),
+        ]
+
+        result = await SearchMembersUseCase(member_repository).execute(
+            "ana garcia", limit=2, club_id="club-1"
+        )
+
+        name, spec = member_repository.search_by_name.await_args.args
+        assert name == "ana garcia"
+        assert spec.filters == {"club_id": "club-1"}
+        assert spec.limit == 2 * CANDIDATES_PER_RESULT
+        assert [m.id for m in result] == ["2", "3"]
+
+    async def test_blank_query_returns_nothing(self, member_repository):
+        assert await SearchMembersUseCase(member_repository).execute("   ") == []
+        member_repository.search_by_name.assert_not_called()
+        member_repository.find_by_spec.assert_not_called()
+
+
+@pytest.mark.unit
+class TestMemberSearchHelpers:
+
+    def test_name_tokens_fold_accents_case_and_hyphens(self):
+        assert name_tokens("José Ángel", "Muñoz-Pérez") == ["jose", "angel", "munoz", "perez"]
+
+    def test_surname_first_query_ranks_full_match_first(self):
+        members = [_member("1", "Luis", "Perez"), _member("2", "Luisa", "Pérez Gil")]
+
+        assert [m.id for m in rank_members("perez luisa", members)] == ["2", "1"]
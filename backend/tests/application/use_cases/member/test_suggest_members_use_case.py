@@ -0,0 +1,40 @@
+"""Tests for SuggestMembersUseCase."""
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from src.domain.entities.member import Member
+from src.application.read_models import MemberRef
+from src.application.search.member_suggestion_index import MemberSuggestionIndex
+from src.application.use_cases.member.suggest_members_use_case import SuggestMembersUseCase
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestSuggestMembersUseCase:
+
+    async def test_ready_index_answers_without_database(self):
+        index = MemberSuggestionIndex()
+        await index.rebuild(_single(Member(id="1", first_name="Ana", last_name="Ruiz", club_id="c1")))
+        search = MagicMock()
+        search.execute = AsyncMock()
+
+        result = await SuggestMembersUseCase(index, search).execute("ru", club_id="c1")
+
+        assert result == [MemberRef(id="1", full_name="Ana Ruiz", club_id="c1")]
+        search.execute.assert_not_called()
+
+    async def test_falls_back_to_search_until_index_is_built(self):
+        search = MagicMock()
+        search.execute = AsyncMock(return_value=[
+            Member(id="1", first_name="Ana", last_name="Ruiz", club_id="c1"),
+        ])
+
+        result = await SuggestMembersUseCase(MemberSuggestionIndex(), search).execute("ru", 5, "c1")
+
+        search.execute.assert_awaited_once_with("ru", 5, "c1")
+        assert result == [MemberRef(id="1", full_name="Ana Ruiz", club_id="c1")]
+
+
+async def _single(member):
+    yield member
@@ -1,19 +1,17 @@
 """Tests for GetClubMemberPaymentsUseCase."""
 
 import pytest
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock
 
 from src.application.use_cases.member_payment.get_club_member_payments_use_case import (
     GetClubMemberPaymentsUseCase,
 )
+from src.application.read_models import MemberRef
 from src.domain.entities.member_payment import MemberPayment, MemberPaymentType, MemberPaymentStatus
 
 
 def _make_member(member_id):
-    m = MagicMock()
-    m.id = member_id
-    m.get_full_name.return_value = f"Name {member_id}"
-    return m
+    return MemberRef(id=member_id, full_name=f"Name {member_id}", club_id="club1")
 
 
 def _make_member_payment(mp_id: str, member_id: str) -> MemberPayment:
@@ -55,7 +53,7 @@ class TestGetClubMemberPaymentsUseCase:
 
     async def test_no_members_returns_empty_list(self, use_case, mock_member_repo, mock_member_payment_repo):
         """When club has no members, return [] and never call find_by_member_ids_year."""
-        mock_member_repo.find_by_club_id = AsyncMock(return_value=[])
+        mock_member_repo.find_refs_by_club_id = AsyncMock(return_value=[])
 
         result = await use_case.execute(club_id="club1", payment_year=2026)
 
@@ -67,7 +65,7 @@ class TestGetClubMemberPaymentsUseCase:
     ):
         """When members exist, calls find_by_member_ids_year with their ids and the year."""
         members = [_make_member("m1"), _make_member("m2")]
-        mock_member_repo.find_by_club_id = AsyncMock(return_value=members)
+        mock_member_repo.find_refs_by_club_id = AsyncMock(return_value=members)
 
         expected_payments = [
             _make_member_payment("mp1", "m1"),
@@ -92,7 +90,7 @@ class TestGetClubMemberPaymentsUseCase:
         m_valid = _make_member("m1")
         m_none = _make_member(None)
 
-        mock_member_repo.find_by_club_id = AsyncMock(return_value=[m_valid, m_none])
+        mock_member_repo.find_refs_by_club_id = AsyncMock(return_value=[m_valid, m_none])
 
         expected_payments = [_make_member_payment("mp1", "m1")]
         mock_member_payment_repo.find_by_member_ids_year = AsyncMock(return_value=expected_payments)
@@ -111,7 +109,7 @@ class TestGetClubMemberPaymentsUseCase:
     ):
         """When all members have None ids, return [] and never call find_by_member_ids_year."""
         members = [_make_member(None), _make_member(None)]
-        mock_member_repo.find_by_club_id = AsyncMock(return_value=members)
+        mock_member_repo.find_refs_by_club_id = AsyncMock(return_value=members)
 
         result = await use_case.execute(club_id="club1", payment_year=2026)
 
@@ -5,6 +5,7 @@ from datetime import datetime
 from unittest.mock import AsyncMock, MagicMock
 
 from src.domain.entities.license import LicenseStatus
+from src.application.read_models import MemberRef
 from src.application.use_cases.member_payment.get_club_payment_summary_use_case import (
     GetClubPaymentSummaryUseCase,
 )
@@ -21,15 +22,10 @@ def mock_repos():
     club.name = "Test Club"
     club_repo.find_by_id = AsyncMock(return_value=club)
 
-    member1 = MagicMock()
-    member1.id = "m1"
-    member1.get_full_name.return_value = "John Doe"
-
-    member2 = MagicMock()
-    member2.id = "m2"
-    member2.get_full_name.return_value = "Jane Smith"
-
-    member_repo.find_by_club_id = AsyncMock(return_value=[member1, member2])
+    member_repo.find_refs_by_club_id = AsyncMock(return_value=[
+        MemberRef(id="m1", full_name="John Doe", club_id="club1"),
+        MemberRef(id="m2", full_name="Jane Smith", club_id="club1"),
+    ])
 
     member_payment_repo.get_summary_by_member_ids = AsyncMock(return_value={
         "total_amount": 100.0,
@@ -37,7 +33,7 @@ def mock_repos():
     })
     member_payment_repo.find_by_member_ids_year = AsyncMock(return_value=[])
 
-    license_repo.find_by_member_ids = AsyncMock(return_value=[])
+    license_repo.find_refs_by_member_ids = AsyncMock(return_value=[])
 
     return {
         "member_payment_repo": member_payment_repo,
@@ -100,7 +96,7 @@ class TestGetClubPaymentSummaryLicensePaid:
         license_2026.member_id = "m1"
         license_2026.expiration_date = datetime(2026, 12, 31, 23, 59, 59)
         license_2026.status = LicenseStatus.ACTIVE
-        mock_repos["license_repo"].find_by_member_ids.return_value = [license_2026]
+        mock_repos["license_repo"].find_refs_by_member_ids.return_value = [license_2026]
 
         # Member only paid insurance, never the license
         mock_repos["member_payment_repo"].find_by_member_ids_year.return_value = [
@@ -0,0 +1,39 @@
+"""Tests for GetAllPaymentsUseCase.
+
+Year, member and club filters are combined into one repository query so a
+limit never truncates results before they are filtered.
+"""
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from src.application.ports.query_spec import QuerySpec
+from src.application.use_cases.payment.get_all_payments_use_case import GetAllPaymentsUseCase
+
+
+@pytest.fixture
+def payment_repository():
+    repo = MagicMock()
+    repo.find_by_spec = AsyncMock(return_value=[])
+    return repo
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestGetAllPaymentsUseCase:
+
+    async def test_year_and_club_filters_are_one_query(self, payment_repository):
+        await GetAllPaymentsUseCase(payment_repository).execute(
+            limit=20, club_id="club-1", payment_year=2026
+        )
+
+        spec = payment_repository.find_by_spec.await_args.args[0]
+        assert spec.filters == {"payment_year": 2026, "club_id": "club-1"}
+        assert spec.sort == (("created_at", True),)
+        assert spec.limit == 20
+
+    async def test_no_filters_lists_everything(self, payment_repository):
+        await GetAllPaymentsUseCase(payment_repository).execute()
+
+        spec = payment_repository.find_by_spec.await_args.args[0]
+        assert spec == QuerySpec().order_by("created_at", descending=True)
@@ -0,0 +1,528 @@
+"""Tests for the post-payment fulfillment pipeline of ProcessRedsysWebhookUseCase.
+
+The webhook commits the payment (and its member payments) before returning;
+seminar, licenses, insurance, invoice and email run afterwards as tracked
+steps with their own retries.
+"""
+
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from src.domain.entities.payment import Payment, PaymentStatus, PaymentType
+from src.domain.entities.member import Member
+from src.domain.entities.invoice import Invoice
+from src.domain.entities.payment_fulfillment import (
+    PaymentFulfillment,
+    FulfillmentStep,
+    FulfillmentStepState,
+    FulfillmentStepStatus,
+)
+from src.application.use_cases.payment.process_redsys_webhook_use_case import (
+    ProcessRedsysWebhookUseCase,
+)
+
+
+def _make_payment() -> Payment:
+    return Payment(
+        id="pay-001",
+        member_id="member-001",
+        club_id="club-001",
+        payment_type=PaymentType.LICENSE,
+        amount=50.0,
+        status=PaymentStatus.PROCESSING,
+        transaction_id="ORDER001",
+        payment_year=2026,
+    )
+
+
+@pytest.fixture
+def redsys_service():
+    service = MagicMock()
+    service.verify_notification_signature = AsyncMock(return_value=True)
+    notification = MagicMock(
+        order_id="ORDER001",
+        authorization_code="123456",
+        response_code="0000",
+        amount_cents=5000,
+        secure_payment=True,
+        card_country="724",
+        card_brand="1",
+        error_code=None,
+        is_successful=True,
+    )
+    service.parse_notification = AsyncMock(return_value=notification)
+    service.get_response_message = MagicMock(return_value="Transacción autorizada")
+    return service
+
+
+@pytest.fixture
+def payment_repository():
+    repo = MagicMock()
+    repo.find_by_transaction_id = AsyncMock(return_value=_make_payment())
+    repo.update = AsyncMock(side_effect=lambda payment: payment)
+    return repo
+
+
+@pytest.fixture
+def member_repository():
+    repo = MagicMock()
+    repo.find_by_id = AsyncMock(return_value=Member(
+        id="member-001", first_name="Ana", last_name="Garcia", email="ana@example.com"
+    ))
+    return repo
+
+
+@pytest.fixture
+def fulfillment_repository():
+    repo = MagicMock()
+    repo.create = AsyncMock(side_effect=lambda fulfillment: fulfillment)
+    repo.update_step = AsyncMock()
+    return repo
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestWebhookFulfillmentPipeline:
+    """The webhook returns before side effects run and tracks each step."""
+
+    async def test_execute_returns_before_side_effects_complete(
+        self, redsys_service, payment_repository, member_repository, fulfillment_repository
+    ):
+        """The payment is persisted as completed before the email is sent."""
+        email_sent = asyncio.Event()
+        email_service = MagicMock()
+
+        async def slow_send(**kwargs):
+            await asyncio.sleep(0)
+            email_sent.set()
+
+        email_service.send_payment_confirmation = AsyncMock(side_effect=slow_send)
+
+        use_case = ProcessRedsysWebhookUseCase(
+            payment_repository=payment_repository,
+            redsys_service=redsys_service,
+            member_repository=member_repository,
+            email_service=email_service,
+            payment_fulfillment_repository=fulfillment_repository,
+        )
+
+        result = await use_case.execute("sig", "params", "HMAC_SHA256_V1")
+
+        assert result.success is True
+        assert result.payment.status == PaymentStatus.COMPLETED
+        payment_repository.update.assert_awaited_once()
+        assert not email_sent.is_set()
+
+        await use_case.wait_for_background_tasks()
+
+        assert email_sent.is_set()
+        fulfillment_repository.create.assert_awaited_once()
+        last_state = fulfillment_repository.update_step.await_args_list[-1].args
+        assert last_state[1] == FulfillmentStep.EMAIL
+        assert last_state[2].status == FulfillmentStepStatus.COMPLETED
+
+    async def test_failing_step_is_retried_then_recorded_as_failed(
+        self, member_repository, fulfillment_repository
+    ):
+        """A step that keeps failing is retried and its last error recorded."""
+        email_service = MagicMock()
+        email_service.send_payment_confirmation = AsyncMock(side_effect=RuntimeError("smtp down"))
+
+        use_case = ProcessRedsysWebhookUseCase(
+            payment_repository=MagicMock(),
+            redsys_service=MagicMock(),
+            member_repository=member_repository,
+            email_service=email_service,
+            payment_fulfillment_repository=fulfillment_repository,
+            fulfillment_max_attempts=3,
+            fulfillment_retry_delay=0,
+        )
+
+        fulfillment = await use_case._run_fulfillment(_make_payment(), [])
+
+        assert email_service.send_payment_confirmation.await_count == 3
+        state = fulfillment.steps[FulfillmentStep.EMAIL]
+        assert state.status == FulfillmentStepStatus.FAILED
+        assert state.attempts == 3
+        assert state.last_error == "smtp down"
+
+    async def test_step_succeeds_on_retry(self, member_repository):
+        """A transient failure is retried and the step ends completed."""
+        email_service = MagicMock()
+        email_service.send_payment_confirmation = AsyncMock(
+            side_effect=[RuntimeError("timeout"), None]
+        )
+
+        use_case = ProcessRedsysWebhookUseCase(
+            payment_repository=MagicMock(),
+            redsys_service=MagicMock(),
+            member_repository=member_repository,
+            email_service=email_service,
+            fulfillment_retry_delay=0,
+        )
+
+        fulfillment = await use_case._run_fulfillment(_make_payment(), [])
+
+        state = fulfillment.steps[FulfillmentStep.EMAIL]
+        assert state.status == FulfillmentStepStatus.COMPLETED
+        assert state.attempts == 2
+
+    async def test_failing_step_does_not_block_other_steps(self, member_repository):
+        """An invoice failure does not prevent the seminar from being marked official."""
+        seminar = MagicMock(is_official=False)
+        seminar_repository = MagicMock()
+        seminar_repository.find_by_id = AsyncMock(return_value=seminar)
+        seminar_repository.update = AsyncMock()
+
+        invoice_repository = MagicMock()
+        invoice_repository.get_next_invoice_number = AsyncMock(side_effect=RuntimeError("db"))
+
+        payment = _make_payment()
+        payment.payment_type = PaymentType.SEMINAR_OFICIALIDAD
+        payment.related_entity_id = "seminar-001"
+
+        use_case = ProcessRedsysWebhookUseCase(
+            payment_repository=MagicMock(),
+            redsys_service=MagicMock(),
+            invoice_repository=invoice_repository,
+            member_repository=member_repository,
+            seminar_repository=seminar_repository,
+            fulfillment_max_attempts=2,
+            fulfillment_retry_delay=0,
+        )
+
+        fulfillment = await use_case._run_fulfillment(payment, [])
+
+        seminar.mark_as_official.assert_called_once()
+        assert fulfillment.steps[FulfillmentStep.SEMINAR].status == FulfillmentStepStatus.COMPLETED
+        assert fulfillment.steps[FulfillmentStep.INVOICE].status == FulfillmentStepStatus.FAILED
+
+
+    async def test_fulfillment_record_is_stored_before_execute_returns(
+        self, redsys_service, payment_repository, member_repository, fulfillment_repository
+    ):
+        """A restart right after the response still finds the pending steps."""
+        email_service = MagicMock()
+        email_service.send_payment_confirmation = AsyncMock()
+
+        use_case = ProcessRedsysWebhookUseCase(
+            payment_repository=payment_repository,
+            redsys_service=redsys_service,
+            member_repository=member_repository,
+            email_service=email_service,
+            payment_fulfillment_repository=fulfillment_repository,
+        )
+
+        await use_case.execute("sig", "params", "HMAC_SHA256_V1")
+
+        fulfillment_repository.create.assert_awaited_once()
+        recorded = fulfillment_repository.create.await_args.args[0]
+        assert recorded.steps[FulfillmentStep.EMAIL].status == FulfillmentStepStatus.PENDING
+        fulfillment_repository.update_step.assert_not_called()
+        await use_case.wait_for_background_tasks()
+
+    async def test_failure_email_is_recorded_as_a_fulfillment_step(
+        self, redsys_service, payment_repository, member_repository, fulfillment_repository
+    ):
+        """The failure notification is tracked like any other step."""
+        redsys_service.parse_notification.return_value.is_successful = False
+        email_service = MagicMock()
+        email_service.send_payment_failed_notification = AsyncMock()
+
+        use_case = ProcessRedsysWebhookUseCase(
+            payment_repository=payment_repository,
+            redsys_service=redsys_service,
+            member_repository=member_repository,
+            email_service=email_service,
+            payment_fulfillment_repository=fulfillment_repository,
+        )
+
+        await use_case.execute("sig", "params", "HMAC_SHA256_V1")
+        await use_case.wait_for_background_tasks()
+
+        recorded = fulfillment_repository.create.await_args.args[0]
+        assert list(recorded.steps) == [FulfillmentStep.EMAIL]
+        email_service.send_payment_failed_notification.assert_awaited_once()
+        last_state = fulfillment_repository.update_step.await_args_list[-1].args
+        assert last_state[2].status == FulfillmentStepStatus.COMPLETED
+
+    async def test_record_and_member_payments_are_written_before_the_status(
+        self, redsys_service, payment_repository, member_repository, fulfillment_repository
+    ):
+        """A failure before the status is saved leaves the payment retryable."""
+        calls = []
+        member_payment_repository = MagicMock()
+        member_payment_repository.create_bulk = AsyncMock(
+            side_effect=lambda payments: calls.append("member_payments") or payments
+        )
+        fulfillment_repository.create = AsyncMock(
+            side_effect=lambda fulfillment: calls.append("fulfillment") or fulfillment
+        )
+        payment_repository.update = AsyncMock(
+            side_effect=lambda payment: calls.append("status") or payment
+        )
+        payment = _make_payment()
+        payment.member_assignments = '[{"member_id": "member-001", "payment_types": ["kyu"]}]'
+        payment_repository.find_by_transaction_id = AsyncMock(return_value=payment)
+        member_repository.find_by_ids = AsyncMock(return_value=[member_repository.find_by_id.return_value])
+        email_service = MagicMock()
+        email_service.send_payment_confirmation = AsyncMock()
+
+        use_case = ProcessRedsysWebhookUseCase(
+            payment_repository=payment_repository,
+            redsys_service=redsys_service,
+            member_repository=member_repository,
+            member_payment_repository=member_payment_repository,
+            email_service=email_service,
+            payment_fulfillment_repository=fulfillment_repository,
+        )
+        use_case._fetch_prices = AsyncMock(return_value={})
+
+        await use_case.execute("sig", "params", "HMAC_SHA256_V1")
+        await use_case.wait_for_background_tasks()
+
+        assert calls == ["member_payments", "fulfillment", "status"]
+
+    async def test_failed_record_write_raises_before_the_status_is_saved(
+        self, redsys_service, payment_repository, member_repository, fulfillment_repository
+    ):
+        fulfillment_repository.create = AsyncMock(side_effect=ConnectionError("down"))
+        use_case = ProcessRedsysWebhookUseCase(
+            payment_repository=payment_repository,
+            redsys_service=redsys_service,
+            member_repository=member_repository,
+            email_service=MagicMock(),
+            payment_fulfillment_repository=fulfillment_repository,
+        )
+
+        with pytest.raises(ConnectionError):
+            await use_case.execute("sig", "params", "HMAC_SHA256_V1")
+
+        payment_repository.update.assert_not_called()
+
+    async def test_retry_of_completed_payment_without_record_schedules_fulfillment(
+        self, redsys_service, payment_repository, member_repository, fulfillment_repository
+    ):
+        """A payment completed before its record existed still gets its side effects."""
+        payment = _make_payment()
+        payment.status = PaymentStatus.COMPLETED
+        payment_repository.find_by_transaction_id = AsyncMock(return_value=payment)
+        fulfillment_repository.find_by_payment_id = AsyncMock(return_value=None)
+        email_service = MagicMock()
+        email_service.send_payment_confirmation = AsyncMock()
+
+        use_case = ProcessRedsysWebhookUseCase(
+            payment_repository=payment_repository,
+            redsys_service=redsys_service,
+            member_repository=member_repository,
+            email_service=email_service,
+            payment_fulfillment_repository=fulfillment_repository,
+        )
+
+        result = await use_case.execute("sig", "params", "HMAC_SHA256_V1")
+        await use_case.wait_for_background_tasks()
+
+        assert result.success is True
+        payment_repository.update.assert_not_called()
+        fulfillment_repository.create.assert_awaited_once()
+        email_service.send_payment_confirmation.assert_awaited_once()
+
+    async def test_retry_of_completed_payment_with_record_leaves_it_to_the_sweeper(
+        self, redsys_service, payment_repository, member_repository, fulfillment_repository
+    ):
+        payment = _make_payment()
+        payment.status = PaymentStatus.COMPLETED
+        payment_repository.find_by_transaction_id = AsyncMock(return_value=payment)
+        fulfillment_repository.find_by_payment_id = AsyncMock(
+            return_value=_resumable(FulfillmentStep.EMAIL)
+        )
+
+        use_case = ProcessRedsysWebhookUseCase(
+            payment_repository=payment_repository,
+            redsys_service=redsys_service,
+            member_repository=member_repository,
+            email_service=MagicMock(),
+            payment_fulfillment_repository=fulfillment_repository,
+        )
+
+        result = await use_case.execute("sig", "params", "HMAC_SHA256_V1")
+
+        assert result.success is True
+        fulfillment_repository.create.assert_not_called()
+        assert not use_case._background_tasks
+
+    async def test_wait_for_background_tasks_gives_up_after_timeout(self):
+        """Shutdown does not hang on a step that never finishes."""
+        use_case = ProcessRedsysWebhookUseCase(
+            payment_repository=MagicMock(),
+            redsys_service=MagicMock(),
+        )
+        never = asyncio.Event()
+        task = use_case._schedule(never.wait())
+
+        assert await use_case.wait_for_background_tasks(timeout=0.01) is False
+
+        task.cancel()
+
+
+def _resumable(*steps: FulfillmentStep, attempts: int = 1) -> PaymentFulfillment:
+    return PaymentFulfillment(
+        payment_id="pay-001",
+        steps={
+            step: FulfillmentStepState(status=FulfillmentStepStatus.RUNNING, attempts=attempts)
+            for step in steps
+        },
+    )
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestResumeFulfillment:
+    """Unfinished steps recorded in payment_fulfillments are run again."""
+
+    async def test_resume_reuses_invoice_created_before_interruption(
+        self, member_repository, fulfillment_repository
+    ):
+        """An invoice that exists is not created twice; the email attaches it."""
+        payment = _make_payment()
+        payment.status = PaymentStatus.COMPLETED
+        payment_repository = MagicMock()
+        payment_repository.find_by_id = AsyncMock(return_value=payment)
+        invoice = MagicMock(spec=Invoice, pdf_path=None)
+        invoice_repository = MagicMock()
+        invoice_repository.find_by_payment_id = AsyncMock(return_value=invoice)
+        invoice_repository.get_next_invoice_number = AsyncMock()
+        email_service = MagicMock()
+        email_service.send_payment_confirmation = AsyncMock()
+
+        use_case = ProcessRedsysWebhookUseCase(
+            payment_repository=payment_repository,
+            redsys_service=MagicMock(),
+            invoice_repository=invoice_repository,
+            member_repository=member_repository,
+            email_service=email_service,
+            payment_fulfillment_repository=fulfillment_repository,
+        )
+
+        fulfillment = await use_case.resume_fulfillment(
+            _resumable(FulfillmentStep.INVOICE, FulfillmentStep.EMAIL), max_attempts=9
+        )
+
+        invoice_repository.get_next_invoice_number.assert_not_called()
+        email_service.send_payment_confirmation.assert_awaited_once()
+        assert fulfillment.is_completed
+
+    async def test_resume_sends_failure_email_for_failed_payment(self, member_repository):
+        payment = _make_payment()
+        payment.fail_payment("Tarjeta denegada")
+        payment_repository = MagicMock()
+        payment_repository.find_by_id = AsyncMock(return_value=payment)
+        email_service = MagicMock()
+        email_service.send_payment_failed_notification = AsyncMock()
+
+        use_case = ProcessRedsysWebhookUseCase(
+            payment_repository=payment_repository,
+            redsys_service=MagicMock(),
+            member_repository=member_repository,
+            email_service=email_service,
+        )
+
+        await use_case.resume_fulfillment(_resumable(FulfillmentStep.EMAIL), max_attempts=9)
+
+        kwargs = email_service.send_payment_failed_notification.await_args.kwargs
+        assert kwargs["error_message"] == "Tarjeta denegada"
+
+    async def test_resume_regenerates_licenses_from_stored_member_payments(self):
+        payment = _make_payment()
+        payment.status = PaymentStatus.COMPLETED
+        payment_repository = MagicMock()
+        payment_repository.find_by_id = AsyncMock(return_value=payment)
+        member_payment_repository = MagicMock()
+        member_payment_repository.find_by_payment_id = AsyncMock(return_value=[])
+
+        use_case = ProcessRedsysWebhookUseCase(
+            payment_repository=payment_repository,
+            redsys_service=MagicMock(),
+            member_payment_repository=member_payment_repository,
+            license_repository=MagicMock(),
+        )
+        use_case._generate_licenses_and_insurance = AsyncMock()
+
+        await use_case.resume_fulfillment(_resumable(FulfillmentStep.LICENSES), max_attempts=9)
+
+        member_payment_repository.find_by_payment_id.assert_awaited_once_with("pay-001")
+        assert use_case._generate_licenses_and_insurance.await_args.kwargs["steps"] == {
+            FulfillmentStep.LICENSES
+        }
+
+    async def test_resume_skips_payment_whose_status_was_never_saved(self, member_repository):
+        """The record is written before the status, so the payment may still be processing."""
+        payment_repository = MagicMock()
+        payment_repository.find_by_id = AsyncMock(return_value=_make_payment())
+        email_service = MagicMock()
+        email_service.send_payment_confirmation = AsyncMock()
+
+        use_case = ProcessRedsysWebhookUseCase(
+            payment_repository=payment_repository,
+            redsys_service=MagicMock(),
+            member_repository=member_repository,
+            email_service=email_service,
+        )
+
+        fulfillment = await use_case.resume_fulfillment(_resumable(FulfillmentStep.EMAIL), max_attempts=9)
+
+        email_service.send_payment_confirmation.assert_not_called()
+        assert not fulfillment.is_completed
+
+    async def test_resume_unfinished_reads_stale_records_within_the_attempt_cap(
+        self, fulfillment_repository
+    ):
+        fulfillment_repository.find_unfinished = AsyncMock(return_value=[])
+        use_case = ProcessRedsysWebhookUseCase(
+            payment_repository=MagicMock(),
+            redsys_service=MagicMock(),
+            payment_fulfillment_repository=fulfillment_repository,
+            fulfillment_max_attempts=3,
+            fulfillment_max_resumes=2,
+        )
+
+        assert await use_case.resume_unfinished_fulfillments(stale_after_seconds=60) == 0
+
+        kwargs = fulfillment_repository.find_unfinished.await_args.kwargs
+        assert kwargs["max_attempts"] == 9
+
+
+@pytest.mark.unit
+class TestPaymentFulfillmentEntity:
+    """Domain behaviour of PaymentFulfillment."""
+
+    def test_requires_payment_id(self):
+        with pytest.raises(ValueError):
+            PaymentFulfillment(payment_id="")
+
+    def test_step_transitions(self):
+        fulfillment = PaymentFulfillment(payment_id="pay-001")
+
+        fulfillment.start_step(FulfillmentStep.INVOICE)
+        fulfillment.fail_step(FulfillmentStep.INVOICE, "boom")
+        assert fulfillment.failed_steps == [FulfillmentStep.INVOICE]
+        assert not fulfillment.is_completed
+
+        fulfillment.start_step(FulfillmentStep.INVOICE)
+        fulfillment.complete_step(FulfillmentStep.INVOICE)
+        assert fulfillment.steps[FulfillmentStep.INVOICE].attempts == 2
+        assert fulfillment.steps[FulfillmentStep.INVOICE].last_error is None
+        assert fulfillment.is_completed
+
+    def test_resumable_steps_skip_completed_and_exhausted_steps(self):
+        fulfillment = PaymentFulfillment(payment_id="pay-001", steps={
+            FulfillmentStep.INVOICE: FulfillmentStepState(status=FulfillmentStepStatus.COMPLETED, attempts=1),
+            FulfillmentStep.EMAIL: FulfillmentStepState(status=FulfillmentStepStatus.FAILED, attempts=9),
+            FulfillmentStep.LICENSES: FulfillmentStepState(status=FulfillmentStepStatus.RUNNING, attempts=1),
+            FulfillmentStep.SEMINAR: FulfillmentStepState(),
+        })
+
+        assert fulfillment.resumable_steps(max_attempts=9) == [
+            FulfillmentStep.LICENSES, FulfillmentStep.SEMINAR
+        ]
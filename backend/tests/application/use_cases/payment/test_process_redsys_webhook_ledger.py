@@ -0,0 +1,197 @@
+"""Tests for webhook notification deduplication in ProcessRedsysWebhookUseCase.
+
+Redsys may deliver the same notification several times. The first delivery
+claims a ledger entry; later deliveries replay the stored outcome without
+touching the payment again.
+"""
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from src.domain.entities.payment import Payment, PaymentStatus, PaymentType
+from src.domain.entities.webhook_ledger_entry import WebhookLedgerEntry, WebhookLedgerStatus
+from src.domain.exceptions.payment import PaymentNotFoundError
+from src.application.use_cases.payment.process_redsys_webhook_use_case import (
+    ProcessRedsysWebhookUseCase,
+)
+from src.infrastructure.adapters.repositories.mongodb_webhook_ledger_repository import (
+    MongoDBWebhookLedgerRepository,
+)
+
+
+@pytest.fixture
+def redsys_service():
+    service = MagicMock()
+    service.verify_notification_signature = AsyncMock(return_value=True)
+    service.parse_notification = AsyncMock(return_value=MagicMock(
+        order_id="ORDER001",
+        authorization_code="123456",
+        response_code="0000",
+        amount_cents=5000,
+        secure_payment=True,
+        card_country="724",
+        card_brand="1",
+        error_code=None,
+        is_successful=True,
+    ))
+    service.get_response_message = MagicMock(return_value="Transacción autorizada")
+    return service
+
+
+@pytest.fixture
+def payment_repository():
+    repo = MagicMock()
+    repo.find_by_transaction_id = AsyncMock(return_value=Payment(
+        id="pay-001",
+        club_id="club-001",
+        payment_type=PaymentType.LICENSE,
+        amount=50.0,
+        status=PaymentStatus.PROCESSING,
+        transaction_id="ORDER001",
+        payment_year=2026,
+    ))
+    repo.update = AsyncMock(side_effect=lambda payment: payment)
+    return repo
+
+
+@pytest.fixture
+def ledger():
+    repo = MagicMock()
+    repo.claim = AsyncMock(return_value=None)
+    repo.complete = AsyncMock()
+    repo.release = AsyncMock()
+    return repo
+
+
+def _build_use_case(payment_repository, redsys_service, ledger):
+    return ProcessRedsysWebhookUseCase(
+        payment_repository=payment_repository,
+        redsys_service=redsys_service,
+        webhook_ledger_repository=ledger,
+    )
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestWebhookLedger:
+    """Insert-first claim and outcome replay."""
+
+    async def test_first_delivery_processes_and_stores_outcome(
+        self, payment_repository, redsys_service, ledger
+    ):
+        use_case = _build_use_case(payment_repository, redsys_service, ledger)
+
+        result = await use_case.execute("sig", "params", "HMAC_SHA256_V1")
+        await use_case.wait_for_background_tasks()
+
+        assert result.replayed is False
+        assert result.payment_id == "pay-001"
+        ledger.claim.assert_awaited_once_with("ORDER001", "sig")
+        ledger.complete.assert_awaited_once_with(
+            "ORDER001", "sig",
+            payment_id="pay-001", success=True, message="Transacción autorizada",
+        )
+        payment_repository.update.assert_awaited_once()
+
+    async def test_duplicate_delivery_replays_stored_outcome(
+        self, payment_repository, redsys_service, ledger
+    ):
+        ledger.claim.return_value = WebhookLedgerEntry(
+            order_id="ORDER001",
+            ds_signature="sig",
+            status=WebhookLedgerStatus.COMPLETED,
+            payment_id="pay-001",
+            success=True,
+            message="Transacción autorizada",
+        )
+        use_case = _build_use_case(payment_repository, redsys_service, ledger)
+
+        result = await use_case.execute("sig", "params", "HMAC_SHA256_V1")
+
+        assert result.replayed is True
+        assert result.success is True
+        assert result.payment_id == "pay-001"
+        assert result.message == "Transacción autorizada"
+        payment_repository.find_by_transaction_id.assert_not_called()
+        payment_repository.update.assert_not_called()
+
+    async def test_concurrent_delivery_short_circuits_while_processing(
+        self, payment_repository, redsys_service, ledger
+    ):
+        ledger.claim.return_value = WebhookLedgerEntry(order_id="ORDER001", ds_signature="sig")
+        use_case = _build_use_case(payment_repository, redsys_service, ledger)
+
+        result = await use_case.execute("sig", "params", "HMAC_SHA256_V1")
+
+        assert result.replayed is True
+        assert result.payment_id is None
+        payment_repository.update.assert_not_called()
+
+    async def test_failed_processing_releases_claim(
+        self, payment_repository, redsys_service, ledger
+    ):
+        payment_repository.find_by_transaction_id.return_value = None
+        use_case = _build_use_case(payment_repository, redsys_service, ledger)
+
+        with pytest.raises(PaymentNotFoundError):
+            await use_case.execute("sig", "params", "HMAC_SHA256_V1")
+
+        ledger.release.assert_awaited_once_with("ORDER001", "sig")
+        ledger.complete.assert_not_called()
+
+
+@pytest.mark.unit
+@pytest.mark.repository
+@pytest.mark.asyncio
+class TestMongoDBWebhookLedgerRepository:
+    """Claim semantics of the MongoDB adapter."""
+
+    @pytest.fixture
+    def collection(self):
+        return MagicMock()
+
+    @pytest.fixture
+    def repository(self, collection):
+        database = MagicMock()
+        database.__getitem__ = MagicMock(return_value=collection)
+        with patch(
+            "src.infrastructure.adapters.repositories.mongodb_webhook_ledger_repository.get_database",
+            return_value=database,
+        ):
+            return MongoDBWebhookLedgerRepository()
+
+    async def test_claim_acquired_when_no_previous_entry(self, repository, collection):
+        collection.find_one_and_update = AsyncMock(return_value=None)
+
+        assert await repository.claim("ORDER001", "sig") is None
+        kwargs = collection.find_one_and_update.await_args.kwargs
+        assert kwargs["upsert"] is True
+
+    async def test_claim_returns_existing_entry(self, repository, collection):
+        from datetime import datetime
+        collection.find_one_and_update = AsyncMock(return_value={
+            "order_id": "ORDER001",
+            "ds_signature": "sig",
+            "status": "completed",
+            "payment_id": "pay-001",
+            "success": True,
+            "message": "ok",
+            "claimed_at": datetime.utcnow(),
+        })
+
+        entry = await repository.claim("ORDER001", "sig")
+
+        assert entry.is_completed
+        assert entry.payment_id == "pay-001"
+
+    async def test_stale_processing_claim_is_taken_over(self, repository, collection):
+        from datetime import datetime, timedelta
+        collection.find_one_and_update = AsyncMock(return_value={
+            "order_id": "ORDER001",
+            "ds_signature": "sig",
+            "status": "processing",
+            "claimed_at": datetime.utcnow() - timedelta(hours=1),
+        })
+        collection.update_one = AsyncMock(return_value=MagicMock(modified_count=1))
+
+        assert await repository.claim("ORDER001", "sig") is None
@@ -0,0 +1,119 @@
+"""Tests for MemberPayment creation in ProcessRedsysWebhookUseCase.
+
+Members and prices for every assignment are resolved with one query each.
+"""
+
+import json
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from src.domain.entities.payment import Payment, PaymentStatus, PaymentType
+from src.domain.entities.member import Member, ClubRole
+from src.domain.entities.member_payment import MemberPaymentType
+from src.application.use_cases.payment.process_redsys_webhook_use_case import (
+    ProcessRedsysWebhookUseCase,
+)
+
+
+def _price_config(key, price):
+    config = MagicMock()
+    config.key = key
+    config.price = price
+    return config
+
+
+def _make_payment(assignments, line_items=None) -> Payment:
+    return Payment(
+        id="pay-001",
+        club_id="club-001",
+        payment_type=PaymentType.ANNUAL_QUOTA,
+        amount=100.0,
+        status=PaymentStatus.COMPLETED,
+        payment_year=2026,
+        member_assignments=json.dumps(assignments),
+        line_items_data=json.dumps(line_items) if line_items else None,
+    )
+
+
+@pytest.fixture
+def member_repository():
+    repo = MagicMock()
+    repo.find_by_ids = AsyncMock(return_value=[
+        Member(id="m1", first_name="Ana", last_name="Garcia"),
+        Member(id="m2", first_name="Luis", last_name="Perez", club_role=ClubRole.ADMIN),
+    ])
+    return repo
+
+
+@pytest.fixture
+def price_configuration_repository():
+    repo = MagicMock()
+    repo.get_many = AsyncMock(
+        side_effect=lambda keys: {key: _price_config(key, 25.0) for key in keys}
+    )
+    return repo
+
+
+@pytest.fixture
+def member_payment_repository():
+    repo = MagicMock()
+    repo.create_bulk = AsyncMock(side_effect=lambda payments: payments)
+    return repo
+
+
+@pytest.fixture
+def use_case(member_repository, price_configuration_repository, member_payment_repository):
+    return ProcessRedsysWebhookUseCase(
+        payment_repository=MagicMock(),
+        redsys_service=MagicMock(),
+        member_repository=member_repository,
+        member_payment_repository=member_payment_repository,
+        price_configuration_repository=price_configuration_repository,
+    )
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestCreateMemberPayments:
+    """Batched lookups when building member payments."""
+
+    async def test_resolves_members_and_prices_with_one_query_each(
+        self, use_case, member_repository, price_configuration_repository
+    ):
+        payment = _make_payment([
+            {"member_id": "m1", "payment_types": ["kyu", "seguro_accidentes"]},
+            {"member_id": "m2", "payment_types": ["dan"]},
+        ])
+
+        member_payments = await use_case._create_member_payments(payment)
+
+        member_repository.find_by_ids.assert_awaited_once_with(["m1", "m2"])
+        price_configuration_repository.get_many.assert_awaited_once()
+        assert len(member_payments) == 3
+        assert all(mp.amount == 25.0 for mp in member_payments)
+
+    async def test_deleted_members_are_skipped(self, use_case):
+        payment = _make_payment([
+            {"member_id": "m1", "payment_types": ["kyu"]},
+            {"member_id": "gone", "payment_types": ["kyu"]},
+        ])
+
+        member_payments = await use_case._create_member_payments(payment)
+
+        assert [mp.member_id for mp in member_payments] == ["m1"]
+
+    async def test_club_fee_from_line_items_goes_to_admin(self, use_case):
+        payment = _make_payment(
+            [
+                {"member_id": "m1", "payment_types": ["kyu"]},
+                {"member_id": "m2", "payment_types": ["dan"]},
+            ],
+            line_items=[{"item_type": "club_fee"}],
+        )
+
+        member_payments = await use_case._create_member_payments(payment)
+
+        club_fee = [mp for mp in member_payments if mp.payment_type == MemberPaymentType.CUOTA_CLUB]
+        assert len(club_fee) == 1
+        assert club_fee[0].member_id == "m2"
+        assert club_fee[0].amount == 25.0
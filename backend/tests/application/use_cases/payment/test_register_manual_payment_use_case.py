@@ -13,6 +13,25 @@ from src.domain.entities.invoice import Invoice, InvoiceStatus
 from src.domain.exceptions.payment import DuplicatePaymentForYearError, InvalidPaymentDataError
 
 
+def _price_config(key, price):
+    config = MagicMock()
+    config.key = key
+    config.price = price
+    return config
+
+
+def _existing_payment(member_id, payment_type, status=MemberPaymentStatus.COMPLETED):
+    return MemberPayment(
+        id="mp-existing",
+        payment_id="pay-old",
+        member_id=member_id,
+        payment_year=2026,
+        payment_type=payment_type,
+        amount=50.0,
+        status=status,
+    )
+
+
 @pytest.fixture
 def mock_repos():
     repos = {
@@ -23,7 +42,7 @@ def mock_repos():
         "price_config_repo": AsyncMock(),
     }
     # Default setup: no duplicates
-    repos["member_payment_repo"].exists_for_member_year_type = AsyncMock(return_value=False)
+    repos["member_payment_repo"].find_by_member_ids_year = AsyncMock(return_value=[])
     # create returns the same payment with an id
     created_payment = Payment(
         id="pay123",
@@ -45,10 +64,10 @@ def mock_repos():
             status=InvoiceStatus.ISSUED,
         )
     )
-    # price config returns a price config with price=50.0
-    mock_price = MagicMock()
-    mock_price.price = 50.0
-    repos["price_config_repo"].find_by_key = AsyncMock(return_value=mock_price)
+    # price config returns every requested key with price=50.0
+    repos["price_config_repo"].get_many = AsyncMock(
+        side_effect=lambda keys: {key: _price_config(key, 50.0) for key in keys}
+    )
     return repos
 
 
@@ -93,7 +112,9 @@ class TestRegisterManualPaymentUseCase:
         assert all(mp.payment_id == "pay123" for mp in mps)
 
     async def test_raises_duplicate_if_member_type_year_already_paid(self, use_case, mock_repos):
-        mock_repos["member_payment_repo"].exists_for_member_year_type = AsyncMock(return_value=True)
+        mock_repos["member_payment_repo"].find_by_member_ids_year = AsyncMock(
+            return_value=[_existing_payment("m1", MemberPaymentType.LICENCIA_KYU)]
+        )
         with pytest.raises(DuplicatePaymentForYearError):
             await use_case.execute(
                 payer_name="Admin",
@@ -176,16 +197,9 @@ class TestRegisterManualPaymentUseCase:
 
     async def test_include_club_fee_duplicate_raises_error(self, mock_repos):
         """include_club_fee=True raises DuplicatePaymentForYearError when club_fee already paid."""
-        from src.domain.entities.member_payment import MemberPaymentType
-
-        def side_effect(member_id, payment_year, payment_type):
-            # Only report club_fee as duplicate
-            if payment_type == MemberPaymentType.CUOTA_CLUB:
-                return True
-            return False
-
-        mock_repos["member_payment_repo"].exists_for_member_year_type = AsyncMock(
-            side_effect=side_effect
+        # Only report club_fee as duplicate
+        mock_repos["member_payment_repo"].find_by_member_ids_year = AsyncMock(
+            return_value=[_existing_payment("m1", MemberPaymentType.CUOTA_CLUB)]
         )
         use_case = RegisterManualPaymentUseCase(
             payment_repository=mock_repos["payment_repo"],
@@ -254,35 +268,70 @@ class TestRegisterManualPaymentUseCase:
             payment_method="cash",
             member_assignments=[ManualMemberAssignment("m1", "M One", ["unknown_type", "kyu"])],
         )
-        # exists_for_member_year_type should be called only for "kyu" (mapped type), not for "unknown_type"
-        calls = mock_repos["member_payment_repo"].exists_for_member_year_type.call_args_list
-        payment_types_checked = [call.kwargs.get("payment_type") or call.args[2] for call in calls]
-        from src.domain.entities.member_payment import MemberPaymentType
-        assert MemberPaymentType.LICENCIA_KYU in payment_types_checked
+        mps = mock_repos["member_payment_repo"].create_bulk.call_args[0][0]
+        assert [mp.payment_type for mp in mps] == [MemberPaymentType.LICENCIA_KYU]
+        assert result.payment is not None
+
+    # ------------------------------------------------------------------
+    # Batched lookups
+    # ------------------------------------------------------------------
+
+    async def test_duplicate_check_and_prices_use_one_query_each(self, use_case, mock_repos):
+        """Every member and item type is resolved with one query per repository."""
+        await use_case.execute(
+            payer_name="Admin",
+            club_id="club1",
+            payment_year=2026,
+            payment_method="cash",
+            member_assignments=[
+                ManualMemberAssignment("m1", "M One", ["kyu", "seguro_accidentes"]),
+                ManualMemberAssignment("m2", "M Two", ["dan", "club_fee"]),
+            ],
+        )
+        mock_repos["member_payment_repo"].find_by_member_ids_year.assert_awaited_once()
+        member_ids, year = mock_repos["member_payment_repo"].find_by_member_ids_year.call_args[0]
+        assert sorted(member_ids) == ["m1", "m2"]
+        assert year == 2026
+        mock_repos["price_config_repo"].get_many.assert_awaited_once()
+        mock_repos["member_payment_repo"].exists_for_member_year_type.assert_not_called()
+        mock_repos["price_config_repo"].find_by_key.assert_not_called()
+
+    async def test_refunded_payment_is_not_a_duplicate(self, use_case, mock_repos):
+        """Only pending or completed member payments block a new one."""
+        mock_repos["member_payment_repo"].find_by_member_ids_year = AsyncMock(return_value=[
+            _existing_payment("m1", MemberPaymentType.LICENCIA_KYU, MemberPaymentStatus.REFUNDED)
+        ])
+        result = await use_case.execute(
+            payer_name="Admin",
+            club_id="club1",
+            payment_year=2026,
+            payment_method="cash",
+            member_assignments=[ManualMemberAssignment("m1", "M One", ["kyu"])],
+        )
         assert result.payment is not None
 
     # ------------------------------------------------------------------
-    # _fetch_price edge cases (lines 260, 263)
+    # _fetch_prices edge cases
     # ------------------------------------------------------------------
 
-    async def test_fetch_price_returns_zero_for_unmapped_type(self, use_case, mock_repos):
-        """_fetch_price returns 0.0 for item types not in PAYMENT_TYPE_TO_PRICE_KEY."""
+    async def test_fetch_prices_returns_zero_for_unmapped_type(self, use_case, mock_repos):
+        """_fetch_prices returns 0.0 for item types not in PAYMENT_TYPE_TO_PRICE_KEY."""
         # "unknown_type" is not in PAYMENT_TYPE_TO_PRICE_KEY so price_key is None
-        price = await use_case._fetch_price("unknown_type")
-        assert price == 0.0
+        prices = await use_case._fetch_prices({"unknown_type"})
+        assert prices == {"unknown_type": 0.0}
         # price_config_repo must NOT be called
-        mock_repos["price_config_repo"].find_by_key.assert_not_called()
+        mock_repos["price_config_repo"].get_many.assert_not_called()
 
-    async def test_fetch_price_raises_when_config_missing(self, use_case, mock_repos):
-        """_fetch_price raises InvalidPaymentDataError when price config record is absent from DB."""
-        mock_repos["price_config_repo"].find_by_key = AsyncMock(return_value=None)
+    async def test_fetch_prices_raises_when_config_missing(self, use_case, mock_repos):
+        """_fetch_prices raises InvalidPaymentDataError when price config record is absent from DB."""
+        mock_repos["price_config_repo"].get_many = AsyncMock(return_value={})
         with pytest.raises(InvalidPaymentDataError) as exc_info:
-            await use_case._fetch_price("kyu")
+            await use_case._fetch_prices({"kyu"})
         assert "kyu" in str(exc_info.value)
 
     async def test_execute_raises_invalid_data_when_price_config_missing(self, mock_repos):
         """Full execute() raises InvalidPaymentDataError when price config for a mapped type is missing."""
-        mock_repos["price_config_repo"].find_by_key = AsyncMock(return_value=None)
+        mock_repos["price_config_repo"].get_many = AsyncMock(return_value={})
         use_case = RegisterManualPaymentUseCase(
             payment_repository=mock_repos["payment_repo"],
             member_payment_repository=mock_repos["member_payment_repo"],
@@ -0,0 +1,142 @@
+"""Micro-benchmarks for the pure-Python hot paths of the response pipeline.
+
+They need no database and only run with ``--benchmark-only``::
+
+    pytest tests/benchmarks --benchmark-only
+    pytest tests/benchmarks --benchmark-only --benchmark-autosave      # store a run
+    pytest tests/benchmarks --benchmark-only --benchmark-compare --benchmark-compare-fail=mean:15%
+
+Every benchmark also records the peak memory allocated by one call
+(``tracemalloc``) as ``peak_alloc_kib`` in its extra info.
+"""
+
+import random
+import tracemalloc
+from datetime import datetime, timedelta
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+from bson import ObjectId
+
+# Rows per benchmarked call
+ROW_COUNTS = (1_000, 10_000, 100_000)
+
+_BENCHMARK_DIR = Path(__file__).parent
+_NOW = datetime(2026, 6, 1)
+
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption("benchmark_only", False):
+        return
+    skip = pytest.mark.skip(reason="micro-benchmark: run with --benchmark-only")
+    for item in items:
+        if _BENCHMARK_DIR in Path(str(item.fspath)).parents:
+            item.add_marker(skip)
+
+
+@pytest.fixture(params=ROW_COUNTS, ids=lambda n: f"{n // 1000}k")
+def rows(request):
+    return request.param
+
+
+@pytest.fixture
+def measure(benchmark):
+    """Benchmark ``func(*args)`` and record the peak allocation of one call.
+
+    The allocation pass runs on its own so tracemalloc does not slow down
+    the timed rounds.
+    """
+    def run(func, *args):
+        tracemalloc.start()
+        try:
+            func(*args)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        benchmark.extra_info["peak_alloc_kib"] = round(peak / 1024, 1)
+        return benchmark(func, *args)
+    return run
+
+
+def build_repository(repository_class, module):
+    """Instantiate a MongoDB repository without a database, for its mapping methods."""
+    with patch(f"src.infrastructure.adapters.repositories.{module}.get_database", return_value=MagicMock()):
+        return repository_class()
+
+
+def member_documents(count: int, seed: int = 0) -> list:
+    rng = random.Random(seed)
+    first_names = ["Ana", "Carlos", "Maria", "Luis", "Elena", "Pablo", "Lucia", "Jose"]
+    last_names = ["Garcia", "Lopez", "Martinez", "Sanchez", "Perez", "Gomez", "Ruiz", "Diaz"]
+    return [
+        {
+            "_id": ObjectId(),
+            "first_name": rng.choice(first_names),
+            "last_name": f"{rng.choice(last_names)} {rng.choice(last_names)}",
+            "dni": f"{rng.randint(10_000_000, 99_999_999)}Z",
+            "email": "null" if n % 20 == 0 else f"member{n}@example.com",
+            "phone": "+34 600 000 000",
+            "address": f"Calle Mayor {n}",
+            "city": "Madrid",
+            "province": "Madrid",
+            "postal_code": "28013",
+            "country": "Spain",
+            "birth_date": datetime(1960 + n % 45, 1 + n % 12, 1 + n % 28),
+            "club_id": f"club-{n % 300}",
+            "status": rng.choice(["active", "active", "active", "inactive", "pending"]),
+            "registration_date": _NOW - timedelta(days=n % 1500),
+            "created_at": _NOW - timedelta(days=n % 1500),
+            "updated_at": _NOW,
+        }
+        for n in range(count)
+    ]
+
+
+def license_documents(member_ids: list, seed: int = 0) -> list:
+    """One to three licenses per member, a mix of current and expired, legacy and current field names."""
+    rng = random.Random(seed)
+    documents = []
+    for n, member_id in enumerate(member_ids):
+        for _ in range(rng.randint(1, 3)):
+            issue_date = _NOW - timedelta(days=rng.randint(30, 900))
+            grade_field = ("technical_grade", "instructor_category") if n % 3 else ("grado_tecnico", "categoria_instructor")
+            documents.append({
+                "_id": ObjectId(),
+                "license_number": f"SA-{len(documents):07d}",
+                "member_id": member_id,
+                "license_type": rng.choice(["kyu", "dan", "instructor"]),
+                "grade": rng.choice(["1st Kyu", "2nd Dan", "3rd Dan"]),
+                "status": "active",
+                "issue_date": issue_date,
+                "expiration_date": None if n % 7 == 0 else issue_date + timedelta(days=rng.randint(200, 700)),
+                grade_field[0]: rng.choice(["kyu", "dan"]),
+                grade_field[1]: rng.choice(["none", "none", "fukushidoin", "shidoin"]),
+                "created_at": issue_date,
+                "updated_at": _NOW,
+            })
+    return documents
+
+
+def insurance_documents(member_ids: list, seed: int = 0) -> list:
+    rng = random.Random(seed)
+    documents = []
+    for member_id in member_ids:
+        for insurance_type in ("accident", "civil_liability"):
+            if rng.random() < 0.3:
+                continue
+            start_date = _NOW - timedelta(days=rng.randint(30, 365))
+            documents.append({
+                "_id": ObjectId(),
+                "member_id": member_id,
+                "insurance_type": insurance_type,
+                "policy_number": f"POL-{len(documents):07d}",
+                "insurance_company": "Mapfre Seguros",
+                "start_date": start_date,
+                "end_date": start_date + timedelta(days=365),
+                "status": rng.choice(["active", "active", "expired"]),
+                "coverage_amount": 50000.0,
+                "created_at": start_date,
+                "updated_at": _NOW,
+            })
+    return documents
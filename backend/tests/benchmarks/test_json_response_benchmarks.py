@@ -0,0 +1,58 @@
+"""Members list endpoint at 10k rows: FastAPI's standard response path against FastJSONRoute."""
+
+from typing import List
+
+import pytest
+from fastapi import APIRouter, FastAPI
+from fastapi.responses import JSONResponse
+from fastapi.testclient import TestClient
+
+from src.infrastructure.adapters.repositories.mongodb_member_repository import MongoDBMemberRepository
+from src.infrastructure.web.dto.member_dto import InsuranceSummary, LicenseSummary, MemberResponse
+from src.infrastructure.web.mappers_member import MemberMapper
+from src.infrastructure.web.responses import FastJSONRoute, PydanticJSONResponse
+from tests.benchmarks.conftest import build_repository, member_documents
+
+ROWS = 10_000
+
+# (route class, default response class) per variant
+VARIANTS = {
+    "standard": (None, JSONResponse),
+    "pydantic_response": (None, PydanticJSONResponse),
+    "fast_route": (FastJSONRoute, PydanticJSONResponse),
+}
+
+
+@pytest.fixture(scope="module")
+def member_responses():
+    repository = build_repository(MongoDBMemberRepository, "mongodb_member_repository")
+    responses = MemberMapper.to_response_list([repository._to_domain(doc) for doc in member_documents(ROWS)])
+    for response in responses:
+        response.club_name = "Aikido Dojo Central Madrid"
+        response.license_summary = LicenseSummary(grade="1st Dan", technical_grade="dan", status="active")
+        response.insurance_summary = InsuranceSummary(has_accident=True, accident_status="active")
+    return responses
+
+
+def _client(variant: str, member_responses) -> TestClient:
+    route_class, response_class = VARIANTS[variant]
+    router = APIRouter(route_class=route_class) if route_class else APIRouter()
+
+    @router.get("/members", response_model=List[MemberResponse])
+    async def get_members():
+        return member_responses
+
+    app = FastAPI(default_response_class=response_class)
+    app.include_router(router)
+    return TestClient(app)
+
+
+@pytest.mark.benchmark(group="members_list_10k")
+@pytest.mark.parametrize("variant", list(VARIANTS))
+def test_members_list_endpoint(measure, member_responses, variant):
+    client = _client(variant, member_responses)
+
+    response = measure(client.get, "/members")
+
+    assert response.status_code == 200
+    assert len(response.json()) == ROWS
@@ -0,0 +1,79 @@
+"""Per-member work of the club payment summary: grade groups, payment map and ordering."""
+
+import asyncio
+import random
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.application.read_models import LicenseRef, MemberRef
+from src.application.use_cases.member_payment.get_club_payment_summary_use_case import (
+    GetClubPaymentSummaryUseCase,
+    grade_groups_by_member,
+)
+from src.domain.entities.license import InstructorCategory, LicenseStatus, TechnicalGrade
+from src.domain.entities.member import MemberStatus
+from src.domain.entities.member_payment import MemberPayment, MemberPaymentStatus, MemberPaymentType
+from tests.benchmarks.conftest import _NOW
+
+YEAR = 2026
+
+
+def _license_refs(count: int, seed: int = 0) -> list:
+    rng = random.Random(seed)
+    return [
+        LicenseRef(
+            id=f"l{n}",
+            member_id=f"m{n % max(1, count // 2)}",
+            license_number=f"SA-{n:07d}",
+            status=LicenseStatus.ACTIVE,
+            technical_grade=rng.choice(list(TechnicalGrade)),
+            instructor_category=rng.choice(list(InstructorCategory)),
+            expiration_date=_NOW.replace(year=YEAR + rng.choice([-1, 0, 1])),
+        )
+        for n in range(count)
+    ]
+
+
+def _use_case(rows: int) -> GetClubPaymentSummaryUseCase:
+    rng = random.Random(0)
+    members = [
+        MemberRef(id=f"m{n}", full_name=f"Member {rng.randint(0, rows)}", club_id="c1", status=MemberStatus.ACTIVE)
+        for n in range(rows)
+    ]
+    payments = [
+        MemberPayment(
+            id=f"p{n}", payment_id=f"pp{n}", member_id=f"m{rng.randrange(rows)}", payment_year=YEAR,
+            payment_type=rng.choice(list(MemberPaymentType)), amount=45.0,
+            status=MemberPaymentStatus.COMPLETED,
+        )
+        for n in range(rows)
+    ]
+    club_repository = MagicMock()
+    club_repository.find_by_id = AsyncMock(return_value=MagicMock(id="c1", name="Club"))
+    member_repository = MagicMock()
+    member_repository.find_refs_by_club_id = AsyncMock(return_value=members)
+    payment_repository = MagicMock()
+    payment_repository.get_summary_by_member_ids = AsyncMock(return_value={"by_type": {}})
+    payment_repository.find_by_member_ids_year = AsyncMock(return_value=payments)
+    license_repository = MagicMock()
+    license_repository.find_refs_by_member_ids = AsyncMock(return_value=_license_refs(rows))
+    return GetClubPaymentSummaryUseCase(payment_repository, club_repository, member_repository, license_repository)
+
+
+@pytest.mark.benchmark(group="grade_groups")
+def test_grade_groups_by_member(measure, rows):
+    licenses = _license_refs(rows)
+
+    groups = measure(grade_groups_by_member, licenses, YEAR)
+
+    assert set(groups.values()) <= {"shidoin", "fukushidoin", "dan", "kyu"}
+
+
+@pytest.mark.benchmark(group="club_payment_summary")
+def test_club_payment_summary(measure, rows):
+    use_case = _use_case(rows)
+
+    result = measure(lambda: asyncio.run(use_case.execute("c1", YEAR)))
+
+    assert result.total_members == rows
@@ -0,0 +1,99 @@
+"""Document -> entity -> DTO -> JSON, and the per-member summaries of the members endpoints."""
+
+import json
+from collections import defaultdict
+from typing import List
+
+import pytest
+from pydantic import TypeAdapter
+
+from src.infrastructure.adapters.repositories.mongodb_insurance_repository import MongoDBInsuranceRepository
+from src.infrastructure.adapters.repositories.mongodb_license_repository import MongoDBLicenseRepository
+from src.infrastructure.adapters.repositories.mongodb_member_repository import MongoDBMemberRepository
+from src.infrastructure.web.dto.member_dto import MemberResponse
+from src.infrastructure.web.mappers_member import MemberMapper
+from src.infrastructure.web.routers.members import _build_insurance_summary, _build_license_summary
+from tests.benchmarks.conftest import (
+    build_repository,
+    insurance_documents,
+    license_documents,
+    member_documents,
+)
+
+MEMBER_RESPONSES = TypeAdapter(List[MemberResponse])
+
+
+def _group_by_member(entities) -> list:
+    grouped = defaultdict(list)
+    for entity in entities:
+        grouped[entity.member_id].append(entity)
+    return list(grouped.values())
+
+
+@pytest.fixture
+def member_repository():
+    return build_repository(MongoDBMemberRepository, "mongodb_member_repository")
+
+
+@pytest.fixture
+def members(member_repository, rows):
+    return [member_repository._to_domain(doc) for doc in member_documents(rows)]
+
+
+@pytest.mark.benchmark(group="member_to_domain")
+def test_member_to_domain(measure, member_repository, rows):
+    documents = member_documents(rows)
+
+    result = measure(lambda: [member_repository._to_domain(doc) for doc in documents])
+
+    assert len(result) == rows
+
+
+@pytest.mark.benchmark(group="license_to_domain")
+def test_license_to_domain(measure, rows):
+    repository = build_repository(MongoDBLicenseRepository, "mongodb_license_repository")
+    documents = license_documents([f"m{n}" for n in range(rows)])
+
+    result = measure(lambda: [repository._to_domain(doc) for doc in documents])
+
+    assert len(result) == len(documents)
+
+
+@pytest.mark.benchmark(group="member_mapper")
+def test_member_mapper_to_response_list(measure, members, rows):
+    result = measure(MemberMapper.to_response_list, members)
+
+    assert len(result) == rows
+
+
+@pytest.mark.benchmark(group="member_response_json")
+def test_member_responses_to_json(measure, members):
+    responses = MemberMapper.to_response_list(members)
+
+    body = measure(lambda: json.dumps(MEMBER_RESPONSES.dump_python(responses, mode="json")))
+
+    assert body.startswith("[")
+
+
+@pytest.mark.benchmark(group="license_summary")
+def test_build_license_summary(measure, rows):
+    repository = build_repository(MongoDBLicenseRepository, "mongodb_license_repository")
+    per_member = _group_by_member(
+        repository._to_domain(doc) for doc in license_documents([f"m{n}" for n in range(rows)])
+    )
+
+    result = measure(lambda: [_build_license_summary(licenses) for licenses in per_member])
+
+    assert len(result) == rows
+
+
+@pytest.mark.benchmark(group="insurance_summary")
+def test_build_insurance_summary(measure, rows):
+    repository = build_repository(MongoDBInsuranceRepository, "mongodb_insurance_repository")
+    per_member = _group_by_member(
+        repository._to_domain(doc) for doc in insurance_documents([f"m{n}" for n in range(rows)])
+    )
+
+    result = measure(lambda: [_build_insurance_summary(insurances) for insurances in per_member])
+
+    assert len(result) == len(per_member)
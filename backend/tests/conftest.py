@@ -11,6 +11,8 @@ from src.infrastructure.adapters.repositories.mongodb_seminar_repository import
 from src.infrastructure.adapters.repositories.mongodb_payment_repository import MongoDBPaymentRepository
 from src.infrastructure.adapters.repositories.mongodb_insurance_repository import MongoDBInsuranceRepository
 
+pytest_plugins = ["tests.plugins.query_budget"]
+
 
 @pytest.fixture(scope="function")
 def db():
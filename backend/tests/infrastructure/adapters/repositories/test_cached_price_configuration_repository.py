@@ -0,0 +1,189 @@
+"""Tests for the read-through price configuration cache."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.domain.entities.price_configuration import PriceConfiguration
+from src.application.ports.read_routing import ReadRouting, current_read_routing, reporting
+from src.infrastructure.adapters.repositories.cached_price_configuration_repository import (
+    PRICE_CACHE_NAME,
+    CachedPriceConfigurationRepository,
+)
+
+
+def _config(key, price=30.0, is_active=True, config_id=None):
+    return PriceConfiguration(
+        id=config_id or key, key=key, price=price, description=key, is_active=is_active,
+        category="license" if "-" in key else "insurance",
+    )
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def inner():
+    repository = MagicMock()
+    repository.find_all = AsyncMock(return_value=[
+        _config("kyu-none-adulto", 30.0),
+        _config("dan-none-adulto", 45.0),
+        _config("seguro_accidentes", 15.0),
+        _config("kyu-none-infantil", 10.0, is_active=False),
+    ])
+    return repository
+
+
+@pytest.fixture
+def versions():
+    store = MagicMock()
+    store.get = AsyncMock(return_value=1)
+    store.bump = AsyncMock(return_value=2)
+    return store
+
+
+@pytest.fixture
+def clock():
+    return _Clock()
+
+
+@pytest.fixture
+def cache(inner, versions, clock):
+    return CachedPriceConfigurationRepository(inner, versions, check_seconds=5, max_age_seconds=300, clock=clock)
+
+
+@pytest.mark.unit
+@pytest.mark.repository
+@pytest.mark.asyncio
+class TestCachedPriceLookups:
+
+    async def test_table_is_loaded_once_for_many_lookups(self, cache, inner):
+        for _ in range(10):
+            await cache.find_by_key("kyu-none-adulto")
+            await cache.find_by_license_type("dan", "none", "adulto")
+
+        inner.find_all.assert_awaited_once()
+
+    async def test_get_many_returns_active_configurations_by_key(self, cache):
+        found = await cache.get_many(["kyu-none-adulto", "seguro_accidentes", "kyu-none-infantil", "missing"])
+
+        assert {key: config.price for key, config in found.items()} == {
+            "kyu-none-adulto": 30.0,
+            "seguro_accidentes": 15.0,
+        }
+
+    async def test_lookups_match_the_database_semantics(self, cache):
+        assert [c.key for c in await cache.find_all()] == [
+            "dan-none-adulto", "kyu-none-adulto", "kyu-none-infantil", "seguro_accidentes",
+        ]
+        assert [c.key for c in await cache.find_active(limit=2)] == ["dan-none-adulto", "kyu-none-adulto"]
+        assert (await cache.find_by_key("kyu-none-infantil")).price == 10.0
+        assert await cache.find_by_license_type("kyu", "none", "infantil") is None
+
+    async def test_callers_get_copies(self, cache):
+        config = await cache.find_by_key("kyu-none-adulto")
+        config.price = 999.0
+
+        assert (await cache.find_by_key("kyu-none-adulto")).price == 30.0
+
+    async def test_concurrent_first_lookups_load_once(self, cache, inner):
+        await asyncio.gather(*(cache.get_many(["kyu-none-adulto"]) for _ in range(20)))
+
+        inner.find_all.assert_awaited_once()
+
+
+@pytest.mark.unit
+@pytest.mark.repository
+@pytest.mark.asyncio
+class TestCachedPriceInvalidation:
+
+    async def test_write_bumps_version_and_reloads(self, cache, inner, versions):
+        await cache.find_by_key("kyu-none-adulto")
+        inner.update = AsyncMock(return_value=_config("kyu-none-adulto", 35.0))
+
+        await cache.update(_config("kyu-none-adulto", 35.0))
+        versions.get.return_value = 2
+        await cache.find_by_key("kyu-none-adulto")
+
+        versions.bump.assert_awaited_once_with(PRICE_CACHE_NAME)
+        assert inner.find_all.await_count == 2
+
+    async def test_version_is_not_checked_within_the_interval(self, cache, versions, clock):
+        await cache.find_by_key("kyu-none-adulto")
+        clock.now += 4
+        await cache.find_by_key("kyu-none-adulto")
+
+        versions.get.assert_awaited_once()
+
+    async def test_other_worker_write_is_seen_after_the_check_interval(self, cache, inner, versions, clock):
+        await cache.find_by_key("kyu-none-adulto")
+        versions.get.return_value = 7
+        clock.now += 6
+
+        await cache.find_by_key("kyu-none-adulto")
+
+        assert inner.find_all.await_count == 2
+
+    async def test_unchanged_version_keeps_the_table(self, cache, inner, clock):
+        await cache.find_by_key("kyu-none-adulto")
+        clock.now += 6
+
+        await cache.find_by_key("kyu-none-adulto")
+
+        inner.find_all.assert_awaited_once()
+
+    async def test_table_is_reloaded_when_older_than_max_age(self, cache, inner, clock):
+        await cache.find_by_key("kyu-none-adulto")
+        clock.now += 301
+
+        await cache.find_by_key("kyu-none-adulto")
+
+        assert inner.find_all.await_count == 2
+
+    async def test_failed_delete_does_not_bump(self, cache, inner, versions):
+        inner.delete = AsyncMock(return_value=False)
+
+        assert await cache.delete("missing") is False
+        versions.bump.assert_not_called()
+
+    async def test_reads_for_writes_bypass_the_cache(self, cache, inner):
+        inner.find_by_id = AsyncMock(return_value=_config("kyu-none-adulto"))
+        inner.exists_by_key = AsyncMock(return_value=True)
+
+        await cache.find_by_id("kyu-none-adulto")
+        assert await cache.exists_by_key("kyu-none-adulto")
+
+        inner.find_all.assert_not_called()
+
+    async def test_collection_version_is_that_of_the_table_served(self, cache, inner):
+        """A stale table must not be served under the database's newer ETag."""
+        inner.get_collection_version = AsyncMock()
+        stamps = [config.updated_at for config in inner.find_all.return_value]
+        await cache.find_all()
+        # Another worker writes; this one has not reloaded yet
+        inner.find_all.return_value = [_config("kyu-none-adulto", 35.0)]
+
+        version = await cache.get_collection_version()
+
+        assert version.count == 4
+        assert version.last_modified == max(stamps)
+        inner.get_collection_version.assert_not_called()
+
+    async def test_table_reads_the_primary_inside_a_reporting_call(self, cache, inner, versions):
+        routings = []
+        versions.get = AsyncMock(side_effect=lambda name: routings.append(current_read_routing()) or 1)
+        inner.find_all = AsyncMock(side_effect=lambda: routings.append(current_read_routing()) or [])
+
+        @reporting
+        async def report():
+            return await cache.find_active()
+
+        await report()
+
+        assert routings == [ReadRouting.PRIMARY, ReadRouting.PRIMARY]
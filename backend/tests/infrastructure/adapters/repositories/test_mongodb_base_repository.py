@@ -0,0 +1,255 @@
+"""Tests for the write helpers shared by the MongoDB repositories."""
+
+import pytest
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock
+from bson import ObjectId
+from pymongo import ASCENDING, DESCENDING
+
+from src.application.ports.query_spec import QuerySpec
+from src.application.read_models.collection_version import CollectionVersion
+from src.domain.entities.member import MemberStatus
+from src.domain.exceptions.base import ValidationError
+from src.infrastructure.adapters.repositories.mongodb_base_repository import (
+    MongoDBBaseRepository,
+    decode_cursor,
+    encode_cursor,
+    keyset_filter,
+)
+
+
+class _DictRepository(MongoDBBaseRepository):
+    """Minimal repository whose domain entity is the document itself."""
+
+    SPEC_FIELDS = {"club_id": "club_id", "status": "status", "created_at": "created_at"}
+
+    def __init__(self, collection):
+        self.collection = collection
+
+    def _to_domain(self, doc):
+        if doc is None:
+            return None
+        return {**doc, "id": str(doc["_id"])}
+
+
+@pytest.mark.unit
+@pytest.mark.repository
+@pytest.mark.asyncio
+class TestMongoDBBaseRepository:
+
+    async def test_insert_many_returns_entities_without_reading_back(self):
+        collection = MagicMock()
+        ids = [ObjectId(), ObjectId()]
+        collection.insert_many = AsyncMock(return_value=MagicMock(inserted_ids=ids))
+        collection.find = MagicMock()
+
+        result = await _DictRepository(collection)._insert_many([{"n": 1}, {"n": 2, "_id": "x"}])
+
+        assert [r["id"] for r in result] == [str(i) for i in ids]
+        assert [r["n"] for r in result] == [1, 2]
+        collection.find.assert_not_called()
+
+    async def test_insert_many_with_no_documents_skips_write(self):
+        collection = MagicMock()
+        collection.insert_many = AsyncMock()
+
+        assert await _DictRepository(collection)._insert_many([]) == []
+        collection.insert_many.assert_not_called()
+
+    async def test_update_returns_none_when_document_missing(self):
+        collection = MagicMock()
+        collection.find_one_and_update = AsyncMock(return_value=None)
+
+        assert await _DictRepository(collection)._update(str(ObjectId()), {"n": 1}) is None
+
+    async def test_iter_streams_with_batch_size(self):
+        docs = [{"_id": ObjectId(), "n": n} for n in range(3)]
+
+        class _Cursor:
+            def __init__(self):
+                self.batch_size = MagicMock(return_value=self)
+
+            def __aiter__(self):
+                return self._gen()
+
+            async def _gen(self):
+                for doc in docs:
+                    yield doc
+
+        cursor = _Cursor()
+        collection = MagicMock()
+        collection.find = MagicMock(return_value=cursor)
+
+        result = [item async for item in _DictRepository(collection)._iter({"n": {"$gte": 0}}, batch_size=2)]
+
+        assert [r["n"] for r in result] == [0, 1, 2]
+        collection.find.assert_called_once_with({"n": {"$gte": 0}}, None)
+        cursor.batch_size.assert_called_once_with(2)
+
+    async def test_iter_rejects_non_positive_batch_size(self):
+        with pytest.raises(ValueError):
+            async for _ in _DictRepository(MagicMock())._iter({}, batch_size=0):
+                pass
+
+
+def _page_collection(documents):
+    collection = MagicMock()
+    cursor = MagicMock()
+    cursor.sort.return_value = cursor
+    cursor.limit.return_value = cursor
+    cursor.to_list = AsyncMock(return_value=documents)
+    collection.find = MagicMock(return_value=cursor)
+    return collection, cursor
+
+
+@pytest.mark.unit
+@pytest.mark.repository
+class TestKeysetCursor:
+
+    def test_cursor_round_trips_dates_and_object_ids(self):
+        doc_id = ObjectId()
+        created_at = datetime(2026, 3, 1, 12, 30)
+
+        assert decode_cursor(encode_cursor(created_at, doc_id)) == (created_at, doc_id)
+
+    def test_invalid_cursor_raises_validation_error(self):
+        with pytest.raises(ValidationError):
+            decode_cursor("not-a-cursor")
+
+    def test_descending_filter_keeps_documents_without_sort_value(self):
+        doc_id = ObjectId()
+
+        assert keyset_filter("created_at", DESCENDING, datetime(2026, 1, 1), doc_id) == {"$or": [
+            {"created_at": {"$lt": datetime(2026, 1, 1)}},
+            {"created_at": datetime(2026, 1, 1), "_id": {"$lt": doc_id}},
+            {"created_at": None},
+        ]}
+
+    def test_ascending_filter_after_null_sort_value(self):
+        doc_id = ObjectId()
+
+        assert keyset_filter("last_name", ASCENDING, None, doc_id) == {"$or": [
+            {"last_name": None, "_id": {"$gt": doc_id}},
+            {"last_name": {"$ne": None}},
+        ]}
+
+
+@pytest.mark.unit
+@pytest.mark.repository
+@pytest.mark.asyncio
+class TestFindPage:
+
+    async def test_first_page_fetches_one_extra_to_detect_more(self):
+        docs = [{"_id": ObjectId(), "last_name": name} for name in ("A", "B", "C")]
+        collection, cursor = _page_collection(docs)
+
+        page = await _DictRepository(collection)._find_page({"club_id": "c1"}, "last_name", ASCENDING, 2)
+
+        assert [item["last_name"] for item in page.items] == ["A", "B"]
+        assert decode_cursor(page.next_cursor) == ("B", docs[1]["_id"])
+        collection.find.assert_called_once_with({"club_id": "c1"})
+        cursor.sort.assert_called_once_with([("last_name", ASCENDING), ("_id", ASCENDING)])
+        cursor.limit.assert_called_once_with(3)
+
+    async def test_next_page_combines_filter_and_position(self):
+        last_id = ObjectId()
+        collection, _ = _page_collection([{"_id": ObjectId(), "last_name": "C"}])
+
+        page = await _DictRepository(collection)._find_page(
+            {"club_id": "c1"}, "last_name", ASCENDING, 2, cursor=encode_cursor("B", last_id)
+        )
+
+        query = collection.find.call_args.args[0]
+        assert query == {"$and": [{"club_id": "c1"}, keyset_filter("last_name", ASCENDING, "B", last_id)]}
+        assert page.next_cursor is None
+        assert not page.has_more
+
+
+@pytest.mark.unit
+@pytest.mark.repository
+@pytest.mark.asyncio
+class TestFindBySpec:
+
+    async def test_spec_compiles_to_single_query(self):
+        collection, cursor = _page_collection([{"_id": ObjectId(), "club_id": "c1"}])
+        spec = (
+            QuerySpec()
+            .where(club_id="c1", status=[MemberStatus.ACTIVE, MemberStatus.PENDING], missing=None)
+            .order_by("created_at", descending=True)
+            .take(10)
+        )
+
+        result = await _DictRepository(collection)._find_by_spec(spec)
+
+        assert len(result) == 1
+        collection.find.assert_called_once_with(
+            {"club_id": "c1", "status": {"$in": ["active", "pending"]}}
+        )
+        cursor.sort.assert_called_once_with([("created_at", DESCENDING)])
+        cursor.limit.assert_called_once_with(10)
+
+    async def test_extra_query_is_anded_with_spec_filters(self):
+        collection, cursor = _page_collection([])
+
+        await _DictRepository(collection)._find_by_spec(QuerySpec().where(club_id="c1"), {"n": 1})
+
+        collection.find.assert_called_once_with({"$and": [{"club_id": "c1"}, {"n": 1}]})
+        cursor.limit.assert_not_called()
+
+    async def test_unknown_field_is_rejected(self):
+        with pytest.raises(ValueError):
+            await _DictRepository(MagicMock())._find_by_spec(QuerySpec().where(password="x"))
+
+
+def _versioned_collection(count, latest):
+    collection = MagicMock()
+    cursor = MagicMock()
+    cursor.sort.return_value = cursor
+    cursor.limit.return_value = cursor
+    cursor.to_list = AsyncMock(return_value=latest)
+    collection.find = MagicMock(return_value=cursor)
+    collection.count_documents = AsyncMock(return_value=count)
+    collection.estimated_document_count = AsyncMock(return_value=count)
+    collection.create_index = AsyncMock()
+    return collection
+
+
+@pytest.mark.unit
+@pytest.mark.repository
+@pytest.mark.asyncio
+class TestCollectionVersion:
+
+    async def test_counts_and_reads_latest_update_from_the_index(self):
+        stamp = datetime(2026, 5, 4, 10, 30)
+        collection = _versioned_collection(7, [{"updated_at": stamp}])
+
+        version = await _DictRepository(collection)._collection_version({"club_id": "c1"})
+
+        assert version == CollectionVersion(count=7, last_modified=stamp)
+        collection.count_documents.assert_awaited_once_with({"club_id": "c1"})
+        assert collection.find.call_args.args[0] == {"club_id": "c1"}
+        cursor = collection.find.return_value
+        cursor.sort.assert_called_once_with("updated_at", DESCENDING)
+        cursor.limit.assert_called_once_with(1)
+
+    async def test_unfiltered_version_uses_the_estimated_count(self):
+        collection = _versioned_collection(12, [{"updated_at": datetime(2026, 5, 4)}])
+
+        version = await _DictRepository(collection)._collection_version()
+
+        assert version.count == 12
+        collection.estimated_document_count.assert_awaited_once()
+        collection.count_documents.assert_not_called()
+
+    async def test_empty_filter_result_is_zero_version(self):
+        collection = _versioned_collection(0, [])
+
+        assert await _DictRepository(collection)._collection_version({"club_id": "c1"}) == CollectionVersion()
+
+    async def test_version_indexes_lead_with_each_scope_field(self):
+        collection = _versioned_collection(0, [])
+
+        await _DictRepository(collection)._ensure_version_indexes("club_id")
+
+        keys = [call.args[0] for call in collection.create_index.await_args_list]
+        assert keys == [[("updated_at", DESCENDING)], [("club_id", ASCENDING), ("updated_at", DESCENDING)]]
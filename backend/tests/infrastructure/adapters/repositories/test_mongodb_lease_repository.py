@@ -0,0 +1,52 @@
+"""Tests for the MongoDB lease repository."""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from pymongo.errors import DuplicateKeyError
+
+from src.infrastructure.adapters.repositories.mongodb_lease_repository import MongoDBLeaseRepository
+
+
+@pytest.fixture
+def collection():
+    collection = MagicMock()
+    collection.find_one_and_update = AsyncMock(return_value=None)
+    collection.delete_one = AsyncMock()
+    return collection
+
+
+@pytest.fixture
+def repository(collection):
+    database = MagicMock()
+    database.__getitem__ = MagicMock(return_value=collection)
+    with patch(
+        "src.infrastructure.adapters.repositories.mongodb_lease_repository.get_database",
+        return_value=database,
+    ):
+        return MongoDBLeaseRepository()
+
+
+@pytest.mark.unit
+@pytest.mark.repository
+@pytest.mark.asyncio
+class TestMongoDBLeaseRepository:
+
+    async def test_acquire_upserts_a_free_or_own_lease(self, repository, collection):
+        assert await repository.try_acquire("scheduler", "host:1", 30) is True
+
+        query, update = collection.find_one_and_update.await_args.args
+        assert query["_id"] == "scheduler"
+        assert {"holder": "host:1"} in query["$or"]
+        assert update[0]["$set"]["expires_at"] == {"$add": ["$$NOW", 30000]}
+        assert collection.find_one_and_update.await_args.kwargs == {"upsert": True}
+
+    async def test_lease_held_by_another_worker_is_not_acquired(self, repository, collection):
+        collection.find_one_and_update.side_effect = DuplicateKeyError("E11000")
+
+        assert await repository.try_acquire("scheduler", "host:2", 30) is False
+
+    async def test_release_only_deletes_own_lease(self, repository, collection):
+        await repository.release("scheduler", "host:1")
+
+        collection.delete_one.assert_awaited_once_with({"_id": "scheduler", "holder": "host:1"})
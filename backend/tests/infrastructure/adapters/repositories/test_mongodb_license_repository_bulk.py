@@ -0,0 +1,105 @@
+"""Tests for the bulk write path of MongoDBLicenseRepository."""
+
+import pytest
+from unittest.mock import patch, AsyncMock, MagicMock
+from bson import ObjectId
+from datetime import datetime
+from pymongo import InsertOne, UpdateOne
+
+from src.domain.entities.license import License, LicenseType, LicenseStatus
+from src.infrastructure.adapters.repositories.mongodb_license_repository import (
+    MongoDBLicenseRepository,
+)
+
+
+@pytest.fixture
+def collections():
+    return {"licenses": MagicMock(), "license_number_sequences": MagicMock()}
+
+
+@pytest.fixture
+def repository(collections):
+    database = MagicMock()
+    database.__getitem__ = MagicMock(side_effect=lambda name: collections[name])
+    with patch(
+        "src.infrastructure.adapters.repositories.mongodb_license_repository.get_database",
+        return_value=database,
+    ):
+        return MongoDBLicenseRepository()
+
+
+def _license(**overrides) -> License:
+    values = dict(
+        license_number="LIC-2026-0001",
+        member_id="member-1",
+        license_type=LicenseType.KYU,
+        grade="Kyu",
+        status=LicenseStatus.ACTIVE,
+        issue_date=datetime(2026, 1, 1),
+        expiration_date=datetime(2026, 12, 31, 23, 59, 59),
+    )
+    values.update(overrides)
+    return License(**values)
+
+
+@pytest.mark.unit
+@pytest.mark.repository
+@pytest.mark.asyncio
+class TestReserveLicenseNumbers:
+
+    async def test_seeds_counter_from_existing_licenses_on_first_use(self, repository, collections):
+        sequences = collections["license_number_sequences"]
+        sequences.count_documents = AsyncMock(return_value=0)
+        sequences.update_one = AsyncMock()
+        sequences.find_one_and_update = AsyncMock(return_value={"_id": "LIC-2026-", "value": 7})
+        collections["licenses"].count_documents = AsyncMock(return_value=4)
+
+        numbers = await repository.reserve_license_numbers("LIC-2026-", 3)
+
+        assert numbers == ["LIC-2026-0005", "LIC-2026-0006", "LIC-2026-0007"]
+        sequences.update_one.assert_awaited_once_with(
+            {"_id": "LIC-2026-"}, {"$max": {"value": 4}}, upsert=True
+        )
+        assert sequences.find_one_and_update.await_args.args[1] == {"$inc": {"value": 3}}
+
+    async def test_existing_counter_is_incremented_without_counting(self, repository, collections):
+        sequences = collections["license_number_sequences"]
+        sequences.count_documents = AsyncMock(return_value=1)
+        sequences.find_one_and_update = AsyncMock(return_value={"_id": "LIC-2026-", "value": 42})
+        collections["licenses"].count_documents = AsyncMock()
+
+        numbers = await repository.reserve_license_numbers("LIC-2026-", 1)
+
+        assert numbers == ["LIC-2026-0042"]
+        collections["licenses"].count_documents.assert_not_called()
+
+    async def test_zero_count_reserves_nothing(self, repository, collections):
+        assert await repository.reserve_license_numbers("LIC-2026-", 0) == []
+
+
+@pytest.mark.unit
+@pytest.mark.repository
+@pytest.mark.asyncio
+class TestUpsertBulk:
+
+    async def test_inserts_new_and_updates_existing_in_one_bulk_write(self, repository, collections):
+        collections["licenses"].bulk_write = AsyncMock()
+        existing_id = str(ObjectId())
+        new = _license()
+        renewed = _license(id=existing_id, license_number="LIC-2025-0003", is_renewed=True)
+
+        result = await repository.upsert_bulk([new, renewed])
+
+        collections["licenses"].bulk_write.assert_awaited_once()
+        operations = collections["licenses"].bulk_write.await_args.args[0]
+        assert isinstance(operations[0], InsertOne)
+        assert isinstance(operations[1], UpdateOne)
+        assert result == [new, renewed]
+        assert ObjectId.is_valid(new.id)
+        assert renewed.id == existing_id
+
+    async def test_empty_list_skips_write(self, repository, collections):
+        collections["licenses"].bulk_write = AsyncMock()
+
+        assert await repository.upsert_bulk([]) == []
+        collections["licenses"].bulk_write.assert_not_called()
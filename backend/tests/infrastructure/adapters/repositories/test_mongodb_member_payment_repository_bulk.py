@@ -0,0 +1,102 @@
+"""Tests for the bulk write path of MongoDBMemberPaymentRepository."""
+
+import pytest
+from unittest.mock import patch, AsyncMock, MagicMock
+from bson import ObjectId
+from pymongo.errors import BulkWriteError
+
+from src.application.ports.member_payment_repository import PartialBulkWriteError
+from src.domain.entities.member_payment import MemberPayment, MemberPaymentType
+from src.infrastructure.adapters.repositories.mongodb_member_payment_repository import (
+    MongoDBMemberPaymentRepository,
+)
+
+
+@pytest.fixture
+def collection():
+    return MagicMock()
+
+
+@pytest.fixture
+def repository(collection):
+    database = MagicMock()
+    database.__getitem__ = MagicMock(return_value=collection)
+    with patch(
+        "src.infrastructure.adapters.repositories.mongodb_member_payment_repository.get_database",
+        return_value=database,
+    ):
+        return MongoDBMemberPaymentRepository()
+
+
+def _payment(member_id: str, payment_id: str = "import_1") -> MemberPayment:
+    return MemberPayment(
+        payment_id=payment_id,
+        member_id=member_id,
+        payment_year=2026,
+        payment_type=MemberPaymentType.LICENCIA_KYU,
+        concept="Licencia Kyu 2026",
+        amount=30.0,
+    )
+
+
+@pytest.mark.unit
+@pytest.mark.repository
+@pytest.mark.asyncio
+class TestUpsertBulk:
+
+    async def test_writes_every_payment_in_one_ordered_bulk_write(self, repository, collection):
+        collection.bulk_write = AsyncMock()
+
+        result = await repository.upsert_bulk([_payment("member-1"), _payment("member-2")])
+
+        assert all(p.id for p in result)
+        operations = collection.bulk_write.await_args.args[0]
+        assert len(operations) == 2
+        assert collection.bulk_write.await_args.kwargs["ordered"] is True
+
+    async def test_failed_write_reports_how_many_payments_were_written(self, repository, collection):
+        collection.bulk_write = AsyncMock(side_effect=BulkWriteError({
+            "nUpserted": 2,
+            "writeErrors": [{"index": 2, "code": 11000, "errmsg": "E11000 duplicate key"}],
+        }))
+
+        with pytest.raises(PartialBulkWriteError) as raised:
+            await repository.upsert_bulk([_payment(f"member-{i}") for i in range(4)])
+
+        assert raised.value.written == 2
+        assert str(raised.value) == "E11000 duplicate key"
+
+
+@pytest.mark.unit
+@pytest.mark.repository
+@pytest.mark.asyncio
+class TestCreateBulk:
+
+    async def test_upserts_on_payment_member_and_type(self, repository, collection):
+        ids = {0: ObjectId(), 1: ObjectId()}
+        collection.bulk_write = AsyncMock(return_value=MagicMock(upserted_ids=ids))
+        collection.find = MagicMock()
+
+        result = await repository.create_bulk([_payment("member-1", "pay-1"), _payment("member-2", "pay-1")])
+
+        assert [p.id for p in result] == [str(ids[0]), str(ids[1])]
+        operation = collection.bulk_write.await_args.args[0][0]
+        assert operation._filter == {"payment_id": "pay-1", "member_id": "member-1", "payment_type": "licencia_kyu"}
+        assert list(operation._doc) == ["$setOnInsert"]
+        collection.find.assert_not_called()
+
+    async def test_repeated_call_returns_the_records_already_stored(self, repository, collection):
+        stored_id = ObjectId()
+        collection.bulk_write = AsyncMock(return_value=MagicMock(upserted_ids={}))
+        cursor = MagicMock()
+        cursor.to_list = AsyncMock(return_value=[{
+            "_id": stored_id, "payment_id": "pay-1", "member_id": "member-1",
+            "payment_type": "licencia_kyu", "payment_year": 2026, "concept": "Licencia Kyu 2026",
+            "amount": 30.0, "status": "completed",
+        }])
+        collection.find = MagicMock(return_value=cursor)
+
+        result = await repository.create_bulk([_payment("member-1", "pay-1")])
+
+        assert [p.id for p in result] == [str(stored_id)]
+        assert collection.find.call_args.args[0] == {"payment_id": {"$in": ["pay-1"]}}
@@ -0,0 +1,99 @@
+"""Tests for the search keys and token prefix search of the member repository."""
+
+import pytest
+from unittest.mock import patch, AsyncMock, MagicMock
+from bson import ObjectId
+
+from src.application.ports.query_spec import QuerySpec
+from src.domain.entities.member import Member
+from src.infrastructure.adapters.repositories.mongodb_member_repository import (
+    MongoDBMemberRepository,
+)
+
+
+def _repository(collection) -> MongoDBMemberRepository:
+    database = MagicMock()
+    database.__getitem__ = MagicMock(return_value=collection)
+    with patch(
+        "src.infrastructure.adapters.repositories.mongodb_member_repository.get_database",
+        return_value=database,
+    ):
+        return MongoDBMemberRepository()
+
+
+def _find_collection(documents):
+    collection = MagicMock()
+    cursor = MagicMock()
+    cursor.sort.return_value = cursor
+    cursor.limit.return_value = cursor
+    cursor.to_list = AsyncMock(return_value=documents)
+    collection.find = MagicMock(return_value=cursor)
+    return collection, cursor
+
+
+@pytest.mark.unit
+@pytest.mark.repository
+class TestMemberSearchKeys:
+
+    def test_document_carries_normalized_search_keys(self):
+        member = Member(
+            first_name="Íñigo", last_name="Sáez-Ruiz", dni="12.345.678-z", email=" Inigo@Mail.ES",
+        )
+
+        doc = _repository(MagicMock())._to_document(member)
+
+        assert doc["search_tokens"] == ["inigo", "saez", "ruiz"]
+        assert doc["search_dni"] == "12345678Z"
+        assert doc["search_email"] == "inigo@mail.es"
+
+
+@pytest.mark.unit
+@pytest.mark.repository
+@pytest.mark.asyncio
+class TestSearchByName:
+
+    async def test_tokens_become_anchored_prefixes_scoped_by_club(self):
+        collection, cursor = _find_collection([])
+
+        await _repository(collection).search_by_name("José Gar", QuerySpec().where(club_id="c1").take(10))
+
+        collection.find.assert_called_once_with({"$and": [
+            {"club_id": "c1"},
+            {"$and": [
+                {"search_tokens": {"$regex": "^jose"}},
+                {"search_tokens": {"$regex": "^gar"}},
+            ]},
+        ]})
+        cursor.limit.assert_called_once_with(10)
+
+    async def test_query_without_letters_skips_database(self):
+        collection = MagicMock()
+
+        assert await _repository(collection).search_by_name("1234") == []
+        collection.find.assert_not_called()
+
+    async def test_backfill_updates_documents_missing_keys(self):
+        docs = [{"_id": ObjectId(), "first_name": "Ana", "last_name": "Núñez", "email": "null"}]
+
+        class _Cursor:
+            def batch_size(self, size):
+                return self
+
+            def __aiter__(self):
+                return self._gen()
+
+            async def _gen(self):
+                for doc in docs:
+                    yield doc
+
+        collection = MagicMock()
+        collection.find = MagicMock(return_value=_Cursor())
+        collection.bulk_write = AsyncMock()
+
+        assert await _repository(collection).backfill_search_keys() == 1
+
+        assert collection.find.call_args.args[0] == {"search_tokens": {"$exists": False}}
+        (update,), = collection.bulk_write.await_args.args
+        assert update._doc == {"$set": {
+            "search_tokens": ["ana", "nunez"], "search_dni": "", "search_email": "",
+        }}
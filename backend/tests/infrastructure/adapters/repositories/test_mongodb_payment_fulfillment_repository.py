@@ -0,0 +1,75 @@
+"""Tests for MongoDBPaymentFulfillmentRepository."""
+
+import pytest
+from datetime import datetime
+from unittest.mock import patch, AsyncMock, MagicMock
+
+from src.domain.entities.payment_fulfillment import FulfillmentStep, FulfillmentStepStatus
+from src.infrastructure.adapters.repositories.mongodb_payment_fulfillment_repository import (
+    MongoDBPaymentFulfillmentRepository,
+)
+
+
+class _Cursor:
+    def __init__(self, docs):
+        self.docs = docs
+        self.sort = MagicMock(return_value=self)
+        self.limit = MagicMock(return_value=self)
+
+    def __aiter__(self):
+        return self._iterate()
+
+    async def _iterate(self):
+        for doc in self.docs:
+            yield doc
+
+
+@pytest.fixture
+def collection():
+    return MagicMock()
+
+
+@pytest.fixture
+def repository(collection):
+    database = MagicMock()
+    database.__getitem__ = MagicMock(return_value=collection)
+    with patch(
+        "src.infrastructure.adapters.repositories.mongodb_payment_fulfillment_repository.get_database",
+        return_value=database,
+    ):
+        return MongoDBPaymentFulfillmentRepository()
+
+
+@pytest.mark.unit
+@pytest.mark.repository
+@pytest.mark.asyncio
+class TestPaymentFulfillmentRepository:
+
+    async def test_ensure_indexes_makes_payment_id_unique(self, repository, collection):
+        collection.create_index = AsyncMock()
+
+        await repository.ensure_indexes()
+
+        first = collection.create_index.await_args_list[0]
+        assert first.args[0] == [("payment_id", 1)]
+        assert first.kwargs["unique"] is True
+
+    async def test_find_unfinished_filters_stale_records_below_attempt_cap(self, repository, collection):
+        cutoff = datetime(2026, 10, 1, 12, 0)
+        cursor = _Cursor([{
+            "_id": "f1",
+            "payment_id": "pay-001",
+            "steps": {"email": {"status": "running", "attempts": 1}},
+        }])
+        collection.find = MagicMock(return_value=cursor)
+
+        result = await repository.find_unfinished(updated_before=cutoff, max_attempts=9, limit=10)
+
+        query = collection.find.call_args.args[0]
+        assert query["updated_at"] == {"$lt": cutoff}
+        assert {
+            "steps.email.status": {"$in": ["pending", "running", "failed"]},
+            "steps.email.attempts": {"$lt": 9},
+        } in query["$or"]
+        cursor.limit.assert_called_once_with(10)
+        assert result[0].steps[FulfillmentStep.EMAIL].status == FulfillmentStepStatus.RUNNING
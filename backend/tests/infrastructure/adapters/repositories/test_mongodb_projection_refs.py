@@ -0,0 +1,133 @@
+"""Tests for the projected read-model queries of the member and license repositories."""
+
+import pytest
+from unittest.mock import patch, AsyncMock, MagicMock
+from bson import ObjectId
+from datetime import datetime
+
+from src.application.read_models import LicenseRef, MemberRef
+from src.domain.entities.license import InstructorCategory, LicenseStatus, TechnicalGrade
+from src.domain.entities.member import MemberStatus
+from src.infrastructure.adapters.repositories.mongodb_member_repository import (
+    MongoDBMemberRepository,
+)
+from src.infrastructure.adapters.repositories.mongodb_license_repository import (
+    MongoDBLicenseRepository,
+)
+
+
+def _build(repository_class, module, collection):
+    database = MagicMock()
+    database.__getitem__ = MagicMock(return_value=collection)
+    with patch(
+        f"src.infrastructure.adapters.repositories.{module}.get_database",
+        return_value=database,
+    ):
+        return repository_class()
+
+
+def _collection_returning(documents):
+    collection = MagicMock()
+    cursor = MagicMock()
+    cursor.to_list = AsyncMock(return_value=documents)
+    collection.find = MagicMock(return_value=cursor)
+    return collection
+
+
+@pytest.mark.unit
+@pytest.mark.repository
+@pytest.mark.asyncio
+class TestMemberRefs:
+
+    async def test_club_refs_use_projection(self):
+        member_id = ObjectId()
+        collection = _collection_returning([{
+            "_id": member_id,
+            "first_name": "Ana",
+            "last_name": "García",
+            "club_id": "club1",
+            "status": "inactive",
+        }])
+        repository = _build(MongoDBMemberRepository, "mongodb_member_repository", collection)
+
+        refs = await repository.find_refs_by_club_id("club1")
+
+        query, projection = collection.find.call_args.args
+        assert query == {"club_id": "club1"}
+        assert set(projection) == {"first_name", "last_name", "club_id", "status"}
+        assert refs == [MemberRef(
+            id=str(member_id), full_name="Ana García", club_id="club1",
+            status=MemberStatus.INACTIVE,
+        )]
+        assert not refs[0].is_active
+
+    async def test_extra_fields_are_projected(self):
+        collection = _collection_returning([{
+            "_id": ObjectId(), "first_name": "Ana", "last_name": "García",
+            "email": "null", "dni": "12345678Z",
+        }])
+        repository = _build(MongoDBMemberRepository, "mongodb_member_repository", collection)
+
+        refs = await repository.find_refs_by_club_id("club1", extra_fields=("email", "dni"))
+
+        _, projection = collection.find.call_args.args
+        assert {"email", "dni"} <= set(projection)
+        assert refs[0].email == ""
+        assert refs[0].dni == "12345678Z"
+
+    async def test_unknown_extra_field_is_rejected(self):
+        repository = _build(MongoDBMemberRepository, "mongodb_member_repository", MagicMock())
+
+        with pytest.raises(ValueError):
+            await repository.find_refs_by_club_id("club1", extra_fields=("password",))
+
+    async def test_refs_by_ids_match_string_and_object_ids(self):
+        member_id = ObjectId()
+        collection = _collection_returning([])
+        repository = _build(MongoDBMemberRepository, "mongodb_member_repository", collection)
+
+        await repository.find_refs_by_ids([str(member_id), "legacy-id"])
+
+        query, _ = collection.find.call_args.args
+        assert set(query["_id"]["$in"]) == {str(member_id), "legacy-id", member_id}
+
+    async def test_refs_by_ids_with_no_ids_skips_query(self):
+        collection = MagicMock()
+        repository = _build(MongoDBMemberRepository, "mongodb_member_repository", collection)
+
+        assert await repository.find_refs_by_ids([]) == []
+        collection.find.assert_not_called()
+
+
+@pytest.mark.unit
+@pytest.mark.repository
+@pytest.mark.asyncio
+class TestLicenseRefs:
+
+    async def test_refs_apply_legacy_fields_and_expiry(self):
+        license_id = ObjectId()
+        collection = _collection_returning([{
+            "_id": license_id,
+            "member_id": "m1",
+            "license_number": "LIC-2020-0001",
+            "status": "active",
+            "grado_tecnico": "dan",
+            "categoria_instructor": "shidoin",
+            "issue_date": datetime(2020, 1, 1),
+        }])
+        repository = _build(MongoDBLicenseRepository, "mongodb_license_repository", collection)
+
+        refs = await repository.find_refs_by_member_ids(["m1"])
+
+        query, projection = collection.find.call_args.args
+        assert query == {"member_id": {"$in": ["m1"]}}
+        assert "member_id" in projection
+        assert refs == [LicenseRef(
+            id=str(license_id),
+            member_id="m1",
+            license_number="LIC-2020-0001",
+            status=LicenseStatus.EXPIRED,
+            technical_grade=TechnicalGrade.DAN,
+            instructor_category=InstructorCategory.SHIDOIN,
+            expiration_date=datetime(2020, 12, 31, 23, 59, 59),
+        )]
@@ -4,6 +4,7 @@ import pytest
 from unittest.mock import AsyncMock, Mock, patch
 from datetime import datetime
 from bson import ObjectId
+from pymongo import ReturnDocument
 
 from src.domain.entities.user import User
 from src.infrastructure.adapters.repositories.mongodb_user_repository import MongoDBUserRepository
@@ -284,22 +285,22 @@ class TestMongoDBUserRepository:
         mock_insert_result = Mock()
         mock_insert_result.inserted_id = inserted_id
         mock_mongo_collection.insert_one.return_value = mock_insert_result
-        mock_mongo_collection.find_one.return_value = created_doc
-        
+
         # Act
         result = await repository.create(user_entity)
-        
+
         # Assert
         assert isinstance(result, User)
         assert result.id == str(inserted_id)
-        
-        # Verify insert_one was called with document without _id
+        assert result.email == user_entity.email
+
+        # Verify insert_one was called with the new document
+        mock_mongo_collection.insert_one.assert_called_once()
         insert_call = mock_mongo_collection.insert_one.call_args[0][0]
-        assert "_id" not in insert_call
         assert insert_call["email"] == user_entity.email
-        
-        # Verify find_one was called to get the created document
-        mock_mongo_collection.find_one.assert_called_once_with({"_id": inserted_id})
+
+        # The created user is built from the written document, not read back
+        mock_mongo_collection.find_one.assert_not_called()
 
     async def test_create_removes_id_from_document_before_insert(self, repository, mock_mongo_collection, user_entity_with_id, user_document):
         """Test that create removes _id from document before inserting."""
@@ -307,18 +308,21 @@ class TestMongoDBUserRepository:
         inserted_id = ObjectId()
         mock_insert_result = Mock()
         mock_insert_result.inserted_id = inserted_id
-        mock_mongo_collection.insert_one.return_value = mock_insert_result
-        # Return a complete user document, not just the _id
-        created_doc = user_document.copy()
-        created_doc["_id"] = inserted_id
-        mock_mongo_collection.find_one.return_value = created_doc
+        inserted_docs = []
+
+        async def insert_one(doc):
+            # Copy: the repository adds the generated _id after the insert
+            inserted_docs.append(dict(doc))
+            return mock_insert_result
+
+        mock_mongo_collection.insert_one = AsyncMock(side_effect=insert_one)
 
         # Act
-        await repository.create(user_entity_with_id)
+        result = await repository.create(user_entity_with_id)
 
         # Assert
-        insert_call = mock_mongo_collection.insert_one.call_args[0][0]
-        assert "_id" not in insert_call
+        assert "_id" not in inserted_docs[0]
+        assert result.id == str(inserted_id)
 
     async def test_update_updates_existing_user_and_returns_updated_user(
         self, repository, mock_mongo_collection, user_entity_with_id, user_document
@@ -329,26 +333,27 @@ class TestMongoDBUserRepository:
         updated_doc["_id"] = ObjectId(user_entity_with_id.id)
         updated_doc["username"] = "updated_username"
         
-        mock_mongo_collection.update_one.return_value = Mock(modified_count=1)
-        mock_mongo_collection.find_one.return_value = updated_doc
-        
+        mock_mongo_collection.find_one_and_update = AsyncMock(return_value=updated_doc)
+
         # Act
         result = await repository.update(user_entity_with_id)
-        
+
         # Assert
         assert isinstance(result, User)
-        
-        # Verify update_one was called with correct filter and update
-        update_call = mock_mongo_collection.update_one.call_args
+        assert result.username == "updated_username"
+
+        # Verify find_one_and_update was called with correct filter and update
+        update_call = mock_mongo_collection.find_one_and_update.call_args
         filter_dict = update_call[0][0]
         update_dict = update_call[0][1]
-        
+
         assert filter_dict == {"_id": ObjectId(user_entity_with_id.id)}
         assert "$set" in update_dict
         assert "_id" not in update_dict["$set"]  # Should not update _id
-        
-        # Verify find_one was called to get the updated document
-        mock_mongo_collection.find_one.assert_called_once_with({"_id": ObjectId(user_entity_with_id.id)})
+        assert update_call.kwargs["return_document"] == ReturnDocument.AFTER
+
+        # The updated document comes back in the same round trip
+        mock_mongo_collection.find_one.assert_not_called()
 
     async def test_update_raises_value_error_when_user_has_no_id(self, repository, user_entity):
         """Test that update raises ValueError when user has no ID."""
@@ -364,17 +369,16 @@ class TestMongoDBUserRepository:
     async def test_update_removes_id_from_update_document(self, repository, mock_mongo_collection, user_entity_with_id, user_document):
         """Test that update removes _id from the update document."""
         # Arrange
-        mock_mongo_collection.update_one.return_value = Mock(modified_count=1)
         # Return a complete user document, not just the _id
         updated_doc = user_document.copy()
         updated_doc["_id"] = ObjectId(user_entity_with_id.id)
-        mock_mongo_collection.find_one.return_value = updated_doc
+        mock_mongo_collection.find_one_and_update = AsyncMock(return_value=updated_doc)
 
         # Act
         await repository.update(user_entity_with_id)
 
         # Assert
-        update_call = mock_mongo_collection.update_one.call_args[0][1]
+        update_call = mock_mongo_collection.find_one_and_update.call_args[0][1]
         assert "_id" not in update_call["$set"]
 
     async def test_delete_removes_user_and_returns_true_when_successful(self, repository, mock_mongo_collection):
@@ -0,0 +1,204 @@
+"""Tests for the single-flight cache and the use case decorator."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from prometheus_client import REGISTRY
+
+from src.application.ports.cache import cached
+from src.infrastructure.cache import Cache, InMemoryCacheBackend
+
+
+def _sample(name, **labels):
+    return REGISTRY.get_sample_value(name, labels) or 0.0
+
+
+@pytest.fixture
+def cache():
+    return Cache("test", InMemoryCacheBackend(), default_ttl=60)
+
+
+def _loader(value="value"):
+    return AsyncMock(return_value=value)
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestGetOrLoad:
+
+    async def test_value_is_loaded_once(self, cache):
+        loader = _loader()
+
+        assert await cache.get_or_load("k", loader) == "value"
+        assert await cache.get_or_load("k", loader) == "value"
+        loader.assert_awaited_once()
+
+    async def test_none_is_cached(self, cache):
+        loader = _loader(None)
+
+        await cache.get_or_load("k", loader)
+        assert await cache.get_or_load("k", loader) is None
+        loader.assert_awaited_once()
+
+    async def test_concurrent_misses_share_one_load(self, cache):
+        release = asyncio.Event()
+        calls = 0
+
+        async def loader():
+            nonlocal calls
+            calls += 1
+            await release.wait()
+            return calls
+
+        lookups = [asyncio.create_task(cache.get_or_load("k", loader)) for _ in range(10)]
+        await asyncio.sleep(0)
+        release.set()
+
+        assert await asyncio.gather(*lookups) == [1] * 10
+        assert calls == 1
+
+    async def test_errors_reach_every_waiter_and_are_not_cached(self, cache):
+        release = asyncio.Event()
+
+        async def failing():
+            await release.wait()
+            raise ValueError("boom")
+
+        lookups = [asyncio.create_task(cache.get_or_load("k", failing)) for _ in range(3)]
+        await asyncio.sleep(0)
+        release.set()
+        results = await asyncio.gather(*lookups, return_exceptions=True)
+
+        assert all(isinstance(result, ValueError) for result in results)
+        assert await cache.get_or_load("k", _loader("ok")) == "ok"
+
+    async def test_waiters_reload_when_the_loading_task_is_cancelled(self, cache):
+        started = asyncio.Event()
+
+        async def hanging():
+            started.set()
+            await asyncio.Event().wait()
+
+        leader = asyncio.create_task(cache.get_or_load("k", hanging))
+        await started.wait()
+        waiter = asyncio.create_task(cache.get_or_load("k", _loader("fresh")))
+        await asyncio.sleep(0)
+        leader.cancel()
+
+        assert await waiter == "fresh"
+
+    async def test_load_overlapping_an_invalidation_is_not_stored(self, cache):
+        started, release = asyncio.Event(), asyncio.Event()
+
+        async def slow():
+            started.set()
+            await release.wait()
+            return "old"
+
+        lookup = asyncio.create_task(cache.get_or_load("k", slow, tags=["t"]))
+        await started.wait()
+        await cache.invalidate_tags("t")
+        release.set()
+
+        assert await lookup == "old"
+        assert await cache.get_or_load("k", _loader("new")) == "new"
+
+    async def test_backend_errors_fall_back_to_the_loader(self):
+        backend = MagicMock()
+        backend.get = AsyncMock(side_effect=ConnectionError("down"))
+        backend.set = AsyncMock(side_effect=ConnectionError("down"))
+        cache = Cache("test", backend)
+
+        assert await cache.get_or_load("k", _loader()) == "value"
+
+    async def test_lookups_are_counted(self):
+        cache = Cache("counted", InMemoryCacheBackend())
+        hits = _sample("cache_lookups_total", cache="counted", result="hit")
+        misses = _sample("cache_lookups_total", cache="counted", result="miss")
+
+        await cache.get_or_load("k", _loader())
+        await cache.get_or_load("k", _loader())
+
+        assert _sample("cache_lookups_total", cache="counted", result="hit") == hits + 1
+        assert _sample("cache_lookups_total", cache="counted", result="miss") == misses + 1
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestInvalidation:
+
+    async def test_delete_drops_one_key(self, cache):
+        await cache.get_or_load("a", _loader("a"))
+        await cache.get_or_load("b", _loader("b"))
+
+        await cache.delete("a")
+
+        assert await cache.get_or_load("a", _loader("a2")) == "a2"
+        assert await cache.get_or_load("b", _loader("b2")) == "b"
+
+    async def test_tags_drop_every_tagged_key(self, cache):
+        await cache.get_or_load("a", _loader("a"), tags=["club:1"])
+        await cache.get_or_load("b", _loader("b"), tags=["club:1", "club:2"])
+        await cache.get_or_load("c", _loader("c"), tags=["club:2"])
+
+        await cache.invalidate_tags("club:1")
+
+        assert await cache.get_or_load("a", _loader("a2")) == "a2"
+        assert await cache.get_or_load("b", _loader("b2")) == "b2"
+        assert await cache.get_or_load("c", _loader("c2")) == "c"
+
+    async def test_namespaces_share_a_backend_without_clashing(self):
+        backend = InMemoryCacheBackend()
+        first, second = Cache("first", backend), Cache("second", backend)
+
+        await first.get_or_load("k", _loader("one"), tags=["t"])
+        await second.get_or_load("k", _loader("two"), tags=["t"])
+        await first.invalidate_tags("t")
+
+        assert await second.get_or_load("k", _loader("other")) == "two"
+
+
+class _UseCase:
+    def __init__(self, cache=None):
+        self.cache = cache
+        self.calls = 0
+
+    @cached(key=lambda member_id, year: f"{member_id}:{year}", tags=lambda member_id, year: [member_id])
+    async def execute(self, member_id, year):
+        self.calls += 1
+        return f"{member_id}-{year}-{self.calls}"
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestCachedDecorator:
+
+    async def test_results_are_cached_by_key(self, cache):
+        use_case = _UseCase(cache)
+
+        assert await use_case.execute("m1", 2026) == "m1-2026-1"
+        assert await use_case.execute("m1", year=2026) == "m1-2026-1"
+        assert await use_case.execute("m1", 2027) == "m1-2027-2"
+
+    async def test_tags_are_computed_from_the_arguments(self, cache):
+        use_case = _UseCase(cache)
+        await use_case.execute("m1", 2026)
+
+        await cache.invalidate_tags("m1")
+
+        assert await use_case.execute("m1", 2026) == "m1-2026-2"
+
+    async def test_runs_uncached_without_a_cache(self):
+        use_case = _UseCase()
+
+        await use_case.execute("m1", 2026)
+        await use_case.execute("m1", 2026)
+
+        assert use_case.calls == 2
+
+
+@pytest.mark.unit
+def test_cached_rejects_sync_functions():
+    with pytest.raises(TypeError):
+        cached(key=str)(lambda self: None)
@@ -0,0 +1,84 @@
+"""Tests for the in-process cache backend."""
+
+import pytest
+
+from src.infrastructure.cache import MISSING, InMemoryCacheBackend
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return _Clock()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestInMemoryCacheBackend:
+
+    async def test_entries_expire_after_their_ttl(self, clock):
+        backend = InMemoryCacheBackend(clock=clock)
+        await backend.set("k", "v", ttl=10, tags=[])
+
+        clock.now += 9
+        assert await backend.get("k") == "v"
+        clock.now += 1
+        assert await backend.get("k") is MISSING
+        assert len(backend) == 0
+
+    async def test_least_recently_used_entry_is_evicted_first(self, clock):
+        backend = InMemoryCacheBackend(max_entries=2, clock=clock)
+        await backend.set("a", "a", ttl=60, tags=[])
+        await backend.set("b", "b", ttl=60, tags=[])
+        await backend.get("a")
+
+        await backend.set("c", "c", ttl=60, tags=[])
+
+        assert await backend.get("b") is MISSING
+        assert await backend.get("a") == "a"
+        assert await backend.get("c") == "c"
+
+    async def test_size_stays_within_max_bytes(self, clock):
+        backend = InMemoryCacheBackend(max_bytes=100, clock=clock)
+        await backend.set("a", b"x" * 40, ttl=60, tags=[])
+        await backend.set("b", b"x" * 40, ttl=60, tags=[])
+
+        await backend.set("c", b"x" * 40, ttl=60, tags=[])
+
+        assert backend.size == 80
+        assert await backend.get("a") is MISSING
+
+    async def test_values_larger_than_the_cap_are_not_stored(self, clock):
+        backend = InMemoryCacheBackend(max_bytes=100, clock=clock)
+        await backend.set("a", b"x" * 40, ttl=60, tags=[])
+
+        await backend.set("big", b"x" * 101, ttl=60, tags=[])
+
+        assert await backend.get("big") is MISSING
+        assert await backend.get("a") == b"x" * 40
+
+    async def test_overwriting_a_key_replaces_its_size_and_tags(self, clock):
+        backend = InMemoryCacheBackend(clock=clock)
+        await backend.set("k", "old value", ttl=60, tags=["old"])
+        await backend.set("k", "new", ttl=60, tags=["new"])
+
+        await backend.delete_tags(["old"])
+
+        assert await backend.get("k") == "new"
+        assert backend.size == 3
+
+    async def test_delete_tags_drops_tagged_entries(self, clock):
+        backend = InMemoryCacheBackend(clock=clock)
+        await backend.set("a", 1, ttl=60, tags=["t"])
+        await backend.set("b", 2, ttl=60, tags=[])
+
+        await backend.delete_tags(["t"])
+
+        assert await backend.get("a") is MISSING
+        assert await backend.get("b") == 2
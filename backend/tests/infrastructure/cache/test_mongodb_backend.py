@@ -0,0 +1,70 @@
+"""Tests for the MongoDB cache backend."""
+
+import pickle
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.infrastructure.cache import MISSING, MongoDBCacheBackend
+
+
+@pytest.fixture
+def collection():
+    collection = MagicMock()
+    collection.find_one = AsyncMock(return_value=None)
+    collection.replace_one = AsyncMock()
+    collection.delete_one = AsyncMock()
+    collection.delete_many = AsyncMock()
+    collection.create_index = AsyncMock()
+    return collection
+
+
+@pytest.fixture
+def backend(collection):
+    database = MagicMock()
+    database.__getitem__ = MagicMock(return_value=collection)
+    with patch("src.infrastructure.cache.mongodb.get_database", return_value=database):
+        return MongoDBCacheBackend()
+
+
+@pytest.mark.unit
+@pytest.mark.repository
+@pytest.mark.asyncio
+class TestMongoDBCacheBackend:
+
+    async def test_set_stores_pickled_value_with_expiry_and_tags(self, backend, collection):
+        before = datetime.utcnow()
+
+        await backend.set("dashboard:all", {"total": 3}, ttl=30, tags=["dashboard:stats"])
+
+        selector, doc = collection.replace_one.await_args.args
+        assert selector == {"_id": "dashboard:all"}
+        assert pickle.loads(doc["value"]) == {"total": 3}
+        assert doc["tags"] == ["dashboard:stats"]
+        assert 29 <= (doc["expires_at"] - before).total_seconds() <= 31
+        assert collection.replace_one.await_args.kwargs == {"upsert": True}
+
+    async def test_get_ignores_expired_entries_not_yet_purged(self, backend, collection):
+        assert await backend.get("dashboard:all") is MISSING
+
+        query = collection.find_one.await_args.args[0]
+        assert query["_id"] == "dashboard:all"
+        assert "$gt" in query["expires_at"]
+
+    async def test_get_returns_the_unpickled_value(self, backend, collection):
+        collection.find_one.return_value = {"value": pickle.dumps([1, 2])}
+
+        assert await backend.get("k") == [1, 2]
+
+    async def test_delete_tags_removes_matching_entries(self, backend, collection):
+        await backend.delete_tags(["a", "b"])
+        await backend.delete_tags([])
+
+        collection.delete_many.assert_awaited_once_with({"tags": {"$in": ["a", "b"]}})
+
+    async def test_ensure_indexes_creates_the_ttl_index(self, backend, collection):
+        await backend.ensure_indexes()
+
+        ttl_call = collection.create_index.await_args_list[0]
+        assert ttl_call.kwargs["expireAfterSeconds"] == 0
@@ -0,0 +1,105 @@
+"""Tests for the relay of invalidations between workers."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.infrastructure.cache.invalidation import WorkerInvalidation
+
+
+@pytest.fixture
+def versions():
+    versions = MagicMock()
+    versions.get_many = AsyncMock(return_value={"clubs": 3})
+    versions.bump = AsyncMock(return_value=4)
+    return versions
+
+
+@pytest.fixture
+def hook():
+    return MagicMock()
+
+
+@pytest.fixture
+def invalidation(versions, hook):
+    invalidation = WorkerInvalidation(versions)
+    invalidation.register("clubs", hook)
+    return invalidation
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestWorkerInvalidation:
+
+    async def test_first_poll_only_records_the_counters(self, invalidation, hook):
+        assert await invalidation.poll() == []
+        hook.assert_not_called()
+
+    async def test_counter_moved_by_another_worker_runs_the_hooks(self, invalidation, versions, hook):
+        await invalidation.poll()
+        versions.get_many.return_value = {"clubs": 5}
+
+        assert await invalidation.poll() == ["clubs"]
+        hook.assert_called_once()
+
+    async def test_publish_runs_local_hooks_and_bumps_the_counter(self, invalidation, versions, hook):
+        await invalidation.poll()
+
+        await invalidation.publish("clubs")
+        versions.get_many.return_value = {"clubs": 4}
+
+        versions.bump.assert_awaited_once_with("clubs")
+        assert await invalidation.poll() == []
+        hook.assert_called_once()
+
+    async def test_publish_without_local_only_signals_the_other_workers(self, invalidation, versions, hook):
+        await invalidation.poll()
+
+        await invalidation.publish("clubs", local=False)
+        versions.get_many.return_value = {"clubs": 4}
+
+        versions.bump.assert_awaited_once_with("clubs")
+        assert await invalidation.poll() == []
+        hook.assert_not_called()
+
+    async def test_publish_survives_a_database_error(self, invalidation, versions, hook):
+        versions.bump.side_effect = ConnectionError("down")
+
+        await invalidation.publish("clubs")
+
+        hook.assert_called_once()
+
+    async def test_failing_hook_does_not_stop_the_others(self, invalidation, versions):
+        invalidation.register("clubs", MagicMock(side_effect=RuntimeError("boom")))
+        second = MagicMock()
+        invalidation.register("clubs", second)
+
+        await invalidation.publish("clubs")
+
+        second.assert_called_once()
+
+    async def test_publish_does_not_swallow_a_bump_from_another_worker(self):
+        counters = {"members": 1}
+
+        async def bump(name):
+            counters[name] += 1
+            return counters[name]
+
+        versions = MagicMock()
+        versions.get_many = AsyncMock(side_effect=lambda names: {name: counters[name] for name in names})
+        versions.bump = AsyncMock(side_effect=bump)
+        hook_a, hook_b = MagicMock(), MagicMock()
+        worker_a, worker_b = WorkerInvalidation(versions), WorkerInvalidation(versions)
+        worker_a.register("members", hook_a)
+        worker_b.register("members", hook_b)
+        await worker_a.poll()
+        await worker_b.poll()
+
+        # B writes, then A writes before polling
+        await worker_b.publish("members", local=False)
+        await worker_a.publish("members", local=False)
+
+        assert await worker_a.poll() == ["members"]
+        hook_a.assert_called_once()
+        assert await worker_b.poll() == ["members"]
+        hook_b.assert_called_once()
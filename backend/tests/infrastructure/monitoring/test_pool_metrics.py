@@ -0,0 +1,91 @@
+"""Tests for the MongoDB connection pool metrics listener and client settings."""
+
+import importlib.util
+
+import pytest
+from pymongo import monitoring
+
+from src.config.settings import DatabaseSettings
+from src.infrastructure.monitoring.pool_metrics import PoolMetricsListener
+
+ADDRESS = ("db.local", 27017)
+
+
+@pytest.mark.unit
+class TestPoolMetricsListener:
+
+    def test_tracks_pool_size_checkouts_and_wait(self):
+        listener = PoolMetricsListener()
+        listener.pool_created(monitoring.PoolCreatedEvent(ADDRESS, {}))
+        for connection_id in (1, 2):
+            listener.connection_created(monitoring.ConnectionCreatedEvent(ADDRESS, connection_id))
+        listener.connection_checked_out(monitoring.ConnectionCheckedOutEvent(ADDRESS, 1, 0.002))
+        listener.connection_checked_out(monitoring.ConnectionCheckedOutEvent(ADDRESS, 2, 0.010))
+        listener.connection_checked_in(monitoring.ConnectionCheckedInEvent(ADDRESS, 1))
+        listener.connection_check_out_failed(
+            monitoring.ConnectionCheckOutFailedEvent(ADDRESS, "timeout", 0.5)
+        )
+        listener.connection_closed(monitoring.ConnectionClosedEvent(ADDRESS, 1, "idle"))
+
+        stats = listener.snapshot()["db.local:27017"]
+
+        assert stats["open_connections"] == 1
+        assert stats["checked_out"] == 1
+        assert stats["checkouts"] == 2
+        assert stats["checkout_failures"] == 1
+        assert stats["checkout_wait_seconds_total"] == pytest.approx(0.512)
+        assert stats["checkout_wait_seconds_max"] == 0.5
+
+    def test_closed_pool_is_forgotten(self):
+        listener = PoolMetricsListener()
+        listener.pool_created(monitoring.PoolCreatedEvent(ADDRESS, {}))
+        listener.pool_closed(monitoring.PoolClosedEvent(ADDRESS))
+
+        assert listener.snapshot() == {}
+
+
+@pytest.mark.unit
+class TestDatabaseSettings:
+
+    def test_client_options_from_environment(self, monkeypatch):
+        monkeypatch.setenv("MONGODB_MAX_POOL_SIZE", "50")
+        monkeypatch.setenv("MONGODB_MIN_POOL_SIZE", "5")
+        monkeypatch.setenv("MONGODB_MAX_IDLE_TIME_MS", "60000")
+        monkeypatch.setenv("MONGODB_COMPRESSORS", "zlib, ")
+        monkeypatch.setenv("MONGODB_RETRY_WRITES", "false")
+        monkeypatch.setenv("MONGODB_READ_PREFERENCE", "primaryPreferred")
+
+        settings = DatabaseSettings()
+        settings.validate()
+
+        assert settings.client_options() == {
+            "maxPoolSize": 50,
+            "minPoolSize": 5,
+            "maxIdleTimeMS": 60000,
+            "serverSelectionTimeoutMS": 30000,
+            "connectTimeoutMS": 20000,
+            "retryWrites": False,
+            "readPreference": "primaryPreferred",
+            "compressors": "zlib",
+        }
+
+    @pytest.mark.parametrize("key, value", [
+        ("MONGODB_READ_PREFERENCE", "secondaryOnly"),
+        ("MONGODB_COMPRESSORS", "lz4"),
+        ("MONGODB_MIN_POOL_SIZE", "500"),
+    ])
+    def test_invalid_values_are_rejected(self, monkeypatch, key, value):
+        monkeypatch.setenv(key, value)
+
+        with pytest.raises(ValueError):
+            DatabaseSettings().validate()
+
+    def test_compressor_without_its_module_is_rejected(self, monkeypatch):
+        find_spec = importlib.util.find_spec
+        monkeypatch.setattr(
+            importlib.util, "find_spec", lambda name: None if name == "zstandard" else find_spec(name)
+        )
+        monkeypatch.setenv("MONGODB_COMPRESSORS", "zstd,zlib")
+
+        with pytest.raises(ValueError, match="zstandard"):
+            DatabaseSettings().validate()
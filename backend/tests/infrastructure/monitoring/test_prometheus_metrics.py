@@ -0,0 +1,138 @@
+"""Tests for the Prometheus metrics, the request latency middleware and /metrics."""
+
+from datetime import timedelta
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from prometheus_client import REGISTRY
+from pymongo import monitoring
+
+from src.infrastructure.monitoring.prometheus import (
+    RENDER_DURATION,
+    CommandLatencyListener,
+    render_metrics,
+    scheduler_job,
+    timed,
+)
+from src.infrastructure.web.middleware import PrometheusMiddleware
+
+CONNECTION = ("db.local", 27017)
+
+
+def _sample(name, **labels):
+    return REGISTRY.get_sample_value(name, labels) or 0.0
+
+
+@pytest.fixture
+def client():
+    app = FastAPI()
+    app.add_middleware(PrometheusMiddleware)
+
+    @app.get("/things/{thing_id}")
+    async def get_thing(thing_id: str):
+        return {"id": thing_id}
+
+    @app.get("/metrics")
+    async def metrics():
+        return {}
+
+    return TestClient(app)
+
+
+@pytest.mark.unit
+class TestPrometheusMiddleware:
+
+    def test_requests_are_labelled_by_route_template(self, client):
+        before = _sample("http_requests_total", method="GET", route="/things/{thing_id}", status="200")
+
+        client.get("/things/a")
+        client.get("/things/b")
+
+        assert _sample("http_requests_total", method="GET", route="/things/{thing_id}", status="200") == before + 2
+        assert _sample("http_request_duration_seconds_count", method="GET", route="/things/{thing_id}") >= 2
+        assert _sample("http_requests_in_progress", method="GET") == 0
+
+    def test_unknown_paths_share_one_label(self, client):
+        before = _sample("http_requests_total", method="GET", route="unmatched", status="404")
+
+        client.get("/nope/1")
+        client.get("/nope/2")
+
+        assert _sample("http_requests_total", method="GET", route="unmatched", status="404") == before + 2
+
+    def test_scrape_endpoint_is_not_recorded(self, client):
+        client.get("/metrics")
+
+        assert _sample("http_requests_total", method="GET", route="/metrics", status="200") == 0
+
+
+@pytest.mark.unit
+class TestCommandLatencyListener:
+
+    def test_latency_is_recorded_by_collection_and_command(self):
+        listener = CommandLatencyListener()
+        before = _sample("mongodb_command_duration_seconds_count", collection="members", command="getMore")
+
+        for request_id, command in ((1, {"find": "members"}), (2, {"getMore": 7, "collection": "members"})):
+            name = next(iter(command))
+            listener.started(monitoring.CommandStartedEvent(command, "test", request_id, CONNECTION, request_id))
+            listener.succeeded(monitoring.CommandSucceededEvent(
+                timedelta(milliseconds=3), {"ok": 1}, name, request_id, CONNECTION, request_id,
+            ))
+
+        assert _sample("mongodb_command_duration_seconds_count", collection="members", command="getMore") == before + 1
+
+    def test_failures_are_counted(self):
+        listener = CommandLatencyListener()
+        before = _sample("mongodb_command_failures_total", collection="licenses", command="insert")
+
+        listener.started(monitoring.CommandStartedEvent({"insert": "licenses"}, "test", 9, CONNECTION, 9))
+        listener.failed(monitoring.CommandFailedEvent(
+            timedelta(milliseconds=1), {"ok": 0}, "insert", 9, CONNECTION, 9,
+        ))
+
+        assert _sample("mongodb_command_failures_total", collection="licenses", command="insert") == before + 1
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestTimers:
+
+    async def test_timed_observes_failed_calls(self):
+        @timed(RENDER_DURATION, format="pdf", document="test")
+        async def render():
+            raise RuntimeError("boom")
+
+        with pytest.raises(RuntimeError):
+            await render()
+
+        assert _sample("document_render_duration_seconds_count", format="pdf", document="test") == 1
+
+    async def test_scheduler_job_counts_failures(self):
+        with pytest.raises(ValueError):
+            with scheduler_job("test_job"):
+                raise ValueError("boom")
+
+        assert _sample("scheduler_job_duration_seconds_count", job="test_job") == 1
+        assert _sample("scheduler_job_failures_total", job="test_job") == 1
+
+
+@pytest.mark.unit
+class TestRenderMetrics:
+
+    def test_single_process_exposes_default_registry(self, monkeypatch):
+        monkeypatch.delenv("PROMETHEUS_MULTIPROC_DIR", raising=False)
+
+        body, content_type = render_metrics()
+
+        assert content_type.startswith("text/plain")
+        assert b"http_requests_total" in body
+
+    def test_multiprocess_mode_reads_worker_files(self, monkeypatch, tmp_path):
+        monkeypatch.setenv("PROMETHEUS_MULTIPROC_DIR", str(tmp_path))
+
+        body, _ = render_metrics()
+
+        # No worker has written yet, so the merged view is empty
+        assert b"http_requests_total" not in body
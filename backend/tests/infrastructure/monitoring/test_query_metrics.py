@@ -0,0 +1,94 @@
+"""Tests for per-request query accounting, the Server-Timing header and N+1 warnings."""
+
+import logging
+from datetime import timedelta
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from pymongo import monitoring
+
+from src.infrastructure.monitoring.query_metrics import (
+    QueryMetricsListener,
+    add_request_observer,
+    track_queries,
+)
+from src.infrastructure.web.middleware import QueryMetricsMiddleware
+from tests.plugins.query_budget import over_budget
+
+CONNECTION = ("db.local", 27017)
+
+
+def _run(listener, request_id, command, duration_ms=2):
+    name = next(iter(command))
+    listener.started(monitoring.CommandStartedEvent(command, "test", request_id, CONNECTION, request_id))
+    listener.succeeded(monitoring.CommandSucceededEvent(
+        timedelta(milliseconds=duration_ms), {"ok": 1}, name, request_id, CONNECTION, request_id,
+    ))
+
+
+@pytest.mark.unit
+class TestQueryMetricsListener:
+
+    def test_commands_are_attributed_to_tracked_request(self):
+        listener = QueryMetricsListener()
+
+        with track_queries() as stats:
+            _run(listener, 1, {"find": "members", "filter": {"club_id": "c1", "status": "active"}})
+            _run(listener, 2, {"getMore": 1, "collection": "members"})
+            _run(listener, 3, {"ping": 1})
+        _run(listener, 4, {"find": "members", "filter": {}})
+
+        assert stats.count == 2
+        assert stats.total_ms == pytest.approx(4)
+        assert dict(stats.shapes) == {("find", "members", ("club_id", "status")): 1}
+
+    def test_repeated_shapes_ignore_filter_values(self):
+        listener = QueryMetricsListener()
+
+        with track_queries() as stats:
+            for n in range(5):
+                _run(listener, n, {"find": "members", "filter": {"_id": n}})
+            _run(listener, 9, {"aggregate": "licenses", "pipeline": [{"$match": {"member_id": 1}}]})
+
+        assert stats.repeated_shapes(5) == [(("find", "members", ("_id",)), 5)]
+
+
+def _app(queries: int) -> FastAPI:
+    listener = QueryMetricsListener()
+    app = FastAPI()
+    app.add_middleware(QueryMetricsMiddleware, repeat_threshold=3)
+
+    @app.get("/licenses")
+    async def licenses():
+        # One member lookup per license, as a driver would report it
+        for n in range(queries):
+            _run(listener, n, {"find": "members", "filter": {"_id": n}}, duration_ms=1.5)
+        return []
+
+    return app
+
+
+@pytest.mark.unit
+class TestQueryMetricsMiddleware:
+
+    @pytest.mark.query_budget(4)
+    def test_server_timing_header_and_n_plus_one_warning(self, caplog):
+        with caplog.at_level(logging.WARNING):
+            response = TestClient(_app(4)).get("/licenses")
+
+        assert response.headers["Server-Timing"] == 'db;dur=6.0;desc="4 queries"'
+        assert "Possible N+1 in GET /licenses: find members {_id} ran 4 times" in caplog.text
+
+    def test_over_budget_requests_are_reported(self):
+        requests = []
+        remove = add_request_observer(lambda *request: requests.append(request))
+        try:
+            TestClient(_app(3)).get("/licenses")
+        finally:
+            remove()
+
+        assert over_budget(requests, 3) == []
+        assert over_budget(requests, 2) == [
+            "GET /licenses ran 3 queries (budget 2): find members {_id} x3"
+        ]
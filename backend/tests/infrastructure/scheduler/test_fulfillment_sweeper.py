@@ -0,0 +1,45 @@
+"""Tests for the sweeper resuming unfinished payment fulfillments."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.infrastructure.scheduler.fulfillment_sweeper import FulfillmentSweeper
+
+
+@pytest.fixture
+def webhook_use_case():
+    use_case = MagicMock()
+    use_case.resume_unfinished_fulfillments = AsyncMock(return_value=2)
+    return use_case
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestFulfillmentSweeper:
+
+    async def test_leader_resumes_stale_fulfillments(self, webhook_use_case):
+        sweeper = FulfillmentSweeper(
+            webhook_use_case, stale_after_seconds=120, leader_lease=MagicMock(is_leader=True)
+        )
+
+        assert await sweeper.sweep() == 2
+        webhook_use_case.resume_unfinished_fulfillments.assert_awaited_once_with(
+            stale_after_seconds=120
+        )
+
+    async def test_other_workers_skip_the_sweep(self, webhook_use_case):
+        sweeper = FulfillmentSweeper(webhook_use_case, leader_lease=MagicMock(is_leader=False))
+
+        assert await sweeper.sweep() == 0
+        webhook_use_case.resume_unfinished_fulfillments.assert_not_called()
+
+    async def test_sweeps_as_soon_as_it_starts(self, webhook_use_case):
+        sweeper = FulfillmentSweeper(webhook_use_case, interval_seconds=3600)
+
+        await sweeper.start()
+        await asyncio.sleep(0)
+        await sweeper.stop()
+
+        webhook_use_case.resume_unfinished_fulfillments.assert_awaited_once()
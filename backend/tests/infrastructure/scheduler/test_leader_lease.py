@@ -0,0 +1,89 @@
+"""Tests for leader election through the scheduler lease."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.infrastructure.scheduler.leader_lease import LeaderLease
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return _Clock()
+
+
+@pytest.fixture
+def repository():
+    repository = MagicMock()
+    repository.try_acquire = AsyncMock(return_value=True)
+    repository.release = AsyncMock()
+    return repository
+
+
+@pytest.fixture
+def lease(repository, clock):
+    return LeaderLease(repository, "scheduler", ttl_seconds=30, clock=clock)
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestLeaderLease:
+
+    async def test_acquiring_the_lease_makes_this_worker_leader(self, lease, repository):
+        assert await lease.renew() is True
+
+        assert lease.is_leader
+        repository.try_acquire.assert_awaited_once_with("scheduler", lease.holder, 30)
+
+    async def test_lease_held_elsewhere_is_not_leader(self, lease, repository):
+        repository.try_acquire.return_value = False
+
+        assert await lease.renew() is False
+        assert not lease.is_leader
+
+    async def test_leadership_lapses_without_a_renewal(self, lease, clock):
+        await lease.renew()
+
+        clock.now += 29
+        assert lease.is_leader
+        clock.now += 1
+        assert not lease.is_leader
+
+    async def test_database_errors_drop_leadership(self, lease, repository):
+        await lease.renew()
+        repository.try_acquire.side_effect = ConnectionError("down")
+
+        assert await lease.renew() is False
+        assert not lease.is_leader
+
+    async def test_stop_releases_a_held_lease(self, lease, repository):
+        await lease.start()
+
+        await lease.stop()
+
+        repository.release.assert_awaited_once_with("scheduler", lease.holder)
+        assert not lease.is_leader
+
+    async def test_stop_without_the_lease_releases_nothing(self, lease, repository):
+        repository.try_acquire.return_value = False
+        await lease.start()
+
+        await lease.stop()
+
+        repository.release.assert_not_called()
+
+
+@pytest.mark.unit
+def test_each_lease_has_its_own_holder(repository, clock):
+    first = LeaderLease(repository, "scheduler", clock=clock)
+    second = LeaderLease(repository, "scheduler", clock=clock)
+
+    assert first.holder != second.holder
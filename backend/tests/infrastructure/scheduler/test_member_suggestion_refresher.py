@@ -0,0 +1,43 @@
+"""Tests for the background rebuilds of the member suggestion index."""
+
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.application.search.member_suggestion_index import MemberSuggestionIndex
+from src.domain.entities.member import Member
+from src.infrastructure.scheduler.member_suggestion_refresher import MemberSuggestionRefresher
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestMemberSuggestionRefresher:
+
+    async def test_invalidation_from_another_worker_rebuilds_before_the_interval(self):
+        members = [Member(id="1", first_name="Ana", last_name="Ruiz")]
+
+        async def iter_all():
+            for member in list(members):
+                yield member
+
+        member_repository = MagicMock()
+        member_repository.iter_all = MagicMock(side_effect=iter_all)
+        index = MemberSuggestionIndex()
+        refresher = MemberSuggestionRefresher(index, member_repository, interval_seconds=3600)
+
+        await refresher.start()
+        try:
+            for _ in range(10):
+                await asyncio.sleep(0)
+            assert [ref.id for ref in index.suggest("ruiz")] == ["1"]
+
+            # Another worker wrote a member and published the change
+            members.append(Member(id="2", first_name="Luis", last_name="Ruiz"))
+            index.invalidate()
+            for _ in range(10):
+                await asyncio.sleep(0)
+
+            assert sorted(ref.id for ref in index.suggest("ruiz")) == ["1", "2"]
+        finally:
+            await refresher.stop()
@@ -0,0 +1,72 @@
+"""Import-time regression tests for the API entry point.
+
+They import ``src.main`` in a fresh interpreter under ``python -X importtime``
+and fail when a dependency that should load on first use (PDFs, images,
+spreadsheets, Redsys encryption, email templates) is imported at startup,
+or when the whole import exceeds ``IMPORT_TIME_BUDGET_MS``.
+"""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict
+
+import pytest
+from dotenv import dotenv_values
+
+BACKEND_DIR = Path(__file__).resolve().parents[2]
+
+# Generous enough for a loaded CI runner; about 0.8 s on a developer laptop
+IMPORT_TIME_BUDGET_MS = int(os.getenv("IMPORT_TIME_BUDGET_MS", "2500"))
+
+# Imported by the code that needs them, never at startup
+DEFERRED_MODULES = ("reportlab", "PIL", "openpyxl", "Crypto", "jinja2")
+
+
+def _import_times(module: str) -> Dict[str, int]:
+    """Cumulative import time in microseconds of every module loaded by importing module."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=BACKEND_DIR,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, name = line.split("|")
+        if cumulative.strip().isdigit():
+            times.setdefault(name.strip(), int(cumulative))
+    return times
+
+
+@pytest.fixture(scope="module")
+def import_times():
+    return _import_times("src.main")
+
+
+def _logfire_configured() -> bool:
+    return bool(os.getenv("LOGFIRE_TOKEN") or dotenv_values(BACKEND_DIR / ".env").get("LOGFIRE_TOKEN"))
+
+
+@pytest.mark.slow
+class TestImportTime:
+
+    @pytest.mark.parametrize("module", DEFERRED_MODULES)
+    def test_heavy_dependency_is_not_imported_at_startup(self, import_times, module):
+        assert module not in import_times
+
+    def test_logfire_is_not_imported_without_a_token(self, import_times):
+        if _logfire_configured():
+            pytest.skip("LOGFIRE_TOKEN is set")
+        assert "logfire" not in import_times
+
+    def test_entry_point_imports_within_budget(self, import_times):
+        elapsed_ms = import_times["src.main"] / 1000
+
+        assert elapsed_ms <= IMPORT_TIME_BUDGET_MS, (
+            f"Importing src.main took {elapsed_ms:.0f} ms, over the {IMPORT_TIME_BUDGET_MS} ms budget"
+        )
@@ -0,0 +1,100 @@
+"""Tests for routing reporting reads to secondaries.
+
+The integration test needs a replica set; a single node is enough, e.g.:
+
+    docker run -d --name mongo-rs -p 27018:27017 mongo:7 --replSet rs0
+    docker exec mongo-rs mongosh --eval "rs.initiate()"
+    MONGODB_REPLSET_URL="mongodb://localhost:27018/?directConnection=true" pytest -m integration
+"""
+
+import os
+import pytest
+from unittest.mock import MagicMock
+from pymongo.read_preferences import SecondaryPreferred
+
+from src.application.ports.read_routing import (
+    ReadRouting,
+    current_read_routing,
+    read_routing,
+    reporting,
+)
+from src.infrastructure.read_routing import reporting_read_preference, routed
+from src.infrastructure.adapters.repositories.mongodb_base_repository import MongoDBBaseRepository
+
+
+class _Repository(MongoDBBaseRepository):
+    def __init__(self, collection):
+        self.collection = collection
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+class TestReportingDecorator:
+
+    async def test_reads_inside_reporting_call_are_routed(self):
+        seen = []
+
+        class _UseCase:
+            @reporting
+            async def execute(self, value):
+                seen.append(current_read_routing())
+                return value
+
+        assert await _UseCase().execute(3) == 3
+        assert seen == [ReadRouting.REPORTING]
+        assert current_read_routing() is ReadRouting.PRIMARY
+        assert _UseCase.execute.is_reporting
+
+    async def test_routing_is_restored_after_errors(self):
+        @reporting
+        async def failing():
+            raise RuntimeError("boom")
+
+        with pytest.raises(RuntimeError):
+            await failing()
+        assert current_read_routing() is ReadRouting.PRIMARY
+
+
+@pytest.mark.unit
+class TestRouted:
+
+    def test_sync_functions_are_rejected(self):
+        with pytest.raises(TypeError):
+            reporting(lambda: None)
+
+    def test_primary_reads_use_collection_as_is(self):
+        collection = MagicMock()
+
+        assert _Repository(collection).collection is collection
+        collection.with_options.assert_not_called()
+
+    def test_reporting_reads_use_secondary_preferred_with_staleness(self):
+        collection = MagicMock()
+
+        with read_routing(ReadRouting.REPORTING):
+            routed_collection = _Repository(collection).collection
+
+        assert routed_collection is collection.with_options.return_value
+        preference = collection.with_options.call_args.kwargs["read_preference"]
+        assert preference == SecondaryPreferred(max_staleness=90)
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+@pytest.mark.skipif(not os.getenv("MONGODB_REPLSET_URL"), reason="needs MONGODB_REPLSET_URL (replica set)")
+class TestReadRoutingReplicaSet:
+
+    async def test_reporting_read_on_single_node_replica_set(self):
+        from motor.motor_asyncio import AsyncIOMotorClient
+
+        client = AsyncIOMotorClient(os.environ["MONGODB_REPLSET_URL"])
+        collection = client["read_routing_test"]["docs"]
+        try:
+            await collection.insert_one({"n": 1})
+            with read_routing(ReadRouting.REPORTING):
+                target = routed(collection)
+                assert target.read_preference == reporting_read_preference()
+                assert await target.count_documents({"n": 1}) >= 1
+        finally:
+            await client.drop_database("read_routing_test")
+            client.close()
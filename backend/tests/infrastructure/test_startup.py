@@ -0,0 +1,56 @@
+"""Tests for the startup phase timings."""
+
+import logging
+
+import pytest
+
+from src.infrastructure.startup import StartupPhases
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.mark.unit
+class TestStartupPhases:
+
+    def test_phases_are_timed_in_order(self):
+        clock = _Clock()
+        phases = StartupPhases(clock=clock)
+
+        with phases.phase("imports"):
+            clock.now += 0.4
+        with phases.phase("database"):
+            clock.now += 0.05
+
+        assert list(phases.durations) == ["imports", "database"]
+        assert phases.durations["imports"] == pytest.approx(0.4)
+
+    def test_failed_phase_is_still_recorded(self):
+        clock = _Clock()
+        phases = StartupPhases(clock=clock)
+
+        with pytest.raises(RuntimeError):
+            with phases.phase("indexes"):
+                clock.now += 0.2
+                raise RuntimeError("boom")
+
+        assert phases.durations["indexes"] == pytest.approx(0.2)
+
+    def test_report_logs_total_and_phases(self, caplog):
+        clock = _Clock()
+        phases = StartupPhases(clock=clock)
+        with phases.phase("imports"):
+            clock.now += 0.4
+        with phases.phase("database"):
+            clock.now += 0.05
+
+        with caplog.at_level(logging.INFO, logger="src.infrastructure.startup"):
+            summary = phases.report()
+
+        assert summary == "Startup finished in 450 ms (imports 400 ms, database 50 ms)"
+        assert summary in caplog.text
@@ -0,0 +1,71 @@
+"""Tests for the multi-worker startup check."""
+
+import logging
+import sys
+import types
+
+import pytest
+
+import src.app
+from src.infrastructure.workers import WORKERS_ENV, check_worker_safety, rebound_globals, unsafe_globals
+
+FAKE_MODULE = "src._fake_worker_state"
+
+SOURCE = '''
+_registry = None
+_constant = 1
+
+
+def register(value):
+    global _registry
+    _registry = value
+
+
+class Holder:
+    @staticmethod
+    def reset():
+        def inner():
+            global _nested
+            _nested = None
+        inner()
+
+
+def read():
+    return _constant
+'''
+
+
+@pytest.fixture
+def fake_module(monkeypatch):
+    module = types.ModuleType(FAKE_MODULE)
+    exec(compile(SOURCE, FAKE_MODULE, "exec"), module.__dict__)
+    monkeypatch.setitem(sys.modules, FAKE_MODULE, module)
+    return module
+
+
+@pytest.mark.unit
+class TestWorkerSafety:
+
+    def test_globals_rebound_by_functions_are_found(self, fake_module):
+        found = [name for name in rebound_globals() if name.startswith(FAKE_MODULE)]
+
+        assert found == [f"{FAKE_MODULE}._nested", f"{FAKE_MODULE}._registry"]
+
+    def test_the_application_has_no_unlisted_per_process_globals(self):
+        # Importing the application loads the modules the check inspects
+        assert f"{src.app.__name__}._scheduler" in rebound_globals()
+        assert unsafe_globals() == []
+
+    def test_warns_about_unsafe_globals_with_several_workers(self, fake_module, monkeypatch, caplog):
+        monkeypatch.setenv(WORKERS_ENV, "4")
+
+        with caplog.at_level(logging.WARNING, logger="src.infrastructure.workers"):
+            unsafe = check_worker_safety()
+
+        assert f"{FAKE_MODULE}._registry" in unsafe
+        assert f"{FAKE_MODULE}._registry" in caplog.text
+
+    def test_single_worker_skips_the_check(self, fake_module, monkeypatch):
+        monkeypatch.setenv(WORKERS_ENV, "1")
+
+        assert check_worker_safety() == []
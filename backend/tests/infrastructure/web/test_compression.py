@@ -0,0 +1,106 @@
+"""Tests for the brotli/gzip compression middleware."""
+
+import gzip
+
+import brotli
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse, Response, StreamingResponse
+from fastapi.testclient import TestClient
+
+from src.infrastructure.web.middleware.compression import CompressionMiddleware, choose_encoding
+
+LARGE = "aikido " * 500
+XLSX = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+
+
+@pytest.fixture
+def client():
+    app = FastAPI()
+    app.add_middleware(CompressionMiddleware, minimum_size=1000)
+
+    @app.get("/large")
+    async def large():
+        return PlainTextResponse(LARGE)
+
+    @app.get("/small")
+    async def small():
+        return PlainTextResponse("ok")
+
+    @app.get("/stream")
+    async def stream():
+        async def chunks():
+            for _ in range(5):
+                yield LARGE.encode()
+        return StreamingResponse(chunks(), media_type="text/csv")
+
+    @app.get("/export")
+    async def export():
+        return Response(LARGE.encode(), media_type=XLSX)
+
+    return TestClient(app)
+
+
+def _raw_get(client, path, accept_encoding):
+    # httpx would decode the body; read it as sent over the wire
+    with client.stream("GET", path, headers={"Accept-Encoding": accept_encoding}) as response:
+        return response, b"".join(response.iter_raw())
+
+
+@pytest.mark.unit
+class TestChooseEncoding:
+
+    @pytest.mark.parametrize("header,expected", [
+        ("gzip, deflate, br", "br"),
+        ("gzip", "gzip"),
+        ("br;q=0.5, gzip;q=0.8", "gzip"),
+        ("br;q=0, gzip", "gzip"),
+        ("*", "br"),
+        ("identity", None),
+        ("", None),
+    ])
+    def test_prefers_highest_weight_then_brotli(self, header, expected):
+        assert choose_encoding(header) == expected
+
+
+@pytest.mark.unit
+class TestCompressionMiddleware:
+
+    def test_brotli_when_accepted(self, client):
+        response, body = _raw_get(client, "/large", "gzip, br")
+
+        assert response.headers["content-encoding"] == "br"
+        assert response.headers["vary"] == "Accept-Encoding"
+        assert int(response.headers["content-length"]) == len(body)
+        assert brotli.decompress(body).decode() == LARGE
+
+    def test_gzip_when_brotli_not_accepted(self, client):
+        response, body = _raw_get(client, "/large", "gzip")
+
+        assert response.headers["content-encoding"] == "gzip"
+        assert gzip.decompress(body).decode() == LARGE
+
+    def test_small_response_is_sent_as_is(self, client):
+        response, body = _raw_get(client, "/small", "gzip, br")
+
+        assert "content-encoding" not in response.headers
+        assert body == b"ok"
+
+    def test_identity_only_client_gets_plain_body(self, client):
+        response, body = _raw_get(client, "/large", "identity")
+
+        assert "content-encoding" not in response.headers
+        assert body.decode() == LARGE
+
+    def test_streaming_response_is_compressed_per_chunk(self, client):
+        response, body = _raw_get(client, "/stream", "gzip")
+
+        assert response.headers["content-encoding"] == "gzip"
+        assert "content-length" not in response.headers
+        assert gzip.decompress(body).decode() == LARGE * 5
+
+    def test_already_compressed_types_are_skipped(self, client):
+        response, body = _raw_get(client, "/export", "gzip, br")
+
+        assert "content-encoding" not in response.headers
+        assert body.decode() == LARGE
@@ -0,0 +1,153 @@
+"""Tests for conditional GET on list endpoints."""
+
+from datetime import date, datetime
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.application.read_models.collection_version import CollectionVersion
+from src.domain.entities.club import Club
+from src.infrastructure.web.conditional import collection_etag, etag_matches
+from src.infrastructure.web.dependencies import (
+    get_all_clubs_use_case,
+    get_all_members_use_case,
+    get_auth_context,
+    get_club_directory,
+    get_club_repository,
+    get_club_use_case,
+    get_insurance_repository,
+    get_license_repository,
+    get_member_repository,
+)
+from src.infrastructure.web.routers.clubs import router as clubs_router
+from src.infrastructure.web.routers.members import router as members_router
+
+VERSION = CollectionVersion(count=3, last_modified=datetime(2026, 5, 4, 10, 30))
+
+
+def _repository(version=VERSION):
+    repository = MagicMock()
+    repository.get_collection_version = AsyncMock(return_value=version)
+    return repository
+
+
+def _provide(value):
+    return lambda: value
+
+
+def _super_admin():
+    return MagicMock(is_super_admin=True, is_club_admin=False, club_id=None)
+
+
+@pytest.mark.unit
+class TestCollectionEtag:
+
+    def test_same_versions_and_scope_give_same_etag(self):
+        assert collection_etag(VERSION, scope="c1") == collection_etag(VERSION, scope="c1")
+
+    @pytest.mark.parametrize("other", [
+        CollectionVersion(count=2, last_modified=VERSION.last_modified),
+        CollectionVersion(count=3, last_modified=datetime(2026, 5, 4, 10, 31)),
+    ])
+    def test_insert_update_or_delete_changes_etag(self, other):
+        assert collection_etag(other) != collection_etag(VERSION)
+
+    def test_scope_changes_etag(self):
+        assert collection_etag(VERSION, scope="c1") != collection_etag(VERSION, scope="c2")
+
+    def test_etag_is_weak(self):
+        assert collection_etag(VERSION).startswith('W/"')
+
+    @pytest.mark.parametrize("header", ['W/"abc"', '"abc"', '"x", W/"abc"', "*"])
+    def test_if_none_match_uses_weak_comparison(self, header):
+        assert etag_matches(header, 'W/"abc"')
+
+    def test_if_none_match_with_other_tags_does_not_match(self):
+        assert not etag_matches('"x", "y"', 'W/"abc"')
+
+
+@pytest.mark.unit
+@pytest.mark.api
+class TestClubListConditionalGet:
+
+    @pytest.fixture
+    def setup(self):
+        club_repo = _repository()
+        use_case = MagicMock()
+        use_case.execute = AsyncMock(return_value=[Club(id="c1", name="Dojo", email="dojo@example.com")])
+        app = FastAPI()
+        app.include_router(clubs_router, prefix="/api/v1")
+        app.dependency_overrides[get_auth_context] = _super_admin
+        app.dependency_overrides[get_all_clubs_use_case] = _provide(use_case)
+        app.dependency_overrides[get_club_use_case] = _provide(MagicMock())
+        app.dependency_overrides[get_club_repository] = _provide(club_repo)
+        return TestClient(app), use_case, club_repo
+
+    def test_list_carries_validators(self, setup):
+        client, _, club_repo = setup
+
+        response = client.get("/api/v1/clubs")
+
+        assert response.status_code == 200
+        assert response.headers["etag"] == collection_etag(VERSION, scope=None)
+        assert response.headers["last-modified"] == "Mon, 04 May 2026 10:30:00 GMT"
+        assert response.headers["cache-control"] == "private, no-cache"
+        club_repo.get_collection_version.assert_awaited_once_with(None)
+
+    def test_matching_etag_returns_304_without_loading_the_list(self, setup):
+        client, use_case, _ = setup
+        etag = client.get("/api/v1/clubs").headers["etag"]
+        use_case.execute.reset_mock()
+
+        response = client.get("/api/v1/clubs", headers={"If-None-Match": etag})
+
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["etag"] == etag
+        use_case.execute.assert_not_called()
+
+    def test_changed_collection_returns_full_list(self, setup):
+        client, _, club_repo = setup
+        etag = client.get("/api/v1/clubs").headers["etag"]
+        club_repo.get_collection_version.return_value = CollectionVersion(count=4, last_modified=VERSION.last_modified)
+
+        response = client.get("/api/v1/clubs", headers={"If-None-Match": etag})
+
+        assert response.status_code == 200
+        assert response.json()[0]["name"] == "Dojo"
+
+
+@pytest.mark.unit
+@pytest.mark.api
+class TestMemberListConditionalGet:
+
+    @pytest.fixture
+    def setup(self):
+        repos = {
+            get_member_repository: _repository(),
+            get_license_repository: _repository(),
+            get_insurance_repository: _repository(CollectionVersion()),
+        }
+        club_directory = MagicMock()
+        club_directory.version = AsyncMock(return_value=VERSION)
+        ctx = MagicMock(is_super_admin=False, is_club_admin=True, club_id="c1")
+        app = FastAPI()
+        app.include_router(members_router, prefix="/api/v1")
+        app.dependency_overrides[get_auth_context] = _provide(ctx)
+        app.dependency_overrides[get_all_members_use_case] = _provide(MagicMock())
+        app.dependency_overrides[get_club_directory] = _provide(club_directory)
+        for dependency, repository in repos.items():
+            app.dependency_overrides[dependency] = _provide(repository)
+        return TestClient(app), repos
+
+    def test_304_for_current_copy_of_club_members(self, setup):
+        client, repos = setup
+        etag = collection_etag(VERSION, VERSION, CollectionVersion(), VERSION, scope=("c1", date.today()))
+
+        response = client.get("/api/v1/members/page", headers={"If-None-Match": etag})
+
+        assert response.status_code == 304
+        repos[get_member_repository].get_collection_version.assert_awaited_once_with("c1")
+        repos[get_license_repository].get_collection_version.assert_awaited_once_with()
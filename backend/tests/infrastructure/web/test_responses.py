@@ -0,0 +1,116 @@
+"""Tests for the pydantic-core response class and the FastJSONRoute router option."""
+
+from dataclasses import dataclass
+from datetime import datetime
+from typing import List
+
+import pytest
+from fastapi import APIRouter, FastAPI, HTTPException, Response, status
+from fastapi.testclient import TestClient
+from pydantic import BaseModel
+
+from src.infrastructure.web.responses import FastJSONRoute, PydanticJSONResponse
+
+
+class ItemResponse(BaseModel):
+    id: str
+    name: str
+    created_at: datetime
+    note: str = "none"
+
+
+@dataclass
+class ItemEntity:
+    id: str
+    name: str
+    created_at: datetime
+    secret: str
+
+
+ITEMS = [ItemResponse(id=str(n), name=f"Item {n}", created_at=datetime(2026, 1, n + 1)) for n in range(3)]
+
+
+def _register(router: APIRouter) -> None:
+    @router.get("/items", response_model=List[ItemResponse])
+    async def list_items():
+        return ITEMS
+
+    @router.get("/items/entities", response_model=List[ItemResponse])
+    async def list_entities():
+        return [ItemEntity(id="1", name="Raw", created_at=datetime(2026, 1, 1), secret="hidden")]
+
+    @router.get("/items/dicts", response_model=List[ItemResponse])
+    def list_dicts():
+        return [{"id": "1", "name": "Dict", "created_at": "2026-01-01T00:00:00", "secret": "hidden"}]
+
+    @router.post("/items", response_model=ItemResponse, status_code=status.HTTP_201_CREATED)
+    async def create_item():
+        return ITEMS[0]
+
+    @router.get("/items/tagged", response_model=List[ItemResponse])
+    async def list_tagged(response: Response):
+        response.headers["ETag"] = 'W/"v1"'
+        return ITEMS
+
+    @router.get("/items/missing", response_model=ItemResponse)
+    async def missing_item():
+        raise HTTPException(status_code=404, detail="not found")
+
+
+def _client(route_class=None) -> TestClient:
+    router = APIRouter(prefix="/api", route_class=route_class) if route_class else APIRouter(prefix="/api")
+    _register(router)
+    app = FastAPI(default_response_class=PydanticJSONResponse)
+    app.include_router(router)
+    return TestClient(app)
+
+
+@pytest.fixture
+def fast():
+    return _client(FastJSONRoute)
+
+
+@pytest.fixture
+def standard():
+    return _client()
+
+
+@pytest.mark.unit
+class TestFastJSONRoute:
+
+    @pytest.mark.parametrize("path", ["/api/items", "/api/items/entities", "/api/items/dicts"])
+    def test_body_matches_standard_serialization(self, fast, standard, path):
+        fast_response, standard_response = fast.get(path), standard.get(path)
+
+        assert fast_response.status_code == standard_response.status_code == 200
+        assert fast_response.json() == standard_response.json()
+        assert fast_response.headers["content-type"] == "application/json"
+
+    def test_values_that_are_not_dtos_are_filtered_by_the_response_model(self, fast):
+        for path in ("/api/items/entities", "/api/items/dicts"):
+            assert "secret" not in fast.get(path).json()[0]
+
+    def test_declared_status_code_is_kept(self, fast):
+        assert fast.post("/api/items").status_code == status.HTTP_201_CREATED
+
+    def test_headers_set_on_injected_response_are_kept(self, fast, standard):
+        assert fast.get("/api/items/tagged").headers["etag"] == standard.get("/api/items/tagged").headers["etag"]
+
+    def test_http_exceptions_pass_through(self, fast):
+        response = fast.get("/api/items/missing")
+
+        assert response.status_code == 404
+        assert response.json() == {"detail": "not found"}
+
+    def test_openapi_schema_still_describes_the_response_model(self, fast):
+        schema = fast.app.openapi()
+
+        response_schema = schema["paths"]["/api/items"]["get"]["responses"]["200"]["content"]["application/json"]["schema"]
+        assert response_schema["items"] == {"$ref": "#/components/schemas/ItemResponse"}
+
+
+@pytest.mark.unit
+class TestPydanticJSONResponse:
+
+    def test_renders_compact_utf8_json(self):
+        assert PydanticJSONResponse({"name": "García", "n": [1, 2]}).body == '{"name":"García","n":[1,2]}'.encode()
@@ -0,0 +1,96 @@
+"""Pytest plugin failing tests whose requests exceed a declared query budget.
+
+Mark a test with ``@pytest.mark.query_budget(n)``; every HTTP request served
+by an app with ``QueryMetricsMiddleware`` during the test may run at most
+``n`` database commands::
+
+    @pytest.mark.query_budget(3)
+    def test_member_list(client):
+        client.get("/api/v1/members")
+
+Endpoint tests that replace repositories with mocks run no driver commands,
+so they wrap the mocks in ``CountingRepository``: each awaited call is then
+reported as one command, through the same listener the driver would use.
+"""
+
+import inspect
+import itertools
+from datetime import timedelta
+from typing import Any, Optional
+
+import pytest
+from pymongo import monitoring
+
+from src.infrastructure.monitoring.query_metrics import (
+    QueryMetricsListener,
+    add_request_observer,
+    describe_shape,
+)
+
+_listener = QueryMetricsListener()
+_request_ids = itertools.count(1)
+_CONNECTION = ("localhost", 27017)
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers",
+        "query_budget(n): fail if a request served during the test runs more than n database commands",
+    )
+
+
+def record_query(command_name: str, collection: str, query: Optional[dict] = None) -> None:
+    """Report one command on ``collection`` to the request being served."""
+    request_id = next(_request_ids)
+    command = {command_name: collection, "filter": query or {}}
+    _listener.started(monitoring.CommandStartedEvent(command, "test", request_id, _CONNECTION, request_id))
+    _listener.succeeded(monitoring.CommandSucceededEvent(
+        timedelta(milliseconds=1), {"ok": 1}, command_name, request_id, _CONNECTION, request_id
+    ))
+
+
+class CountingRepository:
+    """Proxy for a (mock) repository that reports each awaited call as one command on ``collection``."""
+
+    def __init__(self, repository: Any, collection: str):
+        self._repository = repository
+        self._collection = collection
+
+    def __getattr__(self, name: str) -> Any:
+        attribute = getattr(self._repository, name)
+        if not inspect.iscoroutinefunction(attribute):
+            return attribute
+
+        async def counted(*args, **kwargs):
+            record_query(name, self._collection)
+            return await attribute(*args, **kwargs)
+
+        return counted
+
+
+def over_budget(requests, budget: int) -> list:
+    """Describe the (method, path, stats) requests that ran more than ``budget`` commands."""
+    problems = []
+    for method, path, stats in requests:
+        if stats.count > budget:
+            shapes = ", ".join(f"{describe_shape(shape)} x{n}" for shape, n in stats.shapes.most_common(3))
+            problems.append(f"{method} {path} ran {stats.count} queries (budget {budget}): {shapes}")
+    return problems
+
+
+@pytest.hookimpl(wrapper=True)
+def pytest_runtest_call(item):
+    marker = item.get_closest_marker("query_budget")
+    if marker is None:
+        return (yield)
+
+    requests = []
+    remove = add_request_observer(lambda method, path, stats: requests.append((method, path, stats)))
+    try:
+        result = yield
+    finally:
+        remove()
+    problems = over_budget(requests, marker.args[0])
+    if problems:
+        pytest.fail("Query budget exceeded:\n" + "\n".join(problems), pytrace=False)
+    return result
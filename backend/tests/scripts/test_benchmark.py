@@ -0,0 +1,148 @@
+import argparse
+
+import httpx
+import pytest
+
+from scripts.benchmark.report import compare, percentile, summarize
+from scripts.benchmark.runner import Sample, parse_server_timing, run_scenario
+from scripts.benchmark.scenarios import Request, Scenario, SeededData, build_scenarios
+from scripts.seed_demo_data import SCALES, SeedScale, add_scale_arguments, parse_scale
+
+
+def _report(**scenarios):
+    return {"scenarios": scenarios}
+
+
+class TestPercentile:
+    def test_nearest_rank(self):
+        values = list(range(1, 101))
+        assert percentile(values, 50) == 50
+        assert percentile(values, 95) == 95
+        assert percentile(values, 99) == 99
+
+    def test_single_value(self):
+        assert percentile([7.0], 99) == 7.0
+
+    def test_empty_list_rejected(self):
+        with pytest.raises(ValueError):
+            percentile([], 50)
+
+
+class TestSummarize:
+    def test_errors_are_excluded_from_latency_and_queries(self):
+        samples = [Sample(200, 10.0, 3, 1.0), Sample(200, 20.0, 5, 2.0), Sample(500, 900.0, 40, 5.0)]
+
+        summary = summarize(samples)
+
+        assert summary["requests"] == 3
+        assert summary["errors"] == 1
+        assert summary["p99_ms"] == 20.0
+        assert summary["queries_per_request"] == 4.0
+        assert summary["max_queries"] == 5
+
+
+class TestServerTiming:
+    def test_reads_query_count_and_db_time(self):
+        assert parse_server_timing('db;dur=12.5;desc="7 queries"') == (7, 12.5)
+
+    def test_missing_header(self):
+        assert parse_server_timing(None) == (None, None)
+
+
+class TestCompare:
+    def test_slower_p95_beyond_tolerance_is_a_regression(self):
+        baseline = _report(dashboard={"errors": 0, "p95_ms": 100.0})
+
+        assert compare(_report(dashboard={"errors": 0, "p95_ms": 119.0}), baseline) == []
+        assert len(compare(_report(dashboard={"errors": 0, "p95_ms": 130.0}), baseline)) == 1
+
+    def test_tiny_latencies_are_not_flagged(self):
+        baseline = _report(webhook={"errors": 0, "p95_ms": 2.0})
+
+        assert compare(_report(webhook={"errors": 0, "p95_ms": 4.0}), baseline) == []
+
+    def test_more_queries_per_request_is_a_regression(self):
+        baseline = _report(members={"errors": 0, "queries_per_request": 4.0})
+
+        regressions = compare(_report(members={"errors": 0, "queries_per_request": 54.0}), baseline)
+
+        assert regressions == ["members: 54.0 queries/request (baseline 4.0)"]
+
+    def test_query_count_is_gated_on_the_most_expensive_request(self):
+        # A cached endpoint: one miss costs 12 queries, hits cost 2
+        baseline = _report(dashboard={"errors": 0, "queries_per_request": 2.1, "max_queries": 12})
+
+        fewer_hits = _report(dashboard={"errors": 0, "queries_per_request": 2.4, "max_queries": 12})
+        assert compare(fewer_hits, baseline) == []
+        costlier_miss = _report(dashboard={"errors": 0, "queries_per_request": 2.2, "max_queries": 30})
+        assert compare(costlier_miss, baseline) == ["dashboard: up to 30 queries/request (baseline 12)"]
+
+    def test_mean_query_count_is_rounded_up_without_max_queries(self):
+        baseline = _report(members={"errors": 0, "queries_per_request": 3.2})
+
+        assert compare(_report(members={"errors": 0, "queries_per_request": 3.9}), baseline) == []
+
+    def test_new_errors_are_a_regression(self):
+        baseline = _report(export={"errors": 0})
+
+        assert compare(_report(export={"errors": 2}), baseline) == ["export: 2 errors (baseline 0)"]
+
+    def test_scenarios_missing_from_the_run_are_ignored(self):
+        assert compare(_report(), _report(export={"errors": 0, "p95_ms": 1.0})) == []
+
+
+@pytest.mark.asyncio
+class TestRunScenario:
+    async def test_sends_requested_count_with_auth_and_reads_server_timing(self):
+        seen = []
+
+        def handler(request):
+            seen.append(request.headers.get("authorization"))
+            return httpx.Response(200, json={}, headers={"Server-Timing": 'db;dur=3.0;desc="2 queries"'})
+
+        scenario = Scenario("things", lambda: Request("GET", "/things"))
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler), base_url="http://api") as client:
+            samples = await run_scenario(client, scenario, "tok", requests=7, concurrency=3, warmup=2)
+
+        assert len(samples) == 7
+        assert len(seen) == 9
+        assert set(seen) == {"Bearer tok"}
+        assert {s.queries for s in samples} == {2}
+
+    async def test_unauthenticated_requests_send_no_token(self):
+        seen = []
+
+        def handler(request):
+            seen.append(request.headers.get("authorization"))
+            return httpx.Response(200)
+
+        scenario = Scenario("hook", lambda: Request("POST", "/hook", data={"a": "b"}, authenticated=False))
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler), base_url="http://api") as client:
+            await run_scenario(client, scenario, "tok", requests=1, concurrency=1)
+
+        assert seen == [None]
+
+
+class TestScenarios:
+    def test_every_scenario_builds_a_request(self):
+        seeded = SeededData(club_ids=["c1", "c2"], payment_year=2026)
+
+        requests = [scenario.build() for scenario in build_scenarios(seeded)]
+
+        assert all(r.path.startswith("/api/") for r in requests)
+        assert len({s.name for s in build_scenarios(seeded)}) == len(requests)
+
+
+class TestSeedScale:
+    def _parse(self, *argv):
+        parser = argparse.ArgumentParser()
+        add_scale_arguments(parser)
+        return parse_scale(parser.parse_args(argv))
+
+    def test_default_is_the_demo_dataset(self):
+        assert self._parse() == SeedScale()
+
+    def test_named_scale_with_overrides(self):
+        assert self._parse("--scale", "benchmark", "--members", "1000") == SeedScale(
+            clubs=SCALES["benchmark"].clubs, members=1000, payment_years=SCALES["benchmark"].payment_years,
+        )
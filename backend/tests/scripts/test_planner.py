@@ -250,3 +250,16 @@ def test_submitted_zero_cuota_warns():
     plan = p.build()
     assert any(w["type"] == "submitted_zero_cuota" for w in plan.warnings)
     assert not any(a["payment_type"] == "licencia_dan" for a in plan.payment_upserts)
+
+
+def test_member_docs_carry_search_keys():
+    p = Planner(
+        excel_members=[excel_member(num="100", first="Íñigo"), excel_member(num="200", dni="99999999Z", first="Marta", last1="Ruiz", last2="")],
+        excel_fees={}, excel_insurances=[],
+        prod_members=[prod_member()],
+        prod_licenses={}, prod_insurances={}, prod_payments={},
+    )
+    plan = p.build()
+    assert plan.member_updates[0]["fields"]["search_tokens"] == ["inigo", "garcia", "lopez"]
+    assert plan.member_inserts[0]["search_tokens"] == ["marta", "ruiz"]
+    assert plan.member_inserts[0]["search_dni"] == "99999999Z"